@@ -0,0 +1,4 @@
+from benchmarks.run import main
+
+
+main()
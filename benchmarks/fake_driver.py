@@ -0,0 +1,159 @@
+from typing import Any, Dict, List, Optional
+
+from selenium.common.exceptions import NoSuchElementException
+
+from fastbots import config, Bot
+from fastbots.wait import AdaptiveWait
+from fastbots.scripts import BULK_EXTRACT_JS
+
+
+# smallest valid png, written by the fake screenshots
+PNG_BYTES: bytes = bytes.fromhex(
+    '89504e470d0a1a0a0000000d4948445200000001000000010806000000'
+    '1f15c4890000000d49444154789c6360000002000100ffff03000006000557bfabd40000000049454e44ae426082'
+)
+
+
+class FakeElement(object):
+    """
+    Element returned by the fake driver, it answers with the locator value.
+    """
+
+    def __init__(self, driver: 'FakeWebDriver', by: str, value: str) -> None:
+        self._driver: 'FakeWebDriver' = driver
+        self.by: str = by
+        self.value: str = value
+        self.text: str = value
+
+    def get_attribute(self, name: str) -> str:
+        if name in ('innerHTML', 'outerHTML'):
+            return self._driver.page_source
+        return self.value
+
+    def click(self):
+        # the links of the fixtures navigate to the next page
+        next_url: Optional[str] = self._driver.links.get(self.value)
+        if next_url is not None:
+            self._driver.get(next_url)
+
+    def send_keys(self, *value):
+        pass
+
+
+class FakeSwitchTo(object):
+
+    def __init__(self, driver: 'FakeWebDriver') -> None:
+        self._driver: 'FakeWebDriver' = driver
+
+    def window(self, handle: str):
+        self._driver.current_window_handle = handle
+
+
+class FakeWebDriver(object):
+    """
+    Fake WebDriver
+
+    In-process driver with the subset of the WebDriver API used by fastbots, every call returns immediately,
+    so the benchmarks measure only the fastbots overhead.
+
+    Attributes:
+        pages (Dict[str, str]): The html of the pages, by url.
+        links (Dict[str, str]): The url opened by the click of an element, by locator value.
+        missing (set): The locator values that aren't found.
+    """
+
+    def __init__(self, pages: Optional[Dict[str, str]] = None, links: Optional[Dict[str, str]] = None) -> None:
+        self.pages: Dict[str, str] = {} if pages is None else pages
+        self.links: Dict[str, str] = {} if links is None else links
+        self.missing: set = set()
+        self.current_url: str = 'about:blank'
+        self.current_window_handle: str = 'main'
+        self.window_handles: List[str] = ['main']
+        self.switch_to: FakeSwitchTo = FakeSwitchTo(self)
+        self.scopes: List[str] = []
+        self.cookies: List[dict] = []
+        self.calls: int = 0
+
+    @property
+    def page_source(self) -> str:
+        return self.pages.get(self.current_url, '<html><body></body></html>')
+
+    def get(self, url: str):
+        self.calls += 1
+        self.current_url = url
+
+    def implicitly_wait(self, time_to_wait: float):
+        pass
+
+    def set_script_timeout(self, time_to_wait: float):
+        pass
+
+    def find_element(self, by: str, value: str) -> FakeElement:
+        self.calls += 1
+        if value in self.missing:
+            raise NoSuchElementException(f'Element not found: {value}')
+        return FakeElement(self, by, value)
+
+    def find_elements(self, by: str, value: str) -> List[FakeElement]:
+        self.calls += 1
+        return [] if value in self.missing else [FakeElement(self, by, value)]
+
+    def execute_script(self, script: str, *args) -> Any:
+        self.calls += 1
+        if script == BULK_EXTRACT_JS:
+            return {
+                spec['name']: [spec['value']] if spec['multiple'] else spec['value']
+                for spec in args[0] if spec['value'] not in self.missing
+            }
+        return None
+
+    def execute_async_script(self, script: str, *args) -> Any:
+        self.calls += 1
+        return self.current_url
+
+    def save_screenshot(self, filename: str) -> bool:
+        with open(filename, 'wb') as file:
+            file.write(PNG_BYTES)
+        return True
+
+    def get_screenshot_as_png(self) -> bytes:
+        return PNG_BYTES
+
+    def get_full_page_screenshot_as_file(self, filename: str) -> bool:
+        return self.save_screenshot(filename)
+
+    def get_cookies(self) -> List[dict]:
+        return list(self.cookies)
+
+    def add_cookie(self, cookie: dict):
+        self.cookies.append(cookie)
+
+    def delete_all_cookies(self):
+        self.cookies.clear()
+
+    def close(self):
+        pass
+
+    def quit(self):
+        pass
+
+
+class FakeBot(Bot):
+    """
+    Bot driven by the fake driver, used to measure the fastbots overhead without a browser.
+    """
+
+    def __init__(self, pages: Optional[Dict[str, str]] = None, links: Optional[Dict[str, str]] = None) -> None:
+        super().__init__()
+
+        self._driver: FakeWebDriver = FakeWebDriver(pages=pages, links=links)
+        self._wait: AdaptiveWait = AdaptiveWait(driver=self._driver, timeout=config.SELENIUM_DEFAULT_WAIT)
+
+    def __load_preferences__(self) -> dict:
+        return {}
+
+    def __load_options__(self) -> None:
+        return None
+
+    def __load_driver__(self) -> FakeWebDriver:
+        return FakeWebDriver()
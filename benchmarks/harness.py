@@ -0,0 +1,177 @@
+import gc
+import sys
+import json
+import time
+import platform
+import statistics
+from pathlib import Path
+from datetime import datetime
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Optional, Set
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Timings of a benchmark, in seconds per operation.
+    """
+
+    name: str
+    group: str
+    rounds: int
+    operations: int
+    min: float
+    median: float
+    mean: float
+    p95: float
+    max: float
+
+    @property
+    def ops_per_second(self) -> float:
+        return 1 / self.median if self.median > 0 else float('inf')
+
+
+def measure(name: str, group: str, function: Callable[[], None], rounds: int = 20, operations: int = 1,
+            warmup: int = 2, setup: Optional[Callable[[], None]] = None) -> BenchmarkResult:
+    """
+    Measures a function, every round runs the function once and it's divided by the operations of the round.
+
+    Args:
+        name (str): The name of the benchmark.
+        group (str): The group of the benchmark, e.g. fake or firefox.
+        function (Callable[[], None]): The measured function.
+        rounds (int): The measured rounds.
+        operations (int): The operations executed by every call of the function.
+        warmup (int): The rounds executed before the measure.
+        setup (Callable[[], None] | None): Called before every round, not measured.
+
+    Returns:
+        BenchmarkResult: The timings per operation.
+    """
+    for _ in range(warmup):
+        if setup is not None:
+            setup()
+        function()
+
+    # the garbage collector is disabled, so the collections don't add noise to the rounds
+    timings: List[float] = []
+    gc_enabled: bool = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            if setup is not None:
+                setup()
+            gc.collect()
+            started: float = time.perf_counter()
+            function()
+            timings.append((time.perf_counter() - started) / operations)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    timings.sort()
+    return BenchmarkResult(
+        name=name, group=group, rounds=rounds, operations=operations,
+        min=timings[0], median=statistics.median(timings), mean=statistics.fmean(timings),
+        p95=timings[min(int(len(timings) * 0.95), len(timings) - 1)], max=timings[-1],
+    )
+
+
+def environment() -> Dict[str, str]:
+    """
+    Gets the environment of the run, stored with the results.
+
+    Returns:
+        Dict[str, str]: The fastbots version, the python version and the platform.
+    """
+    try:
+        from importlib.metadata import version
+        fastbots_version: str = version('fastbots')
+    except Exception:
+        # not installed, read the version of the sources
+        pyproject: str = (Path(__file__).parent.parent / 'pyproject.toml').read_text()
+        fastbots_version = next(
+            (line.split('=', 1)[1].strip().strip('"') for line in pyproject.splitlines() if line.startswith('version')),
+            'unknown'
+        )
+
+    return {
+        'fastbots': fastbots_version,
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'date': datetime.now().isoformat(timespec='seconds'),
+    }
+
+
+def save_results(results: List[BenchmarkResult], output_dir: Path) -> Path:
+    """
+    Saves the results in a JSON file, named by fastbots version and date.
+
+    Args:
+        results (List[BenchmarkResult]): The results.
+        output_dir (Path): The results folder.
+
+    Returns:
+        Path: The path of the results file.
+    """
+    env: Dict[str, str] = environment()
+    output_dir.mkdir(exist_ok=True, parents=True)
+
+    file_path: Path = output_dir / f'{env["fastbots"]}_{datetime.now().strftime("%Y-%m-%d_%H-%M-%S")}.json'
+    file_path.write_text(json.dumps({'environment': env, 'results': [asdict(result) for result in results]}, indent=2))
+    return file_path
+
+
+def load_results(file_path: Path) -> Dict[str, dict]:
+    """
+    Loads the results of a previous run.
+
+    Args:
+        file_path (Path): The path of the results file.
+
+    Returns:
+        Dict[str, dict]: The results, by group and name.
+    """
+    data: dict = json.loads(Path(file_path).read_text())
+    return {f'{result["group"]}/{result["name"]}': result for result in data['results']}
+
+
+def report(results: List[BenchmarkResult], baseline: Optional[Dict[str, dict]] = None, threshold: float = 0.1) -> str:
+    """
+    Formats the results as a table, with the change of the median against a baseline.
+    The benchmarks missing in the baseline are marked as new and the baseline benchmarks of the measured groups
+    that weren't run are listed as missing, so a renamed benchmark is never skipped silently.
+
+    Args:
+        results (List[BenchmarkResult]): The results.
+        baseline (Dict[str, dict] | None): The results of a previous run, by group and name.
+        threshold (float): The relative change of the median reported as regression.
+
+    Returns:
+        str: The table.
+    """
+    lines: List[str] = [f'{"benchmark":<45} {"median":>12} {"p95":>12} {"ops/s":>12} {"change":>10}']
+
+    for result in results:
+        change: str = ''
+        previous: Optional[dict] = None if baseline is None else baseline.get(f'{result.group}/{result.name}')
+        if previous is not None and previous['median'] > 0:
+            ratio: float = result.median / previous['median'] - 1
+            change = f'{ratio:+.1%}' + (' !' if ratio > threshold else '')
+        elif baseline is not None and previous is None:
+            change = 'new'
+
+        lines.append(
+            f'{result.group + "/" + result.name:<45} {result.median * 1e6:>10.1f}us {result.p95 * 1e6:>10.1f}us '
+            f'{result.ops_per_second:>12.1f} {change:>10}'
+        )
+
+    if baseline is not None:
+        groups: Set[str] = {result.group for result in results}
+        measured: Set[str] = {f'{result.group}/{result.name}' for result in results}
+        for key, previous in baseline.items():
+            if previous['group'] in groups and key not in measured:
+                lines.append(f'{key:<45} {"":>12} {"":>12} {"":>12} {"missing":>10}')
+
+    return '\n'.join(lines)
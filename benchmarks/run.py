@@ -0,0 +1,289 @@
+import os
+import shutil
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from selenium.webdriver.firefox.firefox_profile import FirefoxProfile
+
+from fastbots import config, Bot, Page, Task, BotPool
+from fastbots.locators import LocatorIndex
+from fastbots.profile_cache import FIREFOX_DEFAULT_PREFERENCES, ProfileCache, load_preferences
+
+from benchmarks.fake_driver import FakeBot
+from benchmarks.server import FIXTURES_DIR, FixtureServer
+from benchmarks.harness import BenchmarkResult, load_results, measure, report, save_results
+
+
+# base url of the fake pages, never requested
+FAKE_BASE_URL: str = 'http://fixtures.local/'
+
+# results folder, a file for every run
+RESULTS_DIR: Path = Path(__file__).parent / 'results'
+
+LOCATORS_TEMPLATE: str = """
+[pages_url]
+start_url={base_url}search.html
+search_page={base_url}search.html
+product_page={base_url}product.html
+
+[search_page]
+search_locator=(By.ID, "search")
+product_locator=(By.CSS_SELECTOR, "a.product")
+
+[product_page]
+title_locator=(By.ID, "title")
+price_locator=(By.ID, "price")
+description_locator=(By.ID, "description")
+download_locator=(By.ID, "download")
+"""
+
+
+class SearchPage(Page):
+
+    def __init__(self, bot: Bot) -> None:
+        super().__init__(bot=bot, page_name='search_page')
+
+    def forward(self) -> 'ProductPage':
+        self.bot.driver.find_element(*self.__locator__('product_locator')).click()
+        return ProductPage(bot=self.bot)
+
+
+class ProductPage(Page):
+
+    def __init__(self, bot: Bot) -> None:
+        super().__init__(bot=bot, page_name='product_page', strict_page_check=False)
+
+    def forward(self) -> None:
+        self.bot.payload.output_data.update(self.extract(['title_locator', 'price_locator', 'description_locator']))
+        return None
+
+
+class BenchmarkTask(Task):
+
+    def run(self, bot: Bot) -> bool:
+        page: Optional[Page] = SearchPage(bot=bot)
+        while page is not None:
+            page = page.forward()
+        return True
+
+    def on_success(self, payload):
+        return payload.output_data
+
+    def on_failure(self, payload):
+        raise RuntimeError('The benchmark task failed.')
+
+
+class FakeBotPool(BotPool):
+
+    @staticmethod
+    def create_bot(driver_type: config.DriverType = config.BOT_DRIVER_TYPE) -> Bot:
+        return FakeBot(links={'a.product': f'{FAKE_BASE_URL}product.html?id=1'})
+
+
+def configure(work_dir: Path, base_url: str):
+    """
+    Points the locators, the downloads and the debug artifacts to the work folder, and disables the retries delay.
+    """
+    locators_path: Path = work_dir / f'locators_{abs(hash(base_url))}.ini'
+    locators_path.write_text(LOCATORS_TEMPLATE.format(base_url=base_url))
+
+    config.SELENIUM_LOCATORS_FILE = str(locators_path)
+    config.BOT_DOWNLOAD_FOLDER_PATH = str(work_dir / 'downloads')
+    config.BOT_SCREENSHOT_DOWNLOAD_FOLDER_PATH = str(work_dir / 'debug')
+    config.BOT_HTML_DOWNLOAD_FOLDER_PATH = str(work_dir / 'debug')
+    config.BOT_RETRY_DELAY = 0
+    (work_dir / 'downloads').mkdir(exist_ok=True)
+
+
+def fake_benchmarks(work_dir: Path, rounds: int) -> List[BenchmarkResult]:
+    """
+    Measures the fastbots overhead with the in-process fake driver.
+    """
+    configure(work_dir, FAKE_BASE_URL)
+    group: str = 'fake'
+    results: List[BenchmarkResult] = []
+
+    results.append(measure('bot_startup', group, lambda: FakeBot().close(), rounds=rounds))
+
+    # cold: the file looks changed, it's parsed and compiled again; warm: the compiled index is reused
+    locators_path: Path = Path(config.SELENIUM_LOCATORS_FILE)
+
+    def touch_locators():
+        modified_time: int = locators_path.stat().st_mtime_ns + 1_000_000
+        os.utime(locators_path, ns=(modified_time, modified_time))
+    results.append(measure('locators_load_cold', group, lambda: LocatorIndex.load(str(locators_path)),
+                           rounds=rounds, setup=touch_locators))
+
+    def locators_load_warm():
+        for _ in range(1000):
+            LocatorIndex.load(str(locators_path))
+    results.append(measure('locators_load_warm', group, locators_load_warm, rounds=rounds, operations=1000))
+
+    # the Firefox profile of a launch: zipped and encoded by selenium, or the user.js of the preferences cache
+    preferences: Dict = FIREFOX_DEFAULT_PREFERENCES | load_preferences(config.BOT_PREFERENCES_FILE_PATH)
+    profile_cache: ProfileCache = ProfileCache(str(work_dir / 'profiles'))
+
+    def firefox_profile_encoded():
+        firefox_profile: FirefoxProfile = FirefoxProfile()
+        for key, value in preferences.items():
+            firefox_profile.set_preference(key, value)
+        firefox_profile.set_preference('browser.download.dir', str(work_dir / 'downloads'))
+        firefox_profile.encoded
+        shutil.rmtree(firefox_profile.path, ignore_errors=True)
+    results.append(measure('firefox_profile_encoded', group, firefox_profile_encoded, rounds=rounds))
+
+    def firefox_profile_cached():
+        shutil.rmtree(profile_cache.clone(preferences, {'browser.download.dir': str(work_dir / 'downloads')}))
+    results.append(measure('firefox_profile_cached', group, firefox_profile_cached, rounds=rounds))
+
+    bot: FakeBot = FakeBotPool.create_bot()
+    try:
+        bot.open()
+
+        def locator_resolution():
+            for _ in range(1000):
+                bot.compiled_locator('product_page', 'title_locator')
+        results.append(measure('locator_resolution', group, locator_resolution, rounds=rounds, operations=1000))
+
+        search_url: str = f'{FAKE_BASE_URL}search.html'
+
+        def url_check():
+            for _ in range(100):
+                bot.check_page_url(search_url)
+        results.append(measure('url_check', group, url_check, rounds=rounds, operations=100))
+
+        def page_transition():
+            page: Optional[Page] = SearchPage(bot=bot)
+            while page is not None:
+                page = page.forward()
+        results.append(measure('page_transition', group, page_transition, rounds=rounds,
+                               setup=lambda: bot.driver.get(search_url)))
+
+        download_path: Path = Path(bot._temp_dir) / 'report.txt'
+
+        def download_wait():
+            download_path.write_bytes(b'fastbots benchmark download\n')
+            bot.wait_downloaded_file_path('txt')
+        results.append(measure('download_wait', group, download_wait, rounds=rounds))
+
+        def failure_artifacts():
+            bot.save_html()
+            bot.save_screenshot()
+        results.append(measure('failure_artifacts', group, failure_artifacts, rounds=rounds))
+    finally:
+        bot.close()
+
+    with FakeBotPool(size=1) as bot_pool:
+        task: BenchmarkTask = BenchmarkTask(bot_pool=bot_pool)
+
+        def task_call():
+            for _ in range(10):
+                task()
+        results.append(measure('task_call', group, task_call, rounds=rounds, operations=10))
+
+    return results
+
+
+def browser_benchmarks(work_dir: Path, rounds: int, driver_type: config.DriverType) -> List[BenchmarkResult]:
+    """
+    Measures a headless browser driving the fixture sites served by the local server.
+    """
+    group: str = driver_type.name.lower()
+    results: List[BenchmarkResult] = []
+
+    if config.BOT_ARGUMENTS == 'None':
+        config.BOT_ARGUMENTS = '--headless'
+
+    with FixtureServer(FIXTURES_DIR) as server:
+        configure(work_dir, server.url())
+
+        results.append(measure('driver_startup', group, lambda: BotPool.create_bot(driver_type).close(),
+                               rounds=rounds, warmup=1))
+
+        if driver_type == config.DriverType.FIREFOX and config.BOT_PROFILE_CACHE:
+            # the same launch with the profile zipped and sent by selenium
+            config.BOT_PROFILE_CACHE = False
+            try:
+                results.append(measure('driver_startup_uncached_profile', group,
+                                       lambda: BotPool.create_bot(driver_type).close(), rounds=rounds, warmup=1))
+            finally:
+                config.BOT_PROFILE_CACHE = True
+
+        bot: Bot = BotPool.create_bot(driver_type)
+        try:
+            bot.open()
+            search_url: str = server.url('search.html')
+            product_url: str = server.url('product.html')
+
+            results.append(measure('start_url_load', group, lambda: bot.driver.get(search_url), rounds=rounds))
+
+            def url_check():
+                for _ in range(10):
+                    bot.check_page_url(search_url)
+            results.append(measure('url_check', group, url_check, rounds=rounds, operations=10,
+                                   setup=lambda: bot.driver.get(search_url)))
+
+            def page_transition():
+                page: Optional[Page] = SearchPage(bot=bot)
+                while page is not None:
+                    page = page.forward()
+            results.append(measure('page_transition', group, page_transition, rounds=rounds,
+                                   setup=lambda: bot.driver.get(search_url)))
+
+            def download_wait():
+                bot.driver.find_element(*bot.compiled_locator('product_page', 'download_locator')).click()
+                bot.wait_downloaded_file_path('txt')
+            results.append(measure('download_wait', group, download_wait, rounds=rounds,
+                                   setup=lambda: bot.driver.get(product_url)))
+
+            def failure_artifacts():
+                bot.save_html()
+                bot.save_screenshot()
+            results.append(measure('failure_artifacts', group, failure_artifacts, rounds=rounds))
+        finally:
+            bot.close()
+
+        with BotPool(size=1, driver_type=driver_type) as bot_pool:
+            task: BenchmarkTask = BenchmarkTask(bot_pool=bot_pool)
+            results.append(measure('task_call', group, lambda: task(), rounds=rounds, warmup=1))
+
+    return results
+
+
+def main(args: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description='Offline benchmarks of the fastbots hot paths.')
+    parser.add_argument('--browser', choices=['none', 'firefox', 'chrome', 'all'], default='none',
+                        help='measure also a headless browser on the local fixture server')
+    parser.add_argument('--rounds', type=int, default=20, help='measured rounds of the fake driver benchmarks')
+    parser.add_argument('--browser-rounds', type=int, default=5, help='measured rounds of the browser benchmarks')
+    parser.add_argument('--output', type=Path, default=RESULTS_DIR, help='folder of the results files')
+    parser.add_argument('--compare', type=Path, default=None, help='results file of a previous run, to report the changes')
+    parser.add_argument('--no-save', action='store_true', help="don't save the results")
+    options = parser.parse_args(args)
+
+    logging.disable(logging.WARNING)
+
+    drivers: Dict[str, List[config.DriverType]] = {
+        'none': [], 'firefox': [config.DriverType.FIREFOX], 'chrome': [config.DriverType.CHROME],
+        'all': [config.DriverType.FIREFOX, config.DriverType.CHROME],
+    }
+
+    work_dir: Path = Path(tempfile.mkdtemp(prefix='fastbots-benchmarks-'))
+    try:
+        results: List[BenchmarkResult] = fake_benchmarks(work_dir, options.rounds)
+        for driver_type in drivers[options.browser]:
+            results.extend(browser_benchmarks(work_dir, options.browser_rounds, driver_type))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print(report(results, None if options.compare is None else load_results(options.compare)))
+
+    if not options.no_save:
+        print(f'\nResults saved in: {save_results(results, options.output)}')
+
+
+if __name__ == '__main__':
+    main()
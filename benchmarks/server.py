@@ -0,0 +1,79 @@
+import threading
+from pathlib import Path
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+
+# static pages served by the benchmarks, no network is needed
+FIXTURES_DIR: Path = Path(__file__).parent / 'fixtures'
+
+
+class FixtureRequestHandler(SimpleHTTPRequestHandler):
+    """
+    Serves the fixture files, the files under /download/ are sent as attachments so the browsers download them.
+    """
+
+    def translate_path(self, path: str) -> str:
+        if path.startswith('/download/'):
+            path = path[len('/download'):]
+        return super().translate_path(path)
+
+    def end_headers(self):
+        if self.path.startswith('/download/'):
+            self.send_header('Content-Disposition', f'attachment; filename="{Path(self.path).name}"')
+        self.send_header('Cache-Control', 'no-store')
+        super().end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FixtureServer(object):
+    """
+    Fixture Server
+
+    Local HTTP server of the fixture sites, started on a free port of the loopback interface.
+
+    Attributes:
+        _server (ThreadingHTTPServer): The HTTP server.
+        _thread (threading.Thread): The thread serving the requests.
+
+    Methods:
+        url(path: str) -> str: Gets the url of a fixture file.
+
+    Example:
+        ```python
+        with FixtureServer() as server:
+            bot.driver.get(server.url('search.html'))
+        ```
+    """
+
+    def __init__(self, directory: Path = FIXTURES_DIR) -> None:
+        super().__init__()
+
+        self._server: ThreadingHTTPServer = ThreadingHTTPServer(
+            ('127.0.0.1', 0), partial(FixtureRequestHandler, directory=str(directory))
+        )
+        self._thread: threading.Thread = threading.Thread(target=self._server.serve_forever, name='fixture-server', daemon=True)
+
+    def __enter__(self) -> 'FixtureServer':
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def url(self, path: str = '') -> str:
+        """
+        Gets the url of a fixture file.
+
+        Args:
+            path (str): The path of the file, relative to the fixtures folder.
+
+        Returns:
+            str: The url.
+        """
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}/{path.lstrip("/")}'
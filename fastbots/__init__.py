@@ -14,6 +14,11 @@ from langchain_core.pydantic_v1 import BaseModel, Field
 
 from fastbots.bot import Bot
 from fastbots.page import Page
+from fastbots.bot_pool import BotPool
 from fastbots.task import Task
+from fastbots.retry_policy import RetryPolicy
+from fastbots.task_runner import TaskRunner, TaskRun, TaskRunnerReport
+from fastbots.batch_runner import BatchRunner, BatchReport
 from fastbots.payload import Payload
+from fastbots.sinks import Sink, create_sink
 from fastbots.llm_extractor import LLMExtractor
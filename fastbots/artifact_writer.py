@@ -0,0 +1,271 @@
+import re
+import gzip
+import uuid
+import queue
+import atexit
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from fastbots import config
+
+
+logger = logging.getLogger(__name__)
+
+# shared writers of the process, by artifact folders
+_writers: Dict[Tuple[str, str], 'ArtifactWriter'] = {}
+_writers_lock: threading.Lock = threading.Lock()
+
+# marks the end of the artifacts in the writer queue
+_CLOSE: object = object()
+
+# max content hashes of the written files kept for the dedupe, the oldest are forgotten
+MAX_WRITTEN_FILES: int = 1024
+
+
+def error_signature(error: BaseException) -> str:
+    """
+    Gets the signature of an error, the errors of the same kind share it: the type and the first line of the message,
+    without the numbers (ids, ports, timings) and the hex values (session ids).
+
+    Args:
+        error (BaseException): The error.
+
+    Returns:
+        str: The error signature.
+    """
+    message: str = (str(error).strip().splitlines() or [''])[0]
+    message = re.sub(r'0x[0-9a-fA-F]+|[0-9a-fA-F]{16,}|\d+', '#', message)
+    return f'{type(error).__name__}: {message[:200]}'
+
+
+def artifact_name(task_name: str, attempt: int) -> str:
+    """
+    Gets a collision free name of the artifacts of an attempt, the parallel workers never overwrite each other.
+
+    Args:
+        task_name (str): The name of the task.
+        attempt (int): The attempt number.
+
+    Returns:
+        str: The file name, without the extension.
+    """
+    return f'{re.sub(r"[^A-Za-z0-9_.-]", "_", task_name)}_{attempt}_{uuid.uuid4().hex}'
+
+
+class ArtifactWriter(object):
+    """
+    Artifact Writer
+
+    Saves the debug artifacts of the failed attempts (the HTML page, gzipped, and a screenshot) on a background thread,
+    so an outage of a site doesn't stall every worker on the disk. The capture and the content hashing run on
+    the task thread, the compression and the writes run on the writer thread.
+    The artifacts have collision free names (task, attempt and a random id), an artifact identical to a file already
+    written (by content hash) reuses it and the artifacts of an error signature are capped, so a failing site
+    doesn't fill the disk.
+    When the writer queue is full the artifacts are dropped, the workers never wait.
+
+    Attributes:
+        _html_folder (str): The folder of the HTML pages.
+        _screenshot_folder (str): The folder of the screenshots.
+        _max_per_error (int): The max artifacts captured for an error signature.
+        _queue (queue.Queue): The artifacts not written yet.
+
+    Methods:
+        __init__(html_folder: str, screenshot_folder: str, max_per_error: int, queue_size: int):
+            Initializes the ArtifactWriter instance.
+        shared() -> ArtifactWriter: Gets the writer of the process for the configured folders.
+        capture(bot: Bot, task_name: str, attempt: int, error: BaseException) -> Dict[str, str]:
+            Captures the artifacts of a failed attempt.
+        flush(): Waits until all the queued artifacts are written.
+        close(): Writes the queued artifacts and stops the writer thread.
+
+    Example:
+        ```python
+        paths = ArtifactWriter.shared().capture(bot, 'MyTask', 1, error)
+        ```
+    """
+
+    def __init__(self, html_folder: str = config.BOT_HTML_DOWNLOAD_FOLDER_PATH,
+                 screenshot_folder: str = config.BOT_SCREENSHOT_DOWNLOAD_FOLDER_PATH,
+                 max_per_error: int = config.BOT_ARTIFACTS_MAX_PER_ERROR,
+                 queue_size: int = config.BOT_ARTIFACTS_QUEUE_SIZE) -> None:
+        """
+        Initializes the ArtifactWriter instance and starts the writer thread.
+
+        Args:
+            html_folder (str): The folder of the HTML pages.
+            screenshot_folder (str): The folder of the screenshots.
+            max_per_error (int): The max artifacts captured for an error signature.
+            queue_size (int): The max artifacts queued, the new ones are dropped when it's full.
+        """
+        super().__init__()
+
+        self._html_folder: str = html_folder
+        self._screenshot_folder: str = screenshot_folder
+        self._max_per_error: int = max(max_per_error, 0)
+        self._queue: queue.Queue = queue.Queue(maxsize=max(queue_size, 1))
+        self._lock: threading.Lock = threading.Lock()
+        self._closed: bool = False
+
+        # artifacts captured by error signature, written files by content hash (the most recent ones)
+        self._captured: Dict[str, int] = {}
+        self._files: OrderedDict[str, str] = OrderedDict()
+
+        self._thread: threading.Thread = threading.Thread(target=self.__run__, name='artifact-writer', daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def shared(cls) -> 'ArtifactWriter':
+        """
+        Gets the writer of the process for the configured folders, created at the first usage.
+
+        Returns:
+            ArtifactWriter: The shared writer instance.
+        """
+        key: Tuple[str, str] = (
+            str(Path(config.BOT_HTML_DOWNLOAD_FOLDER_PATH).absolute()),
+            str(Path(config.BOT_SCREENSHOT_DOWNLOAD_FOLDER_PATH).absolute()),
+        )
+
+        with _writers_lock:
+            if key not in _writers:
+                _writers[key] = cls(
+                    html_folder=config.BOT_HTML_DOWNLOAD_FOLDER_PATH,
+                    screenshot_folder=config.BOT_SCREENSHOT_DOWNLOAD_FOLDER_PATH,
+                    max_per_error=config.BOT_ARTIFACTS_MAX_PER_ERROR,
+                    queue_size=config.BOT_ARTIFACTS_QUEUE_SIZE,
+                )
+            return _writers[key]
+
+    def capture(self, bot: Any, task_name: str, attempt: int, error: BaseException) -> Dict[str, str]:
+        """
+        Captures the artifacts of a failed attempt: the HTML page and a screenshot of the viewport
+        are read from the driver and queued, they are written by the writer thread.
+
+        Args:
+            bot (Bot): The bot of the failed attempt.
+            task_name (str): The name of the task.
+            attempt (int): The attempt number.
+            error (BaseException): The error of the attempt.
+
+        Returns:
+            Dict[str, str]: The paths of the artifacts ('html_path', 'screenshot_path'), empty if the signature
+                of the error reached its cap or the queue is full.
+        """
+        signature: str = error_signature(error)
+
+        with self._lock:
+            if self._closed or self._captured.get(signature, 0) >= self._max_per_error:
+                return {}
+            self._captured[signature] = self._captured.get(signature, 0) + 1
+
+        name: str = artifact_name(task_name, attempt)
+        paths: Dict[str, str] = {}
+
+        # the driver isn't thread safe, it's read on the task thread
+        for key, folder, file_name, read in (
+            ('html_path', self._html_folder, f'{name}.html.gz', lambda: bot.driver.page_source.encode('utf-8')),
+            ('screenshot_path', self._screenshot_folder, f'{name}.png', lambda: bot.driver.get_screenshot_as_png()),
+        ):
+            try:
+                content: bytes = read()
+            except Exception as e:
+                logger.warning(f'Artifact not captured ({key}): {e}')
+                continue
+
+            path: Optional[str] = self.__enqueue__(str((Path(folder) / file_name).absolute()), content)
+            if path is not None:
+                paths[key] = path
+
+        return paths
+
+    def flush(self):
+        """
+        Waits until all the queued artifacts are written.
+        """
+        self._queue.join()
+
+    def close(self):
+        """
+        Writes the queued artifacts and stops the writer thread.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        self._queue.put(_CLOSE)
+        self._thread.join()
+
+    def __enqueue__(self, path: str, content: bytes) -> Optional[str]:
+        """
+        Queues an artifact, an identical file already written is reused.
+
+        Args:
+            path (str): The path of the artifact file.
+            content (bytes): The content of the artifact, not compressed.
+
+        Returns:
+            str | None: The path of the artifact file, None if it's dropped.
+        """
+        digest: str = hashlib.sha256(content).hexdigest()
+
+        with self._lock:
+            written_path: Optional[str] = self._files.get(digest)
+            if written_path is not None and Path(written_path).is_file():
+                self._files.move_to_end(digest)
+                return written_path
+
+        try:
+            self._queue.put_nowait((path, digest, content))
+        except queue.Full:
+            logger.warning(f'Artifact writer queue full, artifact dropped: {Path(path).name}')
+            return None
+
+        return path
+
+    def __run__(self):
+        """
+        Writes the queued artifacts, until the writer is closed.
+        """
+        while True:
+            item: Any = self._queue.get()
+
+            try:
+                if item is _CLOSE:
+                    return
+
+                path, digest, content = item
+                Path(path).parent.mkdir(exist_ok=True, parents=True)
+                if path.endswith('.gz'):
+                    content = gzip.compress(content)
+                with open(path, 'wb') as file:
+                    file.write(content)
+
+                # only the written files are reused
+                with self._lock:
+                    self._files[digest] = path
+                    self._files.move_to_end(digest)
+                    while len(self._files) > MAX_WRITTEN_FILES:
+                        self._files.popitem(last=False)
+            except Exception as e:
+                logger.error(f'Artifact not written: {e}')
+            finally:
+                self._queue.task_done()
+
+
+@atexit.register
+def close_shared_writers():
+    """
+    Closes the shared writers, the queued artifacts are written.
+    """
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+
+    for writer in writers:
+        writer.close()
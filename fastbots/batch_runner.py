@@ -0,0 +1,175 @@
+import csv
+import json
+import time
+import logging
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, Union
+
+from fastbots import config
+from fastbots.task import Task
+from fastbots.bot_pool import BotPool
+from fastbots.sinks import Sink, create_sink
+from fastbots.task_runner import TaskRun, __execute_task__
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchReport:
+    """
+    BatchReport class for managing the counters of a batch execution, the records outcomes are in the output file.
+    """
+
+    output_path: str
+    total: int = 0
+    succeeded: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def failed(self) -> int:
+        """
+        Gets the number of failed records.
+
+        Returns:
+            int: The failed records count.
+        """
+        return self.total - self.succeeded
+
+    @property
+    def throughput(self) -> float:
+        """
+        Gets the number of completed records per second.
+
+        Returns:
+            float: The records per second.
+        """
+        if self.elapsed <= 0:
+            return 0.0
+        return self.total / self.elapsed
+
+
+def read_records(source: Union[str, Path, Iterable[Dict[str, Any]]]) -> Iterator[Dict[str, Any]]:
+    """
+    Reads the input records lazily, a record at a time.
+
+    Args:
+        source (Union[str, Path, Iterable[Dict[str, Any]]]): A CSV file (a record per row, by header),
+            a JSONL file (a JSON object per line) or an iterable of records.
+
+    Yields:
+        Dict[str, Any]: The input records.
+
+    Raises:
+        ValueError: If the file format is unknown.
+    """
+    if not isinstance(source, (str, Path)):
+        yield from source
+        return
+
+    path: Path = Path(source)
+    suffix: str = path.suffix.lower()
+
+    if suffix == '.csv':
+        with open(path, 'r', encoding='utf-8-sig', newline='') as file:
+            yield from csv.DictReader(file)
+    elif suffix in ('.jsonl', '.ndjson'):
+        with open(path, 'r', encoding='utf-8') as file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        raise ValueError(f'Unknown records file format: {path.name}, expected a .csv or .jsonl file')
+
+
+class BatchRunner(object):
+    """
+    Batch Runner
+
+    Executes a task over a feed of input records with one long-lived bot: the records are read lazily,
+    the bot state and the payload are reset between the records, and the outcome of every record is
+    written to an output sink (JSONL, CSV, SQLite or Parquet, by file extension) as soon as it's completed.
+    So the memory stays flat whatever the input size.
+    The failures of a record don't stop the batch: the task keeps its retry logic and its hooks,
+    a bot with a broken driver is replaced by a new one.
+
+    Attributes:
+        _task (Task): The task executed for every record.
+        _output_path (str): The path of the output file.
+        _driver_type (config.DriverType): The type of the bot.
+
+    Methods:
+        __init__(task: Task, output_path: str, driver_type: config.DriverType): Initializes the BatchRunner instance.
+        run(records: Union[str, Path, Iterable[Dict[str, Any]]]) -> BatchReport: Executes the task for every record.
+
+    Example:
+        ```python
+        report = BatchRunner(MyTask(), output_path='products.jsonl').run('products.csv')
+        print(report.succeeded, report.failed, report.throughput)
+        ```
+    """
+
+    def __init__(self, task: Task, output_path: str = config.BOT_BATCH_OUTPUT_FILE_PATH,
+                 driver_type: config.DriverType = config.BOT_DRIVER_TYPE) -> None:
+        """
+        Initializes the BatchRunner instance.
+
+        Args:
+            task (Task): The task executed for every record.
+            output_path (str): The path of the output file, the outcomes are appended (the Parquet file is replaced).
+            driver_type (config.DriverType): The type of the bot.
+        """
+        super().__init__()
+
+        self._task: Task = task
+        self._output_path: str = output_path
+        self._driver_type: config.DriverType = driver_type
+
+    def run(self, records: Union[str, Path, Iterable[Dict[str, Any]]]) -> BatchReport:
+        """
+        Executes the task for every record, with one long-lived bot.
+
+        Args:
+            records (Union[str, Path, Iterable[Dict[str, Any]]]): A CSV file, a JSONL file or an iterable of records.
+
+        Returns:
+            BatchReport: The counters of the execution.
+        """
+        start_time: float = time.time()
+        report: BatchReport = BatchReport(output_path=str(Path(self._output_path).absolute()))
+
+        with BotPool(size=1, driver_type=self._driver_type) as bot_pool, create_sink(self._output_path) as sink:
+            for index, input_data in enumerate(read_records(records)):
+                task_run: TaskRun = __execute_task__(self._task, input_data, bot_pool)
+                self.__write__(sink, index, task_run)
+
+                report.total += 1
+                if task_run.result:
+                    report.succeeded += 1
+
+        report.elapsed = time.time() - start_time
+        logger.info(f'Executed {report.total} records in {report.elapsed:.2f}s, succeeded: {report.succeeded}, '
+                    f'failed: {report.failed}, throughput: {report.throughput:.2f} records/s')
+        return report
+
+    def __write__(self, sink: Sink, index: int, task_run: TaskRun):
+        """
+        Writes the outcome of a record to the output sink.
+
+        Args:
+            sink (Sink): The output sink.
+            index (int): The index of the record in the input.
+            task_run (TaskRun): The outcome of the record.
+        """
+        payload = task_run.payload
+        sink.write({
+            'index': index,
+            'input_data': task_run.input_data,
+            'result': task_run.result,
+            'output_data': payload.output_data if payload is not None else None,
+            'downloads': payload.downloads if payload is not None else [],
+            'output': task_run.output,
+            'error': task_run.error,
+            'elapsed': task_run.elapsed,
+        })
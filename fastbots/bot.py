@@ -1,10 +1,11 @@
 import tempfile
 import shutil
 import pickle
-from typing import List, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
 from pathlib import Path
+import uuid
 from datetime import datetime
-from configparser import ConfigParser
 import logging
 import time
 from typing import Type
@@ -13,15 +14,26 @@ from abc import ABC, abstractmethod
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.firefox_profile import FirefoxProfile
-from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
 import capsolver
 
 from fastbots import config, logger
 from fastbots.payload import Payload
-from fastbots.exceptions import ExpectedUrlError, DownloadFileError
+from fastbots.locators import LocatorIndex
+from fastbots.download_watcher import DownloadWatcher
+from fastbots.wait import AdaptiveWait
+from fastbots.scripts import BULK_EXTRACT_JS, READ_WEB_STORAGE_JS, WRITE_WEB_STORAGE_JS
+from fastbots.exceptions import ExpectedUrlError, DownloadFileError, ResponseTimeoutError
+from fastbots.tracing import span, traced
+from fastbots.request_blocker import RequestBlocker
+from fastbots.capture_recorder import CaptureRecorder
+from fastbots.response_harvester import ResponseHarvester
+from fastbots.http_session import HTTPSession
+from fastbots.session_store import SessionState, SessionStore
+from fastbots.checkpoint_store import Checkpoint, CheckpointStore, class_path, load_class
+from fastbots.sinks import Sink, shared_sink
 
 
 logger = logging.getLogger(__name__)
@@ -34,22 +46,56 @@ class Bot(ABC):
     Attributes:
         _temp_dir (str): A temporary directory for storing files during the bot's operation.
         _download_dir (str): The directory where downloaded files are stored.
-        _locators (ConfigParser): Configuration parser for managing locators.
+        _download_watcher (DownloadWatcher): Tracks the downloads in the temporary directory.
+        _locators (LocatorIndex): The compiled locators, shared by all the bots of the process.
         _payload (Payload): Datastore for the bot.
+        _request_blocker (RequestBlocker | None): Blocks the configured requests in the driver proxy.
+        _capture_recorder (CaptureRecorder | None): Streams the captured traffic, when the streaming capture is enabled.
+        _response_harvester (ResponseHarvester | None): Hands back the JSON responses, installed at the first usage.
+        _http_session (HTTPSession | None): The HTTP session of the current job, closed when the job ends.
+        _session_identity (str): The identity of the stored sessions, e.g. the account name.
+        _session_restored (bool): True if a stored session was restored by the current job.
+        _checkpoint_key (str | None): The key of the page chain checkpoints of the current job, None -> disabled.
+        _sink (Sink | None): The sink of the emitted records, loaded at the first usage.
 
     Methods:
         __init__(): Initializes the Bot instance.
         __enter__(): Enters a context and loads/configures resources.
         __exit__(): Exits a context and cleans up resources.
+        open(): Configures the driver and loads the start page.
+        finish(): Ends the current job without closing the driver.
+        reset(): Resets the browser state, so that the driver can be reused.
+        close(): Ends the current job and quits the driver.
+        captured_entries() -> List[Dict[str, Any]]: Gets the last exchanges of the streaming capture.
+        http_session(refresh: bool = False) -> HTTPSession: Gets an HTTP client with the session of the driver.
+        emit(record: Dict[str, Any]): Writes a result record to the sink, without keeping it in memory.
+        wait_for_json(url_pattern: str, method: str | None = None, action: Callable[[], Any] | None = None, timeout: float) -> Any:
+            Waits for a JSON response of the url pattern and returns its decoded body.
+        iter_json(url_pattern: str, method: str | None = None, action: Callable[[], Any] | None = None, timeout: float) -> Iterator[Any]:
+            Iterates over the decoded bodies of all the JSON responses of the url pattern.
         check_page_url(expected_page_url: str): Checks if the browser is on the expected page URL.
         locator(page_name: str, locator_name: str) -> str: Retrieves a locator for a given page.
-        wait_downloaded_file_path(file_extension: str, new_file_name: str | None = None) -> str:
+        compiled_locator(page_name: str, locator_name: str) -> tuple: Retrieves a compiled locator for a given page.
+        extract(locators: Dict[str, Tuple[str, str]], attributes: Dict[str, str] | None = None, multiple: Iterable[str] = ()) -> Dict[str, Any]:
+            Extracts the text or attributes of many elements in a single driver call.
+        wait_downloaded_file_path(file_extension: str, new_file_name: str | None = None, file_name: str | None = None) -> str:
             Waits for a specific downloaded file and returns its path.
+        wait_downloaded_files_paths() -> List[str]: Waits for all the downloads in progress and returns their paths.
         save_screenshot(): Saves a screenshot of the browser.
         save_html(): Saves the HTML page of the browser.
         save_cookies(): Saves all the cookies found in the browser.
         load_cookies(): Loads and adds cookies from a file.
-        __load_locators__() -> ConfigParser: Loads locators from a configuration file.
+        save_session(identity: str | None = None) -> SessionState: Stores the cookies and the web storage of the current site.
+        restore_session(url: str, identity: str | None = None) -> bool: Restores the stored session of a site.
+        forget_session(url: str | None = None, identity: str | None = None): Removes the stored session of a site.
+        checkpoint(page: Page) -> Checkpoint | None: Stores the checkpoint of the page chain, before the page.
+        resume(first_page: Callable[[Bot], Page]) -> Page: Gets the page of the last checkpoint, or the first page.
+        __release__(): Stops the download watcher and removes the temporary directories of a failed launch.
+        __load_locators__() -> LocatorIndex: Loads locators from a configuration file.
+        __load_seleniumwire_options__() -> Dict[str, Any]: Loads the options of the selenium-wire proxy.
+        __load_capture_recorder__() -> CaptureRecorder: Loads the recorder of the streaming capture.
+        __load_request_blocker__() -> RequestBlocker | None: Loads the blocker of the configured requests.
+        __load_response_harvester__() -> ResponseHarvester: Loads the harvester of the JSON responses.
         __load_preferences__() -> Union[FirefoxProfile, dict]:
             Load preferences that are stored in a JSON file specified in the configuration.
         __load_options__() -> Union[FirefoxOptions, ChromeOptions]: Loads default options.
@@ -69,6 +115,9 @@ class Bot(ABC):
 
         # use a temporary directory as the default download folder
         self._temp_dir: str = tempfile.mkdtemp()
+        # track the downloads in progress and completed in the temporary directory
+        self._download_watcher: DownloadWatcher = DownloadWatcher(self._temp_dir)
+        self._download_watcher.start()
 
         # official downloaded file folder
         if config.BOT_DOWNLOAD_FOLDER_PATH != 'None':
@@ -77,9 +126,28 @@ class Bot(ABC):
             self._download_dir: str = tempfile.mkdtemp()
 
         # load all the locators
-        self._locators: ConfigParser = self.__load_locators__()
+        try:
+            self._locators: LocatorIndex = self.__load_locators__()
+        except Exception:
+            self.__release__()
+            raise
         # data store
         self._payload: Payload = Payload()
+        # blocks the configured requests, installed when the bot is opened the first time
+        self._request_blocker: RequestBlocker | None = None
+        # streams the captured traffic, installed when the bot is opened the first time
+        self._capture_recorder: CaptureRecorder | None = None
+        # hands back the JSON responses, installed at the first usage
+        self._response_harvester: ResponseHarvester | None = None
+        # HTTP session of the current job, exported from the driver at the first usage
+        self._http_session: HTTPSession | None = None
+        # stored browser sessions, restored before the start page
+        self._session_identity: str = config.BOT_SESSION_IDENTITY
+        self._session_restored: bool = False
+        # page chain checkpoints, enabled by the task
+        self._checkpoint_key: Optional[str] = None
+        # results sink, shared by the bots of the process
+        self._sink: Optional[Sink] = None
 
         # add the api key if setted
         if config.CAPSOLVER_API_KEY != 'None':
@@ -96,15 +164,25 @@ class Bot(ABC):
         return self._driver
     
     @property
-    def wait(self) -> WebDriverWait:
+    def wait(self) -> AdaptiveWait:
         """
-        Gets the WebDriverWait instance used for waiting in the bot.
+        Gets the WebDriverWait instance used for waiting in the bot, it polls with an adaptive backoff.
 
         Returns:
-            WebDriverWait: The WebDriverWait instance.
+            AdaptiveWait: The WebDriverWait instance.
         """
         return self._wait
     
+    @property
+    def locators(self) -> LocatorIndex:
+        """
+        Gets the compiled locators index used by the bot.
+
+        Returns:
+            LocatorIndex: The compiled locators index.
+        """
+        return self._locators
+
     @property
     def payload(self) -> Payload:
         """
@@ -124,42 +202,276 @@ class Bot(ABC):
         Returns:
             Type['Bot']: The bot instance within the context.
         """
-        # add the url in scope, only used when the capture is enabled
-        if config.SELENIUM_IN_SCOPE_CAPTURE != 'None':
-            self._driver.scopes = config.SELENIUM_IN_SCOPE_CAPTURE.replace(' ', '').strip().split(',')
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        """
+        Exits a context and cleans up resources.
+
+        Flushes the emitted records, removes temporary directories and closes the driver.
+        """
+        self.close()
+
+    def open(self) -> Type['Bot']:
+        """
+        Configures the driver and loads the start page.
+
+        Sets up implicit wait and navigates to the start URL, it's used every time that a bot
+        starts a new job (context enter or lease from a pool).
+
+        Returns:
+            Type['Bot']: The bot instance.
+        """
+        with span('bot.open'):
+            # add the url in scope, only used when the capture is enabled, the streaming capture filters by itself
+            if config.SELENIUM_IN_SCOPE_CAPTURE != 'None' and not config.SELENIUM_CAPTURE_STREAM:
+                self._driver.scopes = config.SELENIUM_IN_SCOPE_CAPTURE.replace(' ', '').strip().split(',')
+
+            # stream the captured traffic, the recorder is installed once per driver
+            if config.SELENIUM_CAPTURE_STREAM and self._capture_recorder is None:
+                self._capture_recorder = self.__load_capture_recorder__()
+
+            # block the configured requests, the blocker is installed once per driver
+            if self._request_blocker is None:
+                self._request_blocker = self.__load_request_blocker__()
+
+            # default global driver settings
+            self._driver.implicitly_wait(config.SELENIUM_GLOBAL_IMPLICIT_WAIT)
 
-        # default global driver settings
-        self._driver.implicitly_wait(config.SELENIUM_GLOBAL_IMPLICIT_WAIT)
+            # load the start page, if it's setted
+            start_url: str = self.locator('pages_url', 'start_url')
 
-        # load the start page, if it's setted
-        start_url: str = self.locator('pages_url', 'start_url')
-        if start_url != 'None':
-            self._driver.get(start_url)
+            # restore the stored session first, so the start page is loaded logged in
+            if config.BOT_SESSION_STORE and start_url != 'None':
+                self._session_restored = self.restore_session(start_url)
+
+            if start_url != 'None':
+                with span('start_url.load', url=start_url):
+                    self._driver.get(start_url)
 
         return self
 
-    def __exit__(self, exc_type, exc_value, exc_tb):
+    def finish(self):
         """
-        Exits a context and cleans up resources.
+        Ends the current job without closing the driver.
 
-        Removes temporary directories and closes the driver.
+        Moves the remaining downloaded files (when the strict download wait is disabled) and
+        tracks the job time in the payload.
         """
         if not config.BOT_STRICT_DOWNLOAD_WAIT:
-            for temp_file in list(Path(self._temp_dir).glob(f'*.*')):
-                # if the file is not a firefox of chrome temporary file
-                if temp_file.suffix not in '.crdownload' and temp_file.suffix not in '.part':
-                    # destination file name
-                    downloaded_file_path = Path(self._download_dir) / temp_file.name
-                    # move to the download folder the file name
-                    destination: str = shutil.move(src=str(temp_file.absolute()), dst=str(downloaded_file_path.absolute()))
-                    self._payload.downloads.append(destination)
-                    self._payload.output_data['downloads_count'] = len(self._payload.downloads)
-                    # remove the file, don't raise exception if not exsit
-                    temp_file.unlink(missing_ok=True)
+            # the completed downloads, the temporary files of the browsers are excluded
+            for temp_file in self._download_watcher.pop_completed():
+                self.__move_downloaded_file__(temp_file)
+
+        if self._request_blocker is not None:
+            self._payload.output_data.update(self._request_blocker.counters())
 
+        if self._http_session is not None:
+            self._http_session.close()
+            self._http_session = None
+
+        # the emitted records of the job are on disk when it ends
+        if self._sink is not None:
+            self._sink.flush()
+
+        if self._capture_recorder is not None:
+            capture_path: str | None = self._capture_recorder.close()
+            if capture_path is not None:
+                self._payload.output_data['capture_path'] = capture_path
+
+        self._payload.output_data['eta'] = time.time()-self._start_time
+
+    @traced('bot.reset')
+    def reset(self):
+        """
+        Resets the browser state, so that the driver can be reused by another job.
+
+        Closes all the tabs except the first one, removes cookies and web storage,
+        empties the temporary download folder and starts a new payload.
+        """
+        # keep only the first tab opened
+        handles: List[str] = self._driver.window_handles
+        for handle in handles[1:]:
+            self._driver.switch_to.window(handle)
+            self._driver.close()
+        self._driver.switch_to.window(handles[0])
+
+        self._driver.delete_all_cookies()
+
+        try:
+            # the storage is bound to the current origin, blank pages doesn't have it
+            self._driver.execute_script('window.localStorage.clear(); window.sessionStorage.clear();')
+        except WebDriverException as e:
+            logger.debug(f'Web storage not cleared: {e}')
+
+        # remove the captured traffic of the previous job
+        if not config.SELENIUM_DISABLE_CAPTURE:
+            del self._driver.requests
+
+        # empty the temporary download folder
+        for temp_file in Path(self._temp_dir).iterdir():
+            if temp_file.is_dir():
+                shutil.rmtree(temp_file, ignore_errors=True)
+            else:
+                temp_file.unlink(missing_ok=True)
+        self._download_watcher.reset()
+
+        if self._request_blocker is not None:
+            self._request_blocker.reset()
+
+        if self._capture_recorder is not None:
+            self._capture_recorder.reset()
+
+        self._payload = Payload()
+        self._start_time = time.time()
+        self._session_restored = False
+        self._checkpoint_key = None
+
+    @traced('bot.close')
+    def close(self):
+        """
+        Ends the current job, removes the temporary directory and quits the driver.
+        """
+        self.finish()
+        self._download_watcher.stop()
         shutil.rmtree(self._temp_dir)
         self._driver.quit()
-        self._payload.output_data['eta'] = time.time()-self._start_time
+
+    def __release__(self):
+        """
+        Stops the download watcher and removes the temporary directories, used when the driver isn't launched,
+        so a failed launch doesn't leak them.
+        """
+        self._download_watcher.stop()
+        shutil.rmtree(self._temp_dir, ignore_errors=True)
+        if self._download_dir != config.BOT_DOWNLOAD_FOLDER_PATH:
+            shutil.rmtree(self._download_dir, ignore_errors=True)
+
+    def captured_entries(self) -> List[Dict[str, Any]]:
+        """
+        Gets the last exchanges of the streaming capture, the whole capture of the job is in the capture file.
+
+        Returns:
+            List[Dict[str, Any]]: The HAR entries kept in memory, empty if the streaming capture is disabled.
+        """
+        if self._capture_recorder is None:
+            return []
+        return self._capture_recorder.entries()
+
+    def emit(self, record: Dict[str, Any]):
+        """
+        Writes a result record to the sink, in the background and without keeping it in memory,
+        so the results of the long crawls survive a crash. The records are flushed when the job ends.
+
+        Args:
+            record (Dict[str, Any]): The record, a column per key.
+
+        Raises:
+            ValueError: If the sink is disabled in the settings.
+
+        Example:
+        ```python
+        for product in page.iter_json(r'/api/products'):
+            bot.emit(product)
+        ```
+        """
+        if self._sink is None:
+            if config.BOT_SINK_FILE_PATH == 'None':
+                raise ValueError('The sink is disabled, set the BOT_SINK_FILE_PATH setting.')
+            self._sink = shared_sink(config.BOT_SINK_FILE_PATH)
+
+        self._sink.write(record)
+        self._payload.output_data['records_emitted'] = self._payload.output_data.get('records_emitted', 0) + 1
+
+    def http_session(self, refresh: bool = False) -> HTTPSession:
+        """
+        Gets a pooled HTTP client with the session of the driver: cookies, user agent and proxy settings.
+
+        The plain GETs and the downloads after a browser login are faster without the browser, the downloaded
+        files are streamed into the download folder and tracked in the payload. The session is closed when the job ends.
+
+        Args:
+            refresh (bool): True -> loads again the cookies of the driver, e.g. after a new login.
+
+        Returns:
+            HTTPSession: The HTTP session of the current job.
+
+        Example:
+        ```python
+        invoices_paths = bot.http_session().download_many(invoices_urls)
+        ```
+        """
+        if self._http_session is None:
+            self._http_session = HTTPSession(
+                cookies=self._driver.get_cookies(), download_dir=self._download_dir, payload=self._payload
+            )
+        elif refresh:
+            self._http_session.set_cookies(self._driver.get_cookies())
+
+        return self._http_session
+
+    @traced('wait.json')
+    def wait_for_json(self, url_pattern: str, method: str | None = None, action: Callable[[], Any] | None = None,
+                      timeout: float = config.SELENIUM_DEFAULT_WAIT) -> Any:
+        """
+        Waits for a JSON response of the url pattern and returns its decoded body, without waiting for the DOM.
+
+        Only the responses received after the call are returned, so the request should be triggered by the action.
+
+        Args:
+            url_pattern (str): The url regular expression, searched in the request url.
+            method (str | None): The request method, None -> any method.
+            action (Callable[[], Any] | None): Called once the wait is registered, e.g. the click that loads the data.
+            timeout (float): The max seconds to wait.
+
+        Returns:
+            Any: The decoded JSON body.
+
+        Raises:
+            ResponseTimeoutError: If no JSON response matches before the timeout.
+
+        Example:
+        ```python
+        products = bot.wait_for_json(r'/api/products', action=lambda: bot.driver.get(search_url))
+        ```
+        """
+        with self.__load_response_harvester__().watch(url_pattern, method) as watch:
+            if action is not None:
+                action()
+            return watch.get(timeout)
+
+    def iter_json(self, url_pattern: str, method: str | None = None, action: Callable[[], Any] | None = None,
+                  timeout: float = config.SELENIUM_DEFAULT_WAIT) -> Iterator[Any]:
+        """
+        Iterates over the decoded bodies of all the JSON responses of the url pattern, while the page paginates.
+
+        The iteration ends when no new response matches before the timeout.
+
+        Args:
+            url_pattern (str): The url regular expression, searched in the request url.
+            method (str | None): The request method, None -> any method.
+            action (Callable[[], Any] | None): Called once the iteration is registered, e.g. the load of the first page.
+            timeout (float): The max seconds to wait for every response.
+
+        Yields:
+            Any: The decoded JSON bodies, in arrival order.
+
+        Example:
+        ```python
+        for products in bot.iter_json(r'/api/products\\?page=', action=lambda: bot.driver.get(search_url)):
+            bot.payload.output_data.setdefault('products', []).extend(products['items'])
+            bot.driver.find_element(By.ID, 'next').click()
+        ```
+        """
+        with self.__load_response_harvester__().watch(url_pattern, method) as watch:
+            if action is not None:
+                action()
+
+            while True:
+                try:
+                    yield watch.get(timeout)
+                except ResponseTimeoutError:
+                    return
 
     def check_page_url(self, expected_page_url: str, strict_page_check: bool = True):
         """
@@ -173,15 +485,10 @@ class Bot(ABC):
             ExpectedUrlError: If the browser is not on the expected page URL.
         """
 
-        # switch to contains in case of strict page check disabled
-        check_function = EC.url_to_be
-        if not strict_page_check:
-            check_function = EC.url_contains
-
         try:
-            # polling that the page URL is the expected
-            WebDriverWait(driver=self._driver, timeout=config.SELENIUM_EXPECTED_URL_TIMEOUT, poll_frequency=1).until(
-                check_function(expected_page_url)
+            # waiting that the page URL is the expected, with adaptive polling or navigation events
+            AdaptiveWait(driver=self._driver, timeout=config.SELENIUM_EXPECTED_URL_TIMEOUT).until_url(
+                expected_url=expected_page_url, strict_page_check=strict_page_check
             )
 
         except TimeoutException as te:
@@ -202,21 +509,71 @@ class Bot(ABC):
         Raises:
             ValueError: If the specified page_name or locator_name is not declared in locator's config.
         """
-        if not self._locators.has_section(page_name):
-            raise ValueError(f'The specified page_name: {page_name} is not declared in locators config.')
-        
-        if not self._locators.has_option(page_name, locator_name):
-            raise ValueError(f'The specified locator_name: {locator_name} is not declared in locators config.')
-        
-        return self._locators.get(page_name, locator_name)
-        
-    def wait_downloaded_file_path(self, file_extension: str, new_file_name: str | None = None) -> str:
+        return self._locators.value(page_name, locator_name)
+
+    def compiled_locator(self, page_name: str, locator_name: str) -> tuple:
+        """
+        Retrieves a compiled locator for a given page.
+
+        Args:
+            page_name (str): The name of the page.
+            locator_name (str): The name of the locator.
+
+        Returns:
+            tuple: The selenium locator, as (By, value).
+
+        Raises:
+            ValueError: If the specified page_name or locator_name is not declared in locator's config.
+        """
+        return self._locators.locator(page_name, locator_name)
+
+    def extract(self, locators: Dict[str, Tuple[str, str]], attributes: Dict[str, str] | None = None,
+                multiple: Iterable[str] = (), root: WebElement | None = None) -> Dict[str, Any]:
+        """
+        Extracts the text or attributes of many elements in a single driver call.
+
+        The missing elements are None, without waiting the implicit wait.
+
+        Args:
+            locators (Dict[str, Tuple[str, str]]): The selenium locators, as (By, value), by result name.
+            attributes (Dict[str, str] | None): The attribute read for every result name, 'text' by default.
+            multiple (Iterable[str]): The result names that collect all the matching elements, as a list.
+            root (WebElement | None): The element where the locators are searched, the whole page if None.
+
+        Returns:
+            Dict[str, Any]: The extracted values, by result name.
+
+        Example:
+        ```python
+        data = bot.extract({'title': (By.ID, 'title'), 'link': (By.CSS_SELECTOR, 'a.product')}, attributes={'link': 'href'})
+        ```
+        """
+        attributes = {} if attributes is None else attributes
+        multiple = set(multiple)
+
+        specs: List[Dict[str, Any]] = [
+            {
+                'name': name, 'by': by, 'value': value,
+                'attribute': attributes.get(name, 'text'), 'multiple': name in multiple
+            }
+            for name, (by, value) in locators.items()
+        ]
+
+        return self._driver.execute_script(BULK_EXTRACT_JS, specs, root)
+
+    @traced('download.wait')
+    def wait_downloaded_file_path(self, file_extension: str, new_file_name: str | None = None,
+                                  file_name: str | None = None) -> str:
         """
         Waits for a specific downloaded file and returns its path.
 
+        Every waited file is claimed, so concurrent downloads with the same extension are returned one by one,
+        in completion order.
+
         Args:
             file_extension (str): The file extension without the dot (e.g., "png" instead of ".png").
             new_file_name (str | None): The new file name if renaming is needed.
+            file_name (str | None): The name of the downloaded file (with extension), if None any name matches.
 
         Returns:
             str: The path of the downloaded file.
@@ -224,45 +581,55 @@ class Bot(ABC):
         Raises:
             DownloadFileError: If an error occurs during the file download.
         """
-        try:
-            # polling that the page URL is the expected, it uses the extension because the temp part file cache by browser
-            # usually have a specific extension that isn't the usually of the files
-            WebDriverWait(driver=self._driver, timeout=config.SELENIUM_FILE_DOWNLOAD_TIMEOUT, poll_frequency=1).until(
-                lambda driver: len(list(Path(self._temp_dir).glob(f'*.{file_extension}'))) == 1
-            )
+        # notified as soon as the browser temporary file is completed
+        downloaded_file: Path = self._download_watcher.wait_for(
+            file_name=file_name, file_extension=file_extension, timeout=config.SELENIUM_FILE_DOWNLOAD_TIMEOUT
+        )
 
-            # get the latest downloaded file
-            latest_file: Path = max(list(Path(self._temp_dir).glob(f'*.{file_extension}')), key=lambda x: x.stat().st_ctime)
+        if new_file_name is not None:
+            new_file_name = f'{new_file_name}.{file_extension}'
 
-            # build the download path based on renamed file or 
-            downloaded_file_path: Path = None
-            if new_file_name is None:
-                downloaded_file_path = Path(self._download_dir) / latest_file.name
-            else:
-                downloaded_file_path = Path(self._download_dir) / f'{new_file_name}.{file_extension}'
-                
-            # move to the download folder the file name
-            destination: str = shutil.move(src=str(latest_file.absolute()), dst=str(downloaded_file_path.absolute()))
-            self._payload.downloads.append(destination)
-            self._payload.output_data['downloads_count'] = len(self._payload.downloads)
-            # remove the file, don't raise exception if not exsit
-            latest_file.unlink(missing_ok=True)
-
-            # return the path and filename as string
-            return destination
+        return self.__move_downloaded_file__(downloaded_file, new_file_name)
 
-        except TimeoutException as te:
-            # if not the expected URL raises an exception
-            file_count: int = len(list(Path(self._temp_dir).glob(f'*.{file_extension}')))
+    @traced('download.wait_all')
+    def wait_downloaded_files_paths(self) -> List[str]:
+        """
+        Waits for all the downloads in progress and returns the paths of all the downloaded files.
 
-            # error string based on the specific error
-            if file_count == 0:
-                raise DownloadFileError('File not founded in the download folder, an error with the download occurs.')
-            elif file_count > 1:
-                raise DownloadFileError(f'Too many downloaded files founded, files number : {file_count}.')
+        Returns:
+            List[str]: The paths of the downloaded files.
 
-            raise DownloadFileError()
+        Raises:
+            DownloadFileError: If some download isn't completed before the timeout.
+        """
+        return [
+            self.__move_downloaded_file__(downloaded_file)
+            for downloaded_file in self._download_watcher.wait_all(timeout=config.SELENIUM_FILE_DOWNLOAD_TIMEOUT)
+        ]
+
+    def __move_downloaded_file__(self, downloaded_file: Path, new_file_name: str | None = None) -> str:
+        """
+        Moves a downloaded file to the download folder and tracks it in the payload.
 
+        Args:
+            downloaded_file (Path): The downloaded file in the temporary directory.
+            new_file_name (str | None): The new file name (with extension) if renaming is needed.
+
+        Returns:
+            str: The path of the moved file.
+        """
+        # build the download path based on renamed file or the original one
+        downloaded_file_path: Path = Path(self._download_dir) / (downloaded_file.name if new_file_name is None else new_file_name)
+
+        # move to the download folder the file name
+        destination: str = shutil.move(src=str(downloaded_file.absolute()), dst=str(downloaded_file_path.absolute()))
+        self._payload.downloads.append(destination)
+        self._payload.output_data['downloads_count'] = len(self._payload.downloads)
+
+        # return the path and filename as string
+        return destination
+
+    @traced('debug.screenshot')
     def save_screenshot(self) -> str:
         """
         Saves a screenshot of the browser.
@@ -276,11 +643,12 @@ class Bot(ABC):
         if not Path(config.BOT_SCREENSHOT_DOWNLOAD_FOLDER_PATH).exists():
             Path(config.BOT_SCREENSHOT_DOWNLOAD_FOLDER_PATH).mkdir(exist_ok=True, parents=True)
 
-        file_path: Path = Path(config.BOT_SCREENSHOT_DOWNLOAD_FOLDER_PATH) / f'{datetime.now().strftime("%Y-%m-%d_%H-%M-%S")}.png'
+        file_path: Path = Path(config.BOT_SCREENSHOT_DOWNLOAD_FOLDER_PATH) / f'{datetime.now().strftime("%Y-%m-%d_%H-%M-%S")}_{uuid.uuid4().hex[:8]}.png'
         self._driver.save_screenshot(str(file_path.absolute()))
         self._payload.output_data['screenshot_path'] = str(file_path.absolute())
         return str(file_path.absolute())
 
+    @traced('debug.html')
     def save_html(self) -> str:
         """
         Saves the HTML page of the browser.
@@ -294,7 +662,7 @@ class Bot(ABC):
         if not Path(config.BOT_HTML_DOWNLOAD_FOLDER_PATH).exists():
             Path(config.BOT_HTML_DOWNLOAD_FOLDER_PATH).mkdir(exist_ok=True, parents=True)
 
-        file_path: Path = Path(config.BOT_HTML_DOWNLOAD_FOLDER_PATH) / f'{datetime.now().strftime("%Y-%m-%d_%H-%M-%S")}.html'
+        file_path: Path = Path(config.BOT_HTML_DOWNLOAD_FOLDER_PATH) / f'{datetime.now().strftime("%Y-%m-%d_%H-%M-%S")}_{uuid.uuid4().hex[:8]}.html'
         with open(str(file_path.absolute()), "w", encoding="utf-8") as file:
             file.write(self._driver.page_source)
         self._payload.output_data['html_path'] = str(file_path.absolute())
@@ -334,12 +702,249 @@ class Bot(ABC):
                 for cookie in cookies:
                     self._driver.add_cookie(cookie)
 
-    def __load_locators__(self) -> ConfigParser:
+    @property
+    def session_identity(self) -> str:
+        """
+        Gets the identity of the stored sessions, e.g. the account name.
+
+        Returns:
+            str: The identity.
+        """
+        return self._session_identity
+
+    @session_identity.setter
+    def session_identity(self, identity: str):
+        """
+        Sets the identity of the stored sessions, before the bot is opened.
+
+        Args:
+            identity (str): The identity.
+        """
+        self._session_identity = identity
+
+    @property
+    def session_restored(self) -> bool:
+        """
+        Checks if a stored session was restored by the current job, so the login pages can be skipped.
+
+        Returns:
+            bool: True if the session was restored.
+        """
+        return self._session_restored
+
+    @traced('session.save')
+    def save_session(self, identity: Optional[str] = None, url: Optional[str] = None) -> SessionState:
+        """
+        Stores the cookies and the web storage of the current site, by identity and domain.
+
+        It's called after the login, the next runs restore the session before the start page is loaded.
+        The session is stored under the domain of the start url, the one looked up by the restore,
+        also when the login redirected the browser to another host.
+
+        Args:
+            identity (str | None): The identity, None -> the identity of the bot.
+            url (str | None): An url of the site, None -> the start url (the current url without a start url).
+
+        Returns:
+            SessionState: The stored session.
+
+        Example:
+        ```python
+        login_page.forward()
+        bot.save_session()
+        ```
+        """
+        try:
+            web_storage: Dict[str, Dict[str, str]] = self._driver.execute_script(READ_WEB_STORAGE_JS) or {}
+        except WebDriverException as e:
+            logger.debug(f'Web storage not saved: {e}')
+            web_storage = {}
+
+        state: SessionState = SessionState(
+            identity=identity or self._session_identity,
+            domain=self.__session_domain__(url),
+            cookies=self._driver.get_cookies(),
+            local_storage=web_storage.get('local_storage') or {},
+            session_storage=web_storage.get('session_storage') or {},
+        )
+        return SessionStore.shared(config.BOT_SESSION_STORE_FILE_PATH).save(state)
+
+    @traced('session.restore')
+    def restore_session(self, url: str, identity: Optional[str] = None) -> bool:
+        """
+        Restores the stored session of a site: the cookies and the web storage are set on a light page of its origin.
+
+        Args:
+            url (str): An url of the site.
+            identity (str | None): The identity, None -> the identity of the bot.
+
+        Returns:
+            bool: True if a stored session was restored.
+        """
+        session_store: SessionStore = SessionStore.shared(config.BOT_SESSION_STORE_FILE_PATH)
+        state: Optional[SessionState] = session_store.load(identity or self._session_identity, self.__session_domain__(url))
+        if state is None or not (state.cookies or state.local_storage or state.session_storage):
+            return False
+
+        self.__restore_cookies__(url, state.cookies)
+
+        if state.local_storage or state.session_storage:
+            try:
+                self._driver.execute_script(WRITE_WEB_STORAGE_JS, state.local_storage, state.session_storage)
+            except WebDriverException as e:
+                logger.debug(f'Web storage not restored: {e}')
+
+        logger.info(f'Session restored: {state.identity}@{state.domain}')
+        return True
+
+    def forget_session(self, url: Optional[str] = None, identity: Optional[str] = None):
+        """
+        Removes the stored session of a site, e.g. when the site logged the bot out.
+
+        Args:
+            url (str | None): An url of the site, None -> the start url (the current url without a start url).
+            identity (str | None): The identity, None -> the identity of the bot.
+        """
+        SessionStore.shared(config.BOT_SESSION_STORE_FILE_PATH).delete(
+            identity or self._session_identity, self.__session_domain__(url)
+        )
+        self._session_restored = False
+
+    def __session_domain__(self, url: Optional[str] = None) -> str:
+        """
+        Gets the domain that keys the stored sessions of a site, the same for the save and the restore.
+
+        Args:
+            url (str | None): An url of the site, None -> the start url (the current url without a start url).
+
+        Returns:
+            str: The host of the url.
+        """
+        if url is None:
+            try:
+                url = self.locator('pages_url', 'start_url')
+            except ValueError:
+                url = 'None'
+
+            if url == 'None':
+                url = self._driver.current_url
+
+        return urlsplit(url).hostname or ''
+
+    @property
+    def checkpoint_key(self) -> Optional[str]:
+        """
+        Gets the key of the page chain checkpoints of the current job.
+
+        Returns:
+            str | None: The checkpoint key, None if the checkpoints are disabled.
+        """
+        return self._checkpoint_key
+
+    @checkpoint_key.setter
+    def checkpoint_key(self, key: Optional[str]):
+        """
+        Sets the key of the page chain checkpoints of the current job, set by the task before the run.
+
+        Args:
+            key (str | None): The checkpoint key, None -> disabled.
+        """
+        self._checkpoint_key = key
+
+    def checkpoint(self, page: Any) -> Optional[Checkpoint]:
+        """
+        Stores the checkpoint of the page chain before a page: the page class, the current url, the cookies
+        and the payload data. It's called after every completed page forward.
+
+        Args:
+            page (Page): The next page of the chain.
+
+        Returns:
+            Checkpoint | None: The stored checkpoint, None if the checkpoints are disabled.
+        """
+        if self._checkpoint_key is None:
+            return None
+
+        checkpoint: Checkpoint = Checkpoint(
+            key=self._checkpoint_key,
+            page_class=class_path(type(page)),
+            url=self._driver.current_url,
+            cookies=self._driver.get_cookies(),
+            payload={'downloads': list(self._payload.downloads), 'output_data': dict(self._payload.output_data)},
+        )
+        with span('checkpoint.save', page=checkpoint.page_class):
+            return CheckpointStore.shared(config.BOT_CHECKPOINT_FILE_PATH).save(checkpoint)
+
+    @traced('checkpoint.resume')
+    def resume(self, first_page: Callable[['Bot'], Any]) -> Any:
+        """
+        Gets the page of the last checkpoint of the current job, with the browser and the payload restored,
+        or the first page of the chain if there isn't a checkpoint.
+
+        Args:
+            first_page (Callable[[Bot], Page]): The first page class of the chain, or a function that creates it.
+
+        Returns:
+            Page: The page where the chain resumes.
+
+        Example:
+        ```python
+        def run(self, bot: Bot) -> bool:
+            page = bot.resume(SearchPage)
+            while page is not None:
+                page = page.forward()
+            return True
+        ```
+        """
+        if self._checkpoint_key is None:
+            return first_page(self)
+
+        checkpoint_store: CheckpointStore = CheckpointStore.shared(config.BOT_CHECKPOINT_FILE_PATH)
+        checkpoint: Optional[Checkpoint] = checkpoint_store.load(self._checkpoint_key)
+        if checkpoint is None:
+            return first_page(self)
+
+        try:
+            page_class = load_class(checkpoint.page_class)
+        except ImportError as e:
+            logger.warning(f'Checkpoint not resumed: {e}')
+            return first_page(self)
+
+        self.__restore_cookies__(checkpoint.url, checkpoint.cookies)
+        self._driver.get(checkpoint.url)
+
+        self._payload.downloads = checkpoint.payload.get('downloads', [])
+        self._payload.output_data.update(checkpoint.payload.get('output_data', {}))
+
+        logger.info(f'Page chain resumed from: {checkpoint.page_class}')
+        return page_class(self)
+
+    def __restore_cookies__(self, url: str, cookies: List[Dict[str, Any]]):
+        """
+        Restores the cookies of a site, on a light page of its origin.
+
+        Args:
+            url (str): An url of the site.
+            cookies (List[Dict[str, Any]]): The cookies, in the selenium format.
+        """
+        parts = urlsplit(url)
+        # the cookies and the storage can be set only on a page of the origin
+        self._driver.get(f'{parts.scheme}://{parts.netloc}{config.BOT_SESSION_RESTORE_PATH}')
+
+        for cookie in cookies:
+            try:
+                self._driver.add_cookie(cookie)
+            except WebDriverException as e:
+                logger.debug(f'Cookie not restored {cookie.get("name")}: {e}')
+
+    def __load_locators__(self) -> LocatorIndex:
         """
         Loads locators from a configuration file.
 
+        The file is compiled once per process, and compiled again only when it's modified.
+
         Returns:
-            ConfigParser: An instance of ConfigParser with loaded locators.
+            LocatorIndex: The compiled locators index.
 
         Example:
         ```python
@@ -347,12 +952,66 @@ class Bot(ABC):
         locators = bot.__load_locators__()
         ```
         """
-        if not Path(config.SELENIUM_LOCATORS_FILE).is_file():
-            return ValueError(f'Erorr, locators file not founded at path: {config.SELENIUM_LOCATORS_FILE}')
-        
-        config_parser: ConfigParser = ConfigParser()
-        config_parser.read(config.SELENIUM_LOCATORS_FILE)
-        return config_parser
+        return LocatorIndex.load(config.SELENIUM_LOCATORS_FILE)
+
+    def __load_seleniumwire_options__(self) -> Dict[str, Any]:
+        """
+        Loads the options of the selenium-wire proxy.
+
+        The streaming capture records the traffic by itself, so the selenium-wire storage is disabled.
+
+        Returns:
+            Dict[str, Any]: The selenium-wire options.
+        """
+        seleniumwire_options: Dict[str, Any] = {
+            'disable_capture': config.SELENIUM_DISABLE_CAPTURE or config.SELENIUM_CAPTURE_STREAM,
+            'enable_har': config.SELENIUM_ENABLE_HAR_CAPTURE and not config.SELENIUM_CAPTURE_STREAM
+        }
+
+        if config.BOT_PROXY_ENABLED:
+            # Proxy settings
+            seleniumwire_options['proxy'] = {
+                'http': config.BOT_HTTP_PROXY,
+                'https': config.BOT_HTTPS_PROXY,
+            }
+
+        return seleniumwire_options
+
+    def __load_capture_recorder__(self) -> CaptureRecorder:
+        """
+        Loads the recorder of the streaming capture and adds it to the driver proxy.
+
+        Returns:
+            CaptureRecorder: The installed recorder.
+        """
+        capture_recorder: CaptureRecorder = CaptureRecorder()
+        capture_recorder.install(self._driver)
+        return capture_recorder
+
+    def __load_response_harvester__(self) -> ResponseHarvester:
+        """
+        Loads the harvester of the JSON responses, it's added to the driver proxy at the first usage.
+
+        Returns:
+            ResponseHarvester: The installed harvester.
+        """
+        if self._response_harvester is None:
+            response_harvester: ResponseHarvester = ResponseHarvester()
+            response_harvester.install(self._driver)
+            self._response_harvester = response_harvester
+        return self._response_harvester
+
+    def __load_request_blocker__(self) -> RequestBlocker | None:
+        """
+        Loads the blocker of the configured requests and adds it to the driver proxy.
+
+        Returns:
+            RequestBlocker | None: The installed blocker, None if nothing is blocked.
+        """
+        request_blocker: RequestBlocker | None = RequestBlocker.from_config(self._locators)
+        if request_blocker is not None:
+            request_blocker.install(self._driver)
+        return request_blocker
 
     @abstractmethod
     def __load_preferences__(self) -> Union[FirefoxProfile, dict]:
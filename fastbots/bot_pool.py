@@ -0,0 +1,270 @@
+import logging
+import threading
+from queue import LifoQueue, Empty
+from contextlib import contextmanager
+from typing import List, Iterator, Set
+
+from fastbots import config
+from fastbots.bot import Bot
+from fastbots.chrome_bot import ChromeBot
+from fastbots.firefox_bot import FirefoxBot
+from fastbots.tracing import span
+
+
+logger = logging.getLogger(__name__)
+
+
+class BotPool(object):
+    """
+    Bot Pool
+
+    Keeps a set of warm bots (driver already launched) and leases them to the tasks,
+    so the browser startup is paid once per bot and not once per job.
+    Between two leases the bot state is reset (tabs, cookies, storage, temporary downloads and payload).
+
+    Attributes:
+        _size (int): The max number of bots kept alive by the pool.
+        _driver_type (config.DriverType): The type of the bots created by the pool.
+        _idle (LifoQueue): The bots ready to be leased, the last returned is the first leased.
+        _bots (List[Bot]): All the bots created by the pool.
+        _broken (Set[Bot]): The leased bots marked as broken, they are quitted when returned.
+
+    Methods:
+        __init__(size: int, driver_type: config.DriverType): Initializes the BotPool instance.
+        create_bot(driver_type: config.DriverType) -> Bot: Creates a new bot of the given type.
+        warm_up(): Launches all the bots of the pool.
+        lease() -> Iterator[Bot]: Leases a ready to use bot, that is returned to the pool at the end.
+        invalidate(bot: Bot): Marks a leased bot as broken, it's quitted instead of returned to the pool.
+        close(): Quits all the bots of the pool.
+
+    Example:
+        ```python
+        with BotPool(size=2) as bot_pool:
+            MyTask(bot_pool=bot_pool)()
+            MyTask(bot_pool=bot_pool)()
+        ```
+    """
+
+    def __init__(self, size: int = config.BOT_POOL_SIZE, driver_type: config.DriverType = config.BOT_DRIVER_TYPE) -> None:
+        """
+        Initializes the BotPool instance.
+
+        Args:
+            size (int): The max number of bots kept alive by the pool.
+            driver_type (config.DriverType): The type of the bots created by the pool.
+        """
+        super().__init__()
+
+        if size < 1:
+            raise ValueError(f'The pool size must be at least 1, found: {size}.')
+
+        self._size: int = size
+        self._driver_type: config.DriverType = driver_type
+        self._idle: LifoQueue = LifoQueue()
+        self._bots: List[Bot] = []
+        self._broken: Set[Bot] = set()
+        self._lock: threading.Lock = threading.Lock()
+        self._available: threading.Semaphore = threading.Semaphore(size)
+        self._closed: bool = False
+
+    def __enter__(self) -> 'BotPool':
+        """
+        Enters a context and returns the pool.
+
+        Returns:
+            BotPool: The pool instance.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        """
+        Exits a context and quits all the bots.
+        """
+        self.close()
+
+    @property
+    def size(self) -> int:
+        """
+        Gets the max number of bots kept alive by the pool.
+
+        Returns:
+            int: The pool size.
+        """
+        return self._size
+
+    @staticmethod
+    def create_bot(driver_type: config.DriverType = config.BOT_DRIVER_TYPE) -> Bot:
+        """
+        Creates a new bot of the given type.
+
+        Args:
+            driver_type (config.DriverType): The type of the bot.
+
+        Returns:
+            Bot: The new bot instance, with the driver launched.
+
+        Raises:
+            ValueError: If the driver type is unknown.
+        """
+        with span('driver.launch', driver_type=str(driver_type.name).lower()):
+            if driver_type == config.DriverType.FIREFOX:
+                return FirefoxBot()
+            elif driver_type == config.DriverType.CHROME:
+                return ChromeBot()
+
+        raise ValueError(f'Unknown Driver Type: {driver_type}')
+
+    def warm_up(self):
+        """
+        Launches all the bots of the pool, so that the first leases don't pay the startup.
+        The slots taken by the running leases are skipped.
+        """
+        while True:
+            # every launch takes a free slot, like a lease, so the concurrent leases can't go over the size
+            if not self._available.acquire(blocking=False):
+                return
+
+            try:
+                with self._lock:
+                    if self._closed or len(self._bots) >= self._size:
+                        return
+
+                bot: Bot = self.create_bot(self._driver_type)
+                with self._lock:
+                    self._bots.append(bot)
+                self._idle.put(bot)
+            finally:
+                self._available.release()
+
+    @contextmanager
+    def lease(self) -> Iterator[Bot]:
+        """
+        Leases a ready to use bot, it's returned to the pool at the end of the context.
+
+        The bot is reset and the start page loaded before it's leased, a bot with a broken driver
+        is quitted and replaced by a new one at the next lease.
+
+        Yields:
+            Bot: The leased bot instance.
+
+        Raises:
+            RuntimeError: If the pool is already closed.
+        """
+        if self._closed:
+            raise RuntimeError('The bot pool is closed.')
+
+        # wait that at least one bot is free
+        self._available.acquire()
+
+        bot: Bot = None
+        try:
+            bot = self.__acquire__()
+            yield bot.open()
+        finally:
+            if bot is not None:
+                self.__release__(bot)
+            self._available.release()
+
+    def invalidate(self, bot: Bot):
+        """
+        Marks a leased bot as broken, e.g. after a driver error, it's quitted at the end of the lease
+        instead of being returned to the pool.
+
+        Args:
+            bot (Bot): The leased bot.
+        """
+        with self._lock:
+            self._broken.add(bot)
+
+    def close(self):
+        """
+        Quits all the bots of the pool.
+        """
+        self._closed = True
+
+        with self._lock:
+            bots: List[Bot] = self._bots
+            self._bots = []
+
+        for bot in bots:
+            self.__discard__(bot)
+
+    def __acquire__(self) -> Bot:
+        """
+        Gets an idle bot, or creates a new one if the pool isn't full.
+
+        Returns:
+            Bot: A bot with a clean state.
+        """
+        try:
+            bot: Bot = self._idle.get_nowait()
+        except Empty:
+            # the semaphore guarantees that the pool isn't full here
+            bot: Bot = self.create_bot(self._driver_type)
+            with self._lock:
+                self._bots.append(bot)
+            return bot
+
+        try:
+            bot.reset()
+            return bot
+        except Exception as e:
+            # the bot isn't usable anymore (e.g. a dead driver or a download folder not cleared), replace it
+            logger.warning(f'Replacing a broken bot of the pool: {e}')
+            self.__remove__(bot)
+            return self.__acquire__()
+
+    def __release__(self, bot: Bot):
+        """
+        Ends the bot job and returns the bot to the pool, if the driver is still alive.
+
+        Args:
+            bot (Bot): The bot to return.
+        """
+        with self._lock:
+            broken: bool = bot in self._broken
+            self._broken.discard(bot)
+
+        if broken:
+            logger.debug('Removing a bot marked as broken from the pool')
+            self.__remove__(bot)
+            return
+
+        try:
+            bot.finish()
+            # health check of the driver
+            bot.driver.current_url
+        except Exception as e:
+            logger.warning(f'Removing a broken bot from the pool: {e}')
+            self.__remove__(bot)
+            return
+
+        if self._closed:
+            self.__remove__(bot)
+        else:
+            self._idle.put(bot)
+
+    def __remove__(self, bot: Bot):
+        """
+        Removes a bot from the pool and quits it.
+
+        Args:
+            bot (Bot): The bot to remove.
+        """
+        with self._lock:
+            if bot in self._bots:
+                self._bots.remove(bot)
+
+        self.__discard__(bot)
+
+    def __discard__(self, bot: Bot):
+        """
+        Quits a bot, ignoring the errors of already dead drivers.
+
+        Args:
+            bot (Bot): The bot to quit.
+        """
+        try:
+            bot.close()
+        except Exception as e:
+            logger.debug(f'Error closing a bot of the pool: {e}')
@@ -0,0 +1,338 @@
+import os
+import re
+import gzip
+import json
+import base64
+import logging
+import threading
+from pathlib import Path
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional, TextIO, Tuple
+
+from fastbots import config
+
+
+logger = logging.getLogger(__name__)
+
+# methods never recorded, as the selenium-wire capture
+IGNORED_METHODS: Tuple[str, ...] = ('OPTIONS',)
+
+
+def compile_scopes(scopes: str) -> Optional[re.Pattern]:
+    """
+    Compiles the url scopes of the capture in a single regular expression.
+
+    Args:
+        scopes (str): The comma separated list of url regular expressions, 'None' -> all the urls are in scope.
+
+    Returns:
+        re.Pattern | None: The compiled pattern, None if all the urls are in scope.
+    """
+    if scopes == 'None':
+        return None
+
+    patterns: List[str] = [scope.strip() for scope in scopes.split(',') if scope.strip()]
+    if not patterns:
+        return None
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns))
+
+
+def name_value(items) -> List[Dict[str, str]]:
+    """
+    Converts headers or query params to the HAR name-value format.
+
+    Args:
+        items: The multi dict of the headers or params.
+
+    Returns:
+        List[Dict[str, str]]: The HAR name-value pairs.
+    """
+    return [{'name': name, 'value': value} for name, value in items.items(multi=True)]
+
+
+class CaptureRecorder(object):
+    """
+    Capture Recorder
+
+    Streams the captured exchanges to a gzip compressed file while the job runs, instead of the selenium-wire
+    storage that keeps all the requests and responses in memory for the whole bot lifetime.
+    Only the exchanges in scope are recorded, and only the last ones are kept in memory in a ring buffer
+    bounded by count and by bytes, so the long crawls run in constant memory.
+
+    Every exchange is a HAR entry: the 'jsonl' format writes an entry per line, the 'har' format writes
+    a HAR document, completed when the file is closed.
+
+    Attributes:
+        _folder_path (Path): The folder of the capture files.
+        _file_format (str): The format of the capture files: 'jsonl' or 'har'.
+        _scopes (re.Pattern | None): The urls in scope, None if all the urls are in scope.
+        _buffer (Deque[Tuple[Dict[str, Any], int]]): The last entries, with their size.
+        _file (TextIO | None): The capture file of the current job.
+
+    Methods:
+        __init__(...): Initializes the CaptureRecorder instance.
+        install(driver): Adds the recorder to the proxy of a selenium-wire driver.
+        entries() -> List[Dict[str, Any]]: Gets the entries of the ring buffer.
+        close() -> str | None: Closes the capture file of the current job.
+        reset(): Closes the capture file and empties the ring buffer, for a new job.
+        record(entry: Dict[str, Any]): Records an entry.
+
+    Example:
+        ```python
+        with FirefoxBot() as bot:
+            bot.driver.get('https://example.com')
+            print(bot.captured_entries()[-1]['response']['status'])
+        ```
+    """
+
+    # name of the proxy addon
+    name: str = 'fastbots_capture_recorder'
+
+    def __init__(self, folder_path: str = config.SELENIUM_CAPTURE_FOLDER_PATH,
+                 file_format: str = config.SELENIUM_CAPTURE_FORMAT,
+                 scopes: str = config.SELENIUM_IN_SCOPE_CAPTURE,
+                 buffer_size: int = config.SELENIUM_CAPTURE_BUFFER_SIZE,
+                 buffer_bytes: int = config.SELENIUM_CAPTURE_BUFFER_BYTES,
+                 max_body_bytes: int = config.SELENIUM_CAPTURE_MAX_BODY_BYTES) -> None:
+        """
+        Initializes the CaptureRecorder instance.
+
+        Args:
+            folder_path (str): The folder of the capture files.
+            file_format (str): 'jsonl' -> an entry per line, 'har' -> a HAR document.
+            scopes (str): The comma separated list of url regular expressions in scope, 'None' -> all the urls.
+            buffer_size (int): The max entries kept in memory.
+            buffer_bytes (int): The max bytes of the entries kept in memory.
+            max_body_bytes (int): The max bytes of a recorded body, the longer bodies are truncated.
+
+        Raises:
+            ValueError: If the file format is unknown.
+        """
+        super().__init__()
+
+        if file_format not in ('jsonl', 'har'):
+            raise ValueError(f'Unknown capture format: {file_format}')
+
+        self._folder_path: Path = Path(folder_path)
+        self._file_format: str = file_format
+        self._scopes: Optional[re.Pattern] = compile_scopes(scopes)
+        self._buffer_size: int = max(buffer_size, 0)
+        self._buffer_bytes: int = max(buffer_bytes, 0)
+        self._max_body_bytes: int = max(max_body_bytes, 0)
+
+        self._buffer: Deque[Tuple[Dict[str, Any], int]] = deque()
+        self._buffered_bytes: int = 0
+        self._file: Optional[TextIO] = None
+        self._file_path: Optional[str] = None
+        self._recorded: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def file_path(self) -> Optional[str]:
+        """
+        Gets the capture file of the current job.
+
+        Returns:
+            str | None: The file path, None if nothing is recorded yet.
+        """
+        return self._file_path
+
+    def install(self, driver):
+        """
+        Adds the recorder to the proxy of a selenium-wire driver.
+
+        Args:
+            driver: The selenium-wire driver.
+
+        Raises:
+            ValueError: If the driver doesn't have a selenium-wire proxy.
+        """
+        backend = getattr(driver, 'backend', None)
+        if backend is None:
+            raise ValueError('The capture recorder needs a selenium-wire driver.')
+
+        backend.master.addons.add(self)
+
+    def in_scope(self, method: str, url: str) -> bool:
+        """
+        Checks if an exchange is recorded.
+
+        Args:
+            method (str): The method of the request.
+            url (str): The url of the request.
+
+        Returns:
+            bool: True if the exchange is in scope.
+        """
+        if method in IGNORED_METHODS:
+            return False
+        return self._scopes is None or self._scopes.search(url) is not None
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """
+        Gets the entries of the ring buffer, the last recorded ones.
+
+        Returns:
+            List[Dict[str, Any]]: The HAR entries, in record order.
+        """
+        with self._lock:
+            return [entry for entry, _ in self._buffer]
+
+    def record(self, entry: Dict[str, Any]):
+        """
+        Records an entry: it's appended to the capture file and to the ring buffer.
+
+        Args:
+            entry (Dict[str, Any]): The HAR entry.
+        """
+        line: str = json.dumps(entry, default=str)
+        size: int = len(line)
+
+        with self._lock:
+            if self._file is None:
+                self.__open__()
+            elif self._file_format == 'har' and self._recorded > 0:
+                self._file.write(',\n')
+
+            self._file.write(line if self._file_format == 'har' else f'{line}\n')
+            self._recorded += 1
+
+            # the oldest entries are dropped, also an entry bigger than the buffer isn't kept
+            self._buffer.append((entry, size))
+            self._buffered_bytes += size
+            while self._buffer and (len(self._buffer) > self._buffer_size or self._buffered_bytes > self._buffer_bytes):
+                _, dropped_size = self._buffer.popleft()
+                self._buffered_bytes -= dropped_size
+
+    def close(self) -> Optional[str]:
+        """
+        Closes the capture file of the current job, the next entries are recorded in a new file.
+
+        Returns:
+            str | None: The path of the closed file, None if nothing was recorded.
+        """
+        with self._lock:
+            if self._file is None:
+                return None
+
+            if self._file_format == 'har':
+                self._file.write('\n]}}\n')
+            self._file.close()
+            self._file = None
+            return self._file_path
+
+    def reset(self):
+        """
+        Closes the capture file and empties the ring buffer, for a new job.
+        """
+        self.close()
+        with self._lock:
+            self._buffer.clear()
+            self._buffered_bytes = 0
+            self._file_path = None
+            self._recorded = 0
+
+    def response(self, flow):
+        """
+        Proxy hook of the responses, the exchanges in scope are recorded.
+
+        Args:
+            flow: The proxy flow of the exchange.
+        """
+        if flow.response is None or not self.in_scope(flow.request.method, flow.request.url):
+            return
+
+        try:
+            self.record(self.__entry__(flow))
+        except Exception as e:
+            logger.warning(f'Exchange not recorded {flow.request.url}: {e}')
+
+    def __open__(self):
+        """
+        Opens a new capture file, called with the lock.
+        """
+        self._folder_path.mkdir(exist_ok=True, parents=True)
+
+        file_name: str = f'{datetime.now().strftime("%Y-%m-%d_%H-%M-%S")}_{os.urandom(4).hex()}.{self._file_format}.gz'
+        self._file_path = str((self._folder_path / file_name).absolute())
+        self._file = gzip.open(self._file_path, 'wt', encoding='utf-8')
+        self._recorded = 0
+
+        if self._file_format == 'har':
+            creator: str = json.dumps({'name': config.PROJECT_NAME, 'version': config.APP_VERSION})
+            self._file.write(f'{{"log": {{"version": "1.2", "creator": {creator}, "entries": [\n')
+
+    def __body__(self, content: Optional[bytes], mime_type: str) -> Dict[str, Any]:
+        """
+        Converts a body to the HAR content format, truncated to the max bytes.
+
+        Args:
+            content (bytes | None): The decoded body.
+            mime_type (str): The content type.
+
+        Returns:
+            Dict[str, Any]: The HAR content.
+        """
+        content = content or b''
+        body: Dict[str, Any] = {'size': len(content), 'mimeType': mime_type}
+
+        if len(content) > self._max_body_bytes:
+            content = content[:self._max_body_bytes]
+            body['comment'] = 'truncated'
+
+        try:
+            body['text'] = content.decode('utf-8')
+        except UnicodeDecodeError:
+            body['text'] = base64.b64encode(content).decode('ascii')
+            body['encoding'] = 'base64'
+
+        return body
+
+    def __entry__(self, flow) -> Dict[str, Any]:
+        """
+        Converts a proxy flow to a HAR entry.
+
+        Args:
+            flow: The proxy flow of the exchange.
+
+        Returns:
+            Dict[str, Any]: The HAR entry.
+        """
+        request, response = flow.request, flow.response
+        wait: float = max((response.timestamp_start or 0) - (request.timestamp_end or 0), 0)
+        receive: float = max((response.timestamp_end or 0) - (response.timestamp_start or 0), 0)
+        send: float = max((request.timestamp_end or 0) - (request.timestamp_start or 0), 0)
+
+        entry: Dict[str, Any] = {
+            'startedDateTime': datetime.fromtimestamp(request.timestamp_start or 0, timezone.utc).isoformat(),
+            'time': int(1000 * (send + wait + receive)),
+            'request': {
+                'method': request.method,
+                'url': request.url,
+                'httpVersion': request.http_version,
+                'headers': name_value(request.headers),
+                'queryString': name_value(request.query),
+                'headersSize': -1,
+                'bodySize': len(request.raw_content or b''),
+            },
+            'response': {
+                'status': response.status_code,
+                'statusText': response.reason,
+                'httpVersion': response.http_version,
+                'headers': name_value(response.headers),
+                'content': self.__body__(response.get_content(strict=False), response.headers.get('Content-Type', '')),
+                'redirectURL': response.headers.get('Location', ''),
+                'headersSize': -1,
+                'bodySize': len(response.raw_content or b''),
+            },
+            'cache': {},
+            'timings': {'send': int(1000 * send), 'wait': int(1000 * wait), 'receive': int(1000 * receive)},
+        }
+
+        if request.raw_content:
+            entry['request']['postData'] = self.__body__(
+                request.get_content(strict=False), request.headers.get('Content-Type', '')
+            )
+
+        return entry
@@ -0,0 +1,198 @@
+import json
+import time
+import sqlite3
+import logging
+import importlib
+import threading
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from fastbots import config
+
+
+logger = logging.getLogger(__name__)
+
+# shared stores of the process, by file path
+_stores: Dict[str, 'CheckpointStore'] = {}
+_stores_lock: threading.Lock = threading.Lock()
+
+
+@dataclass
+class Checkpoint:
+    """
+    State of a page chain after a completed page: the next page, the browser url and cookies and the payload data.
+    """
+
+    key: str
+    page_class: str
+    url: str
+    cookies: List[Dict[str, Any]] = field(default_factory=list)
+    payload: Dict[str, Any] = field(default_factory=dict)
+    saved_at: float = 0.0
+
+
+def class_path(cls: type) -> str:
+    """
+    Gets the import path of a class, stored in the checkpoints.
+
+    Args:
+        cls (type): The class.
+
+    Returns:
+        str: The path, in the format 'module:qualified.name'.
+    """
+    return f'{cls.__module__}:{cls.__qualname__}'
+
+
+def load_class(path: str) -> type:
+    """
+    Imports a class from its import path.
+
+    Args:
+        path (str): The path, in the format 'module:qualified.name'.
+
+    Returns:
+        type: The class.
+
+    Raises:
+        ImportError: If the class can't be imported, e.g. it's defined in a function.
+    """
+    module_name, _, qualified_name = path.partition(':')
+    target: Any = importlib.import_module(module_name)
+    for name in qualified_name.split('.'):
+        target = getattr(target, name, None) if name != '<locals>' else None
+        if target is None:
+            raise ImportError(f'Class not importable: {path}')
+    return target
+
+
+class CheckpointStore(object):
+    """
+    Checkpoint Store
+
+    Persistent store of the page chain checkpoints, stored in a SQLite file shared by threads and processes.
+    There is a checkpoint per key (the task and its input data), replaced after every completed page,
+    so a retry or a rerun after a crash resumes the chain from the last completed page.
+    The checkpoints are removed when the task succeeds and they expire after a time to live.
+
+    Attributes:
+        _path (str): The path of the SQLite file.
+        _ttl (int): The time to live of the checkpoints, in seconds.
+
+    Methods:
+        __init__(path: str, ttl: int): Initializes the CheckpointStore instance.
+        shared(path: str) -> CheckpointStore: Gets the store of the process for a file.
+        save(checkpoint: Checkpoint) -> Checkpoint: Stores a checkpoint, replacing the previous one of its key.
+        load(key: str) -> Checkpoint | None: Gets the checkpoint of a key.
+        delete(key: str): Removes the checkpoint of a key.
+
+    Example:
+        ```python
+        checkpoint = CheckpointStore.shared().load(task.checkpoint_key(input_data))
+        ```
+    """
+
+    def __init__(self, path: str = config.BOT_CHECKPOINT_FILE_PATH, ttl: int = config.BOT_CHECKPOINT_TTL) -> None:
+        """
+        Initializes the CheckpointStore instance, creating the SQLite file if it doesn't exist.
+
+        Args:
+            path (str): The path of the SQLite file.
+            ttl (int): The time to live of the checkpoints, in seconds.
+        """
+        super().__init__()
+
+        self._path: str = path
+        self._ttl: int = ttl
+        self._lock: threading.Lock = threading.Lock()
+
+        if Path(path).parent != Path('.'):
+            Path(path).parent.mkdir(exist_ok=True, parents=True)
+
+        self._connection: sqlite3.Connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS checkpoints ('
+                'key TEXT PRIMARY KEY, page_class TEXT NOT NULL, url TEXT NOT NULL, cookies TEXT NOT NULL, '
+                'payload TEXT NOT NULL, saved_at REAL NOT NULL)'
+            )
+
+    @classmethod
+    def shared(cls, path: str = config.BOT_CHECKPOINT_FILE_PATH) -> 'CheckpointStore':
+        """
+        Gets the store of the process for a file, created at the first usage.
+
+        Args:
+            path (str): The path of the SQLite file.
+
+        Returns:
+            CheckpointStore: The shared store instance.
+        """
+        key: str = str(Path(path).absolute())
+
+        with _stores_lock:
+            if key not in _stores:
+                _stores[key] = cls(path=path)
+            return _stores[key]
+
+    def save(self, checkpoint: Checkpoint) -> Checkpoint:
+        """
+        Stores a checkpoint, replacing the previous one of its key.
+
+        Args:
+            checkpoint (Checkpoint): The checkpoint, the save time is set by the store.
+
+        Returns:
+            Checkpoint: The stored checkpoint.
+        """
+        checkpoint.saved_at = time.time()
+
+        with self._lock:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO checkpoints (key, page_class, url, cookies, payload, saved_at) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (checkpoint.key, checkpoint.page_class, checkpoint.url, json.dumps(checkpoint.cookies),
+                 json.dumps(checkpoint.payload, default=str), checkpoint.saved_at)
+            )
+            self._connection.execute('DELETE FROM checkpoints WHERE saved_at < ?', (checkpoint.saved_at - self._ttl,))
+
+        return checkpoint
+
+    def load(self, key: str) -> Optional[Checkpoint]:
+        """
+        Gets the checkpoint of a key.
+
+        Args:
+            key (str): The checkpoint key.
+
+        Returns:
+            Checkpoint | None: The checkpoint, None if it's missing or expired.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT page_class, url, cookies, payload, saved_at FROM checkpoints WHERE key = ?', (key,)
+            ).fetchone()
+
+            if row is not None and time.time() - row[4] > self._ttl:
+                self._connection.execute('DELETE FROM checkpoints WHERE key = ?', (key,))
+                row = None
+
+        if row is None:
+            return None
+
+        return Checkpoint(
+            key=key, page_class=row[0], url=row[1], cookies=json.loads(row[2]), payload=json.loads(row[3]),
+            saved_at=row[4]
+        )
+
+    def delete(self, key: str):
+        """
+        Removes the checkpoint of a key.
+
+        Args:
+            key (str): The checkpoint key.
+        """
+        with self._lock:
+            self._connection.execute('DELETE FROM checkpoints WHERE key = ?', (key,))
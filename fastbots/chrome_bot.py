@@ -1,13 +1,12 @@
-import json
-from pathlib import Path
 import logging
 
 from seleniumwire.webdriver import Chrome
 from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.remote.webdriver import WebDriver
 
 from fastbots import config, Bot
+from fastbots.wait import AdaptiveWait
+from fastbots.profile_cache import load_preferences
 
 
 logger = logging.getLogger(__name__)
@@ -21,7 +20,7 @@ class ChromeBot(Bot):
 
     Attributes:
         _driver (WebDriver): The Selenium WebDriver instance for Chrome.
-        _wait (WebDriverWait): The default WebDriverWait instance for Chrome.
+        _wait (AdaptiveWait): The default WebDriverWait instance for Chrome.
 
     Methods:
         __init__(): Initializes the ChromeBot instance.
@@ -51,11 +50,14 @@ class ChromeBot(Bot):
         super().__init__()
 
         # Load the configured driver
-        self._driver: WebDriver = self.__load_driver__()
+        try:
+            self._driver: WebDriver = self.__load_driver__()
+        except Exception:
+            self.__release__()
+            raise
 
         # Default wait
-        self._wait: WebDriverWait = WebDriverWait(driver=self._driver, timeout=config.SELENIUM_DEFAULT_WAIT,
-                                                   poll_frequency=1)
+        self._wait: AdaptiveWait = AdaptiveWait(driver=self._driver, timeout=config.SELENIUM_DEFAULT_WAIT)
     
     def __load_preferences__(self) -> dict:
         """
@@ -66,14 +68,8 @@ class ChromeBot(Bot):
         Returns:
             dict: Dictionary containing Chrome preferences.
         """
-        chrome_preferences: dict = {}
-
-        if Path(config.BOT_PREFERENCES_FILE_PATH).exists():
-            # Load all the preferences from the file
-            with open(config.BOT_PREFERENCES_FILE_PATH, 'r') as file:
-                chrome_preferences = json.load(file)
-
-        return chrome_preferences
+        # the file is parsed only once, every bot gets its own copy
+        return load_preferences(config.BOT_PREFERENCES_FILE_PATH)
     
     def __load_options__(self) -> ChromeOptions:
         """
@@ -116,20 +112,8 @@ class ChromeBot(Bot):
         Returns:
             WebDriver: Chrome WebDriver instance.
         """
-        seleniumwire_options = {
-            'disable_capture': config.SELENIUM_DISABLE_CAPTURE,
-            'enable_har': config.SELENIUM_ENABLE_HAR_CAPTURE
-        }
-
-        if config.BOT_PROXY_ENABLED:
-            # Proxy settings
-            seleniumwire_options['proxy'] = {
-                'http': config.BOT_HTTP_PROXY,
-                'https': config.BOT_HTTPS_PROXY,
-            }
-
         # Initialize Chrome with options
         return Chrome(
             options=self.__load_options__(),
-            seleniumwire_options=seleniumwire_options
+            seleniumwire_options=self.__load_seleniumwire_options__()
         )
\ No newline at end of file
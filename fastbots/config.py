@@ -29,8 +29,18 @@ ENV_RELEASE: str = 'release'
 # Dynamic configurations
 
 # Logging level for the application
-# Possible values: logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR, logging.CRITICAL
-LOG_LEVEL: int = config('LOGLEVEL', default=logging.DEBUG, cast=int)
+# Possible values: logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR, logging.CRITICAL, or their names
+LOG_LEVEL: int = config(
+    'LOGLEVEL', default=logging.DEBUG,
+    cast=lambda value: int(value) if str(value).lstrip('-').isdigit() else logging.getLevelName(str(value).upper())
+)
+
+# Log file, JSON records rotated by size; set to None to log only to the console
+LOG_FILE_PATH: str = config('LOG_FILE_PATH', default='log.log', cast=str)
+LOG_MAX_BYTES: int = config('LOG_MAX_BYTES', default=10_485_760, cast=int)
+LOG_BACKUP_COUNT: int = config('LOG_BACKUP_COUNT', default=5, cast=int)
+# Max log records waiting for the handlers thread, the new ones are dropped when it's full
+LOG_QUEUE_SIZE: int = config('LOG_QUEUE_SIZE', default=10_000, cast=int)
 
 # Environment type
 # Possible values: 'development' or 'release'
@@ -66,14 +76,60 @@ BOT_HTTPS_PROXY: str = config('BOT_HTTPS_PROXY', default=BOT_HTTP_PROXY, cast=st
 # Paths for storing screenshots, HTML pages, and cookies
 BOT_SCREENSHOT_DOWNLOAD_FOLDER_PATH: str = config('BOT_SCREENSHOT_DOWNLOAD_FOLDER_PATH', default='debug/', cast=str)
 BOT_HTML_DOWNLOAD_FOLDER_PATH: str = config('BOT_HTML_DOWNLOAD_FOLDER_PATH', default='debug/', cast=str)
+
+# Debug artifacts of the failed attempts, written by a background thread
+BOT_ARTIFACTS: bool = config('BOT_ARTIFACTS', default=True, cast=bool)
+BOT_ARTIFACTS_MAX_PER_ERROR: int = config('BOT_ARTIFACTS_MAX_PER_ERROR', default=5, cast=int)
+BOT_ARTIFACTS_QUEUE_SIZE: int = config('BOT_ARTIFACTS_QUEUE_SIZE', default=50, cast=int)
 BOT_COOKIES_FILE_PATH: str = config('BOT_COOKIES_FILE_PATH', default='cookies.pkl', cast=str)
 
+# Session store: cookies and web storage by identity and domain, restored before the start page is loaded
+BOT_SESSION_STORE: bool = config('BOT_SESSION_STORE', default=False, cast=bool)
+BOT_SESSION_STORE_FILE_PATH: str = config('BOT_SESSION_STORE_FILE_PATH', default='sessions.sqlite', cast=str)
+BOT_SESSION_IDENTITY: str = config('BOT_SESSION_IDENTITY', default='default', cast=str)
+BOT_SESSION_TTL: int = config('BOT_SESSION_TTL', default=24 * 60 * 60, cast=int)
+# light page of the site origin loaded to restore the session, the cookies and the storage need the origin
+BOT_SESSION_RESTORE_PATH: str = config('BOT_SESSION_RESTORE_PATH', default='/robots.txt', cast=str)
+
 # Path to the preferences file for Firefox bot
 BOT_PREFERENCES_FILE_PATH: str = config('BOT_PREFERENCES_FILE_PATH', default='preferences.json', cast=str)
 
+# Firefox user.js preferences cache, rendered once per preferences for every bot profile, shared by the processes of the host
+BOT_PROFILE_CACHE: bool = config('BOT_PROFILE_CACHE', default=True, cast=bool)
+BOT_PROFILE_CACHE_DIR: str = config('BOT_PROFILE_CACHE_DIR', default=None, cast=str)
+
 # Bot retry settings
 BOT_MAX_RETRIES: int = config('BOT_MAX_RETRIES', default=2, cast=int)
+# Checkpoints of the page chains: a retry or a rerun resumes from the last completed page
+BOT_CHECKPOINTS: bool = config('BOT_CHECKPOINTS', default=False, cast=bool)
+BOT_CHECKPOINT_FILE_PATH: str = config('BOT_CHECKPOINT_FILE_PATH', default='checkpoints.sqlite', cast=str)
+BOT_CHECKPOINT_TTL: int = config('BOT_CHECKPOINT_TTL', default=7 * 24 * 60 * 60, cast=int)
+
+# exponential backoff between the attempts: the first delay, the max delay (sec) and the max random jitter (sec)
+BOT_RETRY_INITIAL_DELAY: float = config('BOT_RETRY_INITIAL_DELAY', default=1.0, cast=float)
 BOT_RETRY_DELAY: int = config('BOT_RETRY_DELAY', default=10, cast=int)
+BOT_RETRY_JITTER: float = config('BOT_RETRY_JITTER', default=1.0, cast=float)
+
+# Timing spans of every task run, exported to a local file: 'jsonl' (a span per line), 'otlp' (OpenTelemetry JSON) or None
+BOT_TRACE_EXPORT: str = config('BOT_TRACE_EXPORT', default=None, cast=str)
+BOT_TRACE_FILE_PATH: str = config('BOT_TRACE_FILE_PATH', default='traces.jsonl', cast=str)
+
+# Number of warm bots kept alive by a bot pool
+BOT_POOL_SIZE: int = config('BOT_POOL_SIZE', default=1, cast=int)
+
+# Task runner settings: max tasks executed at the same time, and processes instead of threads
+BOT_RUNNER_MAX_WORKERS: int = config('BOT_RUNNER_MAX_WORKERS', default=2, cast=int)
+BOT_RUNNER_USE_PROCESSES: bool = config('BOT_RUNNER_USE_PROCESSES', default=False, cast=bool)
+
+# Result sinks: file of the records emitted by the bots (.jsonl, .csv, .sqlite, .parquet), None -> disabled,
+# records written in a batch, max records queued for the writer thread and table of the SQLite sinks
+BOT_SINK_FILE_PATH: str = config('BOT_SINK_FILE_PATH', default=None, cast=str)
+BOT_SINK_BATCH_SIZE: int = config('BOT_SINK_BATCH_SIZE', default=100, cast=int)
+BOT_SINK_QUEUE_SIZE: int = config('BOT_SINK_QUEUE_SIZE', default=10_000, cast=int)
+BOT_SINK_TABLE: str = config('BOT_SINK_TABLE', default='records', cast=str)
+
+# Batch mode: output file of the records outcomes, any sink format
+BOT_BATCH_OUTPUT_FILE_PATH: str = config('BOT_BATCH_OUTPUT_FILE_PATH', default='batch_output.jsonl', cast=str)
 
 # Selenium configurations
 
@@ -89,9 +145,20 @@ SELENIUM_EXPECTED_URL_TIMEOUT: int = config('SELENIUM_EXPECTED_URL_TIMEOUT', def
 # Default wait time for Selenium actions
 SELENIUM_DEFAULT_WAIT: int = config('SELENIUM_DEFAULT_WAIT', default=5, cast=int)
 
+# Adaptive waits: first and max polling interval (sec) and the backoff multiplier
+SELENIUM_WAIT_MIN_POLL: float = config('SELENIUM_WAIT_MIN_POLL', default=0.005, cast=float)
+SELENIUM_WAIT_MAX_POLL: float = config('SELENIUM_WAIT_MAX_POLL', default=0.25, cast=float)
+SELENIUM_WAIT_BACKOFF: float = config('SELENIUM_WAIT_BACKOFF', default=1.5, cast=float)
+
+# Wait elements and urls with events inside the page (MutationObserver and navigation events) instead of polling
+SELENIUM_WAIT_EVENTS: bool = config('SELENIUM_WAIT_EVENTS', default=False, cast=bool)
+
 # Timeout for waiting for file downloads in Selenium
 SELENIUM_FILE_DOWNLOAD_TIMEOUT: int = config('SELENIUM_FILE_DOWNLOAD_TIMEOUT', default=20, cast=int)
 
+# Polling interval of the download folder, used only when inotify isn't available
+BOT_DOWNLOAD_POLL_INTERVAL: float = config('BOT_DOWNLOAD_POLL_INTERVAL', default=0.05, cast=float)
+
 # Path to the locators file for Selenium
 SELENIUM_LOCATORS_FILE: str = config('SELENIUM_LOCATORS_FILE', default='locators.ini', cast=str)
 
@@ -106,8 +173,59 @@ SELENIUM_IN_SCOPE_CAPTURE: str = config('SELENIUM_IN_SCOPE_CAPTURE', default=Non
 # Enable Har capture (disabbled by default)
 SELENIUM_ENABLE_HAR_CAPTURE: bool = config('SELENIUM_ENABLE_HAR_CAPTURE', default=False, cast=bool)
 
+# HTTP session of the bots, exported from the driver for the plain requests and the downloads
+BOT_HTTP_MAX_CONNECTIONS: int = config('BOT_HTTP_MAX_CONNECTIONS', default=10, cast=int)
+BOT_HTTP_KEEPALIVE_EXPIRY: float = config('BOT_HTTP_KEEPALIVE_EXPIRY', default=30.0, cast=float)
+BOT_HTTP_TIMEOUT: float = config('BOT_HTTP_TIMEOUT', default=30.0, cast=float)
+
+# Stream the captured exchanges to compressed files instead of the selenium-wire in memory storage,
+# only the last exchanges are kept in memory (bounded by count and bytes)
+SELENIUM_CAPTURE_STREAM: bool = config('SELENIUM_CAPTURE_STREAM', default=False, cast=bool)
+SELENIUM_CAPTURE_FOLDER_PATH: str = config('SELENIUM_CAPTURE_FOLDER_PATH', default='capture/', cast=str)
+SELENIUM_CAPTURE_FORMAT: str = config('SELENIUM_CAPTURE_FORMAT', default='jsonl', cast=str)
+SELENIUM_CAPTURE_BUFFER_SIZE: int = config('SELENIUM_CAPTURE_BUFFER_SIZE', default=100, cast=int)
+SELENIUM_CAPTURE_BUFFER_BYTES: int = config('SELENIUM_CAPTURE_BUFFER_BYTES', default=5_000_000, cast=int)
+SELENIUM_CAPTURE_MAX_BODY_BYTES: int = config('SELENIUM_CAPTURE_MAX_BODY_BYTES', default=1_000_000, cast=int)
+
+# Requests answered locally by the proxy: resource types (comma separated list of image, font, media, stylesheet),
+# known analytics and ads hosts, url globs of all the sites (comma separated list), nothing blocked by default
+BOT_BLOCK_RESOURCES: str = config('BOT_BLOCK_RESOURCES', default=None, cast=str)
+BOT_BLOCK_TRACKERS: bool = config('BOT_BLOCK_TRACKERS', default=False, cast=bool)
+BOT_BLOCK_URLS: str = config('BOT_BLOCK_URLS', default=None, cast=str)
+
 # Capsolver CHAPTCHA resolver service
 CAPSOLVER_API_KEY: str = config('CAPSOLVER_API_KEY', default=None, cast=str)
 
 # OpenAI service for llm
-OPENAI_API_KEY: str = config('OPENAI_API_KEY', default=None, cast=str)
\ No newline at end of file
+OPENAI_API_KEY: str = config('OPENAI_API_KEY', default=None, cast=str)
+
+# Model used by the llm extractor
+LLM_MODEL_NAME: str = config('LLM_MODEL_NAME', default='gpt-3.5-turbo', cast=str)
+
+# Pooled http client shared by the llm models: max connections, keep alive expiry (sec)
+LLM_HTTP_MAX_CONNECTIONS: int = config('LLM_HTTP_MAX_CONNECTIONS', default=20, cast=int)
+LLM_HTTP_KEEPALIVE_EXPIRY: float = config('LLM_HTTP_KEEPALIVE_EXPIRY', default=30.0, cast=float)
+
+# Reduction of the HTML sent to the llm: enabled, kept attributes (href and src only if the model needs links)
+LLM_HTML_REDUCTION: bool = config('LLM_HTML_REDUCTION', default=True, cast=bool)
+LLM_HTML_KEEP_ATTRIBUTES: str = config('LLM_HTML_KEEP_ATTRIBUTES', default='href,src,alt,title', cast=str)
+
+# Max tokens of the HTML sent in a single llm call, bigger pages are split and extracted in parallel
+LLM_CHUNK_MAX_TOKENS: int = config('LLM_CHUNK_MAX_TOKENS', default=12000, cast=int)
+
+# Max llm calls executed at the same time
+LLM_MAX_CONCURRENCY: int = config('LLM_MAX_CONCURRENCY', default=4, cast=int)
+
+# Retries of the rate limited llm calls, with a random exponential backoff up to the max wait (sec)
+LLM_RATE_LIMIT_RETRIES: int = config('LLM_RATE_LIMIT_RETRIES', default=5, cast=int)
+LLM_RATE_LIMIT_MAX_WAIT: int = config('LLM_RATE_LIMIT_MAX_WAIT', default=60, cast=int)
+
+# Induction mode of the llm extractor: the llm finds the locators of the fields once per template, stored in the file
+LLM_INDUCTION: bool = config('LLM_INDUCTION', default=False, cast=bool)
+LLM_INDUCED_LOCATORS_FILE_PATH: str = config('LLM_INDUCED_LOCATORS_FILE_PATH', default='llm_locators.ini', cast=str)
+
+# Persistent cache of the llm extractions: file path, max size (bytes) and time to live (sec)
+LLM_CACHE_ENABLED: bool = config('LLM_CACHE_ENABLED', default=True, cast=bool)
+LLM_CACHE_FILE_PATH: str = config('LLM_CACHE_FILE_PATH', default='llm_cache.sqlite', cast=str)
+LLM_CACHE_MAX_SIZE: int = config('LLM_CACHE_MAX_SIZE', default=100 * 1024 * 1024, cast=int)
+LLM_CACHE_TTL: int = config('LLM_CACHE_TTL', default=7 * 24 * 60 * 60, cast=int)
\ No newline at end of file
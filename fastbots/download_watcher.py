@@ -0,0 +1,399 @@
+import os
+import sys
+import time
+import errno
+import select
+import struct
+import ctypes
+import ctypes.util
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from fastbots import config
+from fastbots.exceptions import DownloadFileError
+
+
+logger = logging.getLogger(__name__)
+
+# temporary files created by the browsers while the download is in progress
+TEMPORARY_SUFFIXES: tuple = ('.part', '.crdownload')
+
+# seconds that an empty file is considered a placeholder of a download that isn't started yet
+EMPTY_FILE_GRACE: float = 0.5
+
+# inotify events used to track the download folder
+_IN_MODIFY: int = 0x00000002
+_IN_CLOSE_WRITE: int = 0x00000008
+_IN_MOVED_FROM: int = 0x00000040
+_IN_MOVED_TO: int = 0x00000080
+_IN_CREATE: int = 0x00000100
+_IN_DELETE: int = 0x00000200
+_IN_NONBLOCK: int = os.O_NONBLOCK
+_IN_CLOEXEC: int = 0o2000000
+_IN_EVENT_HEADER: struct.Struct = struct.Struct('iIII')
+
+
+def is_temporary_file(file_name: str) -> bool:
+    """
+    Checks if a file is a temporary file of a download in progress.
+
+    Args:
+        file_name (str): The name of the file.
+
+    Returns:
+        bool: True if it's a temporary file.
+    """
+    return file_name.endswith(TEMPORARY_SUFFIXES)
+
+
+class DownloadWatcher(object):
+    """
+    Download Watcher
+
+    Tracks the files downloaded in a folder by name, using inotify events (on Linux) or a fast polling as fallback.
+    A file is completed when it exists and the browser temporary file (.part, .crdownload) doesn't exist anymore,
+    so many concurrent downloads are tracked independently and the waiters are notified as soon as they finish.
+
+    Attributes:
+        _directory (Path): The watched folder.
+        _completed (Dict[str, Path]): The completed files not yet claimed, in completion order.
+        _pending (Set[str]): The temporary files of the downloads in progress.
+        _use_inotify (bool): True -> uses the inotify events, else the polling.
+
+    Methods:
+        __init__(directory: str, use_inotify: bool | None = None): Initializes the DownloadWatcher instance.
+        start(): Starts the watcher thread.
+        stop(): Stops the watcher thread.
+        reset(): Forgets all the tracked files.
+        wait_for(file_name: str | None, file_extension: str | None, timeout: float | None) -> Path: Waits a specific download.
+        wait_all(timeout: float | None) -> List[Path]: Waits all the pending downloads.
+        pop_completed() -> List[Path]: Claims all the completed files.
+
+    Example:
+        ```python
+        with DownloadWatcher(bot._temp_dir) as download_watcher:
+            download_button.click()
+            file_path = download_watcher.wait_for(file_extension='pdf', timeout=20)
+        ```
+    """
+
+    def __init__(self, directory: str, use_inotify: Optional[bool] = None) -> None:
+        """
+        Initializes the DownloadWatcher instance.
+
+        Args:
+            directory (str): The watched folder.
+            use_inotify (bool | None): True -> uses the inotify events, False -> uses the polling, None -> autodetect.
+        """
+        super().__init__()
+
+        self._directory: Path = Path(directory)
+        self._completed: Dict[str, Path] = {}
+        self._pending: Set[str] = set()
+        self._empty: Dict[str, float] = {}
+        self._condition: threading.Condition = threading.Condition()
+        self._stop_event: threading.Event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._use_inotify: bool = sys.platform.startswith('linux') if use_inotify is None else use_inotify
+
+    def __enter__(self) -> 'DownloadWatcher':
+        """
+        Enters a context and starts the watcher.
+
+        Returns:
+            DownloadWatcher: The watcher instance.
+        """
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        """
+        Exits a context and stops the watcher.
+        """
+        self.stop()
+
+    @property
+    def pending(self) -> List[str]:
+        """
+        Gets the temporary files of the downloads in progress.
+
+        Returns:
+            List[str]: The temporary files names.
+        """
+        with self._condition:
+            return sorted(self._pending)
+
+    def start(self):
+        """
+        Starts the watcher thread, the files already in the folder are tracked too.
+        """
+        if self._thread is not None:
+            return
+
+        self._stop_event.clear()
+
+        inotify_fd: Optional[int] = self.__init_inotify__() if self._use_inotify else None
+
+        if inotify_fd is None:
+            self._thread = threading.Thread(target=self.__poll__, name='download-watcher', daemon=True)
+        else:
+            self._stop_read_fd, self._stop_write_fd = os.pipe()
+            self._thread = threading.Thread(target=self.__watch__, args=(inotify_fd,), name='download-watcher', daemon=True)
+
+        # track the files created before the watch
+        self.__scan__()
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops the watcher thread.
+        """
+        if self._thread is None:
+            return
+
+        self._stop_event.set()
+        if hasattr(self, '_stop_write_fd'):
+            os.write(self._stop_write_fd, b'\0')
+
+        self._thread.join()
+        self._thread = None
+
+        if hasattr(self, '_stop_write_fd'):
+            os.close(self._stop_read_fd)
+            os.close(self._stop_write_fd)
+            del self._stop_read_fd, self._stop_write_fd
+
+    def reset(self):
+        """
+        Forgets all the tracked files, and tracks again the files in the folder.
+        """
+        with self._condition:
+            self._completed.clear()
+            self._pending.clear()
+            self._empty.clear()
+        self.__scan__()
+
+    def wait_for(self, file_name: Optional[str] = None, file_extension: Optional[str] = None,
+                 timeout: Optional[float] = None) -> Path:
+        """
+        Waits a specific download and claims it, so the same file isn't returned twice.
+
+        Args:
+            file_name (str | None): The name of the downloaded file, if None any name matches.
+            file_extension (str | None): The file extension without the dot, if None any extension matches.
+            timeout (float | None): The max waited seconds, if None the download timeout of the config is used.
+
+        Returns:
+            Path: The path of the downloaded file.
+
+        Raises:
+            DownloadFileError: If the download isn't completed before the timeout.
+        """
+        timeout = config.SELENIUM_FILE_DOWNLOAD_TIMEOUT if timeout is None else timeout
+        suffix: Optional[str] = None if file_extension is None else f'.{file_extension}'
+
+        def claim() -> Optional[Path]:
+            for name in self._completed:
+                if (file_name is None or name == file_name) and (suffix is None or name.endswith(suffix)):
+                    return self._completed.pop(name)
+            return None
+
+        with self._condition:
+            file_path: Optional[Path] = None
+            end_time: float = time.monotonic() + timeout
+
+            while file_path is None:
+                file_path = claim()
+                remaining: float = end_time - time.monotonic()
+
+                if file_path is None and remaining <= 0:
+                    if self._pending:
+                        raise DownloadFileError(f'Download not completed, files in progress: {sorted(self._pending)}.')
+                    raise DownloadFileError('File not founded in the download folder, an error with the download occurs.')
+
+                if file_path is None:
+                    self._condition.wait(remaining)
+
+            return file_path
+
+    def wait_all(self, timeout: Optional[float] = None) -> List[Path]:
+        """
+        Waits all the pending downloads and claims all the completed files.
+
+        Args:
+            timeout (float | None): The max waited seconds, if None the download timeout of the config is used.
+
+        Returns:
+            List[Path]: The paths of the downloaded files.
+
+        Raises:
+            DownloadFileError: If some download isn't completed before the timeout.
+        """
+        timeout = config.SELENIUM_FILE_DOWNLOAD_TIMEOUT if timeout is None else timeout
+
+        with self._condition:
+            if not self._condition.wait_for(lambda: not self._pending, timeout):
+                raise DownloadFileError(f'Download not completed, files in progress: {sorted(self._pending)}.')
+
+            return self.pop_completed()
+
+    def pop_completed(self) -> List[Path]:
+        """
+        Claims all the completed files, without waiting the pending downloads.
+
+        Returns:
+            List[Path]: The paths of the downloaded files.
+        """
+        with self._condition:
+            completed: List[Path] = list(self._completed.values())
+            self._completed.clear()
+            return completed
+
+    def __update__(self, name: str):
+        """
+        Updates the state of a file of the folder and notifies the waiters.
+
+        Args:
+            name (str): The name of the changed file.
+        """
+        file_path: Path = self._directory / name
+
+        with self._condition:
+            if is_temporary_file(name):
+                if file_path.exists():
+                    self._pending.add(name)
+                else:
+                    self._pending.discard(name)
+
+                # the temporary file changes the state of the final file
+                name = name[:name.rfind('.')]
+                file_path = self._directory / name
+
+            if not is_temporary_file(name):
+                # firefox creates an empty placeholder with the final name before the download ends
+                in_progress: bool = any(
+                    f'{name}{suffix}' in self._pending or (self._directory / f'{name}{suffix}').exists()
+                    for suffix in TEMPORARY_SUFFIXES
+                )
+
+                if file_path.is_file() and not in_progress and self.__is_settled__(name, file_path):
+                    self._completed.setdefault(name, file_path)
+                    self._empty.pop(name, None)
+                else:
+                    self._completed.pop(name, None)
+                    if not file_path.is_file():
+                        self._empty.pop(name, None)
+
+            self._condition.notify_all()
+
+    def __is_settled__(self, name: str, file_path: Path) -> bool:
+        """
+        Checks that a file isn't an empty placeholder, created before the browser temporary file.
+
+        Args:
+            name (str): The name of the file.
+            file_path (Path): The path of the file.
+
+        Returns:
+            bool: True if the file isn't empty, or it's empty since the grace time.
+        """
+        try:
+            if file_path.stat().st_size > 0:
+                return True
+        except FileNotFoundError:
+            return False
+
+        return time.monotonic() - self._empty.setdefault(name, time.monotonic()) >= EMPTY_FILE_GRACE
+
+    def __scan__(self):
+        """
+        Updates the state of all the files of the folder.
+        """
+        names: Set[str] = set()
+        try:
+            names = {entry.name for entry in os.scandir(self._directory)}
+        except FileNotFoundError:
+            pass
+
+        with self._condition:
+            names.update(self._pending, self._completed, self._empty)
+
+        # temporary files first, so the completed files are evaluated with the right pending state
+        for name in sorted(names, key=lambda name: not is_temporary_file(name)):
+            self.__update__(name)
+
+    def __poll__(self):
+        """
+        Polling loop, used when inotify isn't available.
+        """
+        while not self._stop_event.wait(config.BOT_DOWNLOAD_POLL_INTERVAL):
+            self.__scan__()
+
+    def __init_inotify__(self) -> Optional[int]:
+        """
+        Initializes an inotify watch of the folder.
+
+        Returns:
+            Optional[int]: The inotify file descriptor, None if inotify isn't available.
+        """
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+            inotify_fd: int = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+            if inotify_fd < 0:
+                raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+
+            mask: int = _IN_CREATE | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_MOVED_FROM | _IN_DELETE | _IN_MODIFY
+            if libc.inotify_add_watch(inotify_fd, str(self._directory).encode(), mask) < 0:
+                error: int = ctypes.get_errno()
+                os.close(inotify_fd)
+                raise OSError(error, 'inotify_add_watch failed')
+
+            return inotify_fd
+
+        except (OSError, AttributeError) as e:
+            logger.debug(f'inotify not available, polling the download folder: {e}')
+            return None
+
+    def __watch__(self, inotify_fd: int):
+        """
+        Inotify loop, reads the events of the folder until the watcher is stopped.
+
+        Args:
+            inotify_fd (int): The inotify file descriptor.
+        """
+        try:
+            while not self._stop_event.is_set():
+                # wake up to check the empty files when their grace time ends
+                with self._condition:
+                    empty: List[str] = list(self._empty)
+
+                readable, _, _ = select.select([inotify_fd, self._stop_read_fd], [], [], EMPTY_FILE_GRACE / 5 if empty else None)
+                for name in empty:
+                    self.__update__(name)
+
+                if inotify_fd not in readable:
+                    continue
+
+                try:
+                    data: bytes = os.read(inotify_fd, 64 * 1024)
+                except OSError as e:
+                    if e.errno == errno.EAGAIN:
+                        continue
+                    raise
+
+                names: List[str] = []
+                offset: int = 0
+                while offset < len(data):
+                    _, _, _, length = _IN_EVENT_HEADER.unpack_from(data, offset)
+                    offset += _IN_EVENT_HEADER.size
+                    name: str = data[offset:offset + length].rstrip(b'\0').decode(errors='surrogateescape')
+                    offset += length
+                    if name and name not in names:
+                        names.append(name)
+
+                for name in sorted(names, key=lambda name: not is_temporary_file(name)):
+                    self.__update__(name)
+        finally:
+            os.close(inotify_fd)
@@ -124,3 +124,44 @@ class DownloadFileError(GenericError):
             str: The error message.
         """
         return self.message
+    
+class ResponseTimeoutError(GenericError):
+    """
+    Response Timeout Error
+
+    Occurs when no response of the expected url is received before the timeout.
+
+    Attributes:
+        message (str): The error message.
+
+    Methods:
+        __init__(message: str = 'Response Timeout Error'): Initializes the ResponseTimeoutError instance.
+        __str__(): Returns the error message as a string.
+
+    Example:
+        ```python
+        try:
+            data = bot.wait_for_json(r'/api/products')
+        except ResponseTimeoutError as e:
+            print(f"Caught an error: {e}")
+        ```
+    """
+
+    def __init__(self, message: str = 'Response Timeout Error') -> None:
+        """
+        Initializes the ResponseTimeoutError instance.
+
+        Args:
+            message (str): The error message.
+        """
+        self.message: str = message
+        super().__init__(self.message)
+
+    def __str__(self) -> str:
+        """
+        Returns the error message as a string.
+
+        Returns:
+            str: The error message.
+        """
+        return self.message
@@ -1,15 +1,19 @@
-import json
+import shutil
 from pathlib import Path
+import uuid
 from datetime import datetime
 import logging
+from typing import List
 
 from seleniumwire.webdriver import Firefox
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.firefox.firefox_profile import FirefoxProfile
-from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.remote.webdriver import WebDriver
 
 from fastbots import config, Bot
+from fastbots.wait import AdaptiveWait
+from fastbots.tracing import traced
+from fastbots.profile_cache import FIREFOX_DEFAULT_PREFERENCES, ProfileCache, load_preferences
 
 
 logger = logging.getLogger(__name__)
@@ -22,10 +26,12 @@ class FirefoxBot(Bot):
 
     Attributes:
         _driver (WebDriver): The WebDriver instance for Firefox.
-        _wait (WebDriverWait): The WebDriverWait instance for Firefox.
+        _wait (AdaptiveWait): The WebDriverWait instance for Firefox.
+        _profile_dir (str | None): The profile cloned from the cached template, None if the cache isn't used.
 
     Methods:
         __init__(): Initializes all attributes of the Firefox Bot instance.
+        close(): Quits the driver and removes the cloned profile.
         save_screenshot(): Saves the browser's screenshot to a PNG file.
         __load_preferences__(): Loads Firefox preferences from a JSON file.
         __load_options__(): Loads Firefox options, including user agent and download directory.
@@ -44,12 +50,31 @@ class FirefoxBot(Bot):
         """
         super().__init__()
 
+        self._profile_dir: str | None = None
+
         # Load the configured driver
-        self._driver: WebDriver = self.__load_driver__()
+        try:
+            self._driver: WebDriver = self.__load_driver__()
+        except Exception:
+            if self._profile_dir is not None:
+                shutil.rmtree(self._profile_dir, ignore_errors=True)
+            self.__release__()
+            raise
 
         # Default wait
-        self._wait: WebDriverWait = WebDriverWait(driver=self._driver, timeout=config.SELENIUM_DEFAULT_WAIT, poll_frequency=1)
+        self._wait: AdaptiveWait = AdaptiveWait(driver=self._driver, timeout=config.SELENIUM_DEFAULT_WAIT)
 
+    def close(self):
+        """
+        Ends the current job, quits the driver and removes the cloned profile.
+        """
+        try:
+            super().close()
+        finally:
+            if self._profile_dir is not None:
+                shutil.rmtree(self._profile_dir, ignore_errors=True)
+
+    @traced('debug.screenshot')
     def save_screenshot(self) -> str:
         """
         Saves the browser's screenshot to a PNG file.
@@ -59,7 +84,7 @@ class FirefoxBot(Bot):
         if not Path(config.BOT_SCREENSHOT_DOWNLOAD_FOLDER_PATH).exists():
             Path(config.BOT_SCREENSHOT_DOWNLOAD_FOLDER_PATH).mkdir(exist_ok=True, parents=True)
 
-        file_path: Path = Path(config.BOT_SCREENSHOT_DOWNLOAD_FOLDER_PATH) / f'{datetime.now().strftime("%Y-%m-%d_%H-%M-%S")}.png'
+        file_path: Path = Path(config.BOT_SCREENSHOT_DOWNLOAD_FOLDER_PATH) / f'{datetime.now().strftime("%Y-%m-%d_%H-%M-%S")}_{uuid.uuid4().hex[:8]}.png'
         self._driver.get_full_page_screenshot_as_file(str(file_path.absolute()))
         return str(file_path.absolute())
 
@@ -75,14 +100,9 @@ class FirefoxBot(Bot):
         # Initialize an empty profile for the settings
         firefox_profile: FirefoxProfile = FirefoxProfile()
 
-        if Path(config.BOT_PREFERENCES_FILE_PATH).exists():
-            # Load all the preferences from the file
-            with open(config.BOT_PREFERENCES_FILE_PATH, 'r') as file:
-                data = json.load(file)
-
-                # Iterate through all the data in the file
-                for key, value in data.items():
-                    firefox_profile.set_preference(key, value)
+        # Iterate through all the preferences of the file, parsed only once
+        for key, value in load_preferences(config.BOT_PREFERENCES_FILE_PATH).items():
+            firefox_profile.set_preference(key, value)
 
         return firefox_profile
 
@@ -90,7 +110,8 @@ class FirefoxBot(Bot):
         """
         Load Firefox Options
 
-        Load all the default Firefox options.
+        Load all the default Firefox options, the profile is cloned from the cached template
+        unless the cache is disabled or a profile is passed in the arguments.
 
         Returns:
             FirefoxOptions: The configured Firefox options.
@@ -99,11 +120,28 @@ class FirefoxBot(Bot):
         firefox_options: FirefoxOptions = FirefoxOptions()
         
         # Add all the arguments specified in the config
+        arguments: List[str] = []
         if config.BOT_ARGUMENTS != 'None':
             arguments = config.BOT_ARGUMENTS.replace(' ', '').strip().split(',')
             for argument in arguments:
                 firefox_options.add_argument(argument)
 
+        # the profile passed in the arguments and the custom preferences loaders are used as they are
+        if config.BOT_PROFILE_CACHE and not any(argument.startswith('-profile') for argument in arguments) \
+                and type(self).__load_preferences__ is FirefoxBot.__load_preferences__:
+            # the browser uses the cloned profile in place, so selenium doesn't send it with the session
+            preferences: dict = FIREFOX_DEFAULT_PREFERENCES | load_preferences(config.BOT_PREFERENCES_FILE_PATH)
+            preferences['general.useragent.override'] = config.BOT_USER_AGENT
+            preferences['browser.download.folderList'] = 2
+
+            self._profile_dir = str(ProfileCache.shared().clone(
+                preferences, {'browser.download.dir': self._temp_dir}
+            ))
+            firefox_options.add_argument('-profile')
+            firefox_options.add_argument(self._profile_dir)
+
+            return firefox_options
+
         firefox_profile: FirefoxProfile = self.__load_preferences__()
 
         # Basic static settings: download directory as temp and user agent from config
@@ -125,20 +163,8 @@ class FirefoxBot(Bot):
         Returns:
             WebDriver: The configured WebDriver instance for Firefox.
         """
-        seleniumwire_options = {
-            'disable_capture': config.SELENIUM_DISABLE_CAPTURE,
-            'enable_har': config.SELENIUM_ENABLE_HAR_CAPTURE
-        }
-
-        if config.BOT_PROXY_ENABLED:
-            # Proxy settings
-            seleniumwire_options['proxy'] = {
-                'http': config.BOT_HTTP_PROXY,
-                'https': config.BOT_HTTPS_PROXY,
-            }
-        
         # Initialize Firefox with options
         return Firefox(
             options=self.__load_options__(),
-            seleniumwire_options=seleniumwire_options
+            seleniumwire_options=self.__load_seleniumwire_options__()
         )
\ No newline at end of file
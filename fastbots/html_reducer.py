@@ -0,0 +1,290 @@
+import re
+import json
+import logging
+import functools
+from html import escape
+from html.parser import HTMLParser
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from fastbots import config
+
+
+logger = logging.getLogger(__name__)
+
+# elements without content useful for the data extraction, removed with all their children
+DROPPED_TAGS: Set[str] = {
+    'script', 'style', 'svg', 'noscript', 'iframe', 'template', 'head', 'meta', 'link',
+    'canvas', 'object', 'embed', 'video', 'audio', 'map', 'base'
+}
+
+# elements without closing tag, the dropped ones must be here too or the content after them is lost
+VOID_TAGS: Set[str] = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'keygen', 'link', 'meta', 'param', 'source',
+    'track', 'wbr'
+}
+
+# elements that end a block of content, the chunks are split after them
+BLOCK_TAGS: Set[str] = {
+    'address', 'article', 'aside', 'blockquote', 'dd', 'div', 'dl', 'dt', 'fieldset', 'figure', 'footer',
+    'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'li', 'main', 'nav', 'ol', 'p', 'pre', 'section',
+    'table', 'tbody', 'thead', 'tr', 'ul'
+}
+
+# attributes kept only when a field of the data model needs them
+LINK_ATTRIBUTES: Dict[str, Tuple[str, ...]] = {
+    'href': ('url', 'link', 'href'),
+    'src': ('url', 'image', 'img', 'src', 'photo', 'picture', 'media'),
+}
+
+
+@functools.lru_cache(maxsize=1)
+def __load_encoding__():
+    """
+    Loads the tokenizer of the OpenAI models, if tiktoken and its encoding are available.
+
+    Returns:
+        The tiktoken encoding, None if it isn't available.
+    """
+    try:
+        import tiktoken
+        return tiktoken.get_encoding('cl100k_base')
+    except Exception as e:
+        logger.debug(f'tiktoken not available, tokens are estimated: {e}')
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """
+    Counts the tokens of a text, it's estimated (4 characters per token) if tiktoken isn't available.
+
+    Args:
+        text (str): The text.
+
+    Returns:
+        int: The number of tokens.
+    """
+    encoding = __load_encoding__()
+    if encoding is None:
+        return (len(text) + 3) // 4
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def keep_attributes_for(schema: Dict[str, Any], keep_attributes: Iterable[str]) -> Set[str]:
+    """
+    Selects the attributes relevant to the fields of a data model.
+
+    The link attributes (href, src) are kept only if some field name or description needs them.
+
+    Args:
+        schema (Dict[str, Any]): The JSON schema of the data model.
+        keep_attributes (Iterable[str]): The candidate attributes.
+
+    Returns:
+        Set[str]: The attributes to keep.
+    """
+    fields_text: str = json.dumps(
+        {name: field.get('description', '') for name, field in schema.get('properties', {}).items()}
+    ).lower()
+
+    return {
+        attribute for attribute in keep_attributes
+        if attribute not in LINK_ATTRIBUTES or any(word in fields_text for word in LINK_ATTRIBUTES[attribute])
+    }
+
+
+class _Node(object):
+    """
+    Element of the reduced HTML tree.
+    """
+
+    __slots__ = ('tag', 'attributes', 'children')
+
+    def __init__(self, tag: Optional[str], attributes: List[Tuple[str, str]]) -> None:
+        self.tag: Optional[str] = tag
+        self.attributes: List[Tuple[str, str]] = attributes
+        self.children: List[Any] = []
+
+
+class _ReducerParser(HTMLParser):
+    """
+    HTML parser that builds a tree without the dropped elements and attributes.
+    """
+
+    def __init__(self, keep_attributes: Set[str]) -> None:
+        super().__init__(convert_charrefs=True)
+
+        self._keep_attributes: Set[str] = keep_attributes
+        self._stack: List[_Node] = [_Node(None, [])]
+        self._dropped_depth: int = 0
+
+    @property
+    def root(self) -> _Node:
+        return self._stack[0]
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
+        if self._dropped_depth or tag in DROPPED_TAGS:
+            if tag not in VOID_TAGS:
+                self._dropped_depth += 1
+            return
+
+        node: _Node = _Node(tag, [
+            (name, value) for name, value in attrs
+            if name in self._keep_attributes and value and not value.startswith(('javascript:', 'data:'))
+        ])
+        self._stack[-1].children.append(node)
+
+        if tag not in VOID_TAGS:
+            self._stack.append(node)
+
+    def handle_startendtag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS and not self._dropped_depth:
+            self.handle_endtag(tag)
+        elif tag not in VOID_TAGS:
+            self._dropped_depth -= 1
+
+    def handle_endtag(self, tag: str):
+        if self._dropped_depth:
+            if tag not in VOID_TAGS:
+                self._dropped_depth -= 1
+            return
+
+        # close the last opened element with the same tag, the unclosed children are closed too
+        for index in range(len(self._stack) - 1, 0, -1):
+            if self._stack[index].tag == tag:
+                del self._stack[index:]
+                return
+
+    def handle_data(self, data: str):
+        if self._dropped_depth:
+            return
+
+        text: str = re.sub(r'\s+', ' ', data)
+        if text.strip():
+            self._stack[-1].children.append(text)
+
+
+class HTMLReducer(object):
+    """
+    HTML Reducer
+
+    Reduces the HTML sent to the language models: removes the scripts, styles, svg and the other elements without content,
+    the comments, the empty elements and all the attributes not relevant for the data extraction.
+    The reduced HTML could be split in chunks, by blocks of content, within a tokens budget.
+
+    Attributes:
+        _keep_attributes (Set[str]): The attributes kept in the reduced HTML.
+
+    Methods:
+        __init__(keep_attributes: Iterable[str]): Initializes the HTMLReducer instance.
+        reduce(html: str) -> str: Reduces the HTML.
+        split(html: str, max_tokens: int) -> List[str]: Splits the reduced HTML in chunks.
+
+    Example:
+        ```python
+        html_reducer = HTMLReducer(keep_attributes=['href', 'alt'])
+        chunks = html_reducer.split(html_reducer.reduce(html), max_tokens=4000)
+        ```
+    """
+
+    def __init__(self, keep_attributes: Iterable[str] = config.LLM_HTML_KEEP_ATTRIBUTES.replace(' ', '').split(',')) -> None:
+        """
+        Initializes the HTMLReducer instance.
+
+        Args:
+            keep_attributes (Iterable[str]): The attributes kept in the reduced HTML.
+        """
+        super().__init__()
+
+        self._keep_attributes: Set[str] = {attribute.lower() for attribute in keep_attributes if attribute}
+
+    def reduce(self, html: str) -> str:
+        """
+        Reduces the HTML, every block of content ends with a new line.
+
+        Args:
+            html (str): The HTML.
+
+        Returns:
+            str: The reduced HTML.
+        """
+        parser: _ReducerParser = _ReducerParser(self._keep_attributes)
+        parser.feed(html)
+        parser.close()
+
+        return re.sub(r'\n\s*\n+', '\n', ''.join(self.__serialize__(parser.root))).strip()
+
+    def split(self, html: str, max_tokens: int) -> List[str]:
+        """
+        Splits the reduced HTML in chunks within the tokens budget, by blocks of content.
+
+        Args:
+            html (str): The reduced HTML.
+            max_tokens (int): The max tokens of every chunk.
+
+        Returns:
+            List[str]: The chunks, only one if the HTML is within the budget.
+        """
+        if count_tokens(html) <= max_tokens:
+            return [html]
+
+        chunks: List[str] = []
+        lines: List[str] = []
+        tokens: int = 0
+
+        for line in html.split('\n'):
+            line_tokens: int = count_tokens(line)
+
+            # a single block over the budget is split by characters
+            if line_tokens > max_tokens and lines:
+                chunks.append('\n'.join(lines))
+                lines, tokens = [], 0
+
+            while line_tokens > max_tokens:
+                size: int = max(len(line) * max_tokens // line_tokens, 1)
+                chunks.append(line[:size])
+                line = line[size:]
+                line_tokens = count_tokens(line)
+
+            if lines and tokens + line_tokens > max_tokens:
+                chunks.append('\n'.join(lines))
+                lines, tokens = [], 0
+
+            lines.append(line)
+            tokens += line_tokens
+
+        if lines:
+            chunks.append('\n'.join(lines))
+
+        return chunks
+
+    def __serialize__(self, node: _Node) -> List[str]:
+        """
+        Serializes a node of the tree, the elements without text and attributes are removed.
+
+        Args:
+            node (_Node): The node.
+
+        Returns:
+            List[str]: The serialized parts.
+        """
+        content: List[str] = []
+        for child in node.children:
+            if isinstance(child, str):
+                content.append(escape(child, quote=False))
+            else:
+                content.extend(self.__serialize__(child))
+
+        if node.tag is None:
+            return content
+
+        if not node.attributes and not ''.join(content).strip():
+            return []
+
+        attributes: str = ''.join(f' {name}="{escape(value)}"' for name, value in node.attributes)
+
+        if node.tag in VOID_TAGS:
+            return [f'<{node.tag}{attributes}>']
+
+        end: str = '\n' if node.tag in BLOCK_TAGS else ''
+        return [f'<{node.tag}{attributes}>', *content, f'</{node.tag}>{end}']
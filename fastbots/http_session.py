@@ -0,0 +1,258 @@
+import os
+import re
+import logging
+import tempfile
+import threading
+import contextvars
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import unquote, urlsplit
+
+import httpx
+
+from fastbots import config
+from fastbots.payload import Payload
+from fastbots.tracing import traced
+from fastbots.exceptions import DownloadFileError
+
+
+logger = logging.getLogger(__name__)
+
+# file name of the content disposition header, quoted or not
+CONTENT_DISPOSITION_FILENAME: re.Pattern = re.compile(r'filename\*?=(?:UTF-8\'\')?"?([^";]+)"?', re.IGNORECASE)
+
+# suffix of the downloads in progress
+PARTIAL_SUFFIX: str = '.part'
+
+
+def download_file_name(response: httpx.Response) -> str:
+    """
+    Gets the file name of a download, from the content disposition header or from the url path.
+
+    Args:
+        response (httpx.Response): The download response.
+
+    Returns:
+        str: The file name, without folders.
+    """
+    match = CONTENT_DISPOSITION_FILENAME.search(response.headers.get('Content-Disposition', ''))
+    file_name: str = unquote(match.group(1)) if match else unquote(urlsplit(str(response.url)).path.rsplit('/', 1)[-1])
+    return Path(file_name).name or 'download'
+
+
+class HTTPSession(object):
+    """
+    HTTP Session
+
+    Pooled HTTP client with the session of a bot: the cookies of the driver, the user agent and the proxy settings,
+    so the plain GETs and the file downloads after a browser login don't need the browser.
+    The connections are kept alive and the requests of a batch are concurrent, bounded by the max connections.
+
+    Attributes:
+        _client (httpx.Client): The pooled HTTP client.
+        _download_dir (str): The folder of the downloaded files.
+        _payload (Payload): The payload that tracks the downloads.
+
+    Methods:
+        __init__(cookies, download_dir, payload): Initializes the HTTPSession instance.
+        set_cookies(cookies: Iterable[Dict[str, Any]]): Loads the cookies of the driver.
+        get(url: str, **kwargs) -> httpx.Response: Sends a GET request.
+        get_many(urls: Iterable[str], **kwargs) -> List[httpx.Response]: Sends many concurrent GET requests.
+        download(url: str, file_name: str | None = None) -> str: Streams a file into the download folder.
+        download_many(urls: Iterable[str]) -> List[str]: Streams many files concurrently into the download folder.
+        close(): Closes the pooled connections.
+
+    Example:
+        ```python
+        # after the login in the browser
+        http_session = bot.http_session()
+        pages = http_session.get_many([f'https://example.com/orders?page={page}' for page in range(10)])
+        invoice_path = http_session.download('https://example.com/orders/1/invoice.pdf')
+        ```
+    """
+
+    def __init__(self, cookies: Iterable[Dict[str, Any]] = (), download_dir: str = config.BOT_DOWNLOAD_FOLDER_PATH,
+                 payload: Optional[Payload] = None) -> None:
+        """
+        Initializes the HTTPSession instance.
+
+        Args:
+            cookies (Iterable[Dict[str, Any]]): The cookies, in the selenium format.
+            download_dir (str): The folder of the downloaded files, 'None' -> a temporary folder.
+            payload (Payload | None): The payload that tracks the downloads, None -> not tracked.
+        """
+        super().__init__()
+
+        self._download_dir: str = download_dir if download_dir != 'None' else tempfile.mkdtemp()
+        self._payload: Optional[Payload] = payload
+        self._lock: threading.Lock = threading.Lock()
+
+        mounts: Dict[str, httpx.HTTPTransport] = {}
+        if config.BOT_PROXY_ENABLED:
+            # the same proxies of the browser
+            mounts = {
+                'http://': httpx.HTTPTransport(proxy=config.BOT_HTTP_PROXY, limits=self.__limits__()),
+                'https://': httpx.HTTPTransport(proxy=config.BOT_HTTPS_PROXY, limits=self.__limits__()),
+            }
+
+        self._client: httpx.Client = httpx.Client(
+            headers={'User-Agent': config.BOT_USER_AGENT},
+            limits=self.__limits__(),
+            timeout=config.BOT_HTTP_TIMEOUT,
+            follow_redirects=True,
+            mounts=mounts or None,
+        )
+        self.set_cookies(cookies)
+
+    def __enter__(self) -> 'HTTPSession':
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
+
+    @property
+    def client(self) -> httpx.Client:
+        """
+        Gets the pooled HTTP client, for the requests not covered by the session methods.
+
+        Returns:
+            httpx.Client: The HTTP client.
+        """
+        return self._client
+
+    def set_cookies(self, cookies: Iterable[Dict[str, Any]]):
+        """
+        Loads the cookies of the driver, e.g. after a new login.
+
+        Args:
+            cookies (Iterable[Dict[str, Any]]): The cookies, in the selenium format.
+        """
+        for cookie in cookies:
+            self._client.cookies.set(
+                cookie['name'], cookie['value'], domain=cookie.get('domain', ''), path=cookie.get('path', '/')
+            )
+
+    @traced('http.get')
+    def get(self, url: str, **kwargs) -> httpx.Response:
+        """
+        Sends a GET request with the session.
+
+        Args:
+            url (str): The url.
+            **kwargs: The arguments of httpx.Client.get, e.g. params or headers.
+
+        Returns:
+            httpx.Response: The response, with the body loaded.
+        """
+        return self._client.get(url, **kwargs)
+
+    def get_many(self, urls: Iterable[str], **kwargs) -> List[httpx.Response]:
+        """
+        Sends many concurrent GET requests, bounded by the max connections.
+
+        Args:
+            urls (Iterable[str]): The urls.
+            **kwargs: The arguments of httpx.Client.get, shared by all the requests.
+
+        Returns:
+            List[httpx.Response]: The responses, in the urls order.
+        """
+        return self.__map__(lambda url: self.get(url, **kwargs), urls)
+
+    @traced('http.download')
+    def download(self, url: str, file_name: Optional[str] = None) -> str:
+        """
+        Streams a file into the download folder and tracks it in the payload.
+
+        The file is written with a partial suffix and renamed when it's completed.
+
+        Args:
+            url (str): The url of the file.
+            file_name (str | None): The name of the file (with extension), None -> the name sent by the server.
+
+        Returns:
+            str: The path of the downloaded file.
+
+        Raises:
+            DownloadFileError: If the server answers with an error.
+        """
+        with self._client.stream('GET', url) as response:
+            if response.is_error:
+                raise DownloadFileError(f'Download failed {url}: {response.status_code} {response.reason_phrase}')
+
+            Path(self._download_dir).mkdir(exist_ok=True, parents=True)
+            file_path: Path = Path(self._download_dir) / (file_name or download_file_name(response))
+            partial_path: Path = file_path.with_name(f'{file_path.name}.{os.urandom(4).hex()}{PARTIAL_SUFFIX}')
+
+            try:
+                with open(partial_path, 'wb') as file:
+                    for chunk in response.iter_bytes():
+                        file.write(chunk)
+                os.replace(partial_path, file_path)
+            except BaseException:
+                partial_path.unlink(missing_ok=True)
+                raise
+
+        destination: str = str(file_path.absolute())
+        if self._payload is not None:
+            with self._lock:
+                self._payload.downloads.append(destination)
+                self._payload.output_data['downloads_count'] = len(self._payload.downloads)
+
+        return destination
+
+    def download_many(self, urls: Iterable[str]) -> List[str]:
+        """
+        Streams many files concurrently into the download folder, bounded by the max connections.
+
+        Args:
+            urls (Iterable[str]): The urls of the files.
+
+        Returns:
+            List[str]: The paths of the downloaded files, in the urls order.
+
+        Raises:
+            DownloadFileError: If the server answers with an error.
+        """
+        return self.__map__(self.download, urls)
+
+    def close(self):
+        """
+        Closes the pooled connections.
+        """
+        self._client.close()
+
+    def __limits__(self) -> httpx.Limits:
+        """
+        Gets the limits of the connections pool.
+
+        Returns:
+            httpx.Limits: The pool limits.
+        """
+        return httpx.Limits(
+            max_connections=config.BOT_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=config.BOT_HTTP_MAX_CONNECTIONS,
+            keepalive_expiry=config.BOT_HTTP_KEEPALIVE_EXPIRY,
+        )
+
+    def __map__(self, function, items: Iterable[str]) -> List[Any]:
+        """
+        Calls a function on many items concurrently, bounded by the max connections.
+
+        Args:
+            function: The function.
+            items (Iterable[str]): The items.
+
+        Returns:
+            List[Any]: The results, in the items order.
+        """
+        items = list(items)
+        if len(items) <= 1:
+            return [function(item) for item in items]
+
+        with ThreadPoolExecutor(max_workers=max(min(config.BOT_HTTP_MAX_CONNECTIONS, len(items)), 1),
+                                thread_name_prefix='http-session') as executor:
+            # the context is copied, so the spans of the requests are nested in the current span
+            futures = [executor.submit(contextvars.copy_context().run, function, item) for item in items]
+            return [future.result() for future in futures]
@@ -0,0 +1,211 @@
+import re
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from fastbots import config
+
+
+logger = logging.getLogger(__name__)
+
+# shared caches of the process, by file path
+_caches: Dict[str, 'LLMCache'] = {}
+_caches_lock: threading.Lock = threading.Lock()
+
+
+class LLMCache(object):
+    """
+    LLM Cache
+
+    Persistent cache of the LLM extractions, stored in a SQLite file shared by threads and processes.
+    The entries are keyed by the hash of the normalized HTML, the data schema, the model name and the prompt template,
+    they expire after a time to live and the least recently used are evicted when the max size is reached.
+
+    Attributes:
+        _path (str): The path of the SQLite file.
+        _max_size (int): The max total size of the cached values, in bytes.
+        _ttl (int): The time to live of the entries, in seconds.
+        _hits (int): The number of cache hits.
+        _misses (int): The number of cache misses.
+
+    Methods:
+        __init__(path: str, max_size: int, ttl: int): Initializes the LLMCache instance.
+        shared(path: str) -> LLMCache: Gets the cache of the process for a file.
+        build_key(html: str, schema: Union[dict, str], model_name: str, prompt_template: str) -> str: Builds the cache key.
+        get(key: str) -> Optional[str]: Gets a cached value.
+        set(key: str, value: str): Stores a value.
+        clear(): Removes all the entries.
+        stats() -> Dict[str, int]: Gets the cache counters.
+
+    Example:
+        ```python
+        llm_cache = LLMCache.shared()
+        key = LLMCache.build_key(html, InformationModel.schema(), 'gpt-3.5-turbo', prompt_template)
+        extracted_data = llm_cache.get(key)
+        ```
+    """
+
+    def __init__(self, path: str = config.LLM_CACHE_FILE_PATH, max_size: int = config.LLM_CACHE_MAX_SIZE,
+                 ttl: int = config.LLM_CACHE_TTL) -> None:
+        """
+        Initializes the LLMCache instance, creating the SQLite file if it doesn't exist.
+
+        Args:
+            path (str): The path of the SQLite file.
+            max_size (int): The max total size of the cached values, in bytes.
+            ttl (int): The time to live of the entries, in seconds.
+        """
+        super().__init__()
+
+        self._path: str = path
+        self._max_size: int = max_size
+        self._ttl: int = ttl
+        self._hits: int = 0
+        self._misses: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+        if Path(path).parent != Path('.'):
+            Path(path).parent.mkdir(exist_ok=True, parents=True)
+
+        self._connection: sqlite3.Connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS llm_cache ('
+                'key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, '
+                'created_at REAL NOT NULL, accessed_at REAL NOT NULL)'
+            )
+            self._connection.execute('CREATE INDEX IF NOT EXISTS llm_cache_accessed_at ON llm_cache (accessed_at)')
+
+    @classmethod
+    def shared(cls, path: str = config.LLM_CACHE_FILE_PATH) -> 'LLMCache':
+        """
+        Gets the cache of the process for a file, created at the first usage.
+
+        Args:
+            path (str): The path of the SQLite file.
+
+        Returns:
+            LLMCache: The shared cache instance.
+        """
+        key: str = str(Path(path).absolute())
+
+        with _caches_lock:
+            if key not in _caches:
+                _caches[key] = cls(path=path)
+            return _caches[key]
+
+    @staticmethod
+    def build_key(html: str, schema: Union[dict, str], model_name: str, prompt_template: str) -> str:
+        """
+        Builds the cache key of an extraction.
+
+        Args:
+            html (str): The HTML sent to the model, the whitespaces are normalized.
+            schema (Union[dict, str]): The JSON schema of the data model.
+            model_name (str): The name of the model.
+            prompt_template (str): The prompt template.
+
+        Returns:
+            str: The cache key, a sha256 hex digest.
+        """
+        if not isinstance(schema, str):
+            schema = json.dumps(schema, sort_keys=True)
+
+        digest = hashlib.sha256()
+        for part in (re.sub(r'\s+', ' ', html).strip(), schema, model_name, prompt_template):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Gets a cached value, and marks it as recently used.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[str]: The cached value, None if it's missing or expired.
+        """
+        now: float = time.time()
+
+        with self._lock:
+            row = self._connection.execute('SELECT value, created_at FROM llm_cache WHERE key = ?', (key,)).fetchone()
+
+            if row is not None and now - row[1] > self._ttl:
+                self._connection.execute('DELETE FROM llm_cache WHERE key = ?', (key,))
+                row = None
+
+            if row is None:
+                self._misses += 1
+                return None
+
+            self._connection.execute('UPDATE llm_cache SET accessed_at = ? WHERE key = ?', (now, key))
+            self._hits += 1
+            return row[0]
+
+    def set(self, key: str, value: str):
+        """
+        Stores a value, evicting the expired and least recently used entries over the max size.
+
+        Args:
+            key (str): The cache key.
+            value (str): The value to store.
+        """
+        now: float = time.time()
+        size: int = len(value.encode('utf-8'))
+
+        if size > self._max_size:
+            logger.debug(f'Value too big for the llm cache: {size} bytes')
+            return
+
+        with self._lock:
+            self._connection.execute('BEGIN IMMEDIATE')
+            try:
+                self._connection.execute(
+                    'INSERT OR REPLACE INTO llm_cache (key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)',
+                    (key, value, size, now, now)
+                )
+                self._connection.execute('DELETE FROM llm_cache WHERE created_at < ?', (now - self._ttl,))
+
+                total_size: int = self._connection.execute('SELECT COALESCE(SUM(size), 0) FROM llm_cache').fetchone()[0]
+                if total_size > self._max_size:
+                    for evicted_key, evicted_size in self._connection.execute(
+                        'SELECT key, size FROM llm_cache WHERE key != ? ORDER BY accessed_at', (key,)
+                    ).fetchall():
+                        self._connection.execute('DELETE FROM llm_cache WHERE key = ?', (evicted_key,))
+                        total_size -= evicted_size
+                        if total_size <= self._max_size:
+                            break
+
+                self._connection.execute('COMMIT')
+            except Exception:
+                self._connection.execute('ROLLBACK')
+                raise
+
+    def clear(self):
+        """
+        Removes all the entries and resets the counters.
+        """
+        with self._lock:
+            self._connection.execute('DELETE FROM llm_cache')
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Gets the cache counters.
+
+        Returns:
+            Dict[str, int]: The hits, misses, entries and total size in bytes.
+        """
+        with self._lock:
+            entries, size = self._connection.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache').fetchone()
+            return {'hits': self._hits, 'misses': self._misses, 'entries': entries, 'size': size}
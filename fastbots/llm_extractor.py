@@ -1,16 +1,102 @@
-from typing import List
+import json
+import asyncio
 import logging
+import functools
+import threading
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+from urllib.parse import urlparse
+
+from openai import RateLimitError
+from tenacity import Retrying, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
-from langchain.chains import LLMChain
-from langchain.prompts import PromptTemplate
-from langchain_openai import ChatOpenAI
-from langchain_core.output_parsers import JsonOutputParser
-from langchain_core.pydantic_v1 import BaseModel
+from selenium.webdriver.remote.webelement import WebElement
+from langchain_core.pydantic_v1 import BaseModel, ValidationError
+from langchain_core.utils.json import parse_json_markdown
 
 from fastbots.bot import Bot
 from fastbots import config
+from fastbots.llm_cache import LLMCache
+from fastbots.tracing import span
+from fastbots.llm_registry import LLMChainRegistry, PROMPT_TEMPLATE
+from fastbots.html_reducer import HTMLReducer, count_tokens, keep_attributes_for
+from fastbots.llm_induction import INDUCTION_PROMPT_TEMPLATE, InducedLocator, InducedLocatorStore, parse_induced_locators, template_key
+
+
+logger = logging.getLogger(__name__)
+
+# bounds the llm calls of the process, shared by the chunks, the batches and the background extractions
+_llm_semaphore: threading.BoundedSemaphore = threading.BoundedSemaphore(max(config.LLM_MAX_CONCURRENCY, 1))
+
+# attributes kept in the html sent to induce the locators, useful to build the selectors
+INDUCTION_ATTRIBUTES: tuple = ('id', 'class', 'name', 'itemprop', 'role')
+
+# executor of the background extractions, created at the first usage
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock: threading.Lock = threading.Lock()
+
+
+def merge_extracted_data(chunks_data: List[Dict[str, Any]], schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Merges the data extracted from the chunks of a page, following the fields of the data model.
+
+    The list fields are concatenated without duplicates, the other fields take the first not empty value.
+
+    Args:
+        chunks_data (List[Dict[str, Any]]): The data extracted from every chunk, in page order.
+        schema (Dict[str, Any]): The JSON schema of the data model.
+
+    Returns:
+        Dict[str, Any]: The merged data.
+    """
+    properties: Dict[str, Any] = schema.get('properties', {})
+    merged: Dict[str, Any] = {}
+
+    for chunk_data in chunks_data:
+        for name, value in chunk_data.items():
+            if properties.get(name, {}).get('type') == 'array' or isinstance(value, list):
+                items: List[Any] = merged.setdefault(name, [])
+                for item in value if isinstance(value, list) else [value]:
+                    if item not in items and item not in (None, ''):
+                        items.append(item)
+
+            elif merged.get(name) in (None, '', {}, []):
+                merged[name] = value
+
+    return merged
+
+
+@functools.lru_cache(maxsize=None)
+def __load_html_reducer__(pydantic_model: Type[BaseModel]) -> HTMLReducer:
+    """
+    Loads the HTML reducer of a pydantic model, shared by all the extractors of the process.
+
+    Args:
+        pydantic_model (Type[BaseModel]): The representation of the data needed to extract.
+
+    Returns:
+        HTMLReducer: The reducer, keeping the attributes relevant to the model fields.
+    """
+    return HTMLReducer(keep_attributes_for(
+        pydantic_model.schema(), config.LLM_HTML_KEEP_ATTRIBUTES.replace(' ', '').split(',')
+    ))
+
+
+def __load_executor__() -> ThreadPoolExecutor:
+    """
+    Loads the executor of the background extractions, shared by all the extractors of the process.
+
+    Returns:
+        ThreadPoolExecutor: The executor.
+    """
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=max(config.LLM_MAX_CONCURRENCY, 1), thread_name_prefix='llm-extractor')
+        return _executor
 
 
 class LLMExtractor(object):
@@ -25,51 +111,73 @@ class LLMExtractor(object):
     Attributes:
         _bot (Bot): The bot instance associated with the extractor.
         _pydantic_model (BaseModel): The representation of the data needed to extract and validate the parsed data.
+        _llm_cache (LLMCache | None): The persistent cache of the extractions, None if disabled.
+        _html_reducer (HTMLReducer | None): The reducer of the HTML sent to the model, None if disabled.
+        _induction (bool): True -> the llm finds the locators of the fields once per template, not their values.
+        _template_name (str | None): The name of the template of the pages, the host of the page if None.
+        _tokens (Dict[str, Dict[str, int]]): The tokens of the last extraction of every locator.
 
     Methods:
-        __init__(self, bot: Bot, pydantic_model: BaseModel): Initialized the LLMExtractor class.
+        __init__(self, bot: Bot, pydantic_model: BaseModel, induction: bool, template_name: str | None): Initialized the LLMExtractor class.
         extract_data(self, locator_name: str) -> str: Extract the needed data.
+        submit(self, locator_name: str) -> Future: Extract the needed data in background.
+        extract_many(self, locator_names: Iterable[str]) -> Dict[str, str]: Extract the data of many locators concurrently.
+        aextract_data(self, locator_name: str) -> str: Async version of extract_data.
+        aextract_many(self, locator_names: Iterable[str]) -> Dict[str, str]: Async version of extract_many.
+
+    Example:
+        ```python
+        # the html is read now, the extraction continues in background while the bot goes to the next page
+        future = LLMExtractor(bot=bot, pydantic_model=InformationModel).submit(locator_name='page_content_locator')
+        bot.driver.get(next_url)
+        extracted_data = future.result()
+        ```
     """
 
-    def __init__(self, bot: Bot, pydantic_model: BaseModel) -> None:
+    def __init__(self, bot: Bot, pydantic_model: BaseModel, induction: bool = config.LLM_INDUCTION,
+                 template_name: str | None = None) -> None:
         """
         Initializes the LLMExtractor class.
 
         Args:
             bot (Bot): The bot instance associated with the extractor.
             pydantic_model (BaseModel): The representation of the data needed to extract and validate the parsed data.
+            induction (bool): True -> the llm finds the locators of the fields once per template, the pages are extracted by selenium.
+            template_name (str | None): The name of the template of the pages, the host of the page if None.
         """
         super().__init__()
 
         self._bot: Bot = bot
+        self._pydantic_model: BaseModel = pydantic_model
+        self._llm_cache: LLMCache | None = LLMCache.shared() if config.LLM_CACHE_ENABLED else None
+        self._html_reducer: HTMLReducer | None = __load_html_reducer__(pydantic_model) if config.LLM_HTML_REDUCTION else None
 
-        llm_model = ChatOpenAI(
-            temperature=0, 
-            model="gpt-3.5-turbo", 
-            openai_api_key=config.OPENAI_API_KEY
-        )
+        # the chain and the http client are built once per process and shared by all the extractors
+        self._llm_chain = LLMChainRegistry.shared().chain(pydantic_model, config.LLM_MODEL_NAME, PROMPT_TEMPLATE)
 
-        prompt_template = """ given this information {information} of an entity on this piece of html,
-            I want you to extract all the information about this entity.
-            You are not allowed to make any assumptions while extracting the information.
-            Every link you provide should be from the information given.
-            There should be no assumptions for Links/URLS.
-            You should not return code to do it.:
-            You should extract the following text infromation from the html:
-            \n{format_instructions} # here we are passing format_instructions
-        """
+        self._induction: bool = induction
+        self._template_name: str | None = template_name
 
-        json_output_parser = JsonOutputParser(
-            pydantic_model=pydantic_model
-        )
+        # tokens of the extractions by locator name, written by the background threads
+        self._tokens: Dict[str, Dict[str, int]] = {}
+        self._tokens_lock: threading.Lock = threading.Lock()
+        if induction:
+            self._induced_locator_store: InducedLocatorStore = InducedLocatorStore.shared(config.LLM_INDUCED_LOCATORS_FILE_PATH)
+            self._induction_chain = LLMChainRegistry.shared().chain(pydantic_model, config.LLM_MODEL_NAME, INDUCTION_PROMPT_TEMPLATE)
+            self._induction_html_reducer: HTMLReducer = HTMLReducer(
+                INDUCTION_ATTRIBUTES + tuple(config.LLM_HTML_KEEP_ATTRIBUTES.replace(' ', '').split(','))
+            )
 
-        prompt = PromptTemplate(
-            template=prompt_template,
-            input_variables=["information"],
-            partial_variables={"format_instructions": json_output_parser.get_format_instructions()},
-        )
+    @property
+    def tokens(self) -> Dict[str, Dict[str, int]]:
+        """
+        Gets the tokens of the last extraction of every locator, before and after the html reduction.
 
-        self._llm_chain = LLMChain(llm=llm_model, prompt=prompt)
+        Returns:
+            Dict[str, Dict[str, int]]: The tokens by locator name.
+        """
+        with self._tokens_lock:
+            return dict(self._tokens)
 
     def __locator__(self, locator_name: str) -> tuple:
         """
@@ -86,37 +194,10 @@ class LLMExtractor(object):
             tuple: A tuple representing the loaded locator.
 
         Raises:
-            ValueError: If the locator is not enclosed in round brackets or is of an unknown or incorrect format.
-        """
-        # load the locators from file and interpret that as code
-        full_locator: str = self._bot.locator('llm_extractor', locator_name).strip().replace('\\\'',  '\'').replace('\\"', '"')
-
-        if not full_locator.startswith('(') or not full_locator.endswith(')'):
-            raise ValueError('The locator must be enclosed in round brackets.')
-
-        # declared locators
-        locator_list: List[str] = [
-            'By.ID', 'By.XPATH', 'By.NAME', 'By.CLASS_NAME', 'By.CSS_SELECTOR', 
-            'By.LINK_TEXT', 'By.PARTIAL_LINK_TEXT', 'By.TAG_NAME'
-        ]
-
-        # check the used locator
-        parsed_locator: tuple = None
-        for locator in locator_list:
-            # check that the first characters are them of the locators and the next one of the comma 
-            if full_locator[1:-1].strip().startswith(locator) and full_locator[1:-1].strip()[len(locator):].strip().startswith(','):
-                # extract the tuple required as locator
-                parsed_locator = (
-                    eval(locator), 
-                    full_locator[1:-1].strip()[len(locator):].strip()[1:].strip()[1:-1]
-                )
-
-                logging.debug(f'{locator_name} {parsed_locator}')
-
-                return parsed_locator
-            
-        else:
-            raise ValueError('The specified locator is unknown or wrong; check by, brackets, and commas.')
+            ValueError: If the locator is not declared in the locators file.
+        """
+        # the locators are compiled once per process when the file is loaded
+        return self._bot.compiled_locator('llm_extractor', locator_name)
 
     def extract_data(self, locator_name: str) -> str:
         """
@@ -126,15 +207,352 @@ class LLMExtractor(object):
         [llm_extractor]
         locator_name=(By.XPATH, "//html//input")
 
+        The HTML is reduced to the content relevant for the model, the pages over the tokens budget are split in chunks,
+        extracted in parallel and merged. The tokens before and after the reduction are stored in the payload
+        output data, under the llm_tokens key; extract_many stores them too, submit keeps them in the tokens property.
+
+        In the induction mode the llm finds the locators of the fields the first time a template is seen,
+        the next pages are extracted by selenium and validated by the pydantic model, the locators are induced again
+        only when the validation fails.
+
         Args:
             locator_name (str): The name of the locator.
         """
         try:
-            extracted_data = self._llm_chain.invoke(
-                input={"information": self._bot.wait.until(EC.presence_of_element_located(self.__locator__(locator_name))).get_attribute('innerHTML')},
-                return_only_outputs=True,
-            )
-            return extracted_data["text"]
+            if self._induction:
+                return self.__induce_extract__(locator_name)
+            extracted_data, tokens = self.__extract__(locator_name, self.__read_html__(locator_name))
+            self.__record_tokens__({locator_name: tokens})
+            return extracted_data
+        except Exception as e:
+            logging.error(e)
+            return None
+
+    def submit(self, locator_name: str) -> Future:
+        """
+        Extract the data in background: the html is read from the browser now, the model is called in the shared executor,
+        so the bot could go on to the next page.
+
+        Args:
+            locator_name (str): The name of the locator.
+
+        The payload isn't changed by the background thread, the tokens of the extraction are in the tokens property.
+
+        Returns:
+            Future: The future of the extracted data, as in extract_data the result is None if the extraction fails.
+        """
+        # the induced locators need the browser, the extraction is completed now
+        if self._induction:
+            future: Future = Future()
+            future.set_result(self.extract_data(locator_name))
+            return future
+
+        try:
+            html: str = self.__read_html__(locator_name)
+        except Exception as e:
+            logging.error(e)
+            future: Future = Future()
+            future.set_result(None)
+            return future
+
+        with self._tokens_lock:
+            self._tokens.pop(locator_name, None)
+
+        # the context is copied, so the spans of the background extraction are nested in the current span
+        extraction: Future = __load_executor__().submit(
+            contextvars.copy_context().run, self.__extract_or_none__, locator_name, html
+        )
+
+        future: Future = Future()
+        extraction.add_done_callback(lambda done: self.__complete__(future, locator_name, done.result()))
+        return future
+
+    def extract_many(self, locator_names: Iterable[str]) -> Dict[str, str]:
+        """
+        Extract the data of many locators, the model calls are concurrent and bounded by the max concurrency.
+
+        Args:
+            locator_names (Iterable[str]): The names of the locators.
+
+        Returns:
+            Dict[str, str]: The extracted data by locator name, None for the failed extractions.
+        """
+        futures: Dict[str, Future] = {locator_name: self.submit(locator_name) for locator_name in locator_names}
+        results: Dict[str, str] = {locator_name: future.result() for locator_name, future in futures.items()}
+
+        self.__record_tokens__({locator_name: self.tokens.get(locator_name) for locator_name in futures})
+        return results
+
+    async def aextract_data(self, locator_name: str) -> str:
+        """
+        Async version of extract_data, the html is read from the browser before the first await.
+
+        Args:
+            locator_name (str): The name of the locator.
+
+        Returns:
+            str: The extracted data, None if the extraction fails.
+        """
+        return await asyncio.wrap_future(self.submit(locator_name))
+
+    async def aextract_many(self, locator_names: Iterable[str]) -> Dict[str, str]:
+        """
+        Async version of extract_many.
+
+        Args:
+            locator_names (Iterable[str]): The names of the locators.
+
+        Returns:
+            Dict[str, str]: The extracted data by locator name, None for the failed extractions.
+        """
+        futures: Dict[str, Future] = {locator_name: self.submit(locator_name) for locator_name in locator_names}
+        results: List[str] = await asyncio.gather(*(asyncio.wrap_future(future) for future in futures.values()))
+
+        self.__record_tokens__({locator_name: self.tokens.get(locator_name) for locator_name in futures})
+        return dict(zip(futures, results))
+
+    def __read_html__(self, locator_name: str) -> str:
+        """
+        Reads the html of a locator from the browser, it must be called from the bot thread.
+
+        Args:
+            locator_name (str): The name of the locator.
+
+        Returns:
+            str: The inner html of the element.
+        """
+        return self._bot.wait.until(EC.presence_of_element_located(self.__locator__(locator_name))).get_attribute('innerHTML')
+
+    def __extract_or_none__(self, locator_name: str, html: str) -> Tuple[Optional[str], Optional[Dict[str, int]]]:
+        """
+        Extracts the data from the html, logging the errors.
+
+        Args:
+            locator_name (str): The name of the locator.
+            html (str): The inner html of the element.
+
+        Returns:
+            Tuple[Optional[str], Optional[Dict[str, int]]]: The extracted data and the tokens,
+                None and None if the extraction fails.
+        """
+        try:
+            return self.__extract__(locator_name, html)
         except Exception as e:
             logging.error(e)
-            return None
\ No newline at end of file
+            return None, None
+
+    def __complete__(self, future: Future, locator_name: str, result: Tuple[Optional[str], Optional[Dict[str, int]]]):
+        """
+        Completes the future of a background extraction, the tokens are kept by the extractor, not in the payload:
+        the bot could be running the next task.
+
+        Args:
+            future (Future): The future returned by submit.
+            locator_name (str): The name of the locator.
+            result (Tuple[Optional[str], Optional[Dict[str, int]]]): The extracted data and the tokens.
+        """
+        extracted_data, tokens = result
+        if tokens is not None:
+            with self._tokens_lock:
+                self._tokens[locator_name] = tokens
+        future.set_result(extracted_data)
+
+    def __record_tokens__(self, tokens: Dict[str, Optional[Dict[str, int]]]):
+        """
+        Stores the tokens of the extractions in the payload output data, it must be called from the bot thread.
+
+        Args:
+            tokens (Dict[str, Optional[Dict[str, int]]]): The tokens by locator name, None for the failed extractions.
+        """
+        llm_tokens: Dict[str, Dict[str, int]] = self._bot.payload.output_data.setdefault('llm_tokens', {})
+        llm_tokens.update({locator_name: value for locator_name, value in tokens.items() if value is not None})
+
+    def __extract__(self, locator_name: str, html: str) -> Tuple[str, Dict[str, int]]:
+        """
+        Extracts the data from the html, without the browser and the payload, so it could run in background.
+
+        Args:
+            locator_name (str): The name of the locator.
+            html (str): The inner html of the element.
+
+        Returns:
+            Tuple[str, Dict[str, int]]: The extracted data as a json string and the tokens before and after the reduction.
+        """
+        raw_tokens: int = count_tokens(html)
+        if self._html_reducer is not None:
+            html = self._html_reducer.reduce(html)
+        reduced_tokens: int = count_tokens(html) if self._html_reducer is not None else raw_tokens
+
+        tokens: Dict[str, int] = {'raw': raw_tokens, 'reduced': reduced_tokens}
+        logger.info(f'LLM extraction of {locator_name}: {raw_tokens} tokens reduced to {reduced_tokens}')
+
+        # the same content, schema, model and prompt is extracted only once
+        cache_key: str = None
+        if self._llm_cache is not None:
+            cache_key = LLMCache.build_key(html, self._pydantic_model.schema(), config.LLM_MODEL_NAME, PROMPT_TEMPLATE)
+            cached_data: str | None = self._llm_cache.get(cache_key)
+            if cached_data is not None:
+                logger.debug(f'LLM cache hit for the locator: {locator_name}')
+                return cached_data, tokens
+
+        chunks: List[str] = [html]
+        if self._html_reducer is not None:
+            chunks = self._html_reducer.split(html, config.LLM_CHUNK_MAX_TOKENS)
+
+        if len(chunks) == 1:
+            text: str = self.__invoke__(html)
+            try:
+                data: Dict[str, Any] = parse_json_markdown(text)
+            except ValueError as e:
+                # a broken answer isn't cached, so the retries call the model again
+                logger.warning(f'LLM answer of {locator_name} is not valid JSON, not cached: {e}')
+                return text, tokens
+        else:
+            logger.debug(f'LLM extraction of {locator_name} split in {len(chunks)} chunks')
+
+            with ThreadPoolExecutor(max_workers=max(min(config.LLM_MAX_CONCURRENCY, len(chunks)), 1)) as executor:
+                futures: List[Future] = [
+                    executor.submit(contextvars.copy_context().run, self.__invoke__, chunk) for chunk in chunks
+                ]
+                chunks_text: List[str] = [future.result() for future in futures]
+
+            data = merge_extracted_data(
+                [parse_json_markdown(chunk_text) for chunk_text in chunks_text], self._pydantic_model.schema()
+            )
+
+        extracted_data: str = json.dumps(data)
+
+        if self._llm_cache is not None:
+            try:
+                self._pydantic_model.parse_obj(data)
+            except ValidationError as e:
+                logger.warning(f'LLM data of {locator_name} is not valid for the model, not cached: {e}')
+            else:
+                self._llm_cache.set(cache_key, extracted_data)
+
+        return extracted_data, tokens
+
+    def __induce_extract__(self, locator_name: str) -> str:
+        """
+        Extracts the data by the induced locators of the template, they are induced if missing or not valid anymore.
+
+        Args:
+            locator_name (str): The name of the locator.
+
+        Returns:
+            str: The extracted data as a json string.
+        """
+        root: WebElement = self._bot.wait.until(EC.presence_of_element_located(self.__locator__(locator_name)))
+
+        template_name: str = self._template_name or urlparse(self._bot.driver.current_url).netloc
+        key: str = template_key(template_name, locator_name, self._pydantic_model)
+        induction_status: Dict[str, str] = self._bot.payload.output_data.setdefault('llm_induction', {})
+
+        induced_locators: Dict[str, InducedLocator] | None = self._induced_locator_store.get(key)
+        if induced_locators is not None:
+            extracted_data: str | None = self.__extract_induced__(root, induced_locators)
+            if extracted_data is not None:
+                induction_status[locator_name] = 'cached'
+                return extracted_data
+
+            logger.info(f'The induced locators of {key} are not valid anymore, inducing them again')
+
+        html: str = root.get_attribute('innerHTML')
+        try:
+            induced_locators = self.__induce__(locator_name, html)
+            extracted_data = self.__extract_induced__(root, induced_locators)
+        except ValueError as e:
+            logger.warning(f'Locators induction of {key} failed: {e}')
+            extracted_data = None
+
+        if extracted_data is None:
+            # the values are extracted by the llm, the template is induced again on the next page
+            induction_status[locator_name] = 'fallback'
+            self._induced_locator_store.remove(key)
+            extracted_data, tokens = self.__extract__(locator_name, html)
+            self.__record_tokens__({locator_name: tokens})
+            return extracted_data
+
+        induction_status[locator_name] = 'induced'
+        self._induced_locator_store.set(key, induced_locators)
+        return extracted_data
+
+    def __induce__(self, locator_name: str, html: str) -> Dict[str, InducedLocator]:
+        """
+        Asks the llm the locators of the fields, the html keeps the attributes useful to build the selectors.
+
+        Args:
+            locator_name (str): The name of the locator.
+            html (str): The inner html of the element.
+
+        Returns:
+            Dict[str, InducedLocator]: The induced locators, by field name.
+
+        Raises:
+            ValueError: If the llm doesn't return a valid locator for every field.
+        """
+        html = self._induction_html_reducer.reduce(html)
+
+        # the template structure is in the first part of the page, the rest isn't sent
+        html = self._induction_html_reducer.split(html, config.LLM_CHUNK_MAX_TOKENS)[0]
+        logger.debug(f'Inducing the locators of {locator_name} from {count_tokens(html)} tokens')
+
+        return parse_induced_locators(self.__invoke__(html, self._induction_chain), self._pydantic_model)
+
+    def __extract_induced__(self, root: WebElement, induced_locators: Dict[str, InducedLocator]) -> Optional[str]:
+        """
+        Extracts the data by the induced locators in a single driver call, and validates it by the pydantic model.
+
+        Args:
+            root (WebElement): The element of the html entry point.
+            induced_locators (Dict[str, InducedLocator]): The induced locators, by field name.
+
+        Returns:
+            Optional[str]: The extracted data as a json string, None if it isn't valid.
+        """
+        values: Dict[str, Any] = self._bot.extract(
+            locators={field_name: induced_locator.locator for field_name, induced_locator in induced_locators.items()},
+            attributes={field_name: induced_locator.attribute for field_name, induced_locator in induced_locators.items()},
+            multiple=[field_name for field_name, induced_locator in induced_locators.items() if induced_locator.multiple],
+            root=root,
+        )
+
+        values = {
+            field_name: value.strip() if isinstance(value, str) else value
+            for field_name, value in values.items() if value not in (None, '', [])
+        }
+        if not values:
+            return None
+
+        try:
+            return self._pydantic_model.parse_obj(values).json()
+        except ValidationError as e:
+            logger.debug(f'The data extracted by the induced locators is not valid: {e}')
+            return None
+
+    def __invoke__(self, html: str, llm_chain=None) -> str:
+        """
+        Calls the model on a piece of html, bounded by the max concurrency of the process,
+        the rate limited calls are retried with a random exponential backoff.
+
+        Args:
+            html (str): The html sent to the model.
+            llm_chain: The chain called, the extraction chain if None.
+
+        Returns:
+            str: The text returned by the model.
+        """
+        llm_chain = self._llm_chain if llm_chain is None else llm_chain
+
+        for attempt in Retrying(
+            retry=retry_if_exception_type(RateLimitError),
+            wait=wait_random_exponential(multiplier=1, max=config.LLM_RATE_LIMIT_MAX_WAIT),
+            stop=stop_after_attempt(max(config.LLM_RATE_LIMIT_RETRIES, 1)),
+            reraise=True,
+        ):
+            with attempt, span('llm.call', attempt=attempt.retry_state.attempt_number):
+                with _llm_semaphore:
+                    return llm_chain.invoke(
+                        input={"information": html},
+                        return_only_outputs=True,
+                    )["text"]
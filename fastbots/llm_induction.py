@@ -0,0 +1,328 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from contextlib import contextmanager
+from configparser import ConfigParser
+from typing import Any, Dict, Iterator, Optional, Tuple, Type
+
+from langchain_core.pydantic_v1 import BaseModel
+from langchain_core.utils.json import parse_json_markdown
+
+from fastbots import config
+from fastbots.locators import LOCATOR_STRATEGIES, format_locator, parse_locator
+
+
+logger = logging.getLogger(__name__)
+
+# prompt used to induce the locators of the fields, instead of their values
+INDUCTION_PROMPT_TEMPLATE: str = """ given this piece of html {information} of a page built from a template,
+            I want you to find, for every field of the data described below, the selector of the element that contains it.
+            Do not extract the values of the fields.
+            The selectors must be relative to the given html and generic for all the pages with the same template,
+            so don't use the values of the fields or the ids that look generated.
+            Return only a JSON object with an entry for every field, in the format:
+            {{"field_name": {{"by": "css selector" or "xpath", "value": "the selector",
+            "attribute": "text" or the name of the attribute that contains the value (e.g. href, src),
+            "multiple": true if the field is a list else false}}}}
+            The data to locate is described by the following format instructions, use only the fields names and descriptions:
+            \n{format_instructions} # here we are passing format_instructions
+        """
+
+# strategies accepted in the llm answer, mapped to the selenium strategy
+_INDUCED_STRATEGIES: Dict[str, str] = {
+    'css selector': LOCATOR_STRATEGIES['By.CSS_SELECTOR'],
+    'css': LOCATOR_STRATEGIES['By.CSS_SELECTOR'],
+    'xpath': LOCATOR_STRATEGIES['By.XPATH'],
+}
+
+# lock file of the store writes: max wait to get it and age of a lock left by a dead process, in seconds
+FILE_LOCK_TIMEOUT: float = 10.0
+FILE_LOCK_STALE: float = 30.0
+
+# shared stores of the process, by file path
+_stores: Dict[str, 'InducedLocatorStore'] = {}
+_stores_lock: threading.Lock = threading.Lock()
+
+
+class InducedLocator(object):
+    """
+    Locator of a data field, induced by the llm.
+
+    Attributes:
+        locator (Tuple[str, str]): The selenium locator, as (By, value).
+        attribute (str): The attribute that contains the value, 'text' for the element text.
+        multiple (bool): True if the field collects all the matching elements.
+    """
+
+    __slots__ = ('locator', 'attribute', 'multiple')
+
+    def __init__(self, locator: Tuple[str, str], attribute: str = 'text', multiple: bool = False) -> None:
+        self.locator: Tuple[str, str] = locator
+        self.attribute: str = attribute
+        self.multiple: bool = multiple
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, InducedLocator) and \
+            (self.locator, self.attribute, self.multiple) == (other.locator, other.attribute, other.multiple)
+
+    def __repr__(self) -> str:
+        return f'InducedLocator({self.locator!r}, attribute={self.attribute!r}, multiple={self.multiple!r})'
+
+
+def template_key(template_name: str, locator_name: str, pydantic_model: Type[BaseModel]) -> str:
+    """
+    Builds the key of the induced locators of a template, changed when the data model changes.
+
+    Args:
+        template_name (str): The name of the site or template, e.g. the host of the page.
+        locator_name (str): The name of the locator of the html entry point.
+        pydantic_model (Type[BaseModel]): The representation of the data.
+
+    Returns:
+        str: The key, used as section name in the store.
+    """
+    schema_hash: str = hashlib.sha256(json.dumps(pydantic_model.schema(), sort_keys=True).encode('utf-8')).hexdigest()
+    return f'{template_name}:{locator_name}:{pydantic_model.__name__}:{schema_hash[:12]}'
+
+
+def parse_induced_locators(text: str, pydantic_model: Type[BaseModel]) -> Dict[str, InducedLocator]:
+    """
+    Parses the locators returned by the llm, only the fields of the data model are kept.
+
+    Args:
+        text (str): The llm answer, a JSON object optionally in a markdown block.
+        pydantic_model (Type[BaseModel]): The representation of the data.
+
+    Returns:
+        Dict[str, InducedLocator]: The induced locators, by field name.
+
+    Raises:
+        ValueError: If the answer isn't a JSON object or a field has no valid locator.
+    """
+    try:
+        answer: Any = parse_json_markdown(text)
+    except Exception as e:
+        raise ValueError(f'The induced locators are not a JSON object: {e}')
+
+    if not isinstance(answer, dict):
+        raise ValueError('The induced locators are not a JSON object.')
+
+    induced_locators: Dict[str, InducedLocator] = {}
+    for field_name, field in pydantic_model.schema().get('properties', {}).items():
+        spec: Any = answer.get(field_name)
+        if not isinstance(spec, dict) or not spec.get('value'):
+            raise ValueError(f'No locator induced for the field: {field_name}')
+
+        strategy: Optional[str] = _INDUCED_STRATEGIES.get(str(spec.get('by', 'css selector')).strip().lower())
+        if strategy is None:
+            raise ValueError(f'Unknown locator strategy for the field {field_name}: {spec.get("by")}')
+
+        induced_locators[field_name] = InducedLocator(
+            locator=(strategy, str(spec['value'])),
+            attribute=str(spec.get('attribute') or 'text'),
+            multiple=bool(spec.get('multiple', field.get('type') == 'array')),
+        )
+
+    return induced_locators
+
+
+class InducedLocatorStore(object):
+    """
+    Induced Locator Store
+
+    Persistent store of the locators induced by the llm, an ini file with a section for every template,
+    in the same format of the locators file:
+    [www.example.com:page_content_locator:InformationModel:0123456789ab]
+    name=(By.CSS_SELECTOR, "h1.title")
+    links=(By.CSS_SELECTOR, "a.product")
+    links.attribute=href
+    links.multiple=True
+
+    Attributes:
+        _path (str): The path of the ini file.
+        _sections (Dict[str, Dict[str, InducedLocator]]): The loaded locators, by template key and field name.
+
+    Methods:
+        __init__(path: str): Initializes the InducedLocatorStore instance.
+        shared(path: str) -> InducedLocatorStore: Gets the store of the process for a file.
+        get(key: str) -> Dict[str, InducedLocator] | None: Gets the locators of a template.
+        set(key: str, induced_locators: Dict[str, InducedLocator]): Stores the locators of a template.
+        remove(key: str): Removes the locators of a template.
+    """
+
+    def __init__(self, path: str = config.LLM_INDUCED_LOCATORS_FILE_PATH) -> None:
+        """
+        Initializes the InducedLocatorStore instance, the file is loaded at the first usage.
+
+        Args:
+            path (str): The path of the ini file.
+        """
+        super().__init__()
+
+        self._path: str = path
+        self._lock: threading.Lock = threading.Lock()
+        self._modified_time: Optional[int] = None
+        self._sections: Dict[str, Dict[str, InducedLocator]] = {}
+
+    @classmethod
+    def shared(cls, path: str = config.LLM_INDUCED_LOCATORS_FILE_PATH) -> 'InducedLocatorStore':
+        """
+        Gets the store of the process for a file, created at the first usage.
+
+        Args:
+            path (str): The path of the ini file.
+
+        Returns:
+            InducedLocatorStore: The shared store instance.
+        """
+        key: str = str(Path(path).absolute())
+
+        with _stores_lock:
+            if key not in _stores:
+                _stores[key] = cls(path=path)
+            return _stores[key]
+
+    def get(self, key: str) -> Optional[Dict[str, InducedLocator]]:
+        """
+        Gets the locators of a template, the file is loaded again if it's changed by another process.
+
+        Args:
+            key (str): The template key.
+
+        Returns:
+            Dict[str, InducedLocator] | None: The locators by field name, None if the template isn't induced yet.
+        """
+        with self._lock:
+            self.__load__()
+            return self._sections.get(key)
+
+    def set(self, key: str, induced_locators: Dict[str, InducedLocator]):
+        """
+        Stores the locators of a template.
+
+        Args:
+            key (str): The template key.
+            induced_locators (Dict[str, InducedLocator]): The locators by field name.
+        """
+        with self._lock, self.__file_lock__():
+            # the locators saved by the other processes are merged
+            self.__load__(force=True)
+            self._sections[key] = dict(induced_locators)
+            self.__save__()
+
+    def remove(self, key: str):
+        """
+        Removes the locators of a template, so it's induced again.
+
+        Args:
+            key (str): The template key.
+        """
+        with self._lock, self.__file_lock__():
+            self.__load__(force=True)
+            if self._sections.pop(key, None) is not None:
+                self.__save__()
+
+    @contextmanager
+    def __file_lock__(self) -> Iterator[None]:
+        """
+        Holds the lock file of the store, so the writes of the processes don't overwrite each other.
+        A lock older than FILE_LOCK_STALE is left by a dead process and it's removed; if the lock isn't free
+        after FILE_LOCK_TIMEOUT the write goes on without it.
+        """
+        lock_path: Path = Path(self._path).with_name(f'.{Path(self._path).name}.lock')
+        lock_path.parent.mkdir(exist_ok=True, parents=True)
+        end_time: float = time.monotonic() + FILE_LOCK_TIMEOUT
+        locked: bool = False
+
+        while not locked:
+            try:
+                os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                locked = True
+            except FileExistsError:
+                try:
+                    if time.time() - os.stat(lock_path).st_mtime > FILE_LOCK_STALE:
+                        os.remove(lock_path)
+                        continue
+                except FileNotFoundError:
+                    continue
+
+                if time.monotonic() > end_time:
+                    logger.warning(f'Lock of {self._path} not released, writing without it')
+                    break
+                time.sleep(0.01)
+
+        try:
+            yield
+        finally:
+            if locked:
+                try:
+                    os.remove(lock_path)
+                except FileNotFoundError:
+                    pass
+
+    def __load__(self, force: bool = False):
+        """
+        Loads the file, only if it's changed since the last load.
+
+        Args:
+            force (bool): True -> the file is loaded also if it looks unchanged.
+        """
+        try:
+            modified_time: int = os.stat(self._path).st_mtime_ns
+        except FileNotFoundError:
+            return
+
+        if modified_time == self._modified_time and not force:
+            return
+
+        config_parser: ConfigParser = ConfigParser(interpolation=None)
+        config_parser.optionxform = str
+        config_parser.read(self._path)
+
+        sections: Dict[str, Dict[str, InducedLocator]] = {}
+        for section in config_parser.sections():
+            options: Dict[str, str] = dict(config_parser.items(section))
+            try:
+                sections[section] = {
+                    field_name: InducedLocator(
+                        locator=parse_locator(full_locator),
+                        attribute=options.get(f'{field_name}.attribute', 'text'),
+                        multiple=options.get(f'{field_name}.multiple', 'False').strip().lower() == 'true',
+                    )
+                    for field_name, full_locator in options.items() if '.' not in field_name
+                }
+            except ValueError as e:
+                logger.warning(f'Wrong induced locators [{section}] in {self._path}, they will be induced again: {e}')
+
+        self._sections = sections
+        self._modified_time = modified_time
+
+    def __save__(self):
+        """
+        Saves the file atomically, so the other processes never read a partial file.
+        """
+        config_parser: ConfigParser = ConfigParser(interpolation=None)
+        config_parser.optionxform = str
+
+        for section, induced_locators in self._sections.items():
+            config_parser.add_section(section)
+            for field_name, induced_locator in induced_locators.items():
+                config_parser.set(section, field_name, format_locator(induced_locator.locator))
+                if induced_locator.attribute != 'text':
+                    config_parser.set(section, f'{field_name}.attribute', induced_locator.attribute)
+                if induced_locator.multiple:
+                    config_parser.set(section, f'{field_name}.multiple', 'True')
+
+        file_path: Path = Path(self._path)
+        file_path.parent.mkdir(exist_ok=True, parents=True)
+
+        temp_path: Path = file_path.with_name(f'.{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+        with open(temp_path, 'w') as file:
+            config_parser.write(file)
+        os.replace(temp_path, file_path)
+
+        self._modified_time = os.stat(file_path).st_mtime_ns
@@ -0,0 +1,171 @@
+import json
+import logging
+import threading
+from typing import Dict, Optional, Tuple, Type
+
+import httpx
+from langchain.chains import LLMChain
+from langchain.prompts import PromptTemplate
+from langchain_openai import ChatOpenAI
+from langchain_core.output_parsers import JsonOutputParser
+from langchain_core.pydantic_v1 import BaseModel
+
+from fastbots import config
+
+
+logger = logging.getLogger(__name__)
+
+# prompt used to extract the data, the format instructions are built from the pydantic model
+PROMPT_TEMPLATE: str = """ given this information {information} of an entity on this piece of html,
+            I want you to extract all the information about this entity.
+            You are not allowed to make any assumptions while extracting the information.
+            Every link you provide should be from the information given.
+            There should be no assumptions for Links/URLS.
+            You should not return code to do it.:
+            You should extract the following text infromation from the html:
+            \n{format_instructions} # here we are passing format_instructions
+        """
+
+# shared registry of the process, created at the first usage
+_registry: Optional['LLMChainRegistry'] = None
+_registry_lock: threading.Lock = threading.Lock()
+
+
+class LLMChainRegistry(object):
+    """
+    LLM Chain Registry
+
+    Builds the LLM chains once per process, by model name, pydantic schema and prompt template,
+    all the models share one pooled HTTP client with keep-alive connections.
+    It's thread safe, so the extractors created in a loop or in many threads reuse the same chains and connections.
+
+    Attributes:
+        _chains (Dict[Tuple[str, str, str], LLMChain]): The built chains, by model name, schema and prompt template.
+        _llm_models (Dict[str, ChatOpenAI]): The built models, by model name.
+        _http_client (httpx.Client | None): The pooled HTTP client, created at the first usage.
+
+    Methods:
+        __init__(): Initializes the LLMChainRegistry instance.
+        shared() -> LLMChainRegistry: Gets the registry of the process.
+        chain(pydantic_model: Type[BaseModel], model_name: str, prompt_template: str) -> LLMChain: Gets a chain.
+        llm_model(model_name: str) -> ChatOpenAI: Gets a model.
+        clear(): Forgets all the built chains and closes the HTTP client.
+
+    Example:
+        ```python
+        llm_chain = LLMChainRegistry.shared().chain(InformationModel)
+        extracted_data = llm_chain.invoke(input={'information': html}, return_only_outputs=True)['text']
+        ```
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the LLMChainRegistry instance.
+        """
+        super().__init__()
+
+        self._chains: Dict[Tuple[str, str, str], LLMChain] = {}
+        self._llm_models: Dict[str, ChatOpenAI] = {}
+        self._http_client: Optional[httpx.Client] = None
+        self._lock: threading.RLock = threading.RLock()
+
+    @classmethod
+    def shared(cls) -> 'LLMChainRegistry':
+        """
+        Gets the registry of the process, created at the first usage.
+
+        Returns:
+            LLMChainRegistry: The shared registry instance.
+        """
+        global _registry
+
+        with _registry_lock:
+            if _registry is None:
+                _registry = cls()
+            return _registry
+
+    @property
+    def http_client(self) -> httpx.Client:
+        """
+        Gets the pooled HTTP client shared by all the models, created at the first usage.
+
+        Returns:
+            httpx.Client: The HTTP client.
+        """
+        with self._lock:
+            if self._http_client is None:
+                self._http_client = httpx.Client(limits=httpx.Limits(
+                    max_connections=config.LLM_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=config.LLM_HTTP_MAX_CONNECTIONS,
+                    keepalive_expiry=config.LLM_HTTP_KEEPALIVE_EXPIRY,
+                ))
+            return self._http_client
+
+    def llm_model(self, model_name: str = config.LLM_MODEL_NAME) -> ChatOpenAI:
+        """
+        Gets the model, built at the first usage.
+
+        Args:
+            model_name (str): The name of the OpenAI model.
+
+        Returns:
+            ChatOpenAI: The model.
+        """
+        with self._lock:
+            if model_name not in self._llm_models:
+                self._llm_models[model_name] = ChatOpenAI(
+                    temperature=0,
+                    model=model_name,
+                    openai_api_key=config.OPENAI_API_KEY,
+                    http_client=self.http_client,
+                )
+            return self._llm_models[model_name]
+
+    def chain(self, pydantic_model: Type[BaseModel], model_name: str = config.LLM_MODEL_NAME,
+              prompt_template: str = PROMPT_TEMPLATE) -> LLMChain:
+        """
+        Gets the chain of a pydantic model, built at the first usage.
+
+        Args:
+            pydantic_model (Type[BaseModel]): The representation of the data needed to extract.
+            model_name (str): The name of the OpenAI model.
+            prompt_template (str): The prompt template, with the information and format_instructions variables.
+
+        Returns:
+            LLMChain: The chain.
+        """
+        key: Tuple[str, str, str] = (model_name, json.dumps(pydantic_model.schema(), sort_keys=True), prompt_template)
+
+        chain: Optional[LLMChain] = self._chains.get(key)
+        if chain is not None:
+            return chain
+
+        with self._lock:
+            if key not in self._chains:
+                logger.debug(f'Building the llm chain of {pydantic_model.__name__} with the model {model_name}')
+
+                json_output_parser = JsonOutputParser(
+                    pydantic_object=pydantic_model
+                )
+
+                prompt = PromptTemplate(
+                    template=prompt_template,
+                    input_variables=["information"],
+                    partial_variables={"format_instructions": json_output_parser.get_format_instructions()},
+                )
+
+                self._chains[key] = LLMChain(llm=self.llm_model(model_name), prompt=prompt)
+
+            return self._chains[key]
+
+    def clear(self):
+        """
+        Forgets all the built chains and models, and closes the HTTP client.
+        """
+        with self._lock:
+            self._chains.clear()
+            self._llm_models.clear()
+
+            if self._http_client is not None:
+                self._http_client.close()
+                self._http_client = None
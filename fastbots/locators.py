@@ -0,0 +1,288 @@
+import os
+import logging
+import threading
+from pathlib import Path
+from types import MappingProxyType
+from configparser import ConfigParser
+from typing import Dict, Mapping, Optional, Tuple
+
+from selenium.webdriver.common.by import By
+
+
+logger = logging.getLogger(__name__)
+
+# section with the pages url, it contains urls instead of locators
+PAGES_URL_SECTION: str = 'pages_url'
+
+# section with the url globs blocked on the sites of the pages url, by page name
+BLOCKED_URLS_SECTION: str = 'blocked_urls'
+
+# sections that don't contain locators
+VALUES_SECTIONS: frozenset = frozenset((PAGES_URL_SECTION, BLOCKED_URLS_SECTION))
+
+# declared locators, mapped to the selenium strategy
+LOCATOR_STRATEGIES: Mapping[str, str] = MappingProxyType({
+    'By.ID': By.ID,
+    'By.XPATH': By.XPATH,
+    'By.NAME': By.NAME,
+    'By.CLASS_NAME': By.CLASS_NAME,
+    'By.CSS_SELECTOR': By.CSS_SELECTOR,
+    'By.LINK_TEXT': By.LINK_TEXT,
+    'By.PARTIAL_LINK_TEXT': By.PARTIAL_LINK_TEXT,
+    'By.TAG_NAME': By.TAG_NAME,
+})
+
+# compiled indexes of the process, by file path: (modification time, index)
+_indexes: Dict[str, Tuple[int, 'LocatorIndex']] = {}
+_indexes_lock: threading.Lock = threading.Lock()
+
+
+def parse_locator(full_locator: str) -> Tuple[str, str]:
+    """
+    Parses a locator declared in the locators file.
+
+    The locators must be in the format:
+    locator_name=(By.XPATH, "//html//input")
+
+    Args:
+        full_locator (str): The locator string.
+
+    Returns:
+        Tuple[str, str]: The selenium locator, as (By, value).
+
+    Raises:
+        ValueError: If the locator is not enclosed in round brackets or is of an unknown or incorrect format.
+    """
+    full_locator = full_locator.strip().replace('\\\'',  '\'').replace('\\"', '"')
+
+    if not full_locator.startswith('(') or not full_locator.endswith(')'):
+        raise ValueError('The locator must be enclosed in round brackets.')
+
+    strategy, comma, value = full_locator[1:-1].strip().partition(',')
+    strategy, value = strategy.strip(), value.strip()
+
+    if not comma or strategy not in LOCATOR_STRATEGIES:
+        raise ValueError('The specified locator is unknown or wrong; check by, brackets, and commas.')
+
+    if len(value) < 2 or value[0] not in '\'"' or value[-1] != value[0]:
+        raise ValueError('The specified locator value must be enclosed in quotes.')
+
+    return LOCATOR_STRATEGIES[strategy], value[1:-1]
+
+
+def format_locator(locator: Tuple[str, str]) -> str:
+    """
+    Formats a selenium locator as declared in the locators file, the inverse of parse_locator.
+
+    The value is enclosed in the quotes it doesn't contain, the backslashes are kept as they are
+    (e.g. the escaped css selectors), only the quotes of the value are escaped if it contains both.
+
+    Args:
+        locator (Tuple[str, str]): The selenium locator, as (By, value).
+
+    Returns:
+        str: The locator string, e.g. (By.XPATH, "//html//input").
+
+    Raises:
+        ValueError: If the locator strategy is unknown.
+    """
+    strategy, value = locator
+    declared: Optional[str] = next((name for name, by in LOCATOR_STRATEGIES.items() if by == strategy), None)
+    if declared is None:
+        raise ValueError(f'Unknown locator strategy: {strategy}')
+
+    if '"' not in value:
+        return f'({declared}, "{value}")'
+    if "'" not in value:
+        return f"({declared}, '{value}')"
+    escaped: str = value.replace('"', '\\"')
+    return f'({declared}, "{escaped}")'
+
+
+class LocatorIndex(object):
+    """
+    Locator Index
+
+    Immutable index of the locators file, compiled once per process and shared by all the bots and pages.
+    The locators are parsed and validated when the file is loaded, so the lookups are dict hits.
+
+    Attributes:
+        _path (str): The path of the locators file.
+        _values (Mapping[str, Mapping[str, str]]): The raw values, by section and option.
+        _locators (Mapping[str, Mapping[str, Tuple[str, str]]]): The compiled locators, by section and option.
+
+    Methods:
+        load(path: str) -> LocatorIndex: Gets the compiled index of the file, reloaded only when the file changes.
+        has_section(page_name: str) -> bool: Checks if a section is declared.
+        options(page_name: str) -> Mapping[str, str]: Gets the raw values of a section.
+        value(page_name: str, locator_name: str) -> str: Gets the raw value of a locator.
+        locator(page_name: str, locator_name: str) -> Tuple[str, str]: Gets a compiled locator.
+
+    Example:
+        ```python
+        locators = LocatorIndex.load('locators.ini')
+        bot.driver.find_element(*locators.locator('search_page', 'search_locator'))
+        ```
+    """
+
+    def __init__(self, path: str, values: Dict[str, Dict[str, str]]) -> None:
+        """
+        Initializes the LocatorIndex instance, compiling all the locators.
+
+        Args:
+            path (str): The path of the locators file.
+            values (Dict[str, Dict[str, str]]): The raw values, by section and option.
+
+        Raises:
+            ValueError: If a declared locator is of an unknown or incorrect format.
+        """
+        super().__init__()
+
+        self._path: str = path
+        self._values: Mapping[str, Mapping[str, str]] = MappingProxyType(
+            {section: MappingProxyType(dict(options)) for section, options in values.items()}
+        )
+
+        locators: Dict[str, Mapping[str, Tuple[str, str]]] = {}
+        for section, options in values.items():
+            if section in VALUES_SECTIONS:
+                continue
+
+            compiled: Dict[str, Tuple[str, str]] = {}
+            for option, full_locator in options.items():
+                try:
+                    compiled[option] = parse_locator(full_locator)
+                except ValueError as e:
+                    raise ValueError(f'Wrong locator [{section}] {option} in {path}: {e}')
+
+            locators[section] = MappingProxyType(compiled)
+
+        self._locators: Mapping[str, Mapping[str, Tuple[str, str]]] = MappingProxyType(locators)
+
+    @classmethod
+    def load(cls, path: str) -> 'LocatorIndex':
+        """
+        Gets the compiled index of the locators file, it's reloaded only when the file modification time changes.
+
+        Args:
+            path (str): The path of the locators file.
+
+        Returns:
+            LocatorIndex: The compiled index.
+
+        Raises:
+            ValueError: If the file doesn't exist or contains a wrong locator.
+        """
+        file_path: Path = Path(path)
+        if not file_path.is_file():
+            raise ValueError(f'Erorr, locators file not founded at path: {path}')
+
+        key: str = str(file_path.absolute())
+        modified_time: int = os.stat(key).st_mtime_ns
+
+        with _indexes_lock:
+            cached = _indexes.get(key)
+            if cached is not None and cached[0] == modified_time:
+                return cached[1]
+
+            config_parser: ConfigParser = ConfigParser()
+            config_parser.read(key)
+
+            index: LocatorIndex = cls(path=key, values={
+                section: dict(config_parser.items(section)) for section in config_parser.sections()
+            })
+            _indexes[key] = (modified_time, index)
+
+            logger.debug(f'Locators file compiled: {key}')
+            return index
+
+    @property
+    def path(self) -> str:
+        """
+        Gets the path of the locators file.
+
+        Returns:
+            str: The file path.
+        """
+        return self._path
+
+    def has_section(self, page_name: str) -> bool:
+        """
+        Checks if a section is declared in the locators file.
+
+        Args:
+            page_name (str): The name of the page.
+
+        Returns:
+            bool: True if the section is declared.
+        """
+        return page_name in self._values
+
+    def options(self, page_name: str) -> Mapping[str, str]:
+        """
+        Gets the raw values of a section, as declared in the file.
+
+        Args:
+            page_name (str): The name of the section.
+
+        Returns:
+            Mapping[str, str]: The raw values, by option, empty if the section isn't declared.
+        """
+        return self._values.get(page_name, MappingProxyType({}))
+
+    def value(self, page_name: str, locator_name: str) -> str:
+        """
+        Gets the raw value of a locator, as declared in the file.
+
+        Args:
+            page_name (str): The name of the page.
+            locator_name (str): The name of the locator.
+
+        Returns:
+            str: The raw value.
+
+        Raises:
+            ValueError: If the specified page_name or locator_name is not declared in locator's config.
+        """
+        try:
+            return self._values[page_name][locator_name]
+        except KeyError:
+            self.__missing__(page_name, locator_name)
+
+    def locator(self, page_name: str, locator_name: str) -> Tuple[str, str]:
+        """
+        Gets a compiled locator.
+
+        Args:
+            page_name (str): The name of the page.
+            locator_name (str): The name of the locator.
+
+        Returns:
+            Tuple[str, str]: The selenium locator, as (By, value).
+
+        Raises:
+            ValueError: If the specified page_name or locator_name is not declared in locator's config.
+        """
+        try:
+            return self._locators[page_name][locator_name]
+        except KeyError:
+            self.__missing__(page_name, locator_name)
+
+    def __missing__(self, page_name: str, locator_name: str):
+        """
+        Raises the error of a locator that isn't declared.
+
+        Args:
+            page_name (str): The name of the page.
+            locator_name (str): The name of the locator.
+
+        Raises:
+            ValueError: If the specified page_name or locator_name is not declared in locator's config.
+        """
+        if page_name not in self._values:
+            raise ValueError(f'The specified page_name: {page_name} is not declared in locators config.')
+
+        if page_name in VALUES_SECTIONS and locator_name in self._values[page_name]:
+            raise ValueError(f'The section: {page_name} contains urls, not locators.')
+
+        raise ValueError(f'The specified locator_name: {locator_name} is not declared in locators config.')
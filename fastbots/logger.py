@@ -1,9 +1,239 @@
+import copy
+import json
+import queue
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import threading
+import contextvars
+from pathlib import Path
+from datetime import datetime, timezone
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 from selenium.webdriver.remote.remote_connection import LOGGER
 
 from fastbots import config
+from fastbots.tracing import current_tracer
+
+
+# context of the current task run (task, attempt, page), added to the log records
+_log_context: contextvars.ContextVar[Dict[str, Any]] = contextvars.ContextVar('fastbots_log_context', default={})
+
+# handlers thread of the process, replaced by setup_logging
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional['NonBlockingQueueHandler'] = None
+_setup_lock: threading.Lock = threading.Lock()
+
+# seconds an error record waits for room in the full queue, then it's handled on the logging thread
+ERROR_QUEUE_TIMEOUT: float = 1.0
+
+TEXT_FORMAT: str = '%(asctime)s %(filename)s:%(lineno)s - %(funcName)s - %(name)s - %(levelname)s -  %(message)s'
+
+
+@contextmanager
+def log_context(**fields: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Adds fields to the log records of the current context, nested in the fields of the outer contexts.
+
+    Args:
+        **fields (Any): The fields, e.g. the task name or the attempt number.
+
+    Yields:
+        Dict[str, Any]: The fields of the current context.
+    """
+    context: Dict[str, Any] = {**_log_context.get(), **fields}
+    token = _log_context.set(context)
+    try:
+        yield context
+    finally:
+        _log_context.reset(token)
+
+
+class ContextFilter(logging.Filter):
+    """
+    Adds the fields of the current context and the trace id of the task run to the log records,
+    it runs on the logging thread because the listener thread doesn't share its context.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        context: Dict[str, Any] = dict(_log_context.get())
+
+        tracer = current_tracer()
+        if tracer is not None:
+            context.setdefault('trace_id', tracer.trace_id)
+
+        record.context = context
+        return True
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    Queues the log records for the listener thread, the logging thread never waits for the handlers:
+    when the queue is full the records below ERROR are dropped, the errors wait a moment for room and then
+    they are handled on the logging thread, so they are never lost. The dropped records are counted and reported
+    by a warning once the queue has room again. The tracebacks are formatted by the listener thread.
+    """
+
+    def __init__(self, log_queue: queue.Queue, listener: Optional[QueueListener] = None,
+                 error_timeout: float = ERROR_QUEUE_TIMEOUT) -> None:
+        super().__init__(log_queue)
+
+        self.dropped: int = 0
+        self.listener: Optional[QueueListener] = listener
+        self._error_timeout: float = error_timeout
+        self._reported: int = 0
+        self._lock: threading.Lock = threading.Lock()
+        self.addFilter(ContextFilter())
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # the message is merged with its args now, the args could change after the call
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            if record.levelno >= logging.ERROR:
+                self.queue.put(record, timeout=self._error_timeout)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            if record.levelno < logging.ERROR:
+                with self._lock:
+                    self.dropped += 1
+                return
+
+            # the listener is stuck or stopped, the handlers are called on the logging thread
+            if self.listener is not None:
+                self.listener.handle(record)
+            else:
+                logging.lastResort.handle(record)
+            return
+
+        if self.dropped > self._reported:
+            self.report_dropped()
+
+    def report_dropped(self, timeout: Optional[float] = None):
+        """
+        Queues a warning with the number of records dropped since the last report.
+
+        Args:
+            timeout (float): The seconds to wait for room in the queue, None -> it doesn't wait.
+        """
+        with self._lock:
+            dropped: int = self.dropped - self._reported
+            if dropped <= 0:
+                return
+            self._reported = self.dropped
+
+        record: logging.LogRecord = logging.LogRecord(
+            __name__, logging.WARNING, __file__, 0, f'{dropped} log records dropped, the log queue was full', None, None
+        )
+        try:
+            if timeout is None:
+                self.queue.put_nowait(record)
+            else:
+                self.queue.put(record, timeout=timeout)
+        except queue.Full:
+            # reported with the next records
+            with self._lock:
+                self._reported -= dropped
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats the log records as JSON objects, a line per record, with the fields of their context.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        data: Dict[str, Any] = {
+            'time': datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'module': record.module,
+            'function': record.funcName,
+            'line': record.lineno,
+            'thread': record.threadName,
+            'process': record.process,
+        }
+        data.update(getattr(record, 'context', {}))
+
+        if record.exc_info:
+            data['exception'] = self.formatException(record.exc_info)
+        if record.stack_info:
+            data['stack'] = self.formatStack(record.stack_info)
+
+        return json.dumps(data, default=str)
+
+
+def setup_logging(level: int = config.LOG_LEVEL, file_path: str = config.LOG_FILE_PATH,
+                  max_bytes: int = config.LOG_MAX_BYTES, backup_count: int = config.LOG_BACKUP_COUNT,
+                  queue_size: int = config.LOG_QUEUE_SIZE) -> QueueListener:
+    """
+    Configures the root logger: the records are queued and handled by a listener thread, so logging never slows down
+    the bots. The console gets the text records, the log file gets the JSON records and it's rotated by size.
+    A previous setup is replaced, the records already queued are handled first.
+
+    Args:
+        level (int): The logging level.
+        file_path (str): The path of the log file, None -> only the console.
+        max_bytes (int): The size of the log file that triggers the rotation.
+        backup_count (int): The number of rotated log files kept.
+        queue_size (int): The max records waiting for the listener thread.
+
+    Returns:
+        QueueListener: The listener of the handlers.
+    """
+    global _listener, _queue_handler
+
+    root: logging.Logger = logging.getLogger()
+
+    with _setup_lock:
+        if _listener is not None:
+            root.removeHandler(_queue_handler)
+            _queue_handler.report_dropped(timeout=ERROR_QUEUE_TIMEOUT)
+            _listener.stop()
+
+        console_handler: logging.Handler = logging.StreamHandler()
+        console_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+        handlers = [console_handler]
+
+        if file_path is not None and file_path != 'None':
+            if Path(file_path).parent != Path('.'):
+                Path(file_path).parent.mkdir(exist_ok=True, parents=True)
+
+            file_handler: logging.Handler = RotatingFileHandler(
+                file_path, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8', delay=True
+            )
+            file_handler.setFormatter(JsonFormatter())
+            handlers.append(file_handler)
+
+        log_queue: queue.Queue = queue.Queue(maxsize=max(queue_size, 1))
+        _listener = QueueListener(log_queue, *handlers)
+        _queue_handler = NonBlockingQueueHandler(log_queue, listener=_listener)
+        _listener.start()
+
+        root.addHandler(_queue_handler)
+        root.setLevel(level)
+
+    return _listener
+
+
+@atexit.register
+def stop_logging():
+    """
+    Handles the queued records, reports the dropped ones and stops the listener thread.
+    """
+    global _listener
+
+    with _setup_lock:
+        if _listener is not None:
+            _queue_handler.report_dropped(timeout=ERROR_QUEUE_TIMEOUT)
+            _listener.stop()
+            _listener = None
 
 
 # Configure logging for external libraries
@@ -14,9 +244,6 @@ logging.getLogger('hpack').setLevel(logging.WARNING)
 # Set logging level for Selenium remote connection
 LOGGER.setLevel(logging.WARNING)
 
-# Configure root logger with console and file handlers
-logging.basicConfig(
-    handlers=[logging.StreamHandler(), RotatingFileHandler('log.log', maxBytes=2000)],
-    format='%(asctime)s %(filename)s:%(lineno)s - %(funcName)s - %(name)s - %(levelname)s -  %(message)s',
-    level=config.LOG_LEVEL
-)
+# Configure the root logger, if the application didn't configure it
+if not logging.getLogger().handlers:
+    setup_logging()
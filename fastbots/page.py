@@ -1,11 +1,12 @@
 import logging
+import functools
 from abc import ABC, abstractmethod
-from typing import Type, Union, List
-
-from selenium.webdriver.common.by import By
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Type, Union
 
 from fastbots.bot import Bot
 from fastbots import config
+from fastbots.tracing import span
+from fastbots.logger import log_context
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +25,12 @@ class Page(ABC):
         __init__(bot: Bot, page_name: str = 'page_name'): Initializes the Page class.
         bot: Gets the associated bot instance.
         __locator__(locator_name: str) -> tuple: Utility method to load a locator.
+        extract(locator_names: Union[List[str], Dict[str, str]], multiple: Iterable[str] = ()) -> Dict[str, Any]:
+            Extracts the text or attributes of many page locators in a single driver call.
+        wait_for_json(url_pattern: str, method: str | None = None, action: Callable[[], Any] | None = None) -> Any:
+            Waits for a JSON response of the url pattern and returns its decoded body.
+        iter_json(url_pattern: str, method: str | None = None, action: Callable[[], Any] | None = None) -> Iterator[Any]:
+            Iterates over the decoded bodies of all the JSON responses of the url pattern.
         forward() -> Union[Type['Page'], None]: Represents a series of actions on the page.
 
     Example:
@@ -55,13 +62,38 @@ class Page(ABC):
 
         self._bot: Bot = bot
         self._page_name: str = page_name
-        
-        # load the pages url from the locators file
-        self._page_url: str = self._bot.locator('pages_url', self._page_name)
 
-        # check that the current page is the expected
-        if config.SELENIUM_EXPECTED_URL_CHECK and self._page_url != 'None':
-            self._bot.check_page_url(expected_page_url=self._page_url, strict_page_check=strict_page_check)
+        with span('page.init', page=page_name), log_context(page=page_name):
+            # load the pages url from the locators file
+            self._page_url: str = self._bot.locator('pages_url', self._page_name)
+
+            # check that the current page is the expected
+            if config.SELENIUM_EXPECTED_URL_CHECK and self._page_url != 'None':
+                self._bot.check_page_url(expected_page_url=self._page_url, strict_page_check=strict_page_check)
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Runs the forward method of every page in a span, so the task traces show the time spent on each page,
+        and stores the checkpoint of the chain after every completed page.
+        """
+        super().__init_subclass__(**kwargs)
+
+        forward = cls.__dict__.get('forward')
+        if forward is None or getattr(forward, '__traced__', False):
+            return
+
+        @functools.wraps(forward)
+        def traced_forward(self, *args, **kwargs):
+            with span('page.forward', page=self._page_name), log_context(page=self._page_name):
+                next_page = forward(self, *args, **kwargs)
+
+            # the chain resumes from the next page, if it's retried
+            if isinstance(next_page, Page):
+                self._bot.checkpoint(next_page)
+            return next_page
+
+        traced_forward.__traced__ = True
+        cls.forward = traced_forward
 
     @property
     def bot(self):
@@ -88,37 +120,79 @@ class Page(ABC):
             tuple: A tuple representing the loaded locator.
 
         Raises:
-            ValueError: If the locator is not enclosed in round brackets or is of an unknown or incorrect format.
-        """
-        # load the locators from file and interpret that as code
-        full_locator: str = self._bot.locator(self._page_name, locator_name).strip().replace('\\\'',  '\'').replace('\\"', '"')
-
-        if not full_locator.startswith('(') or not full_locator.endswith(')'):
-            raise ValueError('The locator must be enclosed in round brackets.')
-
-        # declared locators
-        locator_list: List[str] = [
-            'By.ID', 'By.XPATH', 'By.NAME', 'By.CLASS_NAME', 'By.CSS_SELECTOR', 
-            'By.LINK_TEXT', 'By.PARTIAL_LINK_TEXT', 'By.TAG_NAME'
-        ]
-
-        # check the used locator
-        parsed_locator: tuple = None
-        for locator in locator_list:
-            # check that the first characters are them of the locators and the next one of the comma 
-            if full_locator[1:-1].strip().startswith(locator) and full_locator[1:-1].strip()[len(locator):].strip().startswith(','):
-                # extract the tuple required as locator
-                parsed_locator = (
-                    eval(locator), 
-                    full_locator[1:-1].strip()[len(locator):].strip()[1:].strip()[1:-1]
-                )
-
-                logging.debug(f'{locator_name} {parsed_locator}')
-
-                return parsed_locator
-            
-        else:
-            raise ValueError('The specified locator is unknown or wrong; check by, brackets, and commas.')
+            ValueError: If the locator is not declared in the locators file.
+        """
+        # the locators are compiled once per process when the file is loaded
+        return self._bot.compiled_locator(self._page_name, locator_name)
+
+    def extract(self, locator_names: Union[List[str], Dict[str, str]], multiple: Iterable[str] = ()) -> Dict[str, Any]:
+        """
+        Extracts the text or attributes of many page locators in a single driver call.
+
+        The locators in the file must be in the format:
+        [page_name]
+        locator_name=(By.XPATH, "//html//input")
+
+        Args:
+            locator_names (Union[List[str], Dict[str, str]]): The locator names, for the element text,
+                or a dict with the attribute read for every locator name ('text' for the element text).
+            multiple (Iterable[str]): The locator names that collect all the matching elements, as a list.
+
+        Returns:
+            Dict[str, Any]: The extracted values by locator name, None for the missing elements.
+
+        Example:
+        ```python
+        data = self.extract({'name_locator': 'text', 'image_locator': 'src'}, multiple=['image_locator'])
+        ```
+        """
+        attributes: Dict[str, str] = locator_names if isinstance(locator_names, dict) else {}
+
+        return self._bot.extract(
+            locators={locator_name: self.__locator__(locator_name) for locator_name in locator_names},
+            attributes=attributes,
+            multiple=multiple
+        )
+
+    def wait_for_json(self, url_pattern: str, method: str | None = None, action: Callable[[], Any] | None = None,
+                      timeout: float = config.SELENIUM_DEFAULT_WAIT) -> Any:
+        """
+        Waits for a JSON response of the url pattern and returns its decoded body, without waiting for the DOM.
+
+        Args:
+            url_pattern (str): The url regular expression, searched in the request url.
+            method (str | None): The request method, None -> any method.
+            action (Callable[[], Any] | None): Called once the wait is registered, e.g. the click that loads the data.
+            timeout (float): The max seconds to wait.
+
+        Returns:
+            Any: The decoded JSON body.
+
+        Raises:
+            ResponseTimeoutError: If no JSON response matches before the timeout.
+
+        Example:
+        ```python
+        data = self.wait_for_json(r'/api/search', action=lambda: self.bot.driver.find_element(*self.__locator__('search_locator')).click())
+        ```
+        """
+        return self._bot.wait_for_json(url_pattern, method=method, action=action, timeout=timeout)
+
+    def iter_json(self, url_pattern: str, method: str | None = None, action: Callable[[], Any] | None = None,
+                  timeout: float = config.SELENIUM_DEFAULT_WAIT) -> Iterator[Any]:
+        """
+        Iterates over the decoded bodies of all the JSON responses of the url pattern, while the page paginates.
+
+        Args:
+            url_pattern (str): The url regular expression, searched in the request url.
+            method (str | None): The request method, None -> any method.
+            action (Callable[[], Any] | None): Called once the iteration is registered.
+            timeout (float): The max seconds to wait for every response, the iteration ends after it.
+
+        Yields:
+            Any: The decoded JSON bodies, in arrival order.
+        """
+        return self._bot.iter_json(url_pattern, method=method, action=action, timeout=timeout)
 
     @abstractmethod
     def forward(self) -> Union[Type['Page'], None]:
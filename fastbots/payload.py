@@ -1,13 +1,14 @@
 from dataclasses import dataclass, field
-from typing import List, Dict
+from typing import Any, List, Dict
 
 
 @dataclass
 class Payload:
     """
-    Payload class for managing input data, downloads, and output data.
+    Payload class for managing input data, downloads, output data, and the timing spans of the run.
     """
 
     input_data: Dict[str, str] = field(default_factory=dict)
     downloads: List[str] = field(default_factory=list)
-    output_data: Dict[str, str] = field(default_factory=dict)
\ No newline at end of file
+    output_data: Dict[str, str] = field(default_factory=dict)
+    spans: List[Dict[str, Any]] = field(default_factory=list)
\ No newline at end of file
@@ -0,0 +1,205 @@
+import os
+import json
+import shutil
+import hashlib
+import logging
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from fastbots import config
+
+
+logger = logging.getLogger(__name__)
+
+# preferences file of the profiles
+USER_PREFS_FILE: str = 'user.js'
+
+# preferences selenium sets on the profiles it creates, the selenium attribute changed shape between its versions
+FIREFOX_DEFAULT_PREFERENCES: Dict[str, Any] = {
+    'browser.newtabpage.enabled': False,
+    'browser.startup.homepage': 'about:blank',
+    'browser.usedOnWindows10.introURL': 'about:blank',
+    'network.captive-portal-service.enabled': False,
+    'security.csp.enable': False,
+    'startup.homepage_welcome_url': 'about:blank',
+}
+
+# parsed preferences files, by path, modification time and size
+_preferences: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+_preferences_lock: threading.Lock = threading.Lock()
+
+# shared caches of the process, by cache folder
+_caches: Dict[str, 'ProfileCache'] = {}
+_caches_lock: threading.Lock = threading.Lock()
+
+
+def load_preferences(file_path: str = config.BOT_PREFERENCES_FILE_PATH) -> Dict[str, Any]:
+    """
+    Loads the preferences of a JSON file, the file is parsed again only when it changes.
+
+    Args:
+        file_path (str): The path of the preferences file.
+
+    Returns:
+        Dict[str, Any]: A copy of the preferences, empty if the file doesn't exist.
+    """
+    path: Path = Path(file_path)
+    try:
+        stat = path.stat()
+    except OSError:
+        return {}
+
+    key: Tuple[str, int, int] = (str(path.absolute()), stat.st_mtime_ns, stat.st_size)
+    with _preferences_lock:
+        preferences: Optional[Dict[str, Any]] = _preferences.get(key)
+
+    if preferences is None:
+        with open(path, 'r') as file:
+            preferences = json.load(file)
+
+        with _preferences_lock:
+            # only the last version of every file is kept
+            for old_key in [old_key for old_key in _preferences if old_key[0] == key[0]]:
+                del _preferences[old_key]
+            _preferences[key] = preferences
+
+    # the callers add their own preferences
+    return json.loads(json.dumps(preferences))
+
+
+def user_prefs(preferences: Dict[str, Any]) -> str:
+    """
+    Formats the preferences as the lines of a Firefox user.js file.
+
+    Args:
+        preferences (Dict[str, Any]): The preferences.
+
+    Returns:
+        str: The user.js content.
+    """
+    return ''.join(f'user_pref("{key}", {json.dumps(value)});\n' for key, value in preferences.items())
+
+
+class ProfileCache(object):
+    """
+    Profile Cache
+
+    A user.js preferences cache: the user.js of the shared preferences is rendered once per preferences hash
+    (the template) and the profile of every bot is a folder with only a user.js, the template one plus
+    the preferences of the bot, e.g. its download folder. The browser is started on it with the -profile argument,
+    so the launches skip the preferences parsing and the zipped, base64 encoded profile that selenium sends
+    for every session. It isn't a prepared profile: Firefox still creates the rest of the profile at every launch.
+    The templates are stored in a folder shared by the processes of the host and published with an atomic rename.
+
+    Attributes:
+        _cache_dir (Path): The folder of the templates.
+
+    Methods:
+        __init__(cache_dir: str): Initializes the ProfileCache instance.
+        shared(cache_dir: str) -> ProfileCache: Gets the cache of the process for a folder.
+        template(preferences: Dict[str, Any]) -> Path: Gets the template of the preferences, built if missing.
+        clone(preferences: Dict[str, Any], bot_preferences: Dict[str, Any]) -> Path: Creates the profile of a bot.
+
+    Example:
+        ```python
+        profile_dir = ProfileCache.shared().clone(load_preferences(), {'browser.download.dir': download_dir})
+        firefox_options.add_argument('-profile')
+        firefox_options.add_argument(str(profile_dir))
+        ```
+    """
+
+    def __init__(self, cache_dir: str = config.BOT_PROFILE_CACHE_DIR) -> None:
+        """
+        Initializes the ProfileCache instance.
+
+        Args:
+            cache_dir (str): The folder of the templates, 'None' -> a folder in the system temporary directory.
+        """
+        super().__init__()
+
+        if cache_dir == 'None':
+            cache_dir = str(Path(tempfile.gettempdir()) / 'fastbots-profiles')
+
+        self._cache_dir: Path = Path(cache_dir)
+        self._lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, cache_dir: str = config.BOT_PROFILE_CACHE_DIR) -> 'ProfileCache':
+        """
+        Gets the cache of the process for a folder, created at the first usage.
+
+        Args:
+            cache_dir (str): The folder of the templates.
+
+        Returns:
+            ProfileCache: The shared cache instance.
+        """
+        with _caches_lock:
+            if cache_dir not in _caches:
+                _caches[cache_dir] = cls(cache_dir)
+            return _caches[cache_dir]
+
+    @property
+    def cache_dir(self) -> Path:
+        """
+        Gets the folder of the templates.
+
+        Returns:
+            Path: The folder path.
+        """
+        return self._cache_dir
+
+    def template(self, preferences: Dict[str, Any]) -> Path:
+        """
+        Gets the template of the preferences, it's built only if no process built it before.
+
+        Args:
+            preferences (Dict[str, Any]): The preferences shared by all the bots.
+
+        Returns:
+            Path: The template folder.
+        """
+        content: str = user_prefs(preferences)
+        template_dir: Path = self._cache_dir / f'firefox-{hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]}'
+
+        if template_dir.exists():
+            return template_dir
+
+        with self._lock:
+            if template_dir.exists():
+                return template_dir
+
+            self._cache_dir.mkdir(exist_ok=True, parents=True)
+            build_dir: str = tempfile.mkdtemp(prefix='.build-', dir=self._cache_dir)
+            (Path(build_dir) / USER_PREFS_FILE).write_text(content, encoding='utf-8')
+
+            try:
+                os.rename(build_dir, template_dir)
+                logger.debug(f'Firefox profile template built: {template_dir}')
+            except OSError:
+                # built by another process in the meantime
+                shutil.rmtree(build_dir, ignore_errors=True)
+
+        return template_dir
+
+    def clone(self, preferences: Dict[str, Any], bot_preferences: Dict[str, Any]) -> Path:
+        """
+        Creates the profile of a bot: a folder with the user.js of the template and the preferences of the bot.
+
+        Args:
+            preferences (Dict[str, Any]): The preferences shared by all the bots.
+            bot_preferences (Dict[str, Any]): The preferences of the bot, added to the template ones.
+
+        Returns:
+            Path: The profile folder, removed by the bot when it's closed.
+        """
+        template_dir: Path = self.template(preferences)
+        profile_dir: Path = Path(tempfile.mkdtemp(prefix='fastbots-profile-'))
+
+        (profile_dir / USER_PREFS_FILE).write_text(
+            (template_dir / USER_PREFS_FILE).read_text(encoding='utf-8') + user_prefs(bot_preferences), encoding='utf-8'
+        )
+
+        return profile_dir
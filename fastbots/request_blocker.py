@@ -0,0 +1,277 @@
+import re
+import fnmatch
+import logging
+import threading
+from urllib.parse import urlsplit
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+
+from seleniumwire.thirdparty.mitmproxy.http import HTTPResponse
+
+from fastbots import config
+from fastbots.locators import BLOCKED_URLS_SECTION, PAGES_URL_SECTION, LocatorIndex
+
+
+logger = logging.getLogger(__name__)
+
+# blockable resource types: the fetch destinations sent by the browsers and the fallback file extensions
+RESOURCE_TYPES: Mapping[str, Tuple[FrozenSet[str], Tuple[str, ...]]] = {
+    'image': (frozenset(('image',)), ('.png', '.jpg', '.jpeg', '.gif', '.webp', '.avif', '.svg', '.ico', '.bmp')),
+    'font': (frozenset(('font',)), ('.woff', '.woff2', '.ttf', '.otf', '.eot')),
+    'media': (frozenset(('audio', 'video', 'track')), ('.mp4', '.webm', '.ogg', '.ogv', '.mp3', '.wav', '.m4a', '.mov', '.m3u8')),
+    'stylesheet': (frozenset(('style',)), ('.css',)),
+}
+
+# fetch destinations of the navigations, never blocked by type, e.g. the downloads of an image
+NAVIGATION_DESTINATIONS: FrozenSet[str] = frozenset(('document', 'iframe', 'frame', 'embed', 'object'))
+
+# known analytics and ads hosts, their subdomains are blocked too
+TRACKER_HOSTS: Tuple[str, ...] = (
+    'google-analytics.com', 'googletagmanager.com', 'googleadservices.com', 'googlesyndication.com',
+    'doubleclick.net', 'adservice.google.com', 'connect.facebook.net', 'analytics.tiktok.com', 'bat.bing.com',
+    'hotjar.com', 'clarity.ms', 'segment.io', 'cdn.segment.com', 'mixpanel.com', 'amplitude.com',
+    'scorecardresearch.com', 'quantserve.com', 'taboola.com', 'outbrain.com', 'criteo.com', 'criteo.net',
+    'adnxs.com', 'amazon-adsystem.com', 'nr-data.net', 'fullstory.com',
+)
+
+
+def compile_globs(globs: Iterable[str]) -> Optional[re.Pattern]:
+    """
+    Compiles many url globs in a single regular expression.
+
+    Args:
+        globs (Iterable[str]): The url globs, e.g. '*/ads/*'.
+
+    Returns:
+        re.Pattern | None: The compiled pattern, None without globs.
+    """
+    patterns: List[str] = [fnmatch.translate(glob) for glob in globs if glob]
+    if not patterns:
+        return None
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns))
+
+
+def split_values(value: str) -> List[str]:
+    """
+    Splits a comma separated list of the config.
+
+    Args:
+        value (str): The comma separated list, 'None' -> empty.
+
+    Returns:
+        List[str]: The values, without spaces.
+    """
+    if value == 'None':
+        return []
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+class RequestBlocker(object):
+    """
+    Request Blocker
+
+    Answers locally the requests of the blocked resource types, of the known analytics and ads hosts and
+    of the blocked urls, so they never leave the selenium-wire proxy. It runs as a proxy addon before the
+    selenium-wire interceptors, so it works also when the traffic capture is disabled.
+
+    The blocked urls of a site are declared in the locators file, by page name, and they apply to the requests
+    sent by the site of the page (the host of the referer).
+
+    Attributes:
+        _resource_types (Dict[str, Tuple[FrozenSet[str], Tuple[str, ...]]]): The blocked resource types.
+        _hosts (Tuple[str, ...]): The blocked hosts.
+        _urls (re.Pattern | None): The url globs blocked on all the sites.
+        _site_urls (Dict[str, re.Pattern]): The url globs blocked, by site host.
+        _blocked (int): The requests blocked in the current job.
+        _allowed (int): The requests allowed in the current job.
+
+    Methods:
+        __init__(resource_types, hosts, urls, site_urls): Initializes the RequestBlocker instance.
+        from_config(locators: LocatorIndex) -> RequestBlocker | None: Builds the blocker of the settings.
+        install(driver): Adds the blocker to the proxy of a selenium-wire driver.
+        should_block(url: str, headers: Mapping[str, str]) -> str | None: Checks if a request is blocked.
+        counters() -> Dict[str, int]: Gets the blocked and allowed requests of the current job.
+        reset(): Resets the counters.
+
+    Example:
+        ```ini
+        # locators.ini
+        [pages_url]
+        search_page=https://example.com/search
+
+        [blocked_urls]
+        search_page=*/recommendations/*, *.gif
+        ```
+    """
+
+    # name of the proxy addon
+    name: str = 'fastbots_request_blocker'
+
+    def __init__(self, resource_types: Iterable[str] = (), hosts: Iterable[str] = (), urls: Iterable[str] = (),
+                 site_urls: Optional[Dict[str, Iterable[str]]] = None) -> None:
+        """
+        Initializes the RequestBlocker instance.
+
+        Args:
+            resource_types (Iterable[str]): The blocked resource types: image, font, media, stylesheet.
+            hosts (Iterable[str]): The blocked hosts, with their subdomains.
+            urls (Iterable[str]): The url globs blocked on all the sites.
+            site_urls (Dict[str, Iterable[str]] | None): The url globs blocked, by site host.
+
+        Raises:
+            ValueError: If a resource type is unknown.
+        """
+        super().__init__()
+
+        self._resource_types: Dict[str, Tuple[FrozenSet[str], Tuple[str, ...]]] = {}
+        for resource_type in resource_types:
+            if resource_type not in RESOURCE_TYPES:
+                raise ValueError(f'Unknown resource type: {resource_type}, expected one of: {", ".join(RESOURCE_TYPES)}')
+            self._resource_types[resource_type] = RESOURCE_TYPES[resource_type]
+
+        self._destinations: FrozenSet[str] = frozenset().union(*(dest for dest, _ in self._resource_types.values()))
+        self._extensions: Tuple[str, ...] = tuple(ext for _, exts in self._resource_types.values() for ext in exts)
+        self._hosts: Tuple[str, ...] = tuple(host.lower() for host in hosts)
+        self._urls: Optional[re.Pattern] = compile_globs(urls)
+        self._site_urls: Dict[str, re.Pattern] = {
+            host.lower(): pattern for host, globs in (site_urls or {}).items()
+            if (pattern := compile_globs(globs)) is not None
+        }
+
+        self._blocked: int = 0
+        self._allowed: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, locators: LocatorIndex) -> Optional['RequestBlocker']:
+        """
+        Builds the blocker of the settings and of the blocked urls section of the locators file.
+
+        Args:
+            locators (LocatorIndex): The locators of the bot.
+
+        Returns:
+            RequestBlocker | None: The blocker, None if nothing is blocked.
+        """
+        resource_types: List[str] = [resource_type.lower() for resource_type in split_values(config.BOT_BLOCK_RESOURCES)]
+        hosts: Tuple[str, ...] = TRACKER_HOSTS if config.BOT_BLOCK_TRACKERS else ()
+        urls: List[str] = split_values(config.BOT_BLOCK_URLS)
+
+        site_urls: Dict[str, List[str]] = {}
+        for page_name, globs in locators.options(BLOCKED_URLS_SECTION).items():
+            page_url: Optional[str] = locators.options(PAGES_URL_SECTION).get(page_name)
+            if page_url is None or page_url == 'None':
+                raise ValueError(f'The blocked urls of {page_name} need its url in the [{PAGES_URL_SECTION}] section.')
+            site_urls.setdefault(urlsplit(page_url).hostname or '', []).extend(split_values(globs))
+
+        if not (resource_types or hosts or urls or site_urls):
+            return None
+
+        return cls(resource_types=resource_types, hosts=hosts, urls=urls, site_urls=site_urls)
+
+    def install(self, driver):
+        """
+        Adds the blocker to the proxy of a selenium-wire driver, before the selenium-wire interceptors.
+
+        Args:
+            driver: The selenium-wire driver.
+
+        Raises:
+            ValueError: If the driver doesn't have a selenium-wire proxy.
+        """
+        backend = getattr(driver, 'backend', None)
+        if backend is None:
+            raise ValueError('The request blocker needs a selenium-wire driver.')
+
+        addons = backend.master.addons
+        addons.chain.insert(0, addons.register(self))
+
+    def should_block(self, url: str, headers: Mapping[str, str]) -> Optional[str]:
+        """
+        Checks if a request is blocked.
+
+        Args:
+            url (str): The url of the request.
+            headers (Mapping[str, str]): The headers of the request.
+
+        Returns:
+            str | None: The reason: the resource type, 'tracker' or 'url', None if the request is allowed.
+        """
+        parts = urlsplit(url)
+        host: str = (parts.hostname or '').lower()
+
+        if self._hosts and any(host == blocked or host.endswith(f'.{blocked}') for blocked in self._hosts):
+            return 'tracker'
+
+        if self._resource_types:
+            destination: str = headers.get('Sec-Fetch-Dest', '').lower()
+            if destination not in NAVIGATION_DESTINATIONS:
+                if destination in self._destinations or (
+                    destination in ('', 'empty') and parts.path.lower().endswith(self._extensions)
+                ):
+                    return self.__resource_type__(destination, parts.path.lower())
+
+        if self._urls is not None and self._urls.match(url):
+            return 'url'
+
+        if self._site_urls:
+            # the site of the request is the page that sent it
+            referer: str = headers.get('Referer', '')
+            site: str = (urlsplit(referer).hostname or '').lower() if referer else host
+            pattern: Optional[re.Pattern] = self._site_urls.get(site)
+            if pattern is not None and pattern.match(url):
+                return 'url'
+
+        return None
+
+    def counters(self) -> Dict[str, int]:
+        """
+        Gets the blocked and allowed requests of the current job.
+
+        Returns:
+            Dict[str, int]: The counters, as stored in the payload.
+        """
+        with self._lock:
+            return {'requests_blocked': self._blocked, 'requests_allowed': self._allowed}
+
+    def reset(self):
+        """
+        Resets the counters, for a new job.
+        """
+        with self._lock:
+            self._blocked = 0
+            self._allowed = 0
+
+    def request(self, flow):
+        """
+        Proxy hook of the requests, the blocked requests get an empty response.
+
+        Args:
+            flow: The proxy flow of the request.
+        """
+        reason: Optional[str] = self.should_block(flow.request.url, flow.request.headers)
+
+        with self._lock:
+            if reason is None:
+                self._allowed += 1
+            else:
+                self._blocked += 1
+
+        if reason is not None:
+            logger.debug(f'Request blocked ({reason}): {flow.request.url}')
+            flow.response = HTTPResponse.make(204, b'', {'Cache-Control': 'no-store'})
+
+    def __resource_type__(self, destination: str, path: str) -> str:
+        """
+        Gets the blocked resource type of a request.
+
+        Args:
+            destination (str): The fetch destination of the request.
+            path (str): The lowercase path of the url.
+
+        Returns:
+            str: The resource type.
+        """
+        for resource_type, (destinations, extensions) in self._resource_types.items():
+            if destination in destinations or path.endswith(extensions):
+                return resource_type
+        return 'url'
@@ -0,0 +1,179 @@
+import re
+import json
+import queue
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Optional
+
+from fastbots.exceptions import ResponseTimeoutError
+
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseWatch(object):
+    """
+    Response Watch
+
+    Receives the decoded JSON bodies of the responses that match an url pattern and a method,
+    from the moment it's registered in the harvester until it's removed.
+
+    Attributes:
+        _pattern (re.Pattern): The url pattern, searched in the request url.
+        _method (str | None): The request method, None -> any method.
+        _bodies (queue.Queue): The decoded bodies, not consumed yet.
+    """
+
+    def __init__(self, url_pattern: str, method: Optional[str] = None) -> None:
+        """
+        Initializes the ResponseWatch instance.
+
+        Args:
+            url_pattern (str): The url regular expression, searched in the request url.
+            method (str | None): The request method, None -> any method.
+        """
+        super().__init__()
+
+        self._url_pattern: str = url_pattern
+        self._pattern: re.Pattern = re.compile(url_pattern)
+        self._method: Optional[str] = None if method is None else method.upper()
+        self._bodies: queue.Queue = queue.Queue()
+
+    def matches(self, method: str, url: str) -> bool:
+        """
+        Checks if a request is watched.
+
+        Args:
+            method (str): The request method.
+            url (str): The request url.
+
+        Returns:
+            bool: True if the request matches the url pattern and the method.
+        """
+        return (self._method is None or self._method == method) and self._pattern.search(url) is not None
+
+    def put(self, body: Any):
+        """
+        Adds a decoded body, called by the proxy thread.
+
+        Args:
+            body (Any): The decoded JSON body.
+        """
+        self._bodies.put(body)
+
+    def get(self, timeout: float) -> Any:
+        """
+        Waits for the next decoded body.
+
+        Args:
+            timeout (float): The max seconds to wait.
+
+        Returns:
+            Any: The decoded JSON body.
+
+        Raises:
+            ResponseTimeoutError: If no response matches before the timeout.
+        """
+        try:
+            return self._bodies.get(timeout=timeout)
+        except queue.Empty:
+            raise ResponseTimeoutError(f'No JSON response of: {self._url_pattern} in {timeout} seconds')
+
+
+class ResponseHarvester(object):
+    """
+    Response Harvester
+
+    Hands back the decoded JSON responses that the browser fetches through the selenium-wire proxy,
+    so the data of the pages rendered from JSON APIs is read without waiting for the DOM.
+    It runs as a proxy addon and doesn't need the selenium-wire storage, so it works also when
+    the traffic capture is disabled; only the responses of the registered watches are decoded.
+
+    Attributes:
+        _watches (List[ResponseWatch]): The registered watches.
+
+    Methods:
+        install(driver): Adds the harvester to the proxy of a selenium-wire driver.
+        watch(url_pattern: str, method: str | None) -> Iterator[ResponseWatch]: Registers a watch in a context.
+
+    Example:
+        ```python
+        with response_harvester.watch(r'/api/products\\?page=') as watch:
+            bot.driver.find_element(By.ID, 'next').click()
+            products = watch.get(timeout=10)
+        ```
+    """
+
+    # name of the proxy addon
+    name: str = 'fastbots_response_harvester'
+
+    def __init__(self) -> None:
+        """
+        Initializes the ResponseHarvester instance.
+        """
+        super().__init__()
+
+        self._watches: List[ResponseWatch] = []
+        self._lock: threading.Lock = threading.Lock()
+
+    def install(self, driver):
+        """
+        Adds the harvester to the proxy of a selenium-wire driver.
+
+        Args:
+            driver: The selenium-wire driver.
+
+        Raises:
+            ValueError: If the driver doesn't have a selenium-wire proxy.
+        """
+        backend = getattr(driver, 'backend', None)
+        if backend is None:
+            raise ValueError('The response harvester needs a selenium-wire driver.')
+
+        backend.master.addons.add(self)
+
+    @contextmanager
+    def watch(self, url_pattern: str, method: Optional[str] = None) -> Iterator[ResponseWatch]:
+        """
+        Registers a watch in a context, the responses received before the context aren't harvested.
+
+        Args:
+            url_pattern (str): The url regular expression, searched in the request url.
+            method (str | None): The request method, None -> any method.
+
+        Yields:
+            ResponseWatch: The registered watch.
+        """
+        response_watch: ResponseWatch = ResponseWatch(url_pattern, method)
+
+        with self._lock:
+            self._watches = self._watches + [response_watch]
+        try:
+            yield response_watch
+        finally:
+            with self._lock:
+                self._watches = [watch for watch in self._watches if watch is not response_watch]
+
+    def response(self, flow):
+        """
+        Proxy hook of the responses, the bodies of the watched responses are decoded.
+
+        Args:
+            flow: The proxy flow of the exchange.
+        """
+        # the list is replaced on every change, so it's read without the lock
+        watches: List[ResponseWatch] = [
+            watch for watch in self._watches if watch.matches(flow.request.method, flow.request.url)
+        ]
+        if not watches or flow.response is None:
+            return
+
+        try:
+            body: Any = json.loads(flow.response.get_content(strict=False) or b'')
+        except ValueError as e:
+            logger.debug(f'Not a JSON response {flow.request.url}: {e}')
+            return
+
+        for watch in watches:
+            watch.put(body)
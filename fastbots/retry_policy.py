@@ -0,0 +1,183 @@
+import logging
+from typing import Optional, Tuple, Type
+
+from selenium.common.exceptions import (
+    TimeoutException, StaleElementReferenceException, NoSuchElementException, ElementClickInterceptedException,
+    ElementNotInteractableException, MoveTargetOutOfBoundsException, UnexpectedAlertPresentException,
+    NoSuchFrameException, InvalidSessionIdException, NoSuchWindowException, SessionNotCreatedException,
+    WebDriverException,
+)
+import httpx
+from urllib3.exceptions import HTTPError as DriverConnectionError
+from tenacity import wait_exponential_jitter
+from tenacity.wait import wait_base
+
+from fastbots import config
+from fastbots.exceptions import ExpectedUrlError, DownloadFileError, ResponseTimeoutError
+
+
+logger = logging.getLogger(__name__)
+
+# outcomes of a failed attempt
+RECOVER: str = 'recover'
+RELAUNCH: str = 'relaunch'
+FATAL: str = 'fatal'
+
+# transient errors of the page, the next attempt reuses the live driver
+RECOVERABLE_ERRORS: Tuple[Type[BaseException], ...] = (
+    TimeoutException, StaleElementReferenceException, NoSuchElementException, ElementClickInterceptedException,
+    ElementNotInteractableException, MoveTargetOutOfBoundsException, UnexpectedAlertPresentException,
+    NoSuchFrameException, ExpectedUrlError, DownloadFileError, ResponseTimeoutError, TimeoutError, httpx.TransportError,
+)
+
+# errors of the driver and of its connection, the next attempt runs on a new browser
+RELAUNCH_ERRORS: Tuple[Type[BaseException], ...] = (
+    InvalidSessionIdException, NoSuchWindowException, SessionNotCreatedException, WebDriverException,
+    ConnectionError, DriverConnectionError,
+)
+
+# messages of the navigation errors (network errors of the page, not of the driver), they are recovered in place
+NAVIGATION_ERROR_MESSAGES: Tuple[str, ...] = ('net::ERR_', 'about:neterror', 'Reached error page')
+
+
+class RetryPolicy(object):
+    """
+    Retry Policy
+
+    Sorts the failures of the task attempts and sets the delay between them. The transient errors of the page
+    (timeouts, stale or missing elements, unexpected urls, navigation and network errors) are recovered in place:
+    the live driver is reset and the start page loaded again. The errors of the driver and of its session relaunch
+    the browser. Any other error (a KeyError, a ValueError, ...) is a bug of the task, it fails again on every attempt,
+    so it's fatal and it ends the retries without burning the attempts and the browser launches.
+    A run that returns False is recovered in place.
+    The delay grows exponentially, with a random jitter, up to a max delay.
+
+    The custom errors are matched first, then the defaults in order: recoverable, relaunch;
+    the other errors are fatal, the transient errors of a site are added with the recoverable argument.
+
+    Attributes:
+        _max_attempts (int): The max number of attempts.
+        _initial_delay (float): The delay after the first failed attempt, in seconds.
+        _max_delay (float): The max delay between two attempts, in seconds.
+        _jitter (float): The max random seconds added to every delay.
+        _custom_errors (Tuple[Tuple[Tuple[Type[BaseException], ...], str], ...]): The custom errors, by outcome.
+
+    Methods:
+        __init__(...): Initializes the RetryPolicy instance.
+        from_config() -> RetryPolicy: Builds the policy of the settings.
+        classify(error: BaseException | None) -> str: Gets the outcome of a failed attempt.
+        should_retry(outcome: str | None) -> bool: Checks if an attempt outcome is retried.
+        wait() -> wait_base: Gets the tenacity wait strategy.
+
+    Example:
+        ```python
+        class MyTask(Task):
+
+            def retry_policy(self) -> RetryPolicy:
+                # the site answers with a custom error when it's overloaded
+                return RetryPolicy(recoverable=(SiteBusyError,), max_attempts=5)
+        ```
+    """
+
+    def __init__(self, max_attempts: int = config.BOT_MAX_RETRIES,
+                 initial_delay: float = config.BOT_RETRY_INITIAL_DELAY,
+                 max_delay: float = config.BOT_RETRY_DELAY,
+                 jitter: float = config.BOT_RETRY_JITTER,
+                 recoverable: Tuple[Type[BaseException], ...] = (),
+                 relaunch: Tuple[Type[BaseException], ...] = (),
+                 fatal: Tuple[Type[BaseException], ...] = ()) -> None:
+        """
+        Initializes the RetryPolicy instance.
+
+        Args:
+            max_attempts (int): The max number of attempts.
+            initial_delay (float): The delay after the first failed attempt, in seconds.
+            max_delay (float): The max delay between two attempts, in seconds.
+            jitter (float): The max random seconds added to every delay.
+            recoverable (Tuple[Type[BaseException], ...]): More errors recovered in place.
+            relaunch (Tuple[Type[BaseException], ...]): More errors that relaunch the browser.
+            fatal (Tuple[Type[BaseException], ...]): More errors that end the retries.
+        """
+        super().__init__()
+
+        self._max_attempts: int = max(max_attempts, 1)
+        self._initial_delay: float = max(initial_delay, 0)
+        self._max_delay: float = max(max_delay, 0)
+        self._jitter: float = max(jitter, 0)
+
+        # the custom errors are matched first, so they override the defaults
+        self._custom_errors: Tuple[Tuple[Tuple[Type[BaseException], ...], str], ...] = tuple(
+            (tuple(errors), outcome) for errors, outcome in ((fatal, FATAL), (relaunch, RELAUNCH), (recoverable, RECOVER))
+            if errors
+        )
+
+    @classmethod
+    def from_config(cls) -> 'RetryPolicy':
+        """
+        Builds the policy of the settings, read when the task runs.
+
+        Returns:
+            RetryPolicy: The policy instance.
+        """
+        return cls(
+            max_attempts=config.BOT_MAX_RETRIES, initial_delay=config.BOT_RETRY_INITIAL_DELAY,
+            max_delay=config.BOT_RETRY_DELAY, jitter=config.BOT_RETRY_JITTER,
+        )
+
+    @property
+    def max_attempts(self) -> int:
+        """
+        Gets the max number of attempts.
+
+        Returns:
+            int: The max attempts.
+        """
+        return self._max_attempts
+
+    def classify(self, error: Optional[BaseException]) -> str:
+        """
+        Gets the outcome of a failed attempt.
+
+        Args:
+            error (BaseException | None): The error raised by the attempt, None if the run returned False.
+
+        Returns:
+            str: RECOVER, RELAUNCH or FATAL.
+        """
+        if error is None:
+            return RECOVER
+
+        for errors, outcome in self._custom_errors:
+            if isinstance(error, errors):
+                return outcome
+
+        if isinstance(error, RECOVERABLE_ERRORS):
+            return RECOVER
+        if isinstance(error, WebDriverException) and any(message in str(error) for message in NAVIGATION_ERROR_MESSAGES):
+            return RECOVER
+        if isinstance(error, RELAUNCH_ERRORS):
+            return RELAUNCH
+        return FATAL
+
+    def should_retry(self, outcome: Optional[str]) -> bool:
+        """
+        Checks if an attempt outcome is retried.
+
+        Args:
+            outcome (str | None): The outcome of the attempt, None if it succeeded.
+
+        Returns:
+            bool: True if another attempt is needed.
+        """
+        return outcome is not None and outcome != FATAL
+
+    def wait(self) -> wait_base:
+        """
+        Gets the tenacity wait strategy: exponential backoff with jitter, capped by the max delay.
+
+        Returns:
+            wait_base: The wait strategy.
+        """
+        return wait_exponential_jitter(
+            initial=min(self._initial_delay, self._max_delay), max=self._max_delay, jitter=self._jitter
+        )
@@ -0,0 +1,138 @@
+# JavaScript snippets executed in the browser, they are plain strings used by execute_script and execute_async_script
+
+# function that finds all the elements matching a selenium locator (By value and locator value)
+FIND_ELEMENTS_JS: str = """
+function fastbotsFindElements(by, value, root) {
+    root = root || document;
+    switch (by) {
+        case 'id':
+            return Array.from(root.querySelectorAll('[id="' + CSS.escape(value) + '"]'));
+        case 'css selector':
+            return Array.from(root.querySelectorAll(value));
+        case 'xpath':
+            var result = document.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var nodes = [];
+            for (var i = 0; i < result.snapshotLength; i++) {
+                nodes.push(result.snapshotItem(i));
+            }
+            return nodes;
+        case 'name':
+            return Array.from(root.querySelectorAll('[name="' + CSS.escape(value) + '"]'));
+        case 'class name':
+            return Array.from(root.getElementsByClassName(value));
+        case 'tag name':
+            return Array.from(root.getElementsByTagName(value));
+        case 'link text':
+            return Array.from(root.querySelectorAll('a')).filter(function (a) { return a.innerText.trim() === value; });
+        case 'partial link text':
+            return Array.from(root.querySelectorAll('a')).filter(function (a) { return a.innerText.indexOf(value) !== -1; });
+    }
+    throw new Error('Unknown locator strategy: ' + by);
+}
+"""
+
+# resolves with the first element matching the locator, as soon as it's added to the DOM, or null at the timeout
+# arguments: by, value, timeout (ms), callback
+WAIT_ELEMENT_JS: str = FIND_ELEMENTS_JS + """
+var by = arguments[0], value = arguments[1], timeout = arguments[2], callback = arguments[arguments.length - 1];
+var found = fastbotsFindElements(by, value)[0];
+if (found) {
+    callback(found);
+} else {
+    var timer = null;
+    var observer = new MutationObserver(function () {
+        var element = fastbotsFindElements(by, value)[0];
+        if (element) {
+            observer.disconnect();
+            clearTimeout(timer);
+            callback(element);
+        }
+    });
+    observer.observe(document, {childList: true, subtree: true, attributes: true});
+    timer = setTimeout(function () { observer.disconnect(); callback(null); }, timeout);
+}
+"""
+
+# resolves with the current url, as soon as the url changes without a page load (history api and hash changes),
+# a page load interrupts the script and it's handled by the caller;
+# the history api is wrapped once per page, the listeners of every wait are removed when it ends
+# arguments: current url, timeout (ms), callback
+WAIT_URL_CHANGE_JS: str = """
+var url = arguments[0], timeout = arguments[1], callback = arguments[arguments.length - 1];
+if (!window.__fastbotsHistoryListeners) {
+    window.__fastbotsHistoryListeners = [];
+    ['pushState', 'replaceState'].forEach(function (name) {
+        var original = history[name];
+        history[name] = function () {
+            var result = original.apply(this, arguments);
+            window.__fastbotsHistoryListeners.slice().forEach(function (listener) { setTimeout(listener, 0); });
+            return result;
+        };
+    });
+}
+if (window.location.href !== url) {
+    callback(window.location.href);
+} else {
+    var done = false, timer = null, resolve = null;
+    var finish = function () {
+        done = true;
+        clearTimeout(timer);
+        window.__fastbotsHistoryListeners = window.__fastbotsHistoryListeners.filter(function (listener) {
+            return listener !== resolve;
+        });
+        window.removeEventListener('popstate', resolve);
+        window.removeEventListener('hashchange', resolve);
+        callback(window.location.href);
+    };
+    resolve = function () {
+        if (!done && window.location.href !== url) {
+            finish();
+        }
+    };
+    window.__fastbotsHistoryListeners.push(resolve);
+    window.addEventListener('popstate', resolve);
+    window.addEventListener('hashchange', resolve);
+    timer = setTimeout(finish, timeout);
+}
+"""
+
+# reads the text or an attribute of the elements matching many locators in one call,
+# the missing elements are null and the multiple matches are lists
+# arguments: specs [{name, by, value, attribute, multiple}], root element (optional, the document by default)
+BULK_EXTRACT_JS: str = FIND_ELEMENTS_JS + """
+var specs = arguments[0], root = arguments[1] || document, result = {};
+specs.forEach(function (spec) {
+    var read = function (element) {
+        if (spec.attribute === 'text') {
+            return element.innerText;
+        }
+        var property = element[spec.attribute];
+        if (typeof property === 'string' || typeof property === 'number' || typeof property === 'boolean') {
+            return String(property);
+        }
+        return element.getAttribute(spec.attribute);
+    };
+    var elements = fastbotsFindElements(spec.by, spec.value, root);
+    if (spec.multiple) {
+        result[spec.name] = elements.map(read);
+    } else {
+        result[spec.name] = elements.length ? read(elements[0]) : null;
+    }
+});
+return result;
+"""
+
+# reads the web storage of the current origin, as two plain objects
+READ_WEB_STORAGE_JS: str = """
+return {
+    local_storage: Object.assign({}, window.localStorage),
+    session_storage: Object.assign({}, window.sessionStorage)
+};
+"""
+
+# writes the web storage of the current origin (local storage, session storage)
+WRITE_WEB_STORAGE_JS: str = """
+var localItems = arguments[0], sessionItems = arguments[1];
+Object.keys(localItems).forEach(function (key) { window.localStorage.setItem(key, localItems[key]); });
+Object.keys(sessionItems).forEach(function (key) { window.sessionStorage.setItem(key, sessionItems[key]); });
+"""
@@ -0,0 +1,196 @@
+import json
+import time
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from fastbots import config
+
+
+logger = logging.getLogger(__name__)
+
+# shared stores of the process, by file path
+_stores: Dict[str, 'SessionStore'] = {}
+_stores_lock: threading.Lock = threading.Lock()
+
+
+@dataclass
+class SessionState:
+    """
+    Browser state of an identity on a domain: the cookies and the web storage of its origin.
+    """
+
+    identity: str
+    domain: str
+    cookies: List[Dict[str, Any]] = field(default_factory=list)
+    local_storage: Dict[str, str] = field(default_factory=dict)
+    session_storage: Dict[str, str] = field(default_factory=dict)
+    saved_at: float = 0.0
+    expires_at: float = 0.0
+
+
+class SessionStore(object):
+    """
+    Session Store
+
+    Persistent store of the browser sessions, stored in a SQLite file shared by threads and processes.
+    The sessions are keyed by identity (e.g. the account name) and domain, they hold the cookies and the web storage,
+    and they expire after a time to live; the expired cookies are dropped when a session is loaded.
+    So the bots restore a logged in session before the start page is loaded and skip the login pages.
+
+    Attributes:
+        _path (str): The path of the SQLite file.
+        _ttl (int): The time to live of the sessions, in seconds.
+
+    Methods:
+        __init__(path: str, ttl: int): Initializes the SessionStore instance.
+        shared(path: str) -> SessionStore: Gets the store of the process for a file.
+        save(state: SessionState) -> SessionState: Stores the session of an identity on a domain.
+        load(identity: str, domain: str) -> SessionState | None: Gets the session of an identity on a domain.
+        delete(identity: str, domain: str | None = None): Removes the sessions of an identity.
+        identities(domain: str) -> List[str]: Gets the identities with a session on a domain.
+
+    Example:
+        ```python
+        session_store = SessionStore.shared()
+        state = session_store.load('buyer@example.com', 'shop.example.com')
+        ```
+    """
+
+    def __init__(self, path: str = config.BOT_SESSION_STORE_FILE_PATH, ttl: int = config.BOT_SESSION_TTL) -> None:
+        """
+        Initializes the SessionStore instance, creating the SQLite file if it doesn't exist.
+
+        Args:
+            path (str): The path of the SQLite file.
+            ttl (int): The time to live of the sessions, in seconds.
+        """
+        super().__init__()
+
+        self._path: str = path
+        self._ttl: int = ttl
+        self._lock: threading.Lock = threading.Lock()
+
+        if Path(path).parent != Path('.'):
+            Path(path).parent.mkdir(exist_ok=True, parents=True)
+
+        self._connection: sqlite3.Connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS sessions ('
+                'identity TEXT NOT NULL, domain TEXT NOT NULL, cookies TEXT NOT NULL, local_storage TEXT NOT NULL, '
+                'session_storage TEXT NOT NULL, saved_at REAL NOT NULL, expires_at REAL NOT NULL, '
+                'PRIMARY KEY (identity, domain))'
+            )
+
+    @classmethod
+    def shared(cls, path: str = config.BOT_SESSION_STORE_FILE_PATH) -> 'SessionStore':
+        """
+        Gets the store of the process for a file, created at the first usage.
+
+        Args:
+            path (str): The path of the SQLite file.
+
+        Returns:
+            SessionStore: The shared store instance.
+        """
+        key: str = str(Path(path).absolute())
+
+        with _stores_lock:
+            if key not in _stores:
+                _stores[key] = cls(path=path)
+            return _stores[key]
+
+    def save(self, state: SessionState) -> SessionState:
+        """
+        Stores the session of an identity on a domain, replacing the previous one.
+
+        Args:
+            state (SessionState): The session, the save and expiry times are set by the store.
+
+        Returns:
+            SessionState: The stored session.
+        """
+        state.saved_at = time.time()
+        state.expires_at = state.saved_at + self._ttl
+
+        with self._lock:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO sessions '
+                '(identity, domain, cookies, local_storage, session_storage, saved_at, expires_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (state.identity, state.domain, json.dumps(state.cookies), json.dumps(state.local_storage),
+                 json.dumps(state.session_storage), state.saved_at, state.expires_at)
+            )
+            self._connection.execute('DELETE FROM sessions WHERE expires_at < ?', (state.saved_at,))
+
+        return state
+
+    def load(self, identity: str, domain: str) -> Optional[SessionState]:
+        """
+        Gets the session of an identity on a domain, without the expired cookies.
+
+        Args:
+            identity (str): The identity, e.g. the account name.
+            domain (str): The domain of the site.
+
+        Returns:
+            SessionState | None: The session, None if it's missing or expired.
+        """
+        now: float = time.time()
+
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT cookies, local_storage, session_storage, saved_at, expires_at FROM sessions '
+                'WHERE identity = ? AND domain = ?', (identity, domain)
+            ).fetchone()
+
+            if row is not None and row[4] < now:
+                self._connection.execute('DELETE FROM sessions WHERE identity = ? AND domain = ?', (identity, domain))
+                row = None
+
+        if row is None:
+            return None
+
+        # the session cookies don't have an expiry, they live as long as the stored session
+        cookies: List[Dict[str, Any]] = [
+            cookie for cookie in json.loads(row[0]) if cookie.get('expiry') is None or cookie['expiry'] > now
+        ]
+        return SessionState(
+            identity=identity, domain=domain, cookies=cookies, local_storage=json.loads(row[1]),
+            session_storage=json.loads(row[2]), saved_at=row[3], expires_at=row[4]
+        )
+
+    def delete(self, identity: str, domain: Optional[str] = None):
+        """
+        Removes the sessions of an identity, e.g. when the site logged it out.
+
+        Args:
+            identity (str): The identity.
+            domain (str | None): The domain of the site, None -> all the domains.
+        """
+        with self._lock:
+            if domain is None:
+                self._connection.execute('DELETE FROM sessions WHERE identity = ?', (identity,))
+            else:
+                self._connection.execute('DELETE FROM sessions WHERE identity = ? AND domain = ?', (identity, domain))
+
+    def identities(self, domain: str) -> List[str]:
+        """
+        Gets the identities with a valid session on a domain.
+
+        Args:
+            domain (str): The domain of the site.
+
+        Returns:
+            List[str]: The identities, the most recently saved first.
+        """
+        with self._lock:
+            return [row[0] for row in self._connection.execute(
+                'SELECT identity FROM sessions WHERE domain = ? AND expires_at >= ? ORDER BY saved_at DESC',
+                (domain, time.time())
+            ).fetchall()]
@@ -0,0 +1,468 @@
+import csv
+import json
+import queue
+import atexit
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, TextIO
+
+from fastbots import config
+
+
+logger = logging.getLogger(__name__)
+
+# shared sinks of the process, by file path, closed when the process exits
+_sinks: Dict[str, 'Sink'] = {}
+_sinks_lock: threading.Lock = threading.Lock()
+
+# marks the end of the records in the writer queue
+_CLOSE: object = object()
+
+
+def tabular_value(value: Any) -> Any:
+    """
+    Converts a record value to a column value of the tabular sinks, the nested values are stored as JSON.
+
+    Args:
+        value (Any): The record value.
+
+    Returns:
+        Any: The column value: None, a number, a string or bytes.
+    """
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        return value
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(value, default=str)
+    return str(value)
+
+
+class Sink(ABC):
+    """
+    Sink
+
+    Writes the records incrementally to a file, so the results of the long crawls don't grow in memory and
+    they survive a crash. The records are queued and written in batches by a background thread, the queue is
+    bounded so a slow disk slows down the producers instead of filling the memory.
+
+    Attributes:
+        _path (str): The path of the output file.
+        _batch_size (int): The max records written in a batch.
+        _queue (queue.Queue): The records not written yet.
+        _written (int): The records written.
+
+    Methods:
+        __init__(path: str, batch_size: int, queue_size: int): Initializes the Sink instance.
+        write(record: Dict[str, Any]): Queues a record.
+        flush(): Waits until all the queued records are written.
+        close(): Writes the queued records and closes the file.
+
+    Example:
+        ```python
+        with create_sink('products.csv') as sink:
+            for product in products:
+                sink.write(product)
+        ```
+    """
+
+    def __init__(self, path: str, batch_size: int = config.BOT_SINK_BATCH_SIZE,
+                 queue_size: int = config.BOT_SINK_QUEUE_SIZE) -> None:
+        """
+        Initializes the Sink instance and starts the writer thread.
+
+        Args:
+            path (str): The path of the output file, created with its folders if missing.
+            batch_size (int): The max records written in a batch.
+            queue_size (int): The max records queued, the writers wait when it's full.
+        """
+        super().__init__()
+
+        self._path: str = path
+        self._batch_size: int = max(batch_size, 1)
+        self._queue: queue.Queue = queue.Queue(maxsize=max(queue_size, 1))
+        self._written: int = 0
+        self._closed: bool = False
+        self._lock: threading.Lock = threading.Lock()
+
+        if Path(path).parent != Path('.'):
+            Path(path).parent.mkdir(exist_ok=True, parents=True)
+
+        self._thread: threading.Thread = threading.Thread(
+            target=self.__run__, name=f'sink-{Path(path).name}', daemon=True
+        )
+        self._thread.start()
+
+    def __enter__(self) -> 'Sink':
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
+
+    @property
+    def path(self) -> str:
+        """
+        Gets the path of the output file.
+
+        Returns:
+            str: The file path.
+        """
+        return self._path
+
+    @property
+    def written(self) -> int:
+        """
+        Gets the number of records written to the file.
+
+        Returns:
+            int: The written records.
+        """
+        return self._written
+
+    def write(self, record: Dict[str, Any]):
+        """
+        Queues a record, it's written by the background thread.
+
+        Args:
+            record (Dict[str, Any]): The record, a column per key.
+
+        Raises:
+            ValueError: If the sink is closed.
+        """
+        if self._closed:
+            raise ValueError(f'The sink is closed: {self._path}')
+        # a copy, the caller could change the record after the call
+        self._queue.put(dict(record))
+
+    def flush(self):
+        """
+        Waits until all the queued records are written.
+        """
+        self._queue.join()
+
+    def close(self):
+        """
+        Writes the queued records and closes the file.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        self._queue.put(_CLOSE)
+        self._thread.join()
+
+    def __run__(self):
+        """
+        Writes the queued records in batches, until the sink is closed.
+        """
+        closing: bool = False
+
+        while not closing:
+            batch: List[Dict[str, Any]] = []
+            item: Any = self._queue.get()
+
+            # the records already queued are written together
+            while True:
+                if item is _CLOSE:
+                    closing = True
+                else:
+                    batch.append(item)
+
+                if closing or len(batch) >= self._batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            try:
+                if batch:
+                    self.__write_batch__(batch)
+                    self._written += len(batch)
+            except Exception as e:
+                logger.error(f'Records not written to {self._path}: {e}')
+            finally:
+                for _ in range(len(batch) + (1 if closing else 0)):
+                    self._queue.task_done()
+
+        try:
+            self.__close__()
+        except Exception as e:
+            logger.error(f'Sink not closed {self._path}: {e}')
+
+    @abstractmethod
+    def __write_batch__(self, records: List[Dict[str, Any]]):
+        """
+        Writes a batch of records, called by the writer thread.
+
+        Args:
+            records (List[Dict[str, Any]]): The records.
+        """
+        raise NotImplementedError('Sinks must define this method.')
+
+    @abstractmethod
+    def __close__(self):
+        """
+        Closes the file, called by the writer thread after the last batch.
+        """
+        raise NotImplementedError('Sinks must define this method.')
+
+
+class JsonlSink(Sink):
+    """
+    Appends the records to a JSONL file, a JSON object per line.
+    """
+
+    def __init__(self, path: str, **kwargs) -> None:
+        self._file: Optional[TextIO] = None
+        super().__init__(path, **kwargs)
+
+    def __write_batch__(self, records: List[Dict[str, Any]]):
+        if self._file is None:
+            self._file = open(self._path, 'a', encoding='utf-8')
+
+        self._file.write(''.join(json.dumps(record, default=str) + '\n' for record in records))
+        self._file.flush()
+
+    def __close__(self):
+        if self._file is not None:
+            self._file.close()
+
+
+class CsvSink(Sink):
+    """
+    Appends the records to a CSV file, the columns are the header of the existing file or the keys of the first record.
+    The keys missing from the columns are dropped.
+    """
+
+    def __init__(self, path: str, **kwargs) -> None:
+        self._file: Optional[TextIO] = None
+        self._writer: Optional[csv.DictWriter] = None
+        self._dropped: set = set()
+        super().__init__(path, **kwargs)
+
+    def __write_batch__(self, records: List[Dict[str, Any]]):
+        if self._writer is None:
+            fieldnames: Optional[List[str]] = None
+            if Path(self._path).is_file() and Path(self._path).stat().st_size > 0:
+                with open(self._path, 'r', encoding='utf-8', newline='') as file:
+                    fieldnames = next(csv.reader(file), None)
+
+            self._file = open(self._path, 'a', encoding='utf-8', newline='')
+            self._writer = csv.DictWriter(self._file, fieldnames=fieldnames or list(records[0]), extrasaction='ignore')
+            if not fieldnames:
+                self._writer.writeheader()
+
+        for record in records:
+            dropped = set(record) - set(self._writer.fieldnames) - self._dropped
+            if dropped:
+                logger.warning(f'Columns not in the header of {self._path}, dropped: {", ".join(sorted(dropped))}')
+                self._dropped.update(dropped)
+
+        self._writer.writerows({key: tabular_value(value) for key, value in record.items()} for record in records)
+        self._file.flush()
+
+    def __close__(self):
+        if self._file is not None:
+            self._file.close()
+
+
+class SqliteSink(Sink):
+    """
+    Appends the records to a table of a SQLite file, the missing columns are added when a record has new keys.
+    """
+
+    def __init__(self, path: str, table: str = config.BOT_SINK_TABLE, **kwargs) -> None:
+        self._table: str = table
+        self._connection: Optional[sqlite3.Connection] = None
+        self._columns: List[str] = []
+        super().__init__(path, **kwargs)
+
+    def __write_batch__(self, records: List[Dict[str, Any]]):
+        table: str = self.__quote__(self._table)
+
+        if self._connection is None:
+            self._connection = sqlite3.connect(self._path, timeout=30)
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute(f'CREATE TABLE IF NOT EXISTS {table} (_rowid INTEGER PRIMARY KEY AUTOINCREMENT)')
+            self._columns = [row[1] for row in self._connection.execute(f'PRAGMA table_info({table})')]
+
+        for record in records:
+            for key in record:
+                if key not in self._columns:
+                    self._connection.execute(f'ALTER TABLE {table} ADD COLUMN {self.__quote__(key)}')
+                    self._columns.append(key)
+
+        with self._connection:
+            # a statement for every set of keys, the records of a batch share them usually
+            by_keys: Dict[tuple, List[Dict[str, Any]]] = {}
+            for record in records:
+                by_keys.setdefault(tuple(record), []).append(record)
+
+            for keys, group in by_keys.items():
+                self._connection.executemany(
+                    f'INSERT INTO {table} ({", ".join(self.__quote__(key) for key in keys)}) '
+                    f'VALUES ({", ".join("?" for _ in keys)})',
+                    [tuple(tabular_value(record[key]) for key in keys) for record in group]
+                )
+
+    def __close__(self):
+        if self._connection is not None:
+            self._connection.close()
+
+    def __quote__(self, name: str) -> str:
+        """
+        Quotes a table or column name.
+
+        Args:
+            name (str): The name.
+
+        Returns:
+            str: The quoted name.
+        """
+        return '"' + str(name).replace('"', '""') + '"'
+
+
+class ParquetSink(Sink):
+    """
+    Writes the records to a Parquet file, a row group per batch; it needs pyarrow.
+    The columns are the keys of the first batch, the file is replaced and it's completed when the sink is closed.
+    The columns without a value in the first batch are strings; the values that don't fit the type of their column
+    are stored as strings in the string columns, else they are dropped with a warning, the records are always written.
+    """
+
+    def __init__(self, path: str, **kwargs) -> None:
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError('The parquet sink needs pyarrow, install it with: pip install fastbots[parquet]')
+
+        self._pyarrow = pyarrow
+        self._parquet = pyarrow.parquet
+        self._writer = None
+        self._dropped: set = set()
+        super().__init__(path, **kwargs)
+
+    def __write_batch__(self, records: List[Dict[str, Any]]):
+        rows: List[Dict[str, Any]] = [
+            {key: tabular_value(value) for key, value in record.items()} for record in records
+        ]
+
+        if self._writer is None:
+            # the null columns of the first batch (e.g. no errors yet) could get any value later
+            schema = self._pyarrow.Table.from_pylist(rows).schema
+            schema = self._pyarrow.schema([
+                field.with_type(self._pyarrow.string()) if self._pyarrow.types.is_null(field.type) else field
+                for field in schema
+            ])
+            self._writer = self._parquet.ParquetWriter(self._path, schema)
+
+        schema = self._writer.schema
+        dropped = {key for row in rows for key in row} - set(schema.names) - self._dropped
+        if dropped:
+            logger.warning(f'Columns not in the schema of {self._path}, dropped: {", ".join(sorted(dropped))}')
+            self._dropped.update(dropped)
+
+        self._writer.write_table(self._pyarrow.Table.from_arrays(
+            [self.__column__(field, [row.get(field.name) for row in rows]) for field in schema], schema=schema
+        ))
+
+    def __column__(self, field, values: List[Any]):
+        """
+        Builds a column of a batch, the values that don't fit its type are converted or dropped.
+
+        Args:
+            field (pyarrow.Field): The field of the column.
+            values (List[Any]): The values of the column.
+
+        Returns:
+            pyarrow.Array: The column.
+        """
+        try:
+            return self._pyarrow.array(values, type=field.type)
+        except (self._pyarrow.ArrowInvalid, self._pyarrow.ArrowTypeError, OverflowError):
+            pass
+
+        column: List[Any] = []
+        for value in values:
+            try:
+                self._pyarrow.array([value], type=field.type)
+                column.append(value)
+            except (self._pyarrow.ArrowInvalid, self._pyarrow.ArrowTypeError, OverflowError):
+                if self._pyarrow.types.is_string(field.type):
+                    column.append(value.decode('utf-8', 'replace') if isinstance(value, bytes) else str(value))
+                else:
+                    logger.warning(f'Value not valid for the column {field.name} ({field.type}) of {self._path}, '
+                                   f'dropped: {value!r}')
+                    column.append(None)
+
+        return self._pyarrow.array(column, type=field.type)
+
+    def __close__(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+# sinks by file extension
+SINK_TYPES: Dict[str, type] = {
+    '.jsonl': JsonlSink,
+    '.ndjson': JsonlSink,
+    '.csv': CsvSink,
+    '.sqlite': SqliteSink,
+    '.db': SqliteSink,
+    '.parquet': ParquetSink,
+}
+
+
+def create_sink(path: str, **kwargs) -> Sink:
+    """
+    Creates the sink of a file, by its extension: .jsonl, .csv, .sqlite (or .db), .parquet.
+
+    Args:
+        path (str): The path of the output file.
+        **kwargs: The arguments of the sink, e.g. the batch size.
+
+    Returns:
+        Sink: The sink instance.
+
+    Raises:
+        ValueError: If the file extension is unknown.
+    """
+    sink_type: Optional[type] = SINK_TYPES.get(Path(path).suffix.lower())
+    if sink_type is None:
+        raise ValueError(f'Unknown sink file format: {Path(path).name}, expected one of: {", ".join(SINK_TYPES)}')
+    return sink_type(path, **kwargs)
+
+
+def shared_sink(path: str) -> Sink:
+    """
+    Gets the sink of the process for a file, created at the first usage and closed when the process exits.
+
+    Args:
+        path (str): The path of the output file.
+
+    Returns:
+        Sink: The shared sink instance.
+    """
+    key: str = str(Path(path).absolute())
+
+    with _sinks_lock:
+        if key not in _sinks:
+            _sinks[key] = create_sink(path)
+        return _sinks[key]
+
+
+@atexit.register
+def close_shared_sinks():
+    """
+    Closes the shared sinks, the queued records are written.
+    """
+    with _sinks_lock:
+        sinks: List[Sink] = list(_sinks.values())
+        _sinks.clear()
+
+    for sink in sinks:
+        sink.close()
@@ -1,14 +1,21 @@
+import json
+import hashlib
 import logging
-import traceback
 from abc import ABC, abstractmethod
+from contextlib import ExitStack, contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
 
-from tenacity import RetryError, Retrying, wait_fixed, stop_after_attempt, retry_if_result, after_log
+from tenacity import RetryError, Retrying, stop_after_attempt, retry_if_result, after_log
 
 from fastbots import config
 from fastbots.bot import Bot
 from fastbots.payload import Payload
-from fastbots.chrome_bot import ChromeBot
-from fastbots.firefox_bot import FirefoxBot
+from fastbots.bot_pool import BotPool
+from fastbots.tracing import Tracer, current_tracer, span
+from fastbots.logger import log_context
+from fastbots.retry_policy import RetryPolicy, RECOVER, RELAUNCH, FATAL
+from fastbots.checkpoint_store import CheckpointStore
+from fastbots.artifact_writer import ArtifactWriter
 
 
 logger = logging.getLogger(__name__)
@@ -20,12 +27,31 @@ class Task(ABC):
 
     A blueprint for tasks representing a series of interactions across multiple pages.
 
+    Attributes:
+        _bot_pool (BotPool | None): The pool used to lease warm bots, if None a new bot is created for every attempt.
+
     Methods:
+        __init__(bot_pool: BotPool | None = None): Initializes the Task instance.
         run(bot: Bot) -> bool: Executes the series of interactions. Must be implemented by subclasses.
         on_success(payload: Payload): Actions to be taken on successful completion of the run method.
         on_failure(payload: Payload): Actions to be taken if the run method fails after a specified number of retries.
+        retry_policy() -> RetryPolicy: Gets the policy that sorts the failed attempts and sets the retry delays.
+        checkpoint_key(input_data: Dict[str, str] | None) -> str: Gets the key of the page chain checkpoints.
     """
 
+    _bot_pool: Optional[BotPool] = None
+
+    def __init__(self, bot_pool: Optional[BotPool] = None) -> None:
+        """
+        Initializes the Task instance.
+
+        Args:
+            bot_pool (BotPool | None): The pool used to lease warm bots, if None a new bot is created for every attempt.
+        """
+        super().__init__()
+
+        self._bot_pool = bot_pool
+
     @abstractmethod
     def run(self, bot: Bot) -> bool:
         """
@@ -69,6 +95,29 @@ class Task(ABC):
         """
         raise NotImplementedError('Tasks must define this method.')
     
+    def retry_policy(self) -> RetryPolicy:
+        """
+        Gets the policy that sorts the failed attempts and sets the delays between them,
+        it could be overridden to add the errors of a site.
+
+        Returns:
+            RetryPolicy: The retry policy, by default the one of the settings.
+        """
+        return RetryPolicy.from_config()
+
+    def checkpoint_key(self, input_data: Optional[Dict[str, str]] = None) -> str:
+        """
+        Gets the key of the page chain checkpoints, the same task with the same input data resumes the same chain.
+
+        Args:
+            input_data (Dict[str, str] | None): The data loaded in the payload before the run method.
+
+        Returns:
+            str: The checkpoint key.
+        """
+        digest: str = hashlib.sha256(json.dumps(input_data or {}, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+        return f'{type(self).__module__}.{type(self).__qualname__}:{digest[:16]}'
+
     def __is_false__(self, value):
         """
         Returns True if the value is False.
@@ -81,70 +130,247 @@ class Task(ABC):
         """
         return value is False
     
-    def __call__(self):
+    @contextmanager
+    def __load_bot__(self, bot_pool: Optional[BotPool] = None) -> Iterator[Bot]:
+        """
+        Gets a ready to use bot, leased from the pool if it's setted, else a new one.
+
+        Args:
+            bot_pool (BotPool | None): The pool that overrides the task one.
+
+        Yields:
+            Bot: The bot instance.
+        """
+        bot_pool = bot_pool if bot_pool is not None else self._bot_pool
+
+        if bot_pool is not None:
+            with bot_pool.lease() as bot:
+                yield bot
+        else:
+            with BotPool.create_bot(config.BOT_DRIVER_TYPE) as bot:
+                yield bot
+
+    def __getstate__(self) -> dict:
+        """
+        Gets the task state used by pickle, the bot pool is bound to the current process and it's excluded.
+
+        Returns:
+            dict: The task state.
+        """
+        state: dict = self.__dict__.copy()
+        state.pop('_bot_pool', None)
+        return state
+
+    def __call__(self, input_data: Optional[Dict[str, str]] = None):
         """
         Automatically executed when the class is instantiated and called.
         
         It executes the run method with appropriate logic and handles retries.
 
+        Args:
+            input_data (Dict[str, str] | None): The data loaded in the payload before the run method.
+
+        Returns:
+            The value returned by the on_success or on_failure method.
+        """
+        _, _, output = self.__execute__(input_data=input_data)
+        return output
+
+    def __execute__(self, input_data: Optional[Dict[str, str]] = None, 
+                    bot_pool: Optional[BotPool] = None) -> Tuple[bool, Optional[Payload], Any]:
+        """
+        Executes the run method with appropriate logic and handles retries, tracing the timing spans of every phase.
+
+        The spans are stored in the payload and exported to a local file, if the export is enabled in the config.
+
+        Args:
+            input_data (Dict[str, str] | None): The data loaded in the payload before the run method.
+            bot_pool (BotPool | None): The pool that overrides the task one.
+
+        Returns:
+            Tuple[bool, Optional[Payload], Any]: The run result, the collected payload and 
+                the value returned by the on_success or on_failure method.
+        """
+        tracer: Tracer = Tracer()
+
+        with tracer.activate():
+            with span('task', task=type(self).__name__) as task_span, log_context(task=type(self).__name__):
+                result, payload, output = self.__run_attempts__(input_data=input_data, bot_pool=bot_pool)
+                task_span.attributes['result'] = result
+
+        if payload is not None:
+            payload.spans = tracer.spans()
+
+        try:
+            tracer.export()
+        except Exception as e:
+            logger.error(f'Trace not exported: {e}')
+
+        return result, payload, output
+
+    def __run_attempts__(self, input_data: Optional[Dict[str, str]] = None, 
+                         bot_pool: Optional[BotPool] = None) -> Tuple[bool, Optional[Payload], Any]:
+        """
+        Executes the run method with appropriate logic and handles retries.
+
+        The failed attempts are sorted by the retry policy: the transient errors are recovered on the live driver,
+        the driver errors relaunch the browser and the fatal errors end the retries.
+
+        Args:
+            input_data (Dict[str, str] | None): The data loaded in the payload before the run method.
+            bot_pool (BotPool | None): The pool that overrides the task one.
+
         Returns:
-            bool: True on success, False on failure after retries.
+            Tuple[bool, Optional[Payload], Any]: The run result, the collected payload and 
+                the value returned by the on_success or on_failure method.
         """
+        bot_pool = bot_pool if bot_pool is not None else self._bot_pool
+        policy: RetryPolicy = self.retry_policy()
+
         result: bool = False
         payload: Payload = None
+        outcome: Optional[str] = None
+        # the attempts and the reruns resume the page chain from the last checkpoint
+        checkpoint_key: Optional[str] = self.checkpoint_key(input_data) if config.BOT_CHECKPOINTS else None
 
-        try:
-            for attempt in Retrying(
-                wait=wait_fixed(config.BOT_RETRY_DELAY),
-                stop=stop_after_attempt(config.BOT_MAX_RETRIES),
-                retry=retry_if_result(self.__is_false__),
-                after=after_log(logger, logging.DEBUG)
-            ):
-                with attempt:
-                    bot: Bot = None
-
-                    if config.BOT_DRIVER_TYPE == config.DriverType.FIREFOX:
-                        bot = FirefoxBot()
-                    elif config.BOT_DRIVER_TYPE == config.DriverType.CHROME:
-                        bot = ChromeBot()
-                    else:
-                        raise ValueError(f'Unknown Driver Type: {config.BOT_DRIVER_TYPE}')
-
-                    with bot:
+        with ExitStack() as bot_stack:
+            bot: Optional[Bot] = None
+
+            try:
+                for attempt in Retrying(
+                    wait=policy.wait(),
+                    stop=stop_after_attempt(policy.max_attempts),
+                    retry=retry_if_result(policy.should_retry),
+                    after=after_log(logger, logging.DEBUG)
+                ):
+                    with attempt, span('task.attempt', attempt=attempt.retry_state.attempt_number) as attempt_span, \
+                            log_context(attempt=attempt.retry_state.attempt_number):
+                        # the transient errors reuse the live driver, the other ones relaunch the browser
+                        if bot is not None and outcome == RECOVER and not self.__recover_bot__(bot):
+                            outcome = RELAUNCH
+
+                        if bot is not None and outcome == RELAUNCH:
+                            self.__discard_bot__(bot, bot_stack, bot_pool)
+                            bot = None
+
+                        if bot is None:
+                            bot = bot_stack.enter_context(self.__load_bot__(bot_pool=bot_pool))
+
+                        if input_data is not None:
+                            bot.payload.input_data = dict(input_data)
+                        if checkpoint_key is not None:
+                            bot.checkpoint_key = checkpoint_key
+
+                        error: Optional[Exception] = None
                         try:
-                            result = self.run(bot)
+                            with span('task.run'):
+                                result = self.run(bot)
                             payload = bot.payload
                             payload.output_data['result'] = result
                         except Exception as e:
                             result = False
-                            logging.error(f'{e}')
-                            logging.error(f'{traceback.format_exc()}')
+                            error = e
+                            # the traceback is formatted by the logging thread
+                            logger.error(f'Attempt failed: {e}', exc_info=True)
+
+                            # the artifacts are written in background, they never fail the attempt
+                            if config.BOT_ARTIFACTS:
+                                self.__capture_artifacts__(bot, attempt.retry_state.attempt_number, e)
 
                             # try to get the payload
                             try:
-                                bot.save_html()
-                                bot.save_screenshot()
                                 payload = bot.payload
                                 payload.output_data['result'] = result
                             except Exception as e:
                                 payload = None
-                                logging.error(f'{e}')
+                                logger.error(f'Payload not collected: {e}')
+
+                        outcome = None if result else policy.classify(error)
+                        if attempt_span is not None:
+                            attempt_span.attributes['outcome'] = outcome or 'success'
+                        if outcome == FATAL:
+                            logger.warning(f'Fatal error, the task is not retried: {error}')
+
+                    if not attempt.retry_state.outcome.failed:
+                        attempt.retry_state.set_result(outcome)
 
-                if not attempt.retry_state.outcome.failed:
-                    attempt.retry_state.set_result(result)
+            except RetryError:
+                pass
 
-            if result:
-                try:
-                    return self.on_success(payload)
-                except Exception as e:
-                    logging.error(f'{e}')
-                    logging.error(f'{traceback.format_exc()}')
-                    return
+        # the hooks get the spans of the attempts
+        tracer: Optional[Tracer] = current_tracer()
+        if payload is not None and tracer is not None:
+            payload.spans = tracer.spans()
+
+        if result:
+            if checkpoint_key is not None:
+                CheckpointStore.shared(config.BOT_CHECKPOINT_FILE_PATH).delete(checkpoint_key)
 
-        except RetryError:
             try:
-                return self.on_failure(payload)
+                with span('task.on_success'):
+                    return result, payload, self.on_success(payload)
             except Exception as e:
-                logging.error(f'{e}')
-                logging.error(f'{traceback.format_exc()}')
-                return
\ No newline at end of file
+                logger.error(f'on_success failed: {e}', exc_info=True)
+                return result, payload, None
+
+        try:
+            with span('task.on_failure'):
+                return result, payload, self.on_failure(payload)
+        except Exception as e:
+            logger.error(f'on_failure failed: {e}', exc_info=True)
+            return result, payload, None
+
+    def __capture_artifacts__(self, bot: Bot, attempt: int, error: Exception):
+        """
+        Captures the HTML page and a screenshot of a failed attempt, written by the shared artifact writer.
+        The artifact paths are stored in the payload.
+
+        Args:
+            bot (Bot): The bot of the failed attempt.
+            attempt (int): The attempt number.
+            error (Exception): The error of the attempt.
+        """
+        try:
+            with span('task.artifacts'):
+                paths: Dict[str, str] = ArtifactWriter.shared().capture(bot, type(self).__name__, attempt, error)
+            bot.payload.output_data.update(paths)
+        except Exception as e:
+            logger.warning(f'Artifacts not captured: {e}')
+
+    def __recover_bot__(self, bot: Bot) -> bool:
+        """
+        Recovers the live driver after a transient error: the job is ended, the state cleared and the start page loaded.
+
+        Args:
+            bot (Bot): The bot of the failed attempt.
+
+        Returns:
+            bool: True if the bot is ready for the next attempt, False if the browser needs a relaunch.
+        """
+        try:
+            with span('task.recover'):
+                bot.finish()
+                bot.reset()
+                bot.open()
+            return True
+        except Exception as e:
+            logger.warning(f'Bot not recovered, relaunching the browser: {e}')
+            return False
+
+    def __discard_bot__(self, bot: Bot, bot_stack: ExitStack, bot_pool: Optional[BotPool] = None):
+        """
+        Quits the bot of a failed attempt, a leased bot is removed from the pool.
+
+        Args:
+            bot (Bot): The bot of the failed attempt.
+            bot_stack (ExitStack): The context of the bot.
+            bot_pool (BotPool | None): The pool of the bot.
+        """
+        if bot_pool is not None:
+            bot_pool.invalidate(bot)
+
+        try:
+            with span('task.relaunch'):
+                bot_stack.close()
+        except Exception as e:
+            logger.debug(f'Error closing a broken bot: {e}')
@@ -0,0 +1,227 @@
+import logging
+import time
+from dataclasses import dataclass, field
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from multiprocessing.util import Finalize
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from fastbots import config
+from fastbots.task import Task
+from fastbots.payload import Payload
+from fastbots.bot_pool import BotPool
+
+
+logger = logging.getLogger(__name__)
+
+# bot pool of the current worker process, used only with the process executor
+_worker_bot_pool: Optional[BotPool] = None
+
+
+@dataclass
+class TaskRun:
+    """
+    TaskRun class for managing the outcome of a single task execution.
+    """
+
+    task_name: str
+    input_data: Optional[Dict[str, str]] = None
+    result: bool = False
+    payload: Optional[Payload] = None
+    output: Any = None
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+
+@dataclass
+class TaskRunnerReport:
+    """
+    TaskRunnerReport class for managing the outcome and the throughput of a runner execution.
+    """
+
+    runs: List[TaskRun] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def succeeded(self) -> int:
+        """
+        Gets the number of successful runs.
+
+        Returns:
+            int: The successful runs count.
+        """
+        return sum(1 for run in self.runs if run.result)
+
+    @property
+    def failed(self) -> int:
+        """
+        Gets the number of failed runs.
+
+        Returns:
+            int: The failed runs count.
+        """
+        return len(self.runs) - self.succeeded
+
+    @property
+    def throughput(self) -> float:
+        """
+        Gets the number of completed runs per second.
+
+        Returns:
+            float: The runs per second.
+        """
+        if self.elapsed <= 0:
+            return 0.0
+        return len(self.runs) / self.elapsed
+
+
+def __init_worker__(driver_type: config.DriverType):
+    """
+    Initializes a worker process with its own bot pool, closed when the process exits.
+
+    Args:
+        driver_type (config.DriverType): The type of the bots created by the pool.
+    """
+    global _worker_bot_pool
+
+    _worker_bot_pool = BotPool(size=1, driver_type=driver_type)
+    Finalize(_worker_bot_pool, _worker_bot_pool.close, exitpriority=10)
+
+
+def __execute_task__(task: Task, input_data: Optional[Dict[str, str]], bot_pool: Optional[BotPool] = None) -> TaskRun:
+    """
+    Executes a task in a worker, reusing the task retry logic and hooks.
+
+    Args:
+        task (Task): The task to execute.
+        input_data (Dict[str, str] | None): The data loaded in the payload before the run method.
+        bot_pool (BotPool | None): The pool used by the worker, the process one if None.
+
+    Returns:
+        TaskRun: The outcome of the execution.
+    """
+    start_time: float = time.time()
+    task_run: TaskRun = TaskRun(task_name=type(task).__name__, input_data=input_data)
+
+    try:
+        task_run.result, task_run.payload, task_run.output = task.__execute__(
+            input_data=input_data,
+            bot_pool=bot_pool if bot_pool is not None else _worker_bot_pool
+        )
+    except Exception as e:
+        task_run.error = f'{e}'
+        logger.error(f'Task failed: {e}', exc_info=True)
+
+    task_run.elapsed = time.time() - start_time
+    return task_run
+
+
+class TaskRunner(object):
+    """
+    Task Runner
+
+    Executes many tasks concurrently on a thread or process pool, every worker uses its own bot,
+    that is kept alive between the tasks executed by the worker.
+
+    Attributes:
+        _max_workers (int): The max number of tasks executed at the same time.
+        _use_processes (bool): True -> the tasks are executed in separated processes, else in threads.
+        _driver_type (config.DriverType): The type of the bots used by the workers.
+
+    Methods:
+        __init__(max_workers: int, use_processes: bool, driver_type: config.DriverType): Initializes the TaskRunner instance.
+        run(jobs: Iterable[Union[Task, Tuple[Task, Dict[str, str]]]]) -> TaskRunnerReport: Executes all the jobs and collects the outcomes.
+        iter_runs(jobs: Iterable[Union[Task, Tuple[Task, Dict[str, str]]]]) -> Iterator[TaskRun]: Executes all the jobs, yielding every outcome when completed.
+
+    Example:
+        ```python
+        report = TaskRunner(max_workers=4).run((MyTask(), record) for record in records)
+        print(report.succeeded, report.failed, report.throughput)
+        ```
+    """
+
+    def __init__(self, max_workers: int = config.BOT_RUNNER_MAX_WORKERS,
+                 use_processes: bool = config.BOT_RUNNER_USE_PROCESSES,
+                 driver_type: config.DriverType = config.BOT_DRIVER_TYPE) -> None:
+        """
+        Initializes the TaskRunner instance.
+
+        Args:
+            max_workers (int): The max number of tasks executed at the same time.
+            use_processes (bool): True -> the tasks are executed in separated processes (tasks must be picklable), else in threads.
+            driver_type (config.DriverType): The type of the bots used by the workers.
+        """
+        super().__init__()
+
+        if max_workers < 1:
+            raise ValueError(f'The max workers must be at least 1, found: {max_workers}.')
+
+        self._max_workers: int = max_workers
+        self._use_processes: bool = use_processes
+        self._driver_type: config.DriverType = driver_type
+
+    def run(self, jobs: Iterable[Union[Task, Tuple[Task, Dict[str, str]]]]) -> TaskRunnerReport:
+        """
+        Executes all the jobs and collects the outcomes.
+
+        Args:
+            jobs (Iterable[Union[Task, Tuple[Task, Dict[str, str]]]]): The tasks to execute, optionally with their input data.
+
+        Returns:
+            TaskRunnerReport: The outcomes of all the executions and the aggregated throughput.
+        """
+        start_time: float = time.time()
+        report: TaskRunnerReport = TaskRunnerReport()
+
+        for task_run in self.iter_runs(jobs):
+            report.runs.append(task_run)
+
+        report.elapsed = time.time() - start_time
+        logger.info(f'Executed {len(report.runs)} tasks in {report.elapsed:.2f}s, succeeded: {report.succeeded}, '
+                    f'failed: {report.failed}, throughput: {report.throughput:.2f} tasks/s')
+        return report
+
+    def iter_runs(self, jobs: Iterable[Union[Task, Tuple[Task, Dict[str, str]]]]) -> Iterator[TaskRun]:
+        """
+        Executes all the jobs, yielding every outcome when it's completed (not in the submission order).
+
+        The jobs are consumed lazily, only a bounded number of them is submitted at the same time.
+
+        Args:
+            jobs (Iterable[Union[Task, Tuple[Task, Dict[str, str]]]]): The tasks to execute, optionally with their input data.
+
+        Yields:
+            TaskRun: The outcome of an execution.
+        """
+        bot_pool: Optional[BotPool] = None
+        executor: Executor = None
+
+        if self._use_processes:
+            executor = ProcessPoolExecutor(max_workers=self._max_workers, initializer=__init_worker__,
+                                           initargs=(self._driver_type,))
+        else:
+            bot_pool = BotPool(size=self._max_workers, driver_type=self._driver_type)
+            executor = ThreadPoolExecutor(max_workers=self._max_workers)
+
+        pending: Set[Future] = set()
+
+        try:
+            for job in jobs:
+                task, input_data = job if isinstance(job, tuple) else (job, None)
+
+                # limit the submitted jobs, to keep the memory bounded with big iterables
+                if len(pending) >= self._max_workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+
+                pending.add(executor.submit(__execute_task__, task, input_data, bot_pool))
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            if bot_pool is not None:
+                bot_pool.close()
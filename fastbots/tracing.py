@@ -0,0 +1,290 @@
+import os
+import json
+import time
+import logging
+import functools
+import threading
+import contextvars
+from pathlib import Path
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from fastbots import config
+
+
+logger = logging.getLogger(__name__)
+
+# tracer of the current task run, propagated to the nested calls
+_current_tracer: contextvars.ContextVar[Optional['Tracer']] = contextvars.ContextVar('fastbots_tracer', default=None)
+
+# innermost open span, the parent of the new spans
+_current_span: contextvars.ContextVar[Optional['Span']] = contextvars.ContextVar('fastbots_span', default=None)
+
+# serializes the writes of the exporters, shared by the threads of the process
+_export_lock: threading.Lock = threading.Lock()
+
+
+@dataclass
+class Span:
+    """
+    Timing of a phase of a task run, nested in the phase that contains it.
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    start_time: int = 0
+    end_time: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    status: str = 'ok'
+    error: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        """
+        Gets the duration of the span.
+
+        Returns:
+            float: The duration in seconds.
+        """
+        return (self.end_time - self.start_time) / 1e9
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Gets the span as a dict, with the duration in seconds.
+
+        Returns:
+            Dict[str, Any]: The span data.
+        """
+        # the attributes are plain values, a shallow copy is enough and asdict deep copies every value
+        return {
+            'name': self.name, 'trace_id': self.trace_id, 'span_id': self.span_id, 'parent_id': self.parent_id,
+            'start_time': self.start_time, 'end_time': self.end_time, 'attributes': dict(self.attributes),
+            'status': self.status, 'error': self.error, 'duration': self.duration,
+        }
+
+
+class Tracer(object):
+    """
+    Tracer
+
+    Collects the spans of a task run: the phases of the run (driver launch, start url, pages, waits, downloads,
+    debug artifacts, llm calls and retries) open a span with the span function, and the spans are nested
+    by the context, also across the threads started with a copied context.
+
+    Attributes:
+        _trace_id (str): The id of the trace, shared by all the spans.
+        _spans (List[Span]): The finished spans, in end order.
+
+    Methods:
+        __init__(name: str): Initializes the Tracer instance.
+        activate() -> Iterator[Tracer]: Makes the tracer the current one in the context.
+        spans() -> List[Dict[str, Any]]: Gets the finished spans as dicts.
+        export(exporter: str, file_path: str): Appends the finished spans to a local file.
+
+    Example:
+        ```python
+        with Tracer('my_task').activate() as tracer:
+            with span('my_phase', page='search_page'):
+                ...
+        bot.payload.spans = tracer.spans()
+        ```
+    """
+
+    def __init__(self, name: str = config.PROJECT_NAME) -> None:
+        """
+        Initializes the Tracer instance.
+
+        Args:
+            name (str): The name of the traced service, used by the OpenTelemetry export.
+        """
+        super().__init__()
+
+        self._name: str = name
+        self._trace_id: str = os.urandom(16).hex()
+        self._spans: List[Span] = []
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def trace_id(self) -> str:
+        """
+        Gets the id of the trace.
+
+        Returns:
+            str: The trace id, 32 hex chars.
+        """
+        return self._trace_id
+
+    @contextmanager
+    def activate(self) -> Iterator['Tracer']:
+        """
+        Makes the tracer the current one in the context, the spans opened in the context are collected by it.
+
+        Yields:
+            Tracer: The tracer instance.
+        """
+        tracer_token = _current_tracer.set(self)
+        span_token = _current_span.set(None)
+        try:
+            yield self
+        finally:
+            _current_span.reset(span_token)
+            _current_tracer.reset(tracer_token)
+
+    def spans(self) -> List[Dict[str, Any]]:
+        """
+        Gets the finished spans as dicts, sorted by start time.
+
+        Returns:
+            List[Dict[str, Any]]: The spans data.
+        """
+        with self._lock:
+            spans: List[Span] = sorted(self._spans, key=lambda span: span.start_time)
+        return [span.to_dict() for span in spans]
+
+    def export(self, exporter: str = config.BOT_TRACE_EXPORT, file_path: str = config.BOT_TRACE_FILE_PATH):
+        """
+        Appends the finished spans to a local file.
+
+        Args:
+            exporter (str): 'jsonl' -> a JSON line for every span, 'otlp' -> a JSON line with the OpenTelemetry
+                            (OTLP/JSON) traces, 'None' -> disabled.
+            file_path (str): The path of the file.
+        """
+        if exporter == 'None':
+            return
+
+        if exporter == 'jsonl':
+            lines: List[str] = [json.dumps(span, default=str) for span in self.spans()]
+        elif exporter == 'otlp':
+            lines = [json.dumps(self.__otlp__(), default=str)]
+        else:
+            raise ValueError(f'Unknown trace exporter: {exporter}')
+
+        path: Path = Path(file_path)
+        if path.parent != Path('.'):
+            path.parent.mkdir(exist_ok=True, parents=True)
+
+        with _export_lock:
+            with open(path, 'a', encoding='utf-8') as file:
+                file.write(''.join(f'{line}\n' for line in lines))
+
+    def __record__(self, span: Span):
+        """
+        Collects a finished span.
+
+        Args:
+            span (Span): The finished span.
+        """
+        with self._lock:
+            self._spans.append(span)
+
+    def __otlp__(self) -> Dict[str, Any]:
+        """
+        Converts the finished spans to the OpenTelemetry traces format (OTLP/JSON).
+
+        Returns:
+            Dict[str, Any]: The traces data, with a resource span of the service.
+        """
+        def attribute(key: str, value: Any) -> Dict[str, Any]:
+            if isinstance(value, bool):
+                return {'key': key, 'value': {'boolValue': value}}
+            if isinstance(value, int):
+                return {'key': key, 'value': {'intValue': str(value)}}
+            if isinstance(value, float):
+                return {'key': key, 'value': {'doubleValue': value}}
+            return {'key': key, 'value': {'stringValue': str(value)}}
+
+        with self._lock:
+            spans: List[Span] = sorted(self._spans, key=lambda span: span.start_time)
+
+        return {'resourceSpans': [{
+            'resource': {'attributes': [attribute('service.name', self._name)]},
+            'scopeSpans': [{
+                'scope': {'name': 'fastbots', 'version': config.APP_VERSION},
+                'spans': [
+                    {
+                        'traceId': span.trace_id,
+                        'spanId': span.span_id,
+                        'parentSpanId': span.parent_id or '',
+                        'name': span.name,
+                        'kind': 1,
+                        'startTimeUnixNano': str(span.start_time),
+                        'endTimeUnixNano': str(span.end_time),
+                        'attributes': [attribute(key, value) for key, value in span.attributes.items()],
+                        'status': {'code': 2, 'message': span.error or ''} if span.status == 'error' else {'code': 1},
+                    }
+                    for span in spans
+                ],
+            }],
+        }]}
+
+
+def current_tracer() -> Optional[Tracer]:
+    """
+    Gets the tracer of the current context.
+
+    Returns:
+        Tracer | None: The current tracer, None outside a traced task run.
+    """
+    return _current_tracer.get()
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """
+    Opens a span in the current tracer, nested in the current span.
+    Without a current tracer it does nothing, so the phases of the bots used outside a task aren't traced.
+
+    Args:
+        name (str): The name of the phase.
+        **attributes (Any): The attributes of the span.
+
+    Yields:
+        Span | None: The open span, the attributes could be updated, None without a current tracer.
+    """
+    tracer: Optional[Tracer] = _current_tracer.get()
+    if tracer is None:
+        yield None
+        return
+
+    parent: Optional[Span] = _current_span.get()
+    current: Span = Span(
+        name=name, trace_id=tracer.trace_id, span_id=os.urandom(8).hex(),
+        parent_id=None if parent is None else parent.span_id, start_time=time.time_ns(), attributes=attributes,
+    )
+
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.status = 'error'
+        current.error = f'{type(e).__name__}: {e}'
+        raise
+    finally:
+        current.end_time = time.time_ns()
+        _current_span.reset(token)
+        tracer.__record__(current)
+
+
+def traced(name: str) -> Callable:
+    """
+    Decorator that runs a function in a span.
+
+    Args:
+        name (str): The name of the phase.
+
+    Returns:
+        Callable: The decorator.
+    """
+    def decorator(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if _current_tracer.get() is None:
+                return function(*args, **kwargs)
+            with span(name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
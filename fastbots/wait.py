@@ -0,0 +1,276 @@
+import time
+import logging
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, Tuple, Any
+
+from selenium.webdriver.support.wait import WebDriverWait
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from fastbots import config
+from fastbots.scripts import WAIT_ELEMENT_JS, WAIT_URL_CHANGE_JS
+from fastbots.tracing import traced
+
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveWait(WebDriverWait):
+    """
+    Adaptive Wait
+
+    A WebDriverWait that polls with an exponential backoff, starting from a few milliseconds,
+    so the conditions that are already true cost only one check.
+    The optional events mode waits the elements and the urls inside the page (MutationObserver and navigation events),
+    resolving as soon as they appear.
+
+    Attributes:
+        _min_poll (float): The first polling interval, in seconds.
+        _max_poll (float): The max polling interval, in seconds.
+        _backoff (float): The multiplier of the polling interval after every check.
+        _use_events (bool): True -> until_element and until_url wait the events inside the page.
+
+    Methods:
+        __init__(driver, timeout, ...): Initializes the AdaptiveWait instance.
+        until(method, message) -> Any: Waits until the method returns a value that is not False.
+        until_not(method, message) -> Any: Waits until the method returns a value that is False.
+        until_element(locator) -> WebElement: Waits until an element is present in the page.
+        until_url(expected_url, strict_page_check) -> bool: Waits until the browser is on the expected url.
+
+    Example:
+        ```python
+        element = bot.wait.until(EC.element_to_be_clickable((By.ID, 'search')))
+        element = bot.wait.until_element((By.ID, 'search'))
+        ```
+    """
+
+    def __init__(self, driver, timeout: float, min_poll: float = config.SELENIUM_WAIT_MIN_POLL,
+                 max_poll: float = config.SELENIUM_WAIT_MAX_POLL, backoff: float = config.SELENIUM_WAIT_BACKOFF,
+                 use_events: bool = config.SELENIUM_WAIT_EVENTS, ignored_exceptions: Optional[Tuple] = None) -> None:
+        """
+        Initializes the AdaptiveWait instance.
+
+        Args:
+            driver: The WebDriver instance (or a WebElement) passed to the conditions.
+            timeout (float): The max waited seconds.
+            min_poll (float): The first polling interval, in seconds.
+            max_poll (float): The max polling interval, in seconds.
+            backoff (float): The multiplier of the polling interval after every check.
+            use_events (bool): True -> until_element and until_url wait the events inside the page.
+            ignored_exceptions (Tuple | None): The exceptions ignored during the checks.
+        """
+        super().__init__(driver=driver, timeout=timeout, poll_frequency=min_poll, ignored_exceptions=ignored_exceptions)
+
+        self._min_poll: float = min_poll
+        self._max_poll: float = max(max_poll, min_poll)
+        self._backoff: float = max(backoff, 1.0)
+        self._use_events: bool = use_events
+
+    @traced('wait.until')
+    def until(self, method: Callable[[Any], Any], message: str = '') -> Any:
+        """
+        Waits until the method returns a value that is not False.
+
+        Args:
+            method (Callable[[Any], Any]): The condition, called with the driver.
+            message (str): The message of the timeout exception.
+
+        Returns:
+            Any: The last value returned by the method.
+
+        Raises:
+            TimeoutException: If the method doesn't return a truthy value before the timeout.
+        """
+        return self.__poll__(method, message, lambda value: value)
+
+    @traced('wait.until_not')
+    def until_not(self, method: Callable[[Any], Any], message: str = '') -> Any:
+        """
+        Waits until the method returns a value that is False, the ignored exceptions count as False.
+
+        Args:
+            method (Callable[[Any], Any]): The condition, called with the driver.
+            message (str): The message of the timeout exception.
+
+        Returns:
+            Any: The last value returned by the method, True if an ignored exception was raised.
+
+        Raises:
+            TimeoutException: If the method doesn't return a falsy value before the timeout.
+        """
+        return self.__poll__(method, message, lambda value: not value, not_mode=True)
+
+    @traced('wait.element')
+    def until_element(self, locator: Tuple[str, str]) -> WebElement:
+        """
+        Waits until an element is present in the page.
+
+        In the events mode, it waits the DOM mutations inside the page, else it polls with backoff.
+
+        Args:
+            locator (Tuple[str, str]): The selenium locator, as (By, value).
+
+        Returns:
+            WebElement: The found element.
+
+        Raises:
+            TimeoutException: If the element isn't present before the timeout.
+        """
+        end_time: float = time.monotonic() + self._timeout
+
+        if self._use_events:
+            try:
+                with self.__script_timeout__():
+                    element = self._driver.execute_async_script(
+                        WAIT_ELEMENT_JS, locator[0], locator[1], int(self._timeout * 1000)
+                    )
+                if element is not None:
+                    return element
+                raise TimeoutException(f'Element not found: {locator}')
+
+            except TimeoutException:
+                raise
+            except WebDriverException as e:
+                # a page load interrupts the script, continue polling with the remaining time
+                logger.debug(f'Element events wait interrupted: {e}')
+
+        return self.__poll__(lambda driver: driver.find_element(*locator), f'Element not found: {locator}',
+                             lambda value: value, end_time=end_time)
+
+    @traced('wait.url')
+    def until_url(self, expected_url: str, strict_page_check: bool = True) -> bool:
+        """
+        Waits until the browser is on the expected url.
+
+        In the events mode, it waits the navigation events inside the page, else it polls with backoff.
+
+        Args:
+            expected_url (str): The expected url.
+            strict_page_check (bool): True -> the url must be the same, else the url must contain the expected one.
+
+        Returns:
+            bool: True when the browser is on the expected url.
+
+        Raises:
+            TimeoutException: If the browser isn't on the expected url before the timeout.
+        """
+        def check(current_url: str) -> bool:
+            return current_url == expected_url if strict_page_check else expected_url in current_url
+
+        if not self._use_events:
+            return self.__poll__(lambda driver: check(driver.current_url), f'Expected url: {expected_url}', lambda value: value)
+
+        with self.__script_timeout__():
+            return self.__until_url_events__(expected_url, check)
+
+    def __until_url_events__(self, expected_url: str, check: Callable[[str], bool]) -> bool:
+        """
+        Waits until the browser is on the expected url, by the navigation events inside the page.
+
+        Args:
+            expected_url (str): The expected url.
+            check (Callable[[str], bool]): Checks if an url is the expected one.
+
+        Returns:
+            bool: True when the browser is on the expected url.
+
+        Raises:
+            TimeoutException: If the browser isn't on the expected url before the timeout.
+        """
+        end_time: float = time.monotonic() + self._timeout
+        interval: float = self._min_poll
+
+        while True:
+            try:
+                current_url: str = self._driver.current_url
+                if check(current_url):
+                    return True
+
+                remaining: float = end_time - time.monotonic()
+                if remaining <= 0:
+                    break
+
+                # resolved by the history api and hash changes, interrupted by the page loads
+                if check(self._driver.execute_async_script(WAIT_URL_CHANGE_JS, current_url, int(remaining * 1000))):
+                    return True
+
+            except WebDriverException as e:
+                # the page is loading, retry with backoff
+                logger.debug(f'Url events wait interrupted: {e}')
+                time.sleep(min(interval, max(end_time - time.monotonic(), 0)))
+                interval = min(interval * self._backoff, self._max_poll)
+
+            if time.monotonic() > end_time:
+                break
+
+        raise TimeoutException(f'Expected url: {expected_url}')
+
+    def __poll__(self, method: Callable[[Any], Any], message: str, accept: Callable[[Any], bool],
+                 not_mode: bool = False, end_time: Optional[float] = None) -> Any:
+        """
+        Calls the method until the value is accepted, sleeping with an exponential backoff between the calls.
+
+        Args:
+            method (Callable[[Any], Any]): The condition, called with the driver.
+            message (str): The message of the timeout exception.
+            accept (Callable[[Any], bool]): Checks if the value returned by the method ends the wait.
+            not_mode (bool): True -> the ignored exceptions end the wait, as in until_not.
+            end_time (float | None): The monotonic end time, if None it's computed from the timeout.
+
+        Returns:
+            Any: The accepted value.
+
+        Raises:
+            TimeoutException: If the value isn't accepted before the timeout.
+        """
+        screen = None
+        stacktrace = None
+
+        end_time = time.monotonic() + self._timeout if end_time is None else end_time
+        interval: float = self._min_poll
+
+        while True:
+            try:
+                value = method(self._driver)
+                if accept(value):
+                    return value
+            except self._ignored_exceptions as exc:
+                if not_mode:
+                    return True
+                screen = getattr(exc, 'screen', None)
+                stacktrace = getattr(exc, 'stacktrace', None)
+
+            remaining: float = end_time - time.monotonic()
+            if remaining <= 0:
+                break
+
+            time.sleep(min(interval, remaining))
+            interval = min(interval * self._backoff, self._max_poll)
+
+        raise TimeoutException(message, screen, stacktrace)
+
+    @contextmanager
+    def __script_timeout__(self) -> Iterator[None]:
+        """
+        Raises the driver script timeout during a wait, so the async scripts aren't interrupted before the wait timeout;
+        the previous timeout is restored at the end, so the async scripts of the user keep their own.
+        """
+        try:
+            previous: Optional[float] = self._driver.timeouts.script
+        except Exception:
+            # the driver doesn't expose its timeouts, it can't be restored
+            previous = None
+
+        if previous is not None and previous >= self._timeout + 1:
+            yield
+            return
+
+        self._driver.set_script_timeout(self._timeout + 1)
+        try:
+            yield
+        finally:
+            if previous is not None:
+                try:
+                    self._driver.set_script_timeout(previous)
+                except WebDriverException as e:
+                    logger.debug(f'Script timeout not restored: {e}')
@@ -0,0 +1,47 @@
+import pytest
+
+from fastbots import config, BotPool, Payload
+
+
+class FakeBot:
+
+    def __init__(self):
+        self.payload = Payload()
+        self.driver = self
+        self.recovered = 0
+        self.closed = False
+
+    @property
+    def current_url(self):
+        return 'about:blank'
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
+
+    def open(self):
+        return self
+
+    def finish(self):
+        pass
+
+    def reset(self):
+        self.recovered += 1
+        self.payload = Payload()
+
+    def close(self):
+        self.closed = True
+
+    def save_html(self):
+        pass
+
+    def save_screenshot(self):
+        pass
+
+
+@pytest.fixture
+def fake_bots(mocker, monkeypatch):
+    monkeypatch.setattr(config, 'BOT_RETRY_DELAY', 0)
+    mocker.patch.object(BotPool, 'create_bot', side_effect=lambda *args: FakeBot())
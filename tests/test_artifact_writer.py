@@ -0,0 +1,113 @@
+import gzip
+from pathlib import Path
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from fastbots import config, Task, Payload
+from fastbots.artifact_writer import ArtifactWriter, error_signature, artifact_name
+
+from benchmarks.fake_driver import FakeBot
+
+
+@pytest.fixture
+def writer(tmp_path):
+    writer = ArtifactWriter(
+        html_folder=str(tmp_path / 'html'), screenshot_folder=str(tmp_path / 'screenshots'), max_per_error=2
+    )
+    yield writer
+    writer.close()
+
+
+@pytest.fixture
+def bot():
+    bot = FakeBot()
+    yield bot
+    bot.close()
+
+
+def test_error_signature():
+    assert error_signature(TimeoutException('timeout after 10s')) == error_signature(TimeoutException('timeout after 30s'))
+    assert error_signature(ValueError('a')) != error_signature(TimeoutException('a'))
+
+
+def test_artifact_name():
+    assert artifact_name('My Task', 2).startswith('My_Task_2_')
+    assert artifact_name('MyTask', 1) != artifact_name('MyTask', 1)
+
+
+def test_capture(writer, bot):
+    bot.driver.get('https://example.com/')
+    paths = writer.capture(bot, 'MyTask', 1, TimeoutException('page not loaded'))
+    writer.flush()
+
+    assert paths['html_path'].endswith('.html.gz')
+    assert gzip.decompress(Path(paths['html_path']).read_bytes()).decode('utf-8') == bot.driver.page_source
+    assert Path(paths['screenshot_path']).read_bytes()[:4] == b'\x89PNG'
+
+
+def test_capture_dedupe_and_cap(writer, bot, tmp_path):
+    first = writer.capture(bot, 'MyTask', 1, TimeoutException('page not loaded'))
+    writer.flush()
+    # the same page and screenshot, the written files are reused
+    second = writer.capture(bot, 'MyTask', 2, TimeoutException('page not loaded'))
+    # the signature reached its cap
+    third = writer.capture(bot, 'MyTask', 3, TimeoutException('page not loaded'))
+    # another signature
+    other = writer.capture(bot, 'MyTask', 3, ValueError('bad data'))
+    writer.flush()
+
+    assert first == second == other
+    assert third == {}
+    assert len(list((tmp_path / 'html').iterdir())) == 1
+    assert len(list((tmp_path / 'screenshots').iterdir())) == 1
+
+
+def test_task_captures_artifacts(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'BOT_HTML_DOWNLOAD_FOLDER_PATH', str(tmp_path / 'html'))
+    monkeypatch.setattr(config, 'BOT_SCREENSHOT_DOWNLOAD_FOLDER_PATH', str(tmp_path / 'screenshots'))
+    monkeypatch.setattr(config, 'BOT_MAX_RETRIES', 1)
+
+    class FailingTask(Task):
+
+        def run(self, bot):
+            raise TimeoutException('page not loaded')
+
+        def on_success(self, payload):
+            return payload
+
+        def on_failure(self, payload: Payload):
+            return payload
+
+    bot = FakeBot()
+    with monkeypatch.context() as m:
+        m.setattr(FailingTask, '__load_bot__', lambda self, bot_pool=None: bot)
+        payload = FailingTask()()
+
+    ArtifactWriter.shared().flush()
+    assert Path(payload.output_data['html_path']).parent == tmp_path / 'html'
+    assert Path(payload.output_data['screenshot_path']).is_file()
+
+
+def test_capture_failed_write_not_reused(writer, bot, tmp_path):
+    (tmp_path / 'html').write_text('not a folder')
+    first = writer.capture(bot, 'MyTask', 1, TimeoutException('page not loaded'))
+    writer.flush()
+
+    (tmp_path / 'html').unlink()
+    second = writer.capture(bot, 'MyTask', 2, TimeoutException('page not loaded'))
+    writer.flush()
+
+    assert first['html_path'] != second['html_path']
+    assert first['screenshot_path'] == second['screenshot_path']
+    assert Path(second['html_path']).is_file()
+
+
+def test_written_files_bounded(writer, monkeypatch):
+    monkeypatch.setattr('fastbots.artifact_writer.MAX_WRITTEN_FILES', 2)
+
+    for i in range(4):
+        writer.__enqueue__(str(Path(writer._html_folder) / f'{i}.html.gz'), f'page {i}'.encode('utf-8'))
+    writer.flush()
+
+    assert list(writer._files.values()) == [str(Path(writer._html_folder) / f'{i}.html.gz') for i in (2, 3)]
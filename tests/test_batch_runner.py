@@ -0,0 +1,95 @@
+import csv
+import json
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from fastbots import Task, BotPool
+from fastbots.batch_runner import BatchRunner, read_records
+
+
+pytestmark = pytest.mark.usefixtures('fake_bots')
+
+
+class RecordTask(Task):
+
+    def run(self, bot):
+        if bot.payload.input_data['sku'] == 'broken':
+            raise TimeoutException('page not loaded')
+        bot.payload.output_data['records_seen'] = len(bot.payload.output_data) + 1
+        bot.payload.output_data['bot'] = id(bot)
+        return True
+
+    def on_success(self, payload):
+        return payload.input_data['sku']
+
+    def on_failure(self, payload):
+        return 'failed'
+
+
+def read_output(path):
+    with open(path, 'r', encoding='utf-8') as file:
+        return [json.loads(line) for line in file]
+
+
+def test_read_records(tmp_path):
+    csv_path = tmp_path / 'records.csv'
+    with open(csv_path, 'w', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=['sku', 'name'])
+        writer.writeheader()
+        writer.writerows([{'sku': '1', 'name': 'pen'}, {'sku': '2', 'name': 'book'}])
+    jsonl_path = tmp_path / 'records.jsonl'
+    jsonl_path.write_text('{"sku": "1"}\n\n{"sku": "2"}\n')
+
+    assert list(read_records(str(csv_path))) == [{'sku': '1', 'name': 'pen'}, {'sku': '2', 'name': 'book'}]
+    assert list(read_records(jsonl_path)) == [{'sku': '1'}, {'sku': '2'}]
+    assert list(read_records(iter([{'sku': '1'}]))) == [{'sku': '1'}]
+
+    with pytest.raises(ValueError):
+        list(read_records(str(tmp_path / 'records.xlsx')))
+
+def test_run(tmp_path):
+    output_path = tmp_path / 'output.jsonl'
+    records = ({'sku': 'broken' if i == 3 else str(i)} for i in range(10))
+
+    report = BatchRunner(RecordTask(), output_path=str(output_path)).run(records)
+
+    assert (report.total, report.succeeded, report.failed) == (10, 9, 1)
+    assert report.throughput > 0
+
+    outcomes = read_output(output_path)
+    assert [outcome['index'] for outcome in outcomes] == list(range(10))
+    assert outcomes[3]['result'] is False
+    assert outcomes[3]['output'] == 'failed'
+    assert outcomes[4]['output'] == '4'
+    # one bot for the whole batch, with a clean payload for every record
+    assert len({outcome['output_data']['bot'] for outcome in outcomes if outcome['result']}) == 1
+    assert all(outcome['output_data']['records_seen'] == 1 for outcome in outcomes if outcome['result'])
+    assert BotPool.create_bot.call_count == 1
+
+def test_run_appends(tmp_path):
+    output_path = tmp_path / 'output.jsonl'
+
+    BatchRunner(RecordTask(), output_path=str(output_path)).run([{'sku': '1'}])
+    BatchRunner(RecordTask(), output_path=str(output_path)).run([{'sku': '2'}])
+
+    assert [outcome['output'] for outcome in read_output(output_path)] == ['1', '2']
+
+def test_run_sqlite_output(tmp_path):
+    import sqlite3
+
+    output_path = tmp_path / 'output.sqlite'
+    BatchRunner(RecordTask(), output_path=str(output_path)).run([{'sku': '1'}, {'sku': 'broken'}])
+
+    with sqlite3.connect(output_path) as connection:
+        rows = connection.execute('SELECT "index", result, output FROM records ORDER BY "index"').fetchall()
+    assert rows == [(0, 1, '1'), (1, 0, 'failed')]
+
+def test_run_parquet_output(tmp_path):
+    pyarrow_parquet = pytest.importorskip('pyarrow.parquet')
+
+    output_path = tmp_path / 'output.parquet'
+    BatchRunner(RecordTask(), output_path=str(output_path)).run([{'sku': '1'}, {'sku': 'broken'}])
+
+    rows = pyarrow_parquet.read_table(output_path).to_pylist()
+    assert [(row['index'], row['result'], row['output']) for row in rows] == [(0, True, '1'), (1, False, 'failed')]
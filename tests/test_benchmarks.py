@@ -0,0 +1,44 @@
+from urllib.request import urlopen
+
+import pytest
+
+from fastbots import config
+
+from benchmarks.run import fake_benchmarks
+from benchmarks.server import FixtureServer
+from benchmarks.harness import load_results, report, save_results
+
+
+@pytest.fixture
+def restore_config(monkeypatch):
+    for name in ('SELENIUM_LOCATORS_FILE', 'BOT_DOWNLOAD_FOLDER_PATH', 'BOT_SCREENSHOT_DOWNLOAD_FOLDER_PATH',
+                 'BOT_HTML_DOWNLOAD_FOLDER_PATH', 'BOT_RETRY_DELAY'):
+        monkeypatch.setattr(config, name, getattr(config, name))
+
+
+def test_fake_benchmarks(restore_config, tmp_path):
+    results = fake_benchmarks(tmp_path, rounds=1)
+
+    assert [result.name for result in results] == [
+        'bot_startup', 'locators_load_cold', 'locators_load_warm', 'firefox_profile_encoded',
+        'firefox_profile_cached', 'locator_resolution', 'url_check', 'page_transition',
+        'download_wait', 'failure_artifacts', 'task_call'
+    ]
+    assert all(result.median > 0 for result in results)
+
+    file_path = save_results(results, tmp_path / 'results')
+    baseline = load_results(file_path)
+    assert set(baseline) == {f'fake/{result.name}' for result in results}
+    assert '+0.0%' in report(results, baseline)
+
+    # a renamed benchmark is reported, not skipped
+    baseline['fake/locators_load'] = dict(baseline.pop('fake/locators_load_cold'), name='locators_load')
+    lines = report(results, baseline).splitlines()
+    assert [line.split()[-1] for line in lines if 'locators_load' in line] == ['new', '+0.0%', 'missing']
+
+def test_fixture_server():
+    with FixtureServer() as server:
+        assert b'product' in urlopen(server.url('search.html')).read()
+
+        response = urlopen(server.url('download/report.txt'))
+        assert response.headers['Content-Disposition'] == 'attachment; filename="report.txt"'
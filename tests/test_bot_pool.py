@@ -0,0 +1,108 @@
+import pytest
+
+from fastbots import BotPool
+
+
+class FakeDriver:
+
+    def __init__(self):
+        self.alive = True
+
+    @property
+    def current_url(self):
+        if not self.alive:
+            raise Exception('Driver is dead.')
+        return 'about:blank'
+
+
+class FakeBot:
+
+    def __init__(self):
+        self.driver = FakeDriver()
+        self.resets = 0
+        self.closed = False
+
+    def open(self):
+        return self
+
+    def finish(self):
+        pass
+
+    def reset(self):
+        self.resets += 1
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def bot_pool(mocker):
+    mocker.patch.object(BotPool, 'create_bot', side_effect=lambda *args: FakeBot())
+    with BotPool(size=2) as bot_pool:
+        yield bot_pool
+
+
+def test_lease_reuses_bot(bot_pool):
+    with bot_pool.lease() as first_bot:
+        pass
+    with bot_pool.lease() as second_bot:
+        pass
+
+    assert first_bot is second_bot
+    assert second_bot.resets == 1
+
+def test_lease_concurrent_bots(bot_pool):
+    with bot_pool.lease() as first_bot:
+        with bot_pool.lease() as second_bot:
+            assert first_bot is not second_bot
+
+def test_broken_bot_is_replaced(bot_pool):
+    with bot_pool.lease() as first_bot:
+        first_bot.driver.alive = False
+    with bot_pool.lease() as second_bot:
+        pass
+
+    assert first_bot.closed
+    assert first_bot is not second_bot
+
+def test_warm_up(bot_pool):
+    bot_pool.warm_up()
+    assert BotPool.create_bot.call_count == 2
+
+def test_reset_error_replaces_bot(bot_pool):
+    with bot_pool.lease() as first_bot:
+        pass
+
+    def reset():
+        raise IndexError('list index out of range')
+    first_bot.reset = reset
+
+    with bot_pool.lease() as second_bot:
+        pass
+
+    assert first_bot.closed
+    assert first_bot is not second_bot
+    assert bot_pool._bots == [second_bot]
+
+def test_warm_up_during_lease(bot_pool):
+    with bot_pool.lease():
+        bot_pool.warm_up()
+        with bot_pool.lease():
+            pass
+
+    assert BotPool.create_bot.call_count == 2
+    assert len(bot_pool._bots) == 2
+
+def test_close(bot_pool):
+    with bot_pool.lease() as bot:
+        pass
+    bot_pool.close()
+
+    assert bot.closed
+    with pytest.raises(RuntimeError):
+        with bot_pool.lease():
+            pass
+
+def test_invalid_size():
+    with pytest.raises(ValueError):
+        BotPool(size=0)
@@ -0,0 +1,88 @@
+import gzip
+import json
+import urllib.request
+
+import pytest
+from seleniumwire import backend
+
+from fastbots.capture_recorder import CaptureRecorder
+
+from benchmarks.server import FixtureServer
+
+
+class FakeDriver(object):
+
+    def __init__(self, proxy) -> None:
+        self.backend = proxy
+
+
+def read_lines(file_path):
+    with gzip.open(file_path, 'rt', encoding='utf-8') as file:
+        return [json.loads(line) for line in file]
+
+
+def test_ring_buffer(tmp_path):
+    capture_recorder = CaptureRecorder(folder_path=str(tmp_path), file_format='jsonl', scopes='None',
+                                       buffer_size=3, buffer_bytes=100)
+
+    for index in range(5):
+        capture_recorder.record({'index': index})
+    assert [entry['index'] for entry in capture_recorder.entries()] == [2, 3, 4]
+
+    # the bytes limit drops the oldest entries
+    capture_recorder.record({'index': 5, 'text': 'x' * 75})
+    assert [entry['index'] for entry in capture_recorder.entries()] == [5]
+
+    # all the entries are in the file
+    file_path = capture_recorder.close()
+    assert [entry['index'] for entry in read_lines(file_path)] == [0, 1, 2, 3, 4, 5]
+
+    capture_recorder.reset()
+    assert capture_recorder.entries() == []
+    assert capture_recorder.close() is None
+
+def test_har_format(tmp_path):
+    capture_recorder = CaptureRecorder(folder_path=str(tmp_path), file_format='har', scopes='None')
+    capture_recorder.record({'index': 0})
+    capture_recorder.record({'index': 1})
+
+    with gzip.open(capture_recorder.close(), 'rt', encoding='utf-8') as file:
+        har = json.load(file)
+    assert har['log']['version'] == '1.2'
+    assert har['log']['entries'] == [{'index': 0}, {'index': 1}]
+
+    with pytest.raises(ValueError):
+        CaptureRecorder(folder_path=str(tmp_path), file_format='xml')
+
+def test_in_scope(tmp_path):
+    capture_recorder = CaptureRecorder(folder_path=str(tmp_path), scopes='.*example.*, .*github.*')
+    assert capture_recorder.in_scope('GET', 'https://example.com/')
+    assert capture_recorder.in_scope('POST', 'https://api.github.com/')
+    assert not capture_recorder.in_scope('GET', 'https://other.com/')
+    assert not capture_recorder.in_scope('OPTIONS', 'https://example.com/')
+
+def test_proxy(tmp_path):
+    proxy = backend.create(addr='127.0.0.1', port=0, options={'disable_capture': True})
+    try:
+        with FixtureServer() as server:
+            capture_recorder = CaptureRecorder(folder_path=str(tmp_path), scopes='.*search.*', max_body_bytes=10)
+            capture_recorder.install(FakeDriver(proxy))
+
+            host, port = proxy.address()[:2]
+            opener = urllib.request.build_opener(urllib.request.ProxyHandler({'http': f'http://{host}:{port}'}))
+            opener.open(server.url('search.html')).read()
+            opener.open(server.url('product.html')).read()
+
+            file_path = capture_recorder.close()
+
+        [entry] = read_lines(file_path)
+        assert entry['request']['url'] == server.url('search.html')
+        assert entry['response']['status'] == 200
+        assert entry['response']['content']['comment'] == 'truncated'
+        assert len(entry['response']['content']['text']) == 10
+        assert capture_recorder.entries() == [entry]
+
+        # the selenium-wire storage is empty
+        assert proxy.storage.load_requests() == []
+    finally:
+        proxy.shutdown()
@@ -0,0 +1,150 @@
+import time
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from fastbots import config, Bot, Page, Task
+from fastbots.checkpoint_store import Checkpoint, CheckpointStore, class_path, load_class
+
+from benchmarks.run import FakeBotPool, FAKE_BASE_URL, configure
+
+
+# forward calls of the pages, by page name
+calls = {}
+
+
+class ChainSearchPage(Page):
+
+    def __init__(self, bot: Bot) -> None:
+        super().__init__(bot=bot, page_name='search_page')
+
+    def forward(self) -> 'ChainProductPage':
+        calls['search_page'] = calls.get('search_page', 0) + 1
+        self.bot.payload.output_data['query'] = 'shoes'
+        self.bot.driver.find_element(*self.__locator__('product_locator')).click()
+        return ChainProductPage(bot=self.bot)
+
+
+class ChainProductPage(Page):
+
+    def __init__(self, bot: Bot) -> None:
+        super().__init__(bot=bot, page_name='product_page', strict_page_check=False)
+
+    def forward(self) -> None:
+        calls['product_page'] = calls.get('product_page', 0) + 1
+        if calls['product_page'] == 1:
+            raise TimeoutException('product not loaded')
+        self.bot.payload.output_data['title'] = 'title_locator'
+        return None
+
+
+class ChainTask(Task):
+
+    def run(self, bot: Bot) -> bool:
+        page = bot.resume(ChainSearchPage)
+        while page is not None:
+            page = page.forward()
+        return True
+
+    def on_success(self, payload):
+        return payload.output_data
+
+    def on_failure(self, payload):
+        return None
+
+
+@pytest.fixture
+def checkpoint_store(tmp_path):
+    return CheckpointStore(path=str(tmp_path / 'checkpoints.sqlite'), ttl=60)
+
+
+@pytest.fixture
+def chain_config(tmp_path, monkeypatch):
+    for name in ('SELENIUM_LOCATORS_FILE', 'BOT_DOWNLOAD_FOLDER_PATH', 'BOT_SCREENSHOT_DOWNLOAD_FOLDER_PATH',
+                 'BOT_HTML_DOWNLOAD_FOLDER_PATH', 'BOT_RETRY_DELAY'):
+        monkeypatch.setattr(config, name, getattr(config, name))
+    configure(tmp_path, FAKE_BASE_URL)
+
+    monkeypatch.setattr(config, 'BOT_CHECKPOINTS', True)
+    monkeypatch.setattr(config, 'BOT_CHECKPOINT_FILE_PATH', str(tmp_path / 'chain_checkpoints.sqlite'))
+    calls.clear()
+
+
+def test_save_load(checkpoint_store):
+    checkpoint_store.save(Checkpoint(
+        key='task:1', page_class='pages:ProductPage', url='https://a.com/product',
+        cookies=[{'name': 'sid', 'value': '1'}], payload={'output_data': {'query': 'shoes'}},
+    ))
+
+    checkpoint = checkpoint_store.load('task:1')
+    assert checkpoint.page_class == 'pages:ProductPage'
+    assert checkpoint.url == 'https://a.com/product'
+    assert checkpoint.cookies == [{'name': 'sid', 'value': '1'}]
+    assert checkpoint.payload == {'output_data': {'query': 'shoes'}}
+
+    checkpoint_store.delete('task:1')
+    assert checkpoint_store.load('task:1') is None
+
+
+def test_ttl(tmp_path):
+    checkpoint_store = CheckpointStore(path=str(tmp_path / 'checkpoints.sqlite'), ttl=0)
+    checkpoint_store.save(Checkpoint(key='task:1', page_class='pages:ProductPage', url='https://a.com/'))
+    time.sleep(0.01)
+
+    assert checkpoint_store.load('task:1') is None
+
+
+def test_class_path():
+    assert load_class(class_path(ChainProductPage)) is ChainProductPage
+
+    class LocalPage(Page):
+        def forward(self):
+            return None
+
+    with pytest.raises(ImportError):
+        load_class(class_path(LocalPage))
+
+
+def test_checkpoint_key():
+    assert ChainTask().checkpoint_key({'a': '1', 'b': '2'}) == ChainTask().checkpoint_key({'b': '2', 'a': '1'})
+    assert ChainTask().checkpoint_key({'a': '1'}) != ChainTask().checkpoint_key({'a': '2'})
+
+
+def test_resume_after_retry(chain_config):
+    with FakeBotPool(size=1) as bot_pool:
+        output = ChainTask(bot_pool=bot_pool)({'query': 'shoes'})
+
+    assert output['query'] == 'shoes'
+    assert output['title'] == 'title_locator'
+    # the retry resumes from the product page
+    assert calls == {'search_page': 1, 'product_page': 2}
+    # removed on success
+    assert CheckpointStore.shared(config.BOT_CHECKPOINT_FILE_PATH).load(
+        ChainTask().checkpoint_key({'query': 'shoes'})
+    ) is None
+
+
+def test_resume_after_rerun(chain_config, monkeypatch):
+    monkeypatch.setattr(config, 'BOT_MAX_RETRIES', 1)
+
+    with FakeBotPool(size=1) as bot_pool:
+        assert ChainTask(bot_pool=bot_pool)({'query': 'shoes'}) is None
+        checkpoint = CheckpointStore.shared(config.BOT_CHECKPOINT_FILE_PATH).load(
+            ChainTask().checkpoint_key({'query': 'shoes'})
+        )
+        assert checkpoint.page_class == class_path(ChainProductPage)
+        assert checkpoint.url == f'{FAKE_BASE_URL}product.html?id=1'
+
+        # a new run of the same input resumes the chain
+        assert ChainTask(bot_pool=bot_pool)({'query': 'shoes'})['title'] == 'title_locator'
+
+    assert calls == {'search_page': 1, 'product_page': 2}
+
+
+def test_disabled(chain_config, monkeypatch):
+    monkeypatch.setattr(config, 'BOT_CHECKPOINTS', False)
+
+    with FakeBotPool(size=1) as bot_pool:
+        ChainTask(bot_pool=bot_pool)({'query': 'shoes'})
+
+    assert calls == {'search_page': 2, 'product_page': 2}
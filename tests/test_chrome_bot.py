@@ -1,5 +1,7 @@
+import tempfile
+import threading
+
 import pytest
-from configparser import ConfigParser
 from pathlib import Path
 
 from seleniumwire.webdriver import Chrome
@@ -9,6 +11,7 @@ from selenium.webdriver.remote.webdriver import WebDriver
 
 from fastbots.chrome_bot import ChromeBot
 from fastbots import config, Payload
+from fastbots.locators import LocatorIndex
 
 
 @pytest.fixture()
@@ -58,8 +61,14 @@ def test_load_cookies(bot):
     bot.load_cookies()
     assert bot.driver.get_cookies() == expected_result
 
+def test_compiled_locator(bot):
+    assert bot.compiled_locator('search_page', 'search_locator') == ('id', 'twotabsearchtextbox')
+
+    with pytest.raises(ValueError):
+        bot.compiled_locator('pages_url', 'start_url')
+
 def test__load_locators__(bot):
-    assert isinstance(bot.__load_locators__(), ConfigParser)
+    assert isinstance(bot.__load_locators__(), LocatorIndex)
 
 def test___load_preferences__(bot):
     assert isinstance(bot.__load_preferences__(), dict)
@@ -71,4 +80,17 @@ def test___load_options__(bot):
 
 def test___load_driver__(bot):
     assert isinstance(bot.__load_driver__(), Chrome)
-    #TODO: check that all the config are loaded correctly (default and files)"""
\ No newline at end of file
+    #TODO: check that all the config are loaded correctly (default and files)"""
+def test_failed_launch_releases_resources(mocker, monkeypatch):
+    monkeypatch.setattr(config, 'BOT_DOWNLOAD_FOLDER_PATH', 'None')
+    mocker.patch('fastbots.chrome_bot.Chrome', side_effect=RuntimeError('driver not found'))
+    temp_dirs, mkdtemp = [], tempfile.mkdtemp
+    mocker.patch('fastbots.bot.tempfile.mkdtemp', side_effect=lambda **kwargs: temp_dirs.append(mkdtemp(**kwargs)) or temp_dirs[-1])
+    threads = threading.active_count()
+
+    with pytest.raises(RuntimeError, match='driver not found'):
+        ChromeBot()
+
+    assert len(temp_dirs) >= 2
+    assert not any(Path(temp_dir).exists() for temp_dir in temp_dirs)
+    assert threading.active_count() == threads
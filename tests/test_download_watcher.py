@@ -0,0 +1,81 @@
+import os
+import threading
+import time
+
+import pytest
+
+from fastbots.download_watcher import DownloadWatcher
+from fastbots.exceptions import DownloadFileError
+
+
+@pytest.fixture(params=[True, False], ids=['inotify', 'polling'])
+def download_watcher(request, tmp_path):
+    with DownloadWatcher(str(tmp_path), use_inotify=request.param) as download_watcher:
+        yield download_watcher
+
+
+def download(directory, name, suffix='.part', delay=0.1):
+    """
+    Simulates a browser download, with a placeholder and a temporary file renamed at the end.
+    """
+    (directory / name).write_bytes(b'')
+    (directory / f'{name}{suffix}').write_bytes(b'data')
+    time.sleep(delay)
+    os.replace(directory / f'{name}{suffix}', directory / name)
+
+
+def test_wait_for_existing(download_watcher, tmp_path):
+    (tmp_path / 'file.pdf').write_bytes(b'data')
+    assert download_watcher.wait_for(file_extension='pdf', timeout=1) == tmp_path / 'file.pdf'
+
+def test_wait_for_in_progress(download_watcher, tmp_path):
+    thread = threading.Thread(target=download, args=(tmp_path, 'file.pdf'))
+    thread.start()
+
+    assert download_watcher.wait_for(file_extension='pdf', timeout=2) == tmp_path / 'file.pdf'
+    assert (tmp_path / 'file.pdf').read_bytes() == b'data'
+    thread.join()
+
+def test_wait_for_concurrent(download_watcher, tmp_path):
+    threads = [
+        threading.Thread(target=download, args=(tmp_path, 'first.pdf', '.part', 0.1)),
+        threading.Thread(target=download, args=(tmp_path, 'second.pdf', '.crdownload', 0.2)),
+    ]
+    for thread in threads:
+        thread.start()
+
+    assert download_watcher.wait_for(file_name='second.pdf', timeout=2) == tmp_path / 'second.pdf'
+    assert download_watcher.wait_for(file_extension='pdf', timeout=2) == tmp_path / 'first.pdf'
+    for thread in threads:
+        thread.join()
+
+def test_wait_for_timeout(download_watcher, tmp_path):
+    (tmp_path / 'file.pdf.part').write_bytes(b'data')
+
+    with pytest.raises(DownloadFileError):
+        download_watcher.wait_for(file_extension='pdf', timeout=0.2)
+
+    with pytest.raises(DownloadFileError):
+        download_watcher.wait_for(file_extension='png', timeout=0.2)
+
+def test_wait_all(download_watcher, tmp_path):
+    threads = [threading.Thread(target=download, args=(tmp_path, f'{i}.csv')) for i in range(5)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+
+    assert sorted(path.name for path in download_watcher.wait_all(timeout=2)) == [f'{i}.csv' for i in range(5)]
+    assert download_watcher.pop_completed() == []
+    for thread in threads:
+        thread.join()
+
+def test_reset(download_watcher, tmp_path):
+    (tmp_path / 'file.pdf').write_bytes(b'data')
+    download_watcher.wait_for(file_extension='pdf', timeout=1)
+
+    download_watcher.reset()
+    assert download_watcher.pop_completed() == [tmp_path / 'file.pdf']
+
+def test_wait_for_empty_file(download_watcher, tmp_path):
+    (tmp_path / 'empty.txt').write_bytes(b'')
+    assert download_watcher.wait_for(file_extension='txt', timeout=2) == tmp_path / 'empty.txt'
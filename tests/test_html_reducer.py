@@ -0,0 +1,70 @@
+from fastbots.html_reducer import HTMLReducer, count_tokens, keep_attributes_for
+from fastbots.llm_extractor import merge_extracted_data
+
+
+HTML = """
+<html><head><title>Title</title><script>var a = 1;</script></head>
+<body>
+    <div class="product" data-tracking="x1" style="color: red">
+        <h1 id="name">Product   name</h1>
+        <img src="/image.png" alt="Product image" width="100">
+        <svg><path d="M0 0"/></svg>
+        <a href="/product/1" onclick="track()">Details</a>
+        <div><span class="empty"></span></div>
+        <!-- comment -->
+        <style>.product { color: red; }</style>
+    </div>
+</body></html>
+"""
+
+
+def test_reduce():
+    reduced = HTMLReducer(keep_attributes=['href', 'src', 'alt']).reduce(HTML)
+
+    assert reduced == (
+        '<html><body><div><h1>Product name</h1>\n'
+        '<img src="/image.png" alt="Product image"><a href="/product/1">Details</a></div>\n'
+        '</body></html>'
+    )
+    assert count_tokens(reduced) < count_tokens(HTML)
+
+def test_reduce_dropped_void_tags():
+    reducer = HTMLReducer(keep_attributes=['href'])
+
+    assert 'hello' in reducer.reduce('<head><base href="/"><title>t</title></head><body><p>hello</p></body>')
+    assert 'after' in reducer.reduce('<object><param name=a value=b></object><p>after</p>')
+
+def test_reduce_without_attributes():
+    reduced = HTMLReducer(keep_attributes=[]).reduce(HTML)
+
+    assert 'Details' in reduced
+    assert 'img' not in reduced
+    assert 'href' not in reduced
+
+def test_keep_attributes_for():
+    schema = {'properties': {'name': {'type': 'string'}, 'price': {'type': 'string', 'description': 'The price'}}}
+    assert keep_attributes_for(schema, ['href', 'src', 'alt']) == {'alt'}
+
+    schema['properties']['product_url'] = {'type': 'string'}
+    assert keep_attributes_for(schema, ['href', 'src', 'alt']) == {'href', 'src', 'alt'}
+
+def test_split():
+    html_reducer = HTMLReducer()
+    html = '\n'.join(f'<li>item number {index}</li>' for index in range(100))
+
+    assert html_reducer.split(html, max_tokens=count_tokens(html)) == [html]
+
+    chunks = html_reducer.split(html, max_tokens=50)
+    assert len(chunks) > 1
+    assert all(count_tokens(chunk) <= 50 for chunk in chunks)
+    assert '\n'.join(chunks) == html
+
+def test_merge_extracted_data():
+    schema = {'properties': {'name': {'type': 'string'}, 'links': {'type': 'array', 'items': {'type': 'string'}}}}
+    chunks_data = [
+        {'name': '', 'links': ['/a', '/b']},
+        {'name': 'Product', 'links': ['/b', '/c']},
+        {'name': 'Other', 'links': []},
+    ]
+
+    assert merge_extracted_data(chunks_data, schema) == {'name': 'Product', 'links': ['/a', '/b', '/c']}
@@ -0,0 +1,138 @@
+import json
+import threading
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from fastbots import config
+from fastbots.payload import Payload
+from fastbots.tracing import Tracer, span
+from fastbots.exceptions import DownloadFileError
+from fastbots.http_session import HTTPSession, download_file_name
+
+from benchmarks.server import FixtureServer
+from benchmarks.fake_driver import FakeBot
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        status = 404 if self.path.startswith('/missing') else 200
+        body = json.dumps({
+            'path': self.path, 'cookie': self.headers.get('Cookie'), 'user_agent': self.headers.get('User-Agent'),
+        }).encode()
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope='module')
+def echo_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), EchoHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(scope='module')
+def fixture_server():
+    with FixtureServer() as server:
+        yield server
+
+
+def test_session_headers(echo_url):
+    cookies = [{'name': 'session', 'value': 'abc', 'domain': '127.0.0.1', 'path': '/'}]
+
+    with HTTPSession(cookies=cookies) as http_session:
+        body = http_session.get(f'{echo_url}/orders').json()
+
+    assert body['cookie'] == 'session=abc'
+    assert body['user_agent'] == config.BOT_USER_AGENT
+
+
+def test_get_many(echo_url):
+    urls = [f'{echo_url}/orders?page={page}' for page in range(12)]
+
+    with HTTPSession() as http_session:
+        responses = http_session.get_many(urls)
+
+    assert [response.json()['path'] for response in responses] == [f'/orders?page={page}' for page in range(12)]
+
+
+def test_get_many_spans(echo_url):
+    tracer = Tracer()
+    with tracer.activate(), span('task'), HTTPSession() as http_session:
+        http_session.get_many([f'{echo_url}/a', f'{echo_url}/b'])
+
+    spans = {s['name']: s for s in tracer.spans()}
+    http_spans = [s for s in tracer.spans() if s['name'] == 'http.get']
+    assert len(http_spans) == 2
+    assert all(s['parent_id'] == spans['task']['span_id'] for s in http_spans)
+
+
+def test_download(tmp_path, fixture_server):
+    payload = Payload()
+
+    with HTTPSession(download_dir=str(tmp_path), payload=payload) as http_session:
+        file_path = http_session.download(fixture_server.url('download/report.txt'))
+        renamed_path = http_session.download(fixture_server.url('download/report.txt'), file_name='copy.txt')
+
+    assert Path(file_path) == tmp_path / 'report.txt'
+    assert Path(file_path).read_bytes() == Path(renamed_path).read_bytes()
+    assert payload.downloads == [file_path, renamed_path]
+    assert payload.output_data['downloads_count'] == 2
+    assert not list(tmp_path.glob('*.part'))
+
+
+def test_download_error(tmp_path, echo_url):
+    payload = Payload()
+
+    with HTTPSession(download_dir=str(tmp_path), payload=payload) as http_session:
+        with pytest.raises(DownloadFileError):
+            http_session.download(f'{echo_url}/missing/file.pdf')
+
+    assert payload.downloads == []
+    assert not list(tmp_path.iterdir())
+
+
+def test_download_many(tmp_path, echo_url):
+    with HTTPSession(download_dir=str(tmp_path)) as http_session:
+        paths = http_session.download_many([f'{echo_url}/files/{index}.json' for index in range(5)])
+
+    assert [Path(path).name for path in paths] == [f'{index}.json' for index in range(5)]
+
+
+def test_download_file_name():
+    class Response:
+        def __init__(self, url, headers):
+            self.url = url
+            self.headers = headers
+
+    assert download_file_name(Response('https://a.com/x/report.pdf?v=1', {})) == 'report.pdf'
+    assert download_file_name(Response('https://a.com/x', {'Content-Disposition': 'attachment; filename="a b.csv"'})) == 'a b.csv'
+    assert download_file_name(Response('https://a.com/x', {'Content-Disposition': "attachment; filename*=UTF-8''%C3%A8.txt"})) == 'è.txt'
+    assert download_file_name(Response('https://a.com/', {'Content-Disposition': 'attachment; filename="../../etc"'})) == 'etc'
+
+
+def test_bot_http_session(echo_url):
+    bot = FakeBot()
+    try:
+        bot.driver.add_cookie({'name': 'token', 'value': '1', 'domain': '127.0.0.1'})
+        http_session = bot.http_session()
+        assert bot.http_session() is http_session
+        assert http_session.get(echo_url).json()['cookie'] == 'token=1'
+
+        bot.driver.add_cookie({'name': 'login', 'value': '2', 'domain': '127.0.0.1'})
+        assert 'login=2' in bot.http_session(refresh=True).get(echo_url).json()['cookie']
+
+        bot.finish()
+        assert bot.http_session() is not http_session
+    finally:
+        bot.close()
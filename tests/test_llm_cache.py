@@ -0,0 +1,54 @@
+import time
+
+import pytest
+
+from fastbots.llm_cache import LLMCache
+
+
+@pytest.fixture
+def llm_cache(tmp_path):
+    return LLMCache(path=str(tmp_path / 'llm_cache.sqlite'), max_size=100, ttl=60)
+
+
+def test_build_key():
+    key = LLMCache.build_key('<div>  a\n b </div>', {'title': 'Model'}, 'gpt-3.5-turbo', 'prompt')
+
+    assert key == LLMCache.build_key('<div> a b </div>', {'title': 'Model'}, 'gpt-3.5-turbo', 'prompt')
+    assert key != LLMCache.build_key('<div> a b</div>', {'title': 'Other'}, 'gpt-3.5-turbo', 'prompt')
+    assert key != LLMCache.build_key('<div> a b</div>', {'title': 'Model'}, 'gpt-4', 'prompt')
+    assert key != LLMCache.build_key('<div> a b</div>', {'title': 'Model'}, 'gpt-3.5-turbo', 'other prompt')
+
+def test_get_set(llm_cache):
+    assert llm_cache.get('key') is None
+    llm_cache.set('key', '{"a": 1}')
+    assert llm_cache.get('key') == '{"a": 1}'
+    assert llm_cache.stats() == {'hits': 1, 'misses': 1, 'entries': 1, 'size': 8}
+
+def test_persistent(llm_cache, tmp_path):
+    llm_cache.set('key', 'value')
+    assert LLMCache(path=str(tmp_path / 'llm_cache.sqlite')).get('key') == 'value'
+
+def test_ttl(tmp_path):
+    llm_cache = LLMCache(path=str(tmp_path / 'llm_cache.sqlite'), ttl=0)
+    llm_cache.set('key', 'value')
+    time.sleep(0.01)
+    assert llm_cache.get('key') is None
+
+def test_lru_eviction(llm_cache):
+    llm_cache.set('first', 'a' * 40)
+    llm_cache.set('second', 'b' * 40)
+    time.sleep(0.01)
+    llm_cache.get('first')
+    llm_cache.set('third', 'c' * 40)
+
+    assert llm_cache.get('first') is not None
+    assert llm_cache.get('second') is None
+    assert llm_cache.get('third') is not None
+
+def test_too_big(llm_cache):
+    llm_cache.set('key', 'a' * 101)
+    assert llm_cache.get('key') is None
+
+def test_shared(tmp_path):
+    path = str(tmp_path / 'llm_cache.sqlite')
+    assert LLMCache.shared(path) is LLMCache.shared(path)
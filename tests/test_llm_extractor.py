@@ -0,0 +1,164 @@
+import time
+import asyncio
+import threading
+
+import httpx
+import pytest
+from openai import RateLimitError
+from langchain_core.pydantic_v1 import BaseModel, Field
+
+from fastbots import config, Payload
+from fastbots.llm_cache import LLMCache
+from fastbots.llm_extractor import LLMExtractor
+from fastbots.llm_registry import LLMChainRegistry
+
+
+class InformationModel(BaseModel):
+    name: str = Field(description='The name of the product')
+
+
+class FakeChain:
+
+    def __init__(self, delay=0.0, failures=0):
+        self.delay = delay
+        self.failures = failures
+        self.calls = 0
+        self.running = 0
+        self.max_running = 0
+        self.lock = threading.Lock()
+
+    def invoke(self, input, return_only_outputs=True):
+        with self.lock:
+            self.calls += 1
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            fail = self.calls <= self.failures
+        try:
+            if fail:
+                request = httpx.Request('POST', 'https://api.openai.com/v1/chat/completions')
+                raise RateLimitError('rate limited', response=httpx.Response(429, request=request), body=None)
+            time.sleep(self.delay)
+            return {'text': f'{{"name": "{input["information"]}"}}'}
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+@pytest.fixture
+def bot(mocker):
+    bot = mocker.Mock()
+    bot.payload = Payload()
+    bot.compiled_locator.side_effect = lambda page_name, locator_name: ('id', locator_name)
+    return bot
+
+
+@pytest.fixture
+def llm_extractor(mocker, bot, monkeypatch):
+    monkeypatch.setattr(config, 'LLM_CACHE_ENABLED', False)
+    monkeypatch.setattr(config, 'LLM_RATE_LIMIT_MAX_WAIT', 0)
+    mocker.patch.object(LLMChainRegistry, 'chain')
+
+    llm_extractor = LLMExtractor(bot=bot, pydantic_model=InformationModel)
+    llm_extractor.__read_html__ = lambda locator_name: f'<p>{locator_name}</p>'
+    return llm_extractor
+
+
+def test_extract_data(llm_extractor, bot):
+    llm_extractor._llm_chain = FakeChain()
+
+    assert llm_extractor.extract_data('product_locator') == '{"name": "<p>product_locator</p>"}'
+    assert set(bot.payload.output_data['llm_tokens']['product_locator']) == {'raw', 'reduced'}
+
+def test_invalid_answer_not_cached(llm_extractor, tmp_path):
+    llm_extractor._llm_cache = LLMCache(path=str(tmp_path / 'llm_cache.db'))
+    llm_extractor._llm_chain = FakeChain()
+    llm_extractor._llm_chain.invoke = lambda input, return_only_outputs=True: {'text': 'Sorry, I cannot help'}
+
+    assert llm_extractor.extract_data('product_locator') == 'Sorry, I cannot help'
+    llm_extractor._llm_chain.invoke = lambda input, return_only_outputs=True: {'text': '{"title": "no name"}'}
+    assert llm_extractor.extract_data('product_locator') == '{"title": "no name"}'
+
+    # the retry calls the model again and the valid answer is cached
+    llm_extractor._llm_chain = FakeChain()
+    assert llm_extractor.extract_data('product_locator') == '{"name": "<p>product_locator</p>"}'
+    llm_extractor._llm_chain = FakeChain()
+    assert llm_extractor.extract_data('product_locator') == '{"name": "<p>product_locator</p>"}'
+    assert llm_extractor._llm_chain.calls == 0
+
+def test_extract_many(llm_extractor):
+    llm_extractor._llm_chain = FakeChain(delay=0.1)
+
+    started = time.monotonic()
+    extracted_data = llm_extractor.extract_many(['a_locator', 'b_locator', 'c_locator'])
+
+    assert extracted_data == {name: f'{{"name": "<p>{name}</p>"}}' for name in ('a_locator', 'b_locator', 'c_locator')}
+    assert llm_extractor._llm_chain.max_running > 1
+    assert time.monotonic() - started < 0.3
+
+def test_submit(llm_extractor):
+    llm_extractor._llm_chain = FakeChain(delay=0.1)
+
+    future = llm_extractor.submit('product_locator')
+    assert not future.done()
+    assert future.result() == '{"name": "<p>product_locator</p>"}'
+
+def test_submit_payload_not_changed(llm_extractor, bot):
+    llm_extractor._llm_chain = FakeChain(delay=0.1)
+
+    future = llm_extractor.submit('product_locator')
+    # the bot goes on to the next task, the background extraction doesn't write its payload
+    bot.payload = Payload()
+    future.result()
+
+    assert 'llm_tokens' not in bot.payload.output_data
+    assert set(llm_extractor.tokens['product_locator']) == {'raw', 'reduced'}
+
+    llm_extractor.extract_many(['a_locator', 'b_locator'])
+    assert set(bot.payload.output_data['llm_tokens']) == {'a_locator', 'b_locator'}
+
+def test_aextract_many(llm_extractor):
+    llm_extractor._llm_chain = FakeChain()
+
+    extracted_data = asyncio.run(llm_extractor.aextract_many(['a_locator', 'b_locator']))
+    assert extracted_data == {name: f'{{"name": "<p>{name}</p>"}}' for name in ('a_locator', 'b_locator')}
+
+def test_rate_limit_retry(llm_extractor):
+    llm_extractor._llm_chain = FakeChain(failures=2)
+
+    assert llm_extractor.extract_data('product_locator') == '{"name": "<p>product_locator</p>"}'
+    assert llm_extractor._llm_chain.calls == 3
+
+def test_failed_extraction(llm_extractor, monkeypatch):
+    monkeypatch.setattr(config, 'LLM_RATE_LIMIT_RETRIES', 2)
+    llm_extractor._llm_chain = FakeChain(failures=10)
+
+    assert llm_extractor.extract_many(['product_locator']) == {'product_locator': None}
+    assert llm_extractor._llm_chain.calls == 2
+
+def test_induction(mocker, bot, monkeypatch, tmp_path):
+    monkeypatch.setattr(config, 'LLM_CACHE_ENABLED', False)
+    monkeypatch.setattr(config, 'LLM_INDUCED_LOCATORS_FILE_PATH', str(tmp_path / 'llm_locators.ini'))
+    mocker.patch.object(LLMChainRegistry, 'chain')
+    bot.driver.current_url = 'https://www.example.com/product/1'
+    bot.extract.return_value = {'name': ' Product '}
+    bot.wait.until.return_value.get_attribute.return_value = '<h1 class="title">Product</h1>'
+
+    llm_extractor = LLMExtractor(bot=bot, pydantic_model=InformationModel, induction=True)
+    llm_extractor._llm_chain = FakeChain()
+    llm_extractor._induction_chain = mocker.Mock()
+    llm_extractor._induction_chain.invoke.return_value = {'text': '{"name": {"by": "css selector", "value": "h1"}}'}
+
+    assert llm_extractor.extract_data('product_locator') == '{"name": "Product"}'
+    assert bot.payload.output_data['llm_induction'] == {'product_locator': 'induced'}
+    assert bot.extract.call_args.kwargs['locators'] == {'name': ('css selector', 'h1')}
+
+    # the next pages of the template are extracted without the llm
+    assert llm_extractor.extract_data('product_locator') == '{"name": "Product"}'
+    assert bot.payload.output_data['llm_induction'] == {'product_locator': 'cached'}
+    assert llm_extractor._induction_chain.invoke.call_count == 1
+
+    # the locators are induced again when the data isn't valid, then the llm extracts the values
+    bot.extract.return_value = {'name': None}
+    assert llm_extractor.extract_data('product_locator') == '{"name": "<h1>Product</h1>"}'
+    assert bot.payload.output_data['llm_induction'] == {'product_locator': 'fallback'}
+    assert llm_extractor._induction_chain.invoke.call_count == 2
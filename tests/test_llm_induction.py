@@ -0,0 +1,87 @@
+from typing import List
+
+import pytest
+from langchain_core.pydantic_v1 import BaseModel, Field
+
+from fastbots.llm_induction import InducedLocator, InducedLocatorStore, parse_induced_locators, template_key
+
+
+class ProductModel(BaseModel):
+    name: str = Field(description='The name of the product')
+    links: List[str] = Field(description='The links of the product')
+
+
+class OtherModel(BaseModel):
+    name: str = Field(description='The name of the product')
+
+
+def test_template_key():
+    key = template_key('www.example.com', 'product_locator', ProductModel)
+
+    assert key.startswith('www.example.com:product_locator:ProductModel:')
+    assert key == template_key('www.example.com', 'product_locator', ProductModel)
+    assert key.rsplit(':', 1)[1] != template_key('www.example.com', 'product_locator', OtherModel).rsplit(':', 1)[1]
+
+def test_parse_induced_locators():
+    text = """```json
+    {"name": {"by": "css selector", "value": "h1.title", "attribute": "text"},
+     "links": {"by": "xpath", "value": ".//a[@class='product']", "attribute": "href"},
+     "other": {"by": "css", "value": "p"}}
+    ```"""
+
+    assert parse_induced_locators(text, ProductModel) == {
+        'name': InducedLocator(('css selector', 'h1.title')),
+        'links': InducedLocator(('xpath', ".//a[@class='product']"), attribute='href', multiple=True),
+    }
+
+@pytest.mark.parametrize("text", [
+    'not a json',
+    '{"name": {"by": "css selector", "value": "h1"}}',
+    '{"name": {"by": "id", "value": "h1"}, "links": {"by": "css", "value": "a"}}',
+])
+def test_parse_induced_locators_error(text):
+    with pytest.raises(ValueError):
+        parse_induced_locators(text, ProductModel)
+
+def test_store(tmp_path):
+    path = str(tmp_path / 'llm_locators.ini')
+    induced_locators = {
+        'name': InducedLocator(('css selector', 'h1[data-name="title"]')),
+        'links': InducedLocator(('xpath', ".//a[@class='product']"), attribute='href', multiple=True),
+    }
+
+    store = InducedLocatorStore(path=path)
+    assert store.get('key') is None
+
+    store.set('key', induced_locators)
+    assert store.get('key') == induced_locators
+    assert InducedLocatorStore(path=path).get('key') == induced_locators
+    assert '(By.CSS_SELECTOR, \'h1[data-name="title"]\')' in (tmp_path / 'llm_locators.ini').read_text()
+
+    store.remove('key')
+    assert InducedLocatorStore(path=path).get('key') is None
+
+def test_shared(tmp_path):
+    path = str(tmp_path / 'llm_locators.ini')
+    assert InducedLocatorStore.shared(path) is InducedLocatorStore.shared(path)
+
+def test_store_escaped_selector(tmp_path):
+    path = str(tmp_path / 'llm_locators.ini')
+    induced_locators = {
+        'name': InducedLocator(('css selector', '#a\\:b')),
+        'title': InducedLocator(('xpath', '//h1[@title="it\'s"]')),
+    }
+
+    InducedLocatorStore(path=path).set('key', induced_locators)
+    assert InducedLocatorStore(path=path).get('key') == induced_locators
+
+def test_store_merge(tmp_path):
+    path = str(tmp_path / 'llm_locators.ini')
+    first, second = InducedLocatorStore(path=path), InducedLocatorStore(path=path)
+
+    first.set('first', {'name': InducedLocator(('css selector', 'h1'))})
+    second.set('second', {'name': InducedLocator(('css selector', 'h2'))})
+
+    store = InducedLocatorStore(path=path)
+    assert store.get('first') is not None and store.get('second') is not None
+    assert not list(tmp_path.glob('.*.lock'))
@@ -0,0 +1,59 @@
+import threading
+
+import pytest
+from langchain_core.pydantic_v1 import BaseModel, Field
+
+from fastbots import config
+from fastbots.llm_registry import LLMChainRegistry
+
+
+class InformationModel(BaseModel):
+    name: str = Field(description='The name of the product')
+
+
+class OtherModel(BaseModel):
+    price: str = Field(description='The price of the product')
+
+
+@pytest.fixture
+def llm_registry(monkeypatch):
+    monkeypatch.setattr(config, 'OPENAI_API_KEY', 'test-key')
+    llm_registry = LLMChainRegistry()
+    yield llm_registry
+    llm_registry.clear()
+
+
+def test_shared():
+    assert LLMChainRegistry.shared() is LLMChainRegistry.shared()
+
+def test_chain(llm_registry):
+    chain = llm_registry.chain(InformationModel)
+
+    assert llm_registry.chain(InformationModel) is chain
+    assert llm_registry.chain(OtherModel) is not chain
+    assert llm_registry.chain(InformationModel, model_name='gpt-4') is not chain
+    assert llm_registry.chain(OtherModel).llm is chain.llm
+    assert 'name' in chain.prompt.partial_variables['format_instructions']
+
+def test_http_client(llm_registry):
+    http_client = llm_registry.http_client
+
+    assert llm_registry.llm_model('gpt-3.5-turbo').http_client is http_client
+    assert llm_registry.llm_model('gpt-4').http_client is http_client
+
+    llm_registry.clear()
+    assert http_client.is_closed
+
+def test_chain_threads(llm_registry):
+    chains = []
+
+    def build():
+        chains.append(llm_registry.chain(InformationModel))
+
+    threads = [threading.Thread(target=build) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(chain) for chain in chains}) == 1
@@ -0,0 +1,102 @@
+import os
+
+import pytest
+
+from fastbots.locators import LocatorIndex, parse_locator
+
+
+LOCATORS = """
+[pages_url]
+start_url=https://example.com/
+search_page=https://example.com/search
+
+[blocked_urls]
+search_page=*/recommendations/*, *.gif
+
+[search_page]
+search_locator=(By.ID, "search")
+product_locator=(By.XPATH, '//*[@id="search"]/div[1]')
+escaped_locator=(By.XPATH, "//*[@id=\\"search\\"]/div[1]")
+css_locator=(By.CSS_SELECTOR , 'div.product > a')
+"""
+
+
+@pytest.fixture
+def locators_file(tmp_path):
+    path = tmp_path / 'locators.ini'
+    path.write_text(LOCATORS)
+    return path
+
+
+@pytest.mark.parametrize("full_locator,expected", [
+('(By.ID, "search")', ('id', 'search')),
+('(By.XPATH, \'//*[@id="search"]\')', ('xpath', '//*[@id="search"]')),
+('(By.XPATH, "//*[@id=\\\'search\\\']")', ('xpath', "//*[@id='search']")),
+(' ( By.CSS_SELECTOR ,  "a, b" ) ', ('css selector', 'a, b')),
+('(By.LINK_TEXT, "Next")', ('link text', 'Next')),
+])
+def test_parse_locator(full_locator, expected):
+    assert parse_locator(full_locator) == expected
+
+@pytest.mark.parametrize("full_locator", [
+'By.ID, "search"',
+'(By.IDS, "search")',
+'(By.ID "search")',
+'(By.ID, search)',
+'(By.ID, "search\')',
+])
+def test_parse_locator_wrong(full_locator):
+    with pytest.raises(ValueError):
+        parse_locator(full_locator)
+
+def test_load(locators_file):
+    locators = LocatorIndex.load(str(locators_file))
+
+    assert locators.value('pages_url', 'start_url') == 'https://example.com/'
+    assert locators.value('search_page', 'search_locator') == '(By.ID, "search")'
+    assert locators.locator('search_page', 'search_locator') == ('id', 'search')
+    assert locators.locator('search_page', 'escaped_locator') == ('xpath', '//*[@id="search"]/div[1]')
+    assert locators.locator('search_page', 'css_locator') == ('css selector', 'div.product > a')
+    assert locators.options('blocked_urls') == {'search_page': '*/recommendations/*, *.gif'}
+    assert locators.options('not_exist_page') == {}
+
+def test_load_missing(locators_file):
+    locators = LocatorIndex.load(str(locators_file))
+
+    with pytest.raises(ValueError):
+        locators.locator('not_exist_page', 'search_locator')
+
+    with pytest.raises(ValueError):
+        locators.locator('search_page', 'not_exist_locator')
+
+    with pytest.raises(ValueError):
+        locators.locator('pages_url', 'start_url')
+
+    with pytest.raises(ValueError):
+        LocatorIndex.load(str(locators_file.parent / 'not_exist.ini'))
+
+def test_load_cached(locators_file):
+    assert LocatorIndex.load(str(locators_file)) is LocatorIndex.load(str(locators_file))
+
+def test_load_modified(locators_file):
+    locators = LocatorIndex.load(str(locators_file))
+
+    locators_file.write_text(LOCATORS.replace('"search")', '"new_search")'))
+    stat = locators_file.stat()
+    os.utime(locators_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    reloaded = LocatorIndex.load(str(locators_file))
+    assert reloaded is not locators
+    assert reloaded.locator('search_page', 'search_locator') == ('id', 'new_search')
+
+def test_load_wrong(locators_file):
+    locators_file.write_text(LOCATORS + 'wrong_locator=(By.UNKNOWN, "x")\n')
+
+    with pytest.raises(ValueError):
+        LocatorIndex.load(str(locators_file))
+
+def test_project_locators():
+    locators = LocatorIndex.load('locators.ini')
+
+    for locator_name in ['test_locator', 'test1_locator', 'test2_locator', 'test3_locator']:
+        assert locators.locator('test_page', locator_name)[0] == 'xpath'
@@ -0,0 +1,117 @@
+import json
+import queue
+import logging
+from logging.handlers import QueueListener
+
+import pytest
+
+from fastbots import logger as fastbots_logger
+from fastbots.logger import JsonFormatter, NonBlockingQueueHandler, log_context, setup_logging
+from fastbots.tracing import Tracer
+
+
+def make_record(message='message %s', args=('arg',), exc_info=None, level=logging.ERROR):
+    return logging.LogRecord('fastbots.test', level, __file__, 1, message, args, exc_info)
+
+
+@pytest.fixture
+def restore_logging():
+    root = logging.getLogger()
+    level = root.level
+    yield
+    root.removeHandler(fastbots_logger._queue_handler)
+    fastbots_logger.stop_logging()
+    root.setLevel(level)
+
+
+def test_log_context():
+    handler = NonBlockingQueueHandler(queue.Queue())
+    tracer = Tracer()
+
+    with tracer.activate(), log_context(task='MyTask'), log_context(attempt=2) as context:
+        assert context == {'task': 'MyTask', 'attempt': 2}
+        handler.handle(make_record())
+
+    with log_context(page='Home'):
+        handler.handle(make_record())
+
+    first, second = handler.queue.get_nowait(), handler.queue.get_nowait()
+    assert first.context == {'task': 'MyTask', 'attempt': 2, 'trace_id': tracer.trace_id}
+    assert second.context == {'page': 'Home'}
+    assert first.getMessage() == 'message arg'
+
+
+def test_queue_handler_drops():
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=2))
+
+    for _ in range(4):
+        handler.handle(make_record(level=logging.INFO))
+
+    assert handler.queue.qsize() == 2
+    assert handler.dropped == 2
+
+    # the dropped records are reported once the queue has room
+    handler.queue.get_nowait()
+    handler.queue.get_nowait()
+    handler.handle(make_record(level=logging.INFO))
+    handler.queue.get_nowait()
+    assert '2 log records dropped' in handler.queue.get_nowait().getMessage()
+
+
+def test_queue_handler_keeps_errors():
+    handled = []
+    listener = QueueListener(queue.Queue(maxsize=1))
+    listener.handle = handled.append
+    handler = NonBlockingQueueHandler(listener.queue, listener=listener, error_timeout=0.01)
+
+    handler.handle(make_record(level=logging.INFO))
+    handler.handle(make_record(level=logging.ERROR))
+    handler.handle(make_record(level=logging.CRITICAL))
+
+    assert handler.dropped == 0
+    assert [record.levelno for record in handled] == [logging.ERROR, logging.CRITICAL]
+
+
+def test_queue_handler_keeps_exc_info():
+    handler = NonBlockingQueueHandler(queue.Queue())
+
+    try:
+        raise ValueError('bad value')
+    except ValueError as e:
+        handler.handle(make_record(exc_info=(type(e), e, e.__traceback__)))
+
+    # the traceback is formatted by the listener thread
+    assert handler.queue.get_nowait().exc_info[0] is ValueError
+
+
+def test_json_formatter():
+    try:
+        raise ValueError('bad value')
+    except ValueError as e:
+        record = make_record(exc_info=(type(e), e, e.__traceback__))
+    record.context = {'task': 'MyTask', 'page': 'Home'}
+
+    data = json.loads(JsonFormatter().format(record))
+
+    assert data['message'] == 'message arg'
+    assert data['level'] == 'ERROR'
+    assert data['task'] == 'MyTask'
+    assert data['page'] == 'Home'
+    assert 'ValueError: bad value' in data['exception']
+
+
+def test_setup_logging(tmp_path, restore_logging):
+    file_path = tmp_path / 'logs' / 'bot.log'
+    setup_logging(level=logging.INFO, file_path=str(file_path), max_bytes=500, backup_count=2)
+
+    with log_context(task='MyTask'):
+        for i in range(20):
+            logging.getLogger('fastbots.test').info('record %d', i)
+        logging.getLogger('fastbots.test').debug('filtered')
+
+    fastbots_logger.stop_logging()
+
+    records = [json.loads(line) for path in sorted(file_path.parent.iterdir()) for line in path.read_text().splitlines()]
+    assert len(list(file_path.parent.iterdir())) == 3
+    assert all(record['task'] == 'MyTask' for record in records)
+    assert 'filtered' not in [record['message'] for record in records]
@@ -13,4 +13,25 @@ def page():
 ('test3_locator', "//*[@id='search']/div[1]/div[1]/div/span[1]/div[1]/div[2]")
 ])
 def test__locator__(page, locator_name, expected):
-    assert page.__locator__(locator_name) == expected
\ No newline at end of file
+    assert page.__locator__(locator_name) == expected
+
+
+class SearchPage(Page):
+
+    def forward(self):
+        return None
+
+def test_extract(mocker):
+    bot = mocker.Mock()
+    bot.locator.return_value = 'None'
+    bot.compiled_locator.side_effect = lambda page_name, locator_name: ('id', locator_name)
+    bot.extract.return_value = {'search_locator': 'text', 'product_locator': ['a', 'b']}
+
+    page = SearchPage(bot, 'search_page')
+
+    assert page.extract({'search_locator': 'text', 'product_locator': 'href'}, multiple=['product_locator']) == bot.extract.return_value
+    bot.extract.assert_called_once_with(
+        locators={'search_locator': ('id', 'search_locator'), 'product_locator': ('id', 'product_locator')},
+        attributes={'search_locator': 'text', 'product_locator': 'href'},
+        multiple=['product_locator']
+    )
@@ -0,0 +1,92 @@
+import json
+import shutil
+import threading
+from pathlib import Path
+
+import pytest
+
+from selenium.webdriver.firefox.firefox_profile import FirefoxProfile
+
+from fastbots import config
+from fastbots.firefox_bot import FirefoxBot
+from fastbots.profile_cache import ProfileCache, load_preferences, user_prefs
+
+
+@pytest.fixture
+def preferences_file(tmp_path):
+    file_path = tmp_path / 'preferences.json'
+    file_path.write_text(json.dumps({'pdfjs.disabled': True}))
+    return file_path
+
+
+def test_load_preferences(preferences_file, tmp_path):
+    preferences = load_preferences(str(preferences_file))
+    assert preferences == {'pdfjs.disabled': True}
+
+    # every caller gets its own copy
+    preferences['browser.download.dir'] = '/tmp'
+    assert load_preferences(str(preferences_file)) == {'pdfjs.disabled': True}
+
+    preferences_file.write_text(json.dumps({'pdfjs.disabled': False, 'browser.download.folderList': 2}))
+    assert load_preferences(str(preferences_file)) == {'pdfjs.disabled': False, 'browser.download.folderList': 2}
+
+    assert load_preferences(str(tmp_path / 'missing.json')) == {}
+
+def test_user_prefs():
+    assert user_prefs({'pdfjs.disabled': True, 'general.useragent.override': 'bot'}) == \
+        'user_pref("pdfjs.disabled", true);\nuser_pref("general.useragent.override", "bot");\n'
+
+def test_template(tmp_path):
+    profile_cache = ProfileCache(str(tmp_path / 'cache'))
+
+    template_dir = profile_cache.template({'pdfjs.disabled': True})
+    assert (template_dir / 'user.js').read_text() == 'user_pref("pdfjs.disabled", true);\n'
+
+    # built once per preferences, also by concurrent bots
+    templates = []
+    threads = [threading.Thread(target=lambda: templates.append(profile_cache.template({'pdfjs.disabled': True})))
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert set(templates) == {template_dir}
+    assert profile_cache.template({'pdfjs.disabled': False}) != template_dir
+    assert sorted(path.name for path in (tmp_path / 'cache').iterdir()) == sorted([
+        template_dir.name, profile_cache.template({'pdfjs.disabled': False}).name
+    ])
+
+    # the processes of the host share the templates
+    assert ProfileCache(str(tmp_path / 'cache')).template({'pdfjs.disabled': True}) == template_dir
+
+def test_clone(tmp_path):
+    profile_cache = ProfileCache(str(tmp_path / 'cache'))
+    template_dir = profile_cache.template({'pdfjs.disabled': True})
+
+    first_dir = profile_cache.clone({'pdfjs.disabled': True}, {'browser.download.dir': '/tmp/first'})
+    second_dir = profile_cache.clone({'pdfjs.disabled': True}, {'browser.download.dir': '/tmp/second'})
+
+    assert first_dir != second_dir
+    assert (first_dir / 'user.js').read_text().endswith('user_pref("browser.download.dir", "/tmp/first");\n')
+    assert (second_dir / 'user.js').read_text().endswith('user_pref("browser.download.dir", "/tmp/second");\n')
+    assert (template_dir / 'user.js').read_text() == 'user_pref("pdfjs.disabled", true);\n'
+    assert [path.name for path in first_dir.iterdir()] == ['user.js']
+
+    shutil.rmtree(first_dir)
+    shutil.rmtree(second_dir)
+
+def test_firefox_options_own_defaults(tmp_path, monkeypatch):
+    # selenium 4.15 keeps None until a profile is created, then a frozen/mutable dict
+    monkeypatch.setattr(FirefoxProfile, 'DEFAULT_PREFERENCES', None)
+    monkeypatch.setattr(config, 'BOT_PROFILE_CACHE', True)
+    monkeypatch.setattr(config, 'BOT_ARGUMENTS', 'None')
+    monkeypatch.setattr(ProfileCache, 'shared', classmethod(lambda cls: ProfileCache(str(tmp_path / 'cache'))))
+
+    bot = FirefoxBot.__new__(FirefoxBot)
+    bot._temp_dir = str(tmp_path / 'downloads')
+    bot.__load_options__()
+
+    content = (Path(bot._profile_dir) / 'user.js').read_text()
+    shutil.rmtree(bot._profile_dir)
+    assert 'user_pref("browser.startup.homepage", "about:blank");' in content
+    assert 'frozen' not in content
@@ -0,0 +1,97 @@
+import urllib.request
+
+import pytest
+from seleniumwire import backend
+
+from fastbots import config
+from fastbots.locators import LocatorIndex
+from fastbots.request_blocker import RequestBlocker
+
+from benchmarks.server import FixtureServer
+
+
+class FakeDriver(object):
+
+    def __init__(self, proxy) -> None:
+        self.backend = proxy
+
+
+@pytest.fixture
+def request_blocker():
+    return RequestBlocker(
+        resource_types=['image', 'font'], hosts=['doubleclick.net'], urls=['*/ads/*'],
+        site_urls={'example.com': ['*/recommendations/*']}
+    )
+
+
+@pytest.mark.parametrize('url,headers,reason', [
+    ('https://example.com/logo.png', {}, 'image'),
+    ('https://example.com/image?id=1', {'Sec-Fetch-Dest': 'image'}, 'image'),
+    ('https://example.com/font.woff2', {'Sec-Fetch-Dest': 'font'}, 'font'),
+    ('https://example.com/report.png', {'Sec-Fetch-Dest': 'document'}, None),
+    ('https://example.com/video.mp4', {}, None),
+    ('https://ad.doubleclick.net/pixel', {}, 'tracker'),
+    ('https://notdoubleclick.net/pixel', {}, None),
+    ('https://cdn.example.org/ads/banner.js', {}, 'url'),
+    ('https://api.example.net/recommendations/1', {'Referer': 'https://example.com/search'}, 'url'),
+    ('https://api.example.net/recommendations/1', {'Referer': 'https://other.com/'}, None),
+    ('https://example.com/search', {'Sec-Fetch-Dest': 'document'}, None),
+])
+def test_should_block(request_blocker, url, headers, reason):
+    assert request_blocker.should_block(url, headers) == reason
+
+def test_unknown_resource_type():
+    with pytest.raises(ValueError):
+        RequestBlocker(resource_types=['video'])
+
+def test_from_config(monkeypatch):
+    monkeypatch.setattr(config, 'BOT_BLOCK_RESOURCES', 'None')
+    monkeypatch.setattr(config, 'BOT_BLOCK_TRACKERS', False)
+    monkeypatch.setattr(config, 'BOT_BLOCK_URLS', 'None')
+
+    locators = LocatorIndex(path='locators.ini', values={'pages_url': {'search_page': 'https://example.com/search'}})
+    assert RequestBlocker.from_config(locators) is None
+
+    locators = LocatorIndex(path='locators.ini', values={
+        'pages_url': {'search_page': 'https://example.com/search'},
+        'blocked_urls': {'search_page': '*/recommendations/*, *.gif'},
+    })
+    request_blocker = RequestBlocker.from_config(locators)
+    assert request_blocker.should_block('https://example.com/spinner.gif', {}) == 'url'
+    assert request_blocker.should_block('https://example.com/logo.png', {}) is None
+
+    monkeypatch.setattr(config, 'BOT_BLOCK_RESOURCES', 'Image, font')
+    monkeypatch.setattr(config, 'BOT_BLOCK_TRACKERS', True)
+    request_blocker = RequestBlocker.from_config(locators)
+    assert request_blocker.should_block('https://example.com/logo.png', {}) == 'image'
+    assert request_blocker.should_block('https://www.google-analytics.com/collect', {}) == 'tracker'
+
+    locators = LocatorIndex(path='locators.ini', values={'blocked_urls': {'search_page': '*.gif'}})
+    with pytest.raises(ValueError):
+        RequestBlocker.from_config(locators)
+
+def test_proxy():
+    request_blocker = RequestBlocker(resource_types=['image'])
+    proxy = backend.create(addr='127.0.0.1', port=0, options={'disable_capture': True})
+    try:
+        request_blocker.install(FakeDriver(proxy))
+
+        host, port = proxy.address()[:2]
+        opener = urllib.request.build_opener(urllib.request.ProxyHandler({'http': f'http://{host}:{port}'}))
+
+        with FixtureServer() as server:
+            assert b'product' in opener.open(server.url('search.html')).read()
+
+            response = opener.open(server.url('logo.png'))
+            assert response.status == 204
+            assert response.read() == b''
+
+        assert request_blocker.counters() == {'requests_blocked': 1, 'requests_allowed': 1}
+        request_blocker.reset()
+        assert request_blocker.counters() == {'requests_blocked': 0, 'requests_allowed': 0}
+    finally:
+        proxy.shutdown()
+
+def test_install_without_proxy():
+    with pytest.raises(ValueError):
+        RequestBlocker(resource_types=['image']).install(object())
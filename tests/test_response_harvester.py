@@ -0,0 +1,91 @@
+import json
+import threading
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from seleniumwire import backend
+
+from fastbots.exceptions import ResponseTimeoutError
+from fastbots.response_harvester import ResponseHarvester, ResponseWatch
+
+from benchmarks.fake_driver import FakeBot
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        body = b'<html></html>' if self.path.startswith('/page') else json.dumps({'path': self.path}).encode()
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope='module')
+def api_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), ApiHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def proxy():
+    proxy = backend.create(addr='127.0.0.1', port=0, options={'disable_capture': True})
+    yield proxy
+    proxy.shutdown()
+
+
+@pytest.fixture
+def bot(proxy):
+    bot = FakeBot()
+    bot.driver.backend = proxy
+    yield bot
+    bot.close()
+
+
+def fetch(proxy, url):
+    host, port = proxy.address()[:2]
+    opener = urllib.request.build_opener(urllib.request.ProxyHandler({'http': f'http://{host}:{port}'}))
+    return opener.open(url).read()
+
+
+def test_watch():
+    response_watch = ResponseWatch(r'/api/products', method='get')
+    assert response_watch.matches('GET', 'https://example.com/api/products?page=1')
+    assert not response_watch.matches('POST', 'https://example.com/api/products')
+    assert not response_watch.matches('GET', 'https://example.com/products')
+
+    with pytest.raises(ResponseTimeoutError):
+        response_watch.get(timeout=0.01)
+
+def test_wait_for_json(bot, proxy, api_url):
+    data = bot.wait_for_json(r'/api/products', action=lambda: fetch(proxy, f'{api_url}/api/products?page=1'), timeout=5)
+    assert data == {'path': '/api/products?page=1'}
+
+    # the responses before the wait, the not matching and the not JSON responses aren't returned
+    fetch(proxy, f'{api_url}/api/products?page=2')
+    with pytest.raises(ResponseTimeoutError):
+        bot.wait_for_json(r'/api/products|/page', timeout=0.5, action=lambda: (
+            fetch(proxy, f'{api_url}/api/users'), fetch(proxy, f'{api_url}/page.html')
+        ))
+
+def test_iter_json(bot, proxy, api_url):
+    pages = []
+    for data in bot.iter_json(r'/api/products', timeout=0.5, action=lambda: fetch(proxy, f'{api_url}/api/products?page=1')):
+        pages.append(data['path'])
+        if len(pages) < 3:
+            fetch(proxy, f'{api_url}/api/products?page={len(pages) + 1}')
+
+    assert pages == ['/api/products?page=1', '/api/products?page=2', '/api/products?page=3']
+    assert bot._response_harvester._watches == []
+
+def test_install_without_proxy():
+    with pytest.raises(ValueError):
+        ResponseHarvester().install(object())
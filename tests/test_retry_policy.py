@@ -0,0 +1,126 @@
+import httpx
+import pytest
+from selenium.common.exceptions import (
+    TimeoutException, StaleElementReferenceException, InvalidSessionIdException, WebDriverException,
+)
+
+from fastbots import config, Task, BotPool
+from fastbots.exceptions import ExpectedUrlError
+from fastbots.retry_policy import RetryPolicy, RECOVER, RELAUNCH, FATAL
+
+
+pytestmark = pytest.mark.usefixtures('fake_bots')
+
+
+class FlakyTask(Task):
+
+    def __init__(self, errors, bot_pool=None):
+        super().__init__(bot_pool=bot_pool)
+        self.errors = list(errors)
+        self.bots = []
+
+    def run(self, bot):
+        self.bots.append(bot)
+        error = self.errors.pop(0) if self.errors else None
+        if isinstance(error, Exception):
+            raise error
+        return error is None
+
+    def on_success(self, payload):
+        return 'success'
+
+    def on_failure(self, payload):
+        return 'failure'
+
+
+@pytest.fixture(autouse=True)
+def max_retries(monkeypatch):
+    monkeypatch.setattr(config, 'BOT_MAX_RETRIES', 3)
+
+
+def test_classify():
+    policy = RetryPolicy()
+
+    assert policy.classify(None) == RECOVER
+    assert policy.classify(TimeoutException()) == RECOVER
+    assert policy.classify(StaleElementReferenceException()) == RECOVER
+    assert policy.classify(ExpectedUrlError('a', 'b')) == RECOVER
+    assert policy.classify(WebDriverException('Reached error page: about:neterror?e=dnsNotFound')) == RECOVER
+    assert policy.classify(InvalidSessionIdException()) == RELAUNCH
+    assert policy.classify(WebDriverException('chrome not reachable')) == RELAUNCH
+    assert policy.classify(ConnectionRefusedError()) == RELAUNCH
+    assert policy.classify(httpx.ConnectTimeout('timeout')) == RECOVER
+    assert policy.classify(RuntimeError()) == FATAL
+    assert policy.classify(KeyError('price')) == FATAL
+    assert policy.classify(IndexError()) == FATAL
+    assert policy.classify(AttributeError()) == FATAL
+    assert policy.classify(TypeError()) == FATAL
+
+def test_classify_custom_errors():
+    policy = RetryPolicy(recoverable=(KeyError,), fatal=(TimeoutException,))
+
+    assert policy.classify(KeyError()) == RECOVER
+    assert policy.classify(TimeoutException()) == FATAL
+    assert policy.classify(StaleElementReferenceException()) == RECOVER
+
+def test_should_retry():
+    policy = RetryPolicy()
+
+    assert not policy.should_retry(None)
+    assert not policy.should_retry(FATAL)
+    assert policy.should_retry(RECOVER)
+    assert policy.should_retry(RELAUNCH)
+
+def test_wait():
+    class RetryState:
+        attempt_number = 3
+
+    wait = RetryPolicy(initial_delay=1, max_delay=10, jitter=1).wait()
+    assert all(4 <= wait(RetryState()) <= 5 for _ in range(20))
+
+    assert RetryPolicy(initial_delay=1, max_delay=0, jitter=1).wait()(RetryState()) == 0
+
+def test_recover_in_place():
+    task = FlakyTask([TimeoutException(), False])
+
+    assert task() == 'success'
+    assert len(task.bots) == 3
+    assert len({id(bot) for bot in task.bots}) == 1
+    assert task.bots[0].recovered == 2
+    assert BotPool.create_bot.call_count == 1
+
+def test_relaunch():
+    task = FlakyTask([InvalidSessionIdException()])
+
+    assert task() == 'success'
+    assert len({id(bot) for bot in task.bots}) == 2
+    assert task.bots[0].closed
+    assert BotPool.create_bot.call_count == 2
+
+def test_fatal_not_retried():
+    task = FlakyTask([AttributeError('typo')])
+
+    assert task() == 'failure'
+    assert len(task.bots) == 1
+
+def test_unknown_error_not_retried():
+    task = FlakyTask([KeyError('price')])
+
+    assert task() == 'failure'
+    assert len(task.bots) == 1
+    assert BotPool.create_bot.call_count == 1
+
+def test_attempts_exhausted():
+    task = FlakyTask([TimeoutException()] * 5)
+
+    assert task() == 'failure'
+    assert len(task.bots) == 3
+
+def test_relaunch_leased_bot():
+    with BotPool(size=1) as bot_pool:
+        task = FlakyTask([InvalidSessionIdException()], bot_pool=bot_pool)
+
+        assert task() == 'success'
+        assert task.bots[0].closed
+        assert not task.bots[1].closed
+        assert BotPool.create_bot.call_count == 2
@@ -0,0 +1,120 @@
+import time
+
+import pytest
+
+from fastbots import config
+from fastbots.session_store import SessionState, SessionStore
+from fastbots.scripts import READ_WEB_STORAGE_JS, WRITE_WEB_STORAGE_JS
+
+from benchmarks.fake_driver import FakeBot
+
+
+@pytest.fixture
+def session_store(tmp_path):
+    return SessionStore(path=str(tmp_path / 'sessions.sqlite'), ttl=60)
+
+
+@pytest.fixture
+def store_path(tmp_path, monkeypatch):
+    path = str(tmp_path / 'bot_sessions.sqlite')
+    monkeypatch.setattr(config, 'BOT_SESSION_STORE_FILE_PATH', path)
+    return path
+
+
+def test_save_load(session_store):
+    session_store.save(SessionState(
+        identity='buyer', domain='shop.example.com', cookies=[{'name': 'sid', 'value': '1'}],
+        local_storage={'token': 'abc'}, session_storage={'cart': '2'},
+    ))
+
+    state = session_store.load('buyer', 'shop.example.com')
+    assert state.cookies == [{'name': 'sid', 'value': '1'}]
+    assert state.local_storage == {'token': 'abc'}
+    assert state.session_storage == {'cart': '2'}
+    assert state.expires_at == pytest.approx(state.saved_at + 60)
+
+    assert session_store.load('seller', 'shop.example.com') is None
+    assert session_store.load('buyer', 'example.com') is None
+
+
+def test_identities(session_store):
+    session_store.save(SessionState(identity='buyer', domain='shop.example.com'))
+    time.sleep(0.01)
+    session_store.save(SessionState(identity='seller', domain='shop.example.com'))
+
+    assert session_store.identities('shop.example.com') == ['seller', 'buyer']
+
+    session_store.delete('seller')
+    assert session_store.identities('shop.example.com') == ['buyer']
+
+
+def test_expired_cookies(session_store):
+    session_store.save(SessionState(identity='buyer', domain='a.com', cookies=[
+        {'name': 'old', 'value': '1', 'expiry': int(time.time()) - 10},
+        {'name': 'new', 'value': '2', 'expiry': int(time.time()) + 3600},
+        {'name': 'session', 'value': '3'},
+    ]))
+
+    assert [cookie['name'] for cookie in session_store.load('buyer', 'a.com').cookies] == ['new', 'session']
+
+
+def test_ttl(tmp_path):
+    session_store = SessionStore(path=str(tmp_path / 'sessions.sqlite'), ttl=0)
+    session_store.save(SessionState(identity='buyer', domain='a.com'))
+    time.sleep(0.01)
+
+    assert session_store.load('buyer', 'a.com') is None
+
+
+def test_shared_processes(session_store, tmp_path):
+    session_store.save(SessionState(identity='buyer', domain='a.com', cookies=[{'name': 'sid', 'value': '1'}]))
+
+    # another connection, as another process
+    assert SessionStore(path=str(tmp_path / 'sessions.sqlite')).load('buyer', 'a.com').cookies[0]['value'] == '1'
+
+
+def test_bot_session(store_path, monkeypatch):
+    bot = FakeBot()
+    monkeypatch.setattr(bot, 'locator', lambda page_name, locator_name: 'https://shop.example.com/orders')
+    try:
+        # the login redirected the browser to another host
+        bot.driver.get('https://accounts.example.com/login/done')
+        bot.driver.add_cookie({'name': 'sid', 'value': '1', 'domain': 'shop.example.com'})
+        bot.driver.execute_script = lambda script, *args: (
+            {'local_storage': {'token': 'abc'}, 'session_storage': {}} if script == READ_WEB_STORAGE_JS else None
+        )
+        bot.session_identity = 'buyer'
+        bot.save_session()
+
+        bot.reset()
+        assert not bot.session_restored
+        assert not bot.restore_session('https://other.example.com/')
+
+        calls = []
+        bot.driver.execute_script = lambda script, *args: calls.append((script, args))
+        assert bot.restore_session('https://shop.example.com/orders')
+        assert bot.driver.current_url == f'https://shop.example.com{config.BOT_SESSION_RESTORE_PATH}'
+        assert bot.driver.get_cookies() == [{'name': 'sid', 'value': '1', 'domain': 'shop.example.com'}]
+        assert calls == [(WRITE_WEB_STORAGE_JS, ({'token': 'abc'}, {}))]
+
+        bot.forget_session('https://shop.example.com/')
+        assert not bot.restore_session('https://shop.example.com/orders')
+    finally:
+        bot.close()
+
+
+def test_bot_open_restores(store_path, monkeypatch):
+    SessionStore.shared(store_path).save(SessionState(
+        identity=config.BOT_SESSION_IDENTITY, domain='shop.example.com', cookies=[{'name': 'sid', 'value': '1'}]
+    ))
+    monkeypatch.setattr(config, 'BOT_SESSION_STORE', True)
+
+    bot = FakeBot()
+    monkeypatch.setattr(bot, 'locator', lambda page_name, locator_name: 'https://shop.example.com/orders')
+    try:
+        bot.open()
+        assert bot.session_restored
+        assert bot.driver.get_cookies() == [{'name': 'sid', 'value': '1'}]
+        assert bot.driver.current_url == 'https://shop.example.com/orders'
+    finally:
+        bot.close()
@@ -0,0 +1,141 @@
+import csv
+import json
+import sqlite3
+import threading
+
+import pytest
+
+from fastbots import config
+from fastbots.sinks import CsvSink, JsonlSink, SqliteSink, create_sink, shared_sink, tabular_value
+
+from benchmarks.fake_driver import FakeBot
+
+
+def test_tabular_value():
+    assert tabular_value(None) is None
+    assert tabular_value(1.5) == 1.5
+    assert tabular_value('a') == 'a'
+    assert tabular_value({'a': [1]}) == '{"a": [1]}'
+    assert tabular_value(('a', 1)) == '["a", 1]'
+
+
+def test_create_sink(tmp_path):
+    with create_sink(str(tmp_path / 'out.csv')) as sink:
+        assert isinstance(sink, CsvSink)
+    with create_sink(str(tmp_path / 'out.db')) as sink:
+        assert isinstance(sink, SqliteSink)
+
+    with pytest.raises(ValueError):
+        create_sink(str(tmp_path / 'out.xlsx'))
+
+
+def test_jsonl_sink(tmp_path):
+    path = tmp_path / 'nested' / 'out.jsonl'
+
+    with JsonlSink(str(path), batch_size=3) as sink:
+        for i in range(10):
+            sink.write({'i': i, 'tags': ['a']})
+        sink.flush()
+        assert sink.written == 10
+
+    assert [json.loads(line)['i'] for line in path.read_text().splitlines()] == list(range(10))
+
+    with pytest.raises(ValueError):
+        sink.write({'i': 10})
+
+
+def test_csv_sink_appends(tmp_path):
+    path = tmp_path / 'out.csv'
+
+    with CsvSink(str(path)) as sink:
+        sink.write({'sku': '1', 'price': 10, 'tags': ['a', 'b']})
+    with CsvSink(str(path)) as sink:
+        sink.write({'price': 20, 'sku': '2', 'extra': 'dropped'})
+
+    with open(path, newline='') as file:
+        rows = list(csv.DictReader(file))
+    assert rows == [
+        {'sku': '1', 'price': '10', 'tags': '["a", "b"]'},
+        {'sku': '2', 'price': '20', 'tags': ''},
+    ]
+
+
+def test_sqlite_sink_new_columns(tmp_path):
+    path = tmp_path / 'out.sqlite'
+
+    with SqliteSink(str(path), table='products') as sink:
+        sink.write({'sku': '1', 'price': 10})
+        sink.write({'sku': '2', 'title': 'pen'})
+
+    with sqlite3.connect(path) as connection:
+        rows = connection.execute('SELECT sku, price, title FROM products ORDER BY _rowid').fetchall()
+    assert rows == [('1', 10, None), ('2', None, 'pen')]
+
+
+def test_parquet_sink(tmp_path):
+    pyarrow_parquet = pytest.importorskip('pyarrow.parquet')
+    path = tmp_path / 'out.parquet'
+
+    with create_sink(str(path), batch_size=2) as sink:
+        for i in range(5):
+            sink.write({'i': i, 'tags': ['a']})
+
+    assert pyarrow_parquet.read_table(path).column('i').to_pylist() == list(range(5))
+
+
+def test_parquet_sink_late_types(tmp_path):
+    pyarrow_parquet = pytest.importorskip('pyarrow.parquet')
+    path = tmp_path / 'out.parquet'
+
+    with create_sink(str(path), batch_size=1) as sink:
+        # the first record succeeded, the error column has no value yet
+        sink.write({'index': 0, 'error': None, 'price': 10})
+        sink.flush()
+        sink.write({'index': 1, 'error': 'page not loaded', 'price': 'n/a'})
+        sink.flush()
+        sink.write({'index': 2, 'error': 404, 'price': 12, 'extra': 'dropped'})
+
+    assert pyarrow_parquet.read_table(path).to_pylist() == [
+        {'index': 0, 'error': None, 'price': 10},
+        {'index': 1, 'error': 'page not loaded', 'price': None},
+        {'index': 2, 'error': '404', 'price': 12},
+    ]
+
+
+def test_concurrent_writers(tmp_path):
+    path = tmp_path / 'out.jsonl'
+
+    with JsonlSink(str(path), queue_size=5) as sink:
+        threads = [
+            threading.Thread(target=lambda n=n: [sink.write({'thread': n, 'i': i}) for i in range(100)])
+            for n in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert len(path.read_text().splitlines()) == 400
+
+
+def test_bot_emit(tmp_path, monkeypatch):
+    path = str(tmp_path / 'emitted.jsonl')
+
+    bot = FakeBot()
+    try:
+        monkeypatch.setattr(config, 'BOT_SINK_FILE_PATH', 'None')
+        with pytest.raises(ValueError):
+            bot.emit({'sku': '1'})
+
+        monkeypatch.setattr(config, 'BOT_SINK_FILE_PATH', path)
+        bot.emit({'sku': '1'})
+        bot.emit({'sku': '2'})
+        assert bot.payload.output_data['records_emitted'] == 2
+
+        # flushed when the job ends
+        bot.finish()
+        assert len(open(path).read().splitlines()) == 2
+    finally:
+        bot.close()
+
+    assert shared_sink(path) is shared_sink(path)
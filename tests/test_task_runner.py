@@ -0,0 +1,84 @@
+import os
+import pickle
+import threading
+
+import pytest
+
+from fastbots import config, task_runner, Task, TaskRunner, BotPool
+
+
+pytestmark = pytest.mark.usefixtures('fake_bots')
+
+
+class EchoTask(Task):
+
+    def run(self, bot):
+        bot.payload.output_data['bot'] = id(bot)
+        bot.payload.output_data['thread'] = threading.get_ident()
+        bot.payload.output_data['pid'] = os.getpid()
+        return bot.payload.input_data['value'] != 'fail'
+
+    def on_success(self, payload):
+        return payload.input_data['value']
+
+    def on_failure(self, payload):
+        return 'failed'
+
+
+def test_run_collects_outcomes():
+    report = TaskRunner(max_workers=2).run((EchoTask(), {'value': str(i)}) for i in range(10))
+
+    assert len(report.runs) == 10
+    assert report.succeeded == 10
+    assert sorted(run.output for run in report.runs) == sorted(str(i) for i in range(10))
+    assert all(run.payload.output_data['result'] for run in report.runs)
+    assert report.throughput > 0
+
+def test_run_reuses_worker_bots():
+    report = TaskRunner(max_workers=2).run((EchoTask(), {'value': str(i)}) for i in range(10))
+
+    assert len({run.payload.output_data['bot'] for run in report.runs}) <= 2
+    assert BotPool.create_bot.call_count <= 2
+
+def test_run_failure_hooks():
+    report = TaskRunner(max_workers=1).run([(EchoTask(), {'value': 'fail'})])
+
+    assert report.failed == 1
+    assert report.runs[0].output == 'failed'
+
+def test_invalid_max_workers():
+    with pytest.raises(ValueError):
+        TaskRunner(max_workers=0)
+
+def test_task_pickle_excludes_bot_pool():
+    bot_pool = BotPool(size=1)
+    task = EchoTask(bot_pool=bot_pool)
+
+    restored = pickle.loads(pickle.dumps(task))
+    bot_pool.close()
+
+    assert task._bot_pool is bot_pool
+    assert restored._bot_pool is None
+
+def test_init_worker(monkeypatch):
+    monkeypatch.setattr(task_runner, '_worker_bot_pool', None)
+    task_runner.__init_worker__(config.BOT_DRIVER_TYPE)
+    bot_pool = task_runner._worker_bot_pool
+
+    try:
+        task_run = task_runner.__execute_task__(pickle.loads(pickle.dumps(EchoTask())), {'value': '1'})
+    finally:
+        bot_pool.close()
+
+    assert bot_pool.size == 1
+    assert task_run.result and task_run.output == '1'
+    assert BotPool.create_bot.call_count == 1
+
+def test_run_processes():
+    # the forked workers inherit the patched bot creation
+    report = TaskRunner(max_workers=2, use_processes=True).run((EchoTask(), {'value': str(i)}) for i in range(4))
+
+    assert report.succeeded == 4
+    assert sorted(run.output for run in report.runs) == ['0', '1', '2', '3']
+    assert os.getpid() not in {run.payload.output_data['pid'] for run in report.runs}
+
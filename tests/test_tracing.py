@@ -0,0 +1,83 @@
+import json
+import threading
+import contextvars
+
+import pytest
+
+from fastbots import config
+from fastbots.tracing import Tracer, current_tracer, span, traced
+
+from benchmarks.run import BenchmarkTask, FakeBotPool, FAKE_BASE_URL, configure
+
+
+@pytest.fixture
+def restore_config(monkeypatch):
+    for name in ('SELENIUM_LOCATORS_FILE', 'BOT_DOWNLOAD_FOLDER_PATH', 'BOT_SCREENSHOT_DOWNLOAD_FOLDER_PATH',
+                 'BOT_HTML_DOWNLOAD_FOLDER_PATH', 'BOT_RETRY_DELAY'):
+        monkeypatch.setattr(config, name, getattr(config, name))
+
+
+def test_span_without_tracer():
+    with span('phase') as current:
+        assert current is None
+    assert current_tracer() is None
+
+def test_nested_spans():
+    with Tracer().activate() as tracer:
+        with span('parent', page='search_page') as parent:
+            with span('child'):
+                pass
+
+            # the spans of a copied context are nested in the current span
+            thread = threading.Thread(target=contextvars.copy_context().run, args=(traced('thread')(lambda: None),))
+            thread.start()
+            thread.join()
+
+    spans = {span['name']: span for span in tracer.spans()}
+    assert spans['parent']['parent_id'] is None
+    assert spans['parent']['attributes'] == {'page': 'search_page'}
+    assert spans['child']['parent_id'] == parent.span_id
+    assert spans['thread']['parent_id'] == parent.span_id
+    assert all(span['trace_id'] == tracer.trace_id for span in spans.values())
+    assert spans['parent']['duration'] >= spans['child']['duration'] >= 0
+
+def test_span_error():
+    with Tracer().activate() as tracer:
+        with pytest.raises(ValueError):
+            with span('phase'):
+                raise ValueError('failed')
+
+    [failed] = tracer.spans()
+    assert failed['status'] == 'error'
+    assert failed['error'] == 'ValueError: failed'
+
+def test_export(tmp_path):
+    with Tracer('my_project').activate() as tracer:
+        with span('phase', attempt=1):
+            pass
+
+    tracer.export('None', str(tmp_path / 'none.jsonl'))
+    assert not (tmp_path / 'none.jsonl').exists()
+
+    tracer.export('jsonl', str(tmp_path / 'traces' / 'spans.jsonl'))
+    [line] = (tmp_path / 'traces' / 'spans.jsonl').read_text().splitlines()
+    assert json.loads(line)['name'] == 'phase'
+
+    tracer.export('otlp', str(tmp_path / 'otlp.jsonl'))
+    resource_span = json.loads((tmp_path / 'otlp.jsonl').read_text())['resourceSpans'][0]
+    assert resource_span['resource']['attributes'][0]['value'] == {'stringValue': 'my_project'}
+    assert resource_span['scopeSpans'][0]['spans'][0]['attributes'] == [{'key': 'attempt', 'value': {'intValue': '1'}}]
+
+    with pytest.raises(ValueError):
+        tracer.export('xml', str(tmp_path / 'traces.xml'))
+
+def test_task_spans(restore_config, tmp_path):
+    configure(tmp_path, FAKE_BASE_URL)
+
+    with FakeBotPool(size=1) as bot_pool:
+        result, payload, _ = BenchmarkTask(bot_pool=bot_pool).__execute__()
+
+    assert result
+    names = [span['name'] for span in payload.spans]
+    assert names[:2] == ['task', 'task.attempt']
+    assert {'bot.open', 'task.run', 'page.init', 'page.forward', 'task.on_success'} <= set(names)
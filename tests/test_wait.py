@@ -0,0 +1,108 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+
+from fastbots.wait import AdaptiveWait
+
+
+class FakeDriver:
+
+    def __init__(self, urls=(), element=None, events_error=None):
+        self.urls = list(urls)
+        self.element = element
+        self.events_error = events_error
+        self.timeouts = SimpleNamespace(script=1)
+        self.script_timeouts = []
+        self.find_calls = 0
+
+    @property
+    def current_url(self):
+        return self.urls.pop(0) if len(self.urls) > 1 else self.urls[0]
+
+    def find_element(self, by, value):
+        self.find_calls += 1
+        if self.find_calls < 3:
+            raise NoSuchElementException()
+        return self.element
+
+    def set_script_timeout(self, timeout):
+        self.timeouts.script = timeout
+        self.script_timeouts.append(timeout)
+
+    def execute_async_script(self, script, *args):
+        if self.events_error is not None:
+            raise self.events_error
+        if 'MutationObserver' in script:
+            return self.element
+        return self.urls[-1]
+
+
+def test_until_immediate():
+    start_time = time.monotonic()
+    assert AdaptiveWait(FakeDriver(), timeout=5).until(lambda driver: 'ok') == 'ok'
+    assert time.monotonic() - start_time < 0.05
+
+def test_until_backoff():
+    calls = []
+
+    def condition(driver):
+        calls.append(time.monotonic())
+        return len(calls) == 5
+
+    assert AdaptiveWait(FakeDriver(), timeout=5, min_poll=0.01, max_poll=0.04, backoff=2).until(condition)
+    intervals = [end - start for start, end in zip(calls, calls[1:])]
+    assert intervals[0] < intervals[-1]
+    assert sum(intervals) < 0.5
+
+def test_until_timeout():
+    with pytest.raises(TimeoutException):
+        AdaptiveWait(FakeDriver(), timeout=0.1).until(lambda driver: False)
+
+def test_until_not():
+    assert AdaptiveWait(FakeDriver(), timeout=1).until_not(lambda driver: False) is False
+
+def test_until_element_polling():
+    driver = FakeDriver(element='element')
+    assert AdaptiveWait(driver, timeout=1).until_element(('id', 'search')) == 'element'
+    assert driver.find_calls == 3
+
+def test_until_element_events():
+    driver = FakeDriver(element='element')
+    assert AdaptiveWait(driver, timeout=1, use_events=True).until_element(('id', 'search')) == 'element'
+    assert driver.find_calls == 0
+    # raised during the wait and restored after it
+    assert driver.script_timeouts == [2, 1]
+
+def test_until_element_events_interrupted():
+    driver = FakeDriver(element='element', events_error=WebDriverException('document unloaded'))
+    assert AdaptiveWait(driver, timeout=1, use_events=True).until_element(('id', 'search')) == 'element'
+
+@pytest.mark.parametrize("use_events", [False, True])
+def test_until_url(use_events):
+    driver = FakeDriver(urls=['about:blank', 'https://example.com/', 'https://example.com/page'])
+    assert AdaptiveWait(driver, timeout=1, use_events=use_events).until_url('https://example.com/page')
+
+def test_until_url_events_restores_timeout():
+    driver = FakeDriver(urls=['about:blank', 'https://example.com/page'])
+    driver.timeouts.script = 30
+    assert AdaptiveWait(driver, timeout=1, use_events=True).until_url('https://example.com/page')
+    # the user timeout is already long enough
+    assert driver.script_timeouts == []
+
+    driver = FakeDriver(urls=['https://example.com/'])
+    with pytest.raises(TimeoutException):
+        AdaptiveWait(driver, timeout=0.1, use_events=True).until_url('https://example.com/page')
+    assert driver.timeouts.script == 1
+
+@pytest.mark.parametrize("use_events", [False, True])
+def test_until_url_not_strict(use_events):
+    driver = FakeDriver(urls=['https://example.com/page?id=1'])
+    assert AdaptiveWait(driver, timeout=1, use_events=use_events).until_url('example.com/page', strict_page_check=False)
+
+@pytest.mark.parametrize("use_events", [False, True])
+def test_until_url_timeout(use_events):
+    driver = FakeDriver(urls=['https://example.com/'])
+    with pytest.raises(TimeoutException):
+        AdaptiveWait(driver, timeout=0.1, use_events=use_events).until_url('https://example.com/page')